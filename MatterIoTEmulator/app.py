@@ -44,46 +44,14 @@ from utils.network_interface_priority import *
 from utils.device_runner import DeviceRunner
 from utils.getIP import CreateIpAddress
 from utils.handle_recover import HandleRecoverDevices
+from rpc.scenario import ScenarioError, ScenarioRunner, load_scenario
+from utils import sim_random
 from constants import *
 
-# Import lighting device types
-from device_types_ui.lighting.on_off_light import OnOffLight
-from device_types_ui.lighting.dimmable_light import DimmableLight
-from device_types_ui.lighting.color_temperature_light import ColorTemperatureLight
-from device_types_ui.lighting.extended_color_light import ExtendedColorLight
-# Import smart plug device types
-from device_types_ui.smart_plug.on_off_plugin_unit import OnOffPluginUnit
-from device_types_ui.smart_plug.dimmable_plugin_unit import DimmablePluginUnit
-# Import Pump device types
-from device_types_ui.pump.pump import Pump
-# Import Sensor device types
-from device_types_ui.sensors.contact_sensor import ContactSensor
-from device_types_ui.sensors.flow_sensor import FlowSensor
-from device_types_ui.sensors.humidity_sensor import HumiditySensor
-from device_types_ui.sensors.light_sensor import LightSensor
-from device_types_ui.sensors.occupancy_sensor import OccupancySensor
-from device_types_ui.sensors.temperature_sensor import TemperatureSensor
-from device_types_ui.sensors.pressure_sensor import PressureSensor
-from device_types_ui.sensors.air_quality_sensor import AirQualitySensor
-from device_types_ui.sensors.smoke_co_alarm import SmokeCoAlarm
-
-
-from device_types_ui.closures.door_lock import DoorLock
-from device_types_ui.closures.window_covering import WindowCovering
-from device_types_ui.HVAC.fan import Fan
-from device_types_ui.HVAC.thermostat import Thermostat
-from device_types_ui.HVAC.heating_cooling_unit import HeatingCooling
-from device_types_ui.HVAC.air_purifier import AirPurifier
+# Device type controllers are imported when the device is started
+from device_types_ui.controllers import load_controller
 from credentials.development.gen_dac_cert import GenDacTool
 
-from device_types_ui.appliances.laundry_washer import LaundryWasher
-from device_types_ui.appliances.room_air_conditioner import RoomAirConditioner
-from device_types_ui.appliances.dishwasher import Dishwasher
-from device_types_ui.appliances.refrigerator import Refrigerator
-
-from device_types_ui.robotic.robotic_vacuum_cleaner import RobotVacuum
-from device_types_ui.switchs.generic_switch import GenericSwitch
-
 from setup_payload.generate_setup_payload import CommissioningFlow, SetupPayload
 
 SOURCE_PATH = os.path.dirname(os.path.realpath(__file__))
@@ -248,6 +216,7 @@ class MainWindow(QMainWindow):
         self.ipv6 = ""
         self.targetId = ""
         self.rpcPort = 33000
+        self.tab_visible = True
         self.rpc_port_default = 33000
         self.generateIp_done = False
         self.isIPBindFail = False
@@ -591,62 +560,9 @@ class MainWindow(QMainWindow):
         Show controller on UI emulator.
         """
         self.current_device_type = self.ui.cbb_device_selection.currentText()
-        if self.current_device_type == "Dimmable Light(0x0101)":
-            self.ctrl = DimmableLight(self)
-        elif self.current_device_type == "On/Off Light(0x0100)":
-            self.ctrl = OnOffLight(self)
-        elif self.current_device_type == "Color Temperature Light(0x010C)":
-            self.ctrl = ColorTemperatureLight(self)
-        elif self.current_device_type == "Extended Color Light(0x010D)":
-            self.ctrl = ExtendedColorLight(self)
-        elif self.current_device_type == "On/Off Plug-in Unit(0x010A)":
-            self.ctrl = OnOffPluginUnit(self)
-        elif self.current_device_type == "Dimmable Plug-in Unit(0x010B)":
-            self.ctrl = DimmablePluginUnit(self)
-        elif self.current_device_type == "Pump(0x0303)":
-            self.ctrl = Pump(self)
-        elif self.current_device_type == "Contact Sensor(0x0015)":
-            self.ctrl = ContactSensor(self)
-        elif self.current_device_type == "Light Sensor(0x0106)":
-            self.ctrl = LightSensor(self)
-        elif self.current_device_type == "Occupancy Sensor(0x0107)":
-            self.ctrl = OccupancySensor(self)
-        elif self.current_device_type == "Temperature Sensor(0x0302)":
-            self.ctrl = TemperatureSensor(self)
-        elif self.current_device_type == "Pressure Sensor(0x0305)":
-            self.ctrl = PressureSensor(self)
-        elif self.current_device_type == "Flow Sensor(0x0306)":
-            self.ctrl = FlowSensor(self)
-        elif self.current_device_type == "Humidity Sensor(0x0307)":
-            self.ctrl = HumiditySensor(self)
-        elif self.current_device_type == "Door Lock(0x000A)":
-            self.ctrl = DoorLock(self)
-        elif self.current_device_type == "Window Covering(0x0202)":
-            self.ctrl = WindowCovering(self)
-        elif self.current_device_type == "Fan(0x002B)":
-            self.ctrl = Fan(self)
-        elif self.current_device_type == "Thermostat(0x0301)":
-            self.ctrl = Thermostat(self)
-        elif self.current_device_type == "HeatingCoolingUnit(0x0300)":
-            self.ctrl = HeatingCooling(self)
-        elif self.current_device_type == "Air Purifier(0x002D)":
-            self.ctrl = AirPurifier(self)
-        elif self.current_device_type == "Air Quality Sensor(0x002C)":
-            self.ctrl = AirQualitySensor(self)
-        elif self.current_device_type == "Dishwasher(0x0075)":
-            self.ctrl = Dishwasher(self)
-        elif self.current_device_type == "Laundry Washer(0x0073)":
-            self.ctrl = LaundryWasher(self)
-        elif self.current_device_type == "Room Air Conditioner(0x0072)":
-            self.ctrl = RoomAirConditioner(self)
-        elif self.current_device_type == "Refrigerator(0x0070)":
-            self.ctrl = Refrigerator(self)
-        elif self.current_device_type == "Smoke&Carbon Alarm(0x0076)":
-            self.ctrl = SmokeCoAlarm(self)
-        elif self.current_device_type == "Robot Vaccum Cleaner(0x0074)":
-            self.ctrl = RobotVacuum(self)
-        elif self.current_device_type == "Generic Switch(0x000F)":
-            self.ctrl = GenericSwitch(self)
+        controller = load_controller(self.current_device_type)
+        if controller is not None:
+            self.ctrl = controller(self)
         else:
             logging.info(self.ui.cbb_device_selection.currentText())
             self.update_status(
@@ -1092,6 +1008,7 @@ class MainWindow(QMainWindow):
                 self._runner = None
 
             if (hasattr(self, "ctrl") and hasattr(self.ctrl, "stop")):
+                self.save_rpc_metrics()
                 self.ctrl.stop()
 
         except PermissionError:
@@ -1303,6 +1220,31 @@ class MainWindow(QMainWindow):
             file.write(line + "\n")
             file.close()
 
+    def set_tab_visible(self, visible):
+        """
+        Show or hide the tab of the device, the controller updates
+        its widgets only while the tab is shown.
+        """
+        self.tab_visible = visible
+        ctrl = getattr(self, "ctrl", None)
+        if ctrl is not None and hasattr(ctrl, "set_ui_visible"):
+            ctrl.set_ui_visible(visible)
+
+    def save_rpc_metrics(self):
+        """
+        Save the rpc call counts and latencies of the device to the log
+        folder, next to the device log.
+        """
+        metrics = getattr(getattr(self.ctrl, "client", None), "metrics", None)
+        if metrics is None:
+            return
+        try:
+            path_metrics = "/log/{}/{}--{}--rpc-metrics.json".format(
+                str(self.today), self.time_start, self.targetId)
+            metrics.dump(SOURCE_PATH + path_metrics)
+        except Exception as e:
+            logging.error("Can't save rpc metrics: " + str(e))
+
     def get_running_app_command(self):
         """
         Return appliucation command running.
@@ -1864,6 +1806,7 @@ class Main(QMainWindow):
         self.tabWidget.setUsesScrollButtons(True)
         self.tabWidget.setStyleSheet("QTabBar::scroller  { width: 100px; }")
         self.tabWidget.tabCloseRequested.connect(self.closeTab)
+        self.tabWidget.currentChanged.connect(self.handle_current_tab_changed)
         self.addButton = QPushButton("+", self)
         self.addButton.setGeometry(20, 10, 30, 30)
         self.addButton.clicked.connect(self.addNewTab)
@@ -1871,7 +1814,18 @@ class Main(QMainWindow):
         self.infoButton = QPushButton("I \n N \n F \n O", self)
         self.infoButton.setGeometry(20, 40, 30, 100)
         self.infoButton.clicked.connect(self.showOverlay)
+
+        # Scenario of attribute writes played on the running devices
+        self.scenarioButton = QPushButton("R \n U \n N", self)
+        self.scenarioButton.setGeometry(20, 150, 30, 80)
+        self.scenarioButton.clicked.connect(self.run_scenario)
+        self.scenario_runner = None
         self.tab = MainWindow()
+        # Seed of the random streams of the run, recorded in the manifest
+        sim_random.configure(
+            self.tab.read_config(),
+            os.path.join(SOURCE_PATH + "/log/", "run_manifest_{}.json".format(
+                datetime.datetime.now().strftime("%Y%m%d_%H%M%S"))))
 
         self.overlay_widget = OverlayWidget(self)
         self.overlay_widget.hide()
@@ -1914,6 +1868,59 @@ class Main(QMainWindow):
             self.list_device_connect = list_device_connect
             self.update_widget()
 
+    def run_scenario(self):
+        """
+        Load a scenario file and play it on the running devices.
+        """
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Run Scenario", SOURCE_PATH,
+            "Scenario (*.json *.yaml *.yml)")
+        if not path:
+            return
+        if self.scenario_runner is not None:
+            self.scenario_runner.cancel()
+        try:
+            self.scenario_runner = ScenarioRunner(
+                load_scenario(path), self.resolve_scenario_target)
+        except (ScenarioError, ValueError, TypeError) as e:
+            QMessageBox.warning(self, "Scenario", str(e), QMessageBox.Ok)
+            return
+        self.scenario_runner.start()
+        Thread(target=self.save_scenario_report,
+               args=(self.scenario_runner,), daemon=True).start()
+
+    def resolve_scenario_target(self, target):
+        """
+        Return the rpc client of a running device.
+
+        Arguments:
+            target {str} -- the target id or the rpc port of the device
+        """
+        for tab in self.listTab:
+            if str(target) in (tab.targetId, str(tab.rpcPort)):
+                return getattr(getattr(tab, 'ctrl', None), 'client', None)
+        return None
+
+    def save_scenario_report(self, runner):
+        """
+        Wait for the end of a scenario and save its timing report
+        in the log folder.
+
+        Arguments:
+            runner {ScenarioRunner} -- the running scenario
+        """
+        runner.wait()
+        path = os.path.join(
+            SOURCE_PATH + "/log/", "scenario_{}_{}.json".format(
+                runner.name,
+                datetime.datetime.now().strftime("%Y%m%d_%H%M%S")))
+        try:
+            runner.save_report(path)
+            logging.info(
+                f"Scenario {runner.name} done: {runner.report()['summary']}")
+        except OSError as e:
+            logging.error(f"Can not save scenario report: {str(e)}")
+
     def update_lbwidget(self, num_connect, num_tab):
         """
         Update content of label widget.
@@ -2412,6 +2419,15 @@ class Main(QMainWindow):
             self.tabWidget.currentIndex(),
             device_changed)
 
+    def handle_current_tab_changed(self, index):
+        """
+        Show the controller of the current tab only, the hidden tabs
+        stop updating their widgets until they are shown again
+        :param index {int}: The index of the current tab
+        """
+        for tab_index, tab in enumerate(self.listTab):
+            tab.set_tab_visible(tab_index == index)
+
     def handle_remove_targetId_when_stopped(self, deviceID):
         if (deviceID in self.listDevice):
             self.listDevice.remove(deviceID)
@@ -22,11 +22,8 @@ from qtwidgets import Toggle
 import logging
 import threading
 import os
-import time
-import random
 
 from rpc.airpurifier_client import AirPurifierClient
-from ..stoppablethread import UpdateStatusThread
 from ..constants_device import *
 from constants import *
 from ..device_base_ui import *
@@ -87,6 +84,7 @@ class AirPurifier(BaseDeviceUI):
         :param parent: An UI object load AirPurifier device UI controller.
         """
         super().__init__(parent)
+        self.emit_changed_status_only = True
 
         self.fan_mode = 0
         self.fan_mode_sequence = 2
@@ -439,9 +437,7 @@ class AirPurifier(BaseDeviceUI):
         :param feature_type: Value feature map of fan control cluster
         """
         logging.info("RPC SET fan feature: " + str(feature_type))
-        self.mutex.acquire(timeout=1)     
         self.client.SetAirPurifierSensor(self.get_air_purifier_data(fan_feature_type = feature_type))
-        self.mutex.release()
  
     def set_initial_value(self):
         """
@@ -493,7 +489,6 @@ class AirPurifier(BaseDeviceUI):
         logging.info("RPC SET Fan Mode: " + str(mode))
         self.enable_update = False
         QTimer.singleShot(1, self.enable_update_mode)
-        self.mutex.acquire(timeout=1)
         fan_data ={
             'fanControl': {
                 'fanMode': mode,
@@ -501,7 +496,6 @@ class AirPurifier(BaseDeviceUI):
             }
         } 
         self.client.SetAirPurifierSensor(self.get_air_purifier_data(fan_data = fan_data))
-        self.mutex.release()      
 
     def check_pm25(self, pm25):
         """Check pm25 value to set air quality value respectively"""
@@ -643,40 +637,6 @@ class AirPurifier(BaseDeviceUI):
         except Exception as e:
             logging.error("Error: " + str(e))
 
-    def update_device_status(self):
-        """
-        Update value for all attributes on UI
-        when set timer for change random attribute value
-        """
-        try:
-            while self.check_condition_update_status(
-                    self.update_device_status_thread):
-                try:
-                    self.mutex.acquire(timeout=1)
-                    air_purifier_status = self.client.GetAirPurifierSensor()
-                    ep2_temp_measure_status = self.client.GetTempValue()
-                    hepa_filter_status = self.client.GetCondition()
-                    ep3_humidity_measure_status = self.client.GetHumidityValue()
-                    device_airquality_status = self.client.GetAirQuality()
-                    device_concentration_status = self.client.GetPM25()
-                    device_state = self.client.get_device_state()
-                    self.mutex.release()
-                    self.sig_device_status_changed.emit(
-                        {
-                            'device_air_status': device_airquality_status,
-                            'air_purifier_status': air_purifier_status,
-                            'ep3_humidity_measure_status': ep3_humidity_measure_status,
-                            'hepa_filter_status': hepa_filter_status,
-                            'ep2_temp_measure_status': ep2_temp_measure_status,
-                            'device_concentration_status': device_concentration_status,
-                            'device_state': device_state})
-                    time.sleep(0.5)
-                except Exception as e:
-                    logging.error(
-                        f'{str(e)} , RPC Port: {str(self.parent.rpcPort)}')
-        except Exception as e:
-            logging.error(str(e))
-
     def stop(self):
         """
         Stop thread update device status
@@ -22,9 +22,7 @@ from qtwidgets import Toggle
 import logging
 import threading
 import os
-import time
 from rpc.fan_client import FanClient
-from ..stoppablethread import UpdateStatusThread
 from constants import *
 from ..device_base_ui import *
 
@@ -221,10 +219,8 @@ class Fan(BaseDeviceUI):
             self.rock_mode = ROCK_UP_DOWN
         elif (2 == index):
             self.rock_mode = ROCK_ROUND
-        self.mutex.acquire(timeout=1)
         self.client.set(
             {'fanRock': {'rockSetting': self.rock_mode, 'rockSupport': True}})
-        self.mutex.release()
 
     def enable_update_mode(self):
         """Enable 'enable_update' attribute for enable update value of combo box"""
@@ -238,10 +234,8 @@ class Fan(BaseDeviceUI):
         logging.info("RPC SET Fan Mode: " + str(mode))
         self.enable_update = False
         QTimer.singleShot(1, self.enable_update_mode)
-        self.mutex.acquire(timeout=1)
         self.client.set({'fanMode': mode})
         self.fan_mode = mode
-        self.mutex.release()
 
     def handle_wind_mode_changed(self, index):
         """
@@ -249,10 +243,8 @@ class Fan(BaseDeviceUI):
         :param index {int}: A index of wind combo box
         """
         logging.info("RPC SET Wind Mode: " + str(index + 1))
-        self.mutex.acquire(timeout=1)
         self.client.set(
             {'fanWind': {'windSetting': (index + 1), 'windSupport': True}})
-        self.mutex.release()
 
     def handle_airflow_mode_changed(self, mode):
         """
@@ -260,9 +252,7 @@ class Fan(BaseDeviceUI):
         :param index {int}: A index of air flow combo box
         """
         logging.info("RPC SET Air flow direction Mode: " + str(mode))
-        self.mutex.acquire(timeout=1)
         self.client.set({'fanAirFlowDirection': {'airFlowDirection': mode}})
-        self.mutex.release()
 
     def fan_feature_changed(self, feature_type):
         """
@@ -270,9 +260,7 @@ class Fan(BaseDeviceUI):
         :param feature_type: Value feature map of fan control cluster
         """
         logging.info("RPC SET Fan feature Mode: " + str(feature_type))
-        self.mutex.acquire(timeout=1)
         self.client.set({'featureMap': {'featureMap': feature_type}})
-        self.mutex.release()
 
     def check_enable_fan_feature(self, feature_type):
         """
@@ -22,9 +22,7 @@ from qtwidgets import Toggle
 import logging
 import threading
 import os
-import time
 from rpc.thermostat_client import ThermostatClient
-from ..stoppablethread import UpdateStatusThread
 from ..constants_device import *
 from constants import *
 from ..device_base_ui import *
@@ -68,6 +66,8 @@ class Thermostat(BaseDeviceUI):
         :param parent: An UI object load Thermostat device UI controller.
         """
         super().__init__(parent)
+        self.emit_changed_status_only = True
+        self.skip_poll_on_control = True
         self.systemMode = 0
 
         # Show icon
@@ -316,7 +316,6 @@ class Thermostat(BaseDeviceUI):
         """
         index = self.cb_mode.currentIndex()
         logging.info("RPC SET index: " + str(index))
-        self.mutex.acquire(timeout=1)
         self.check_system_mode(index)
         if index == INDEX_OFF:
             self.client.set({'systemMode': MODE_OFF})
@@ -336,7 +335,6 @@ class Thermostat(BaseDeviceUI):
             self.client.set({'systemMode': MODE_DRY})
         elif index == INDEX_SLEEP:
             self.client.set({'systemMode': MODE_SLEEP})            
-        self.mutex.release()
         self.is_on_control = False
 
     def handle_level_heating_changed(self):
@@ -346,10 +344,9 @@ class Thermostat(BaseDeviceUI):
         """
         heat_value = self.sl_level_heat.value() * 100
         logging.info("RPC SET : " + str(heat_value))
-        self.mutex.acquire(timeout=1)
-        self.client.set({'occupiedHeatingSetpoint': heat_value})
-        self.mutex.release()
-        self.is_on_control = False
+        self.queue_control_write(
+            'occupiedHeatingSetpoint', self.client.set,
+            {'occupiedHeatingSetpoint': heat_value})
 
     def handle_level_cooling_changed(self):
         """
@@ -358,10 +355,9 @@ class Thermostat(BaseDeviceUI):
         """
         cooling_value = self.sl_level_cooling.value() * 100
         logging.info("RPC SET : " + str(cooling_value))
-        self.mutex.acquire(timeout=1)
-        self.client.set({'occupiedCoolingSetpoint': cooling_value})
-        self.mutex.release()
-        self.is_on_control = False
+        self.queue_control_write(
+            'occupiedCoolingSetpoint', self.client.set,
+            {'occupiedCoolingSetpoint': cooling_value})
 
     def on_device_status_changed(self, result):
         """
@@ -428,29 +424,6 @@ class Thermostat(BaseDeviceUI):
         except Exception as e:
             logging.error(str(e))
 
-    def update_device_status(self):
-        """
-        Update value for all attributes on UI
-        when set timer for change random attribute value
-        """
-        try:
-            while self.check_condition_update_status(
-                    self.update_device_status_thread):
-                try:
-                    if not self.is_on_control:
-                        self.mutex.acquire(timeout=1)
-                        device_status = self.client.get()
-                        device_state = self.client.get_device_state()
-                        self.mutex.release()
-                        self.sig_device_status_changed.emit(
-                            {'device_status': device_status, 'device_state': device_state})
-                    time.sleep(0.5)
-                except Exception as e:
-                    logging.error(
-                        f'{str(e)} , RPC Port: {str(self.parent.rpcPort)}')
-        except Exception as e:
-            logging.error(str(e))
-
     def stop(self):
         """
         Stop thread update device status
@@ -21,12 +21,8 @@ from PySide2.QtWidgets import *
 from qtwidgets import Toggle
 import logging
 import threading
-from threading import Timer
 import os
-import time
-import random
 from rpc.dishwasher_client import DishwasherClient
-from ..stoppablethread import UpdateStatusThread
 from constants import *
 from ..device_base_ui import *
 
@@ -298,10 +294,8 @@ class Dishwasher(BaseDeviceUI):
         self.step_on = False
         self.number_temp = False
         self.select_temp_level = False
-        self.mutex.acquire(timeout=1)
         self.client.set({'dishTempControlFeature': {
                         'tempFeature': feature_mode}})
-        self.mutex.release()
         if feature_mode == TEMP_NUMBER_FEATURE:
             self.number_temp = True
             self.sl_title = QLabel()
@@ -409,14 +403,12 @@ class Dishwasher(BaseDeviceUI):
         :param level_mode: Temperature level corressponding to index of combo box
         """
         logging.info("RPC SET Temperature level change: " + str(level_mode))
-        self.mutex.acquire(timeout=1)
         self.client.set(
             {
                 'temperatureControl': {
                     'temperatureSetpoint': self.temperature,
                     'step': self.cr_step,
                     'selectedTemperatureLevel': level_mode}})
-        self.mutex.release()
 
     def destroy_timer_dishwasher(self):
         """Destroy dishwasher timer object"""
@@ -469,7 +461,6 @@ class Dishwasher(BaseDeviceUI):
         :param cr_phase: New value of current phase attribute
         :param cr_error_state: New value of operation state error attribute
         """
-        self.mutex.acquire(timeout=1)
         self.client.set(
             {
                 'operationalState': {
@@ -478,7 +469,6 @@ class Dishwasher(BaseDeviceUI):
                     'crOpStateIndex': cr_opState_index if cr_opState_index is not None else self.cr_opState_index,
                     'errState': cr_error_state if cr_error_state is not None else self.cr_error_state,
                     'countdownTime': cr_countdown_time if cr_countdown_time is not None else self.countdown_time}})
-        self.mutex.release()
 
     def update_timer(self):
         """
@@ -525,9 +515,7 @@ class Dishwasher(BaseDeviceUI):
         logging.info("RPC SET DishWasher Mode: " + str(mode))
         self.get_timer_mode()
         self.destroy_timer_dishwasher()
-        self.mutex.acquire(timeout=1)
         self.client.set({'dishwasherMode': {'currentMode': mode}})
-        self.mutex.release()
 
     def handle_operational_changed(self, mode):
         """
@@ -539,8 +527,7 @@ class Dishwasher(BaseDeviceUI):
             self.destroy_timer_dishwasher()
             self.countdown_time = 0
             self.set_operational_state(cr_state=STOPPED, cr_opState_index=STOP, cr_phase=COOLING)
-            statusTimer = Timer(2, self.notify_process_stopped)
-            statusTimer.start()
+            QTimer.singleShot(2000, self.notify_process_stopped)
 
         elif mode == START:
             self.is_run = True
@@ -571,10 +558,8 @@ class Dishwasher(BaseDeviceUI):
         :param mode {int}: A new mode of dishwasher feature mode
         """
         logging.info("RPC SET Dishwasher mode feature: " + str(mode))
-        self.mutex.acquire(timeout=1)
         self.client.set(
             {'dishDepOnOffFeature': {'featureMapOnOff': True if mode == 1 else False}})
-        self.mutex.release()
 
     def dishwasher_alarm_feature_changed(self, mode):
         """
@@ -582,10 +567,8 @@ class Dishwasher(BaseDeviceUI):
         :param mode {int}: A new alarm feature mode of dishwasher alarm feature map
         """
         logging.info("RPC SET Dishwasher alarm feature: " + str(mode))
-        self.mutex.acquire(timeout=1)
         self.client.set({'dishwasherAlarmReset': {
             'featureMapReset': True if mode == 1 else False}})
-        self.mutex.release()
 
     def dishwasher_alarm_changed(self, mode):
         """
@@ -593,9 +576,7 @@ class Dishwasher(BaseDeviceUI):
         :param mode {int}: A new alarm mode of dishwasher alarm
         """
         logging.info("RPC SET Dishwasher alarm: " + str(mode))
-        self.mutex.acquire(timeout=1)
         self.client.set({'dishwasherAlarm': {'alarmState': mode}})
-        self.mutex.release()
 
     def on_pressed_event(self):
         """Slider pressed handler"""
@@ -615,13 +596,13 @@ class Dishwasher(BaseDeviceUI):
         """
         temp = (self.sl_level.value())
         logging.info("RPC SET Temperature number: " + str(temp))
-        self.mutex.acquire(timeout=1)
         if "On" in self.lbl_main_status.text():
             self.on_off = True
         else:
             self.on_off = False
 
-        self.client.set(
+        self.queue_control_write(
+            'temperatureControl', self.client.set,
             {
                 'temperatureControl': {
                     'temperatureSetpoint': temp,
@@ -629,8 +610,6 @@ class Dishwasher(BaseDeviceUI):
                     'selectedTemperatureLevel': self.select_temp},
                 'onOff': {
                     'onOff': self.on_off}})
-        self.mutex.release()
-        self.is_on_control = False
 
     def set_initial_value(self):
         """
@@ -698,14 +677,12 @@ class Dishwasher(BaseDeviceUI):
         :param data: Value of on-off attribute, 0: False, other True
         """
         logging.info("RPC SET On/Off: " + str(data))
-        self.mutex.acquire(timeout=1)
         if data == 0:
             self.client.set({'onOff': {'onOff': False}})
             self.check_onoff(False)
         else:
             self.client.set({'onOff': {'onOff': True}})
             self.check_onoff(True)
-        self.mutex.release()
 
     def on_device_status_changed(self, result):
         """
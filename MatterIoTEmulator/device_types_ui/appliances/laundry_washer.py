@@ -21,12 +21,8 @@ from PySide2.QtWidgets import *
 from qtwidgets import Toggle
 import logging
 import threading
-from threading import Timer
 import os
-import random
-import time
 from rpc.laundrywasher_client import LaundryWasherClient
-from ..stoppablethread import UpdateStatusThread
 from constants import *
 from ..device_base_ui import *
 
@@ -308,14 +304,12 @@ class LaundryWasher(BaseDeviceUI):
         logging.info("RPC SET Laundry control feature mode: " + str(mode))
         self.client.set({'laundryControlFeature': {
                         'laundryControlFeature': mode}})
-        self.mutex.acquire(timeout=1)
         if mode == SPIN_FEATURE:
             self.spin_speeds_box.setEnabled(True)
             self.rinse_box.setEnabled(False)
         else:
             self.spin_speeds_box.setEnabled(False)
             self.rinse_box.setEnabled(True)
-        self.mutex.release()
 
     def handle_temp_feature_changed(self, feature_mode):
         """
@@ -326,9 +320,7 @@ class LaundryWasher(BaseDeviceUI):
         self.step_on = False
         self.number_temp = False
         self.select_temp_level = False
-        self.mutex.acquire(timeout=1)
         self.client.set({'tempControlFeature': {'tempFeature': feature_mode}})
-        self.mutex.release()
         if feature_mode == TEMP_NUMBER_FEATURE:
             self.number_temp = True
             self.sl_title = QLabel()
@@ -434,9 +426,7 @@ class LaundryWasher(BaseDeviceUI):
         :param rinse_mode: Number of rinse value corressponding to index of combo box
         """
         logging.info("RPC SET number of Rinse: " + str(rinse_mode))
-        self.mutex.acquire(timeout=1)
         self.client.set({'numberOfRinses': {'numberOfRinses': rinse_mode}})
-        self.mutex.release()
 
     def handle_level_box_changed(self, level_mode):
         """
@@ -444,14 +434,12 @@ class LaundryWasher(BaseDeviceUI):
         :param level_mode: Temperature level corressponding to index of combo box
         """
         logging.info("RPC SET temp level: " + str(level_mode))
-        self.mutex.acquire(timeout=1)
         self.client.set(
             {
                 'temperatureControl': {
                     'temperatureValue': self.temperature,
                     'step': self.cr_step,
                     'selectedTemperatureLevel': level_mode}})
-        self.mutex.release()
 
     def destroy_timer_laundry(self):
         """Destroy laundrywasher timer object"""
@@ -510,7 +498,6 @@ class LaundryWasher(BaseDeviceUI):
         :param cr_phase: New value of current phase attribute
         :param cr_error_state: New value of operation state error attribute
         """
-        self.mutex.acquire(timeout=1)
         self.client.set(
             {
                 'laundryOperationalState': {
@@ -519,7 +506,6 @@ class LaundryWasher(BaseDeviceUI):
                     'crOpStateIndex': cr_opState_index if cr_opState_index is not None else self.cr_opState_index,
                     'errState': cr_error_state if cr_error_state is not None else self.cr_error_state,
                     'countdownTime': cr_countdown_time if cr_countdown_time is not None else self.countdown_time}})
-        self.mutex.release()
 
     def update_timer(self):
         """
@@ -566,9 +552,7 @@ class LaundryWasher(BaseDeviceUI):
         logging.info("RPC SET Laundry Washer Mode: " + str(mode))
         self.get_timer_mode()
         self.destroy_timer_laundry()
-        self.mutex.acquire(timeout=1)
         self.client.set({'laundryMode': {'currentMode': mode}})
-        self.mutex.release()
 
     def handle_spin_mode_changed(self, mode):
         """
@@ -576,9 +560,7 @@ class LaundryWasher(BaseDeviceUI):
         :param mode {int}: A new mode of spin speed mode
         """
         logging.info("RPC SET Laundry Control Spin Mode: " + str(mode))
-        self.mutex.acquire(timeout=1)
         self.client.set({'spinSpeed': {'spinSpeed': mode}})
-        self.mutex.release()
 
     def handle_operational_changed(self, mode):
         """
@@ -590,8 +572,7 @@ class LaundryWasher(BaseDeviceUI):
             self.destroy_timer_laundry()
             self.countdown_time = 0
             self.set_operational_state(cr_state=STOPPED, cr_opState_index=STOP, cr_phase=COOLING)
-            statusTimer = Timer(2, self.notify_process_stopped)
-            statusTimer.start()
+            QTimer.singleShot(2000, self.notify_process_stopped)
 
         elif mode == START:
             self.is_run = True
@@ -634,12 +615,12 @@ class LaundryWasher(BaseDeviceUI):
         through rpc service when temperature slider change
         """
         temp = self.sl_level.value()
-        self.mutex.acquire(timeout=1)
         if "On" in self.lbl_main_status.text():
             self.on_off = True
         else:
             self.on_off = False
-        self.client.set(
+        self.queue_control_write(
+            'temperatureControl', self.client.set,
             {
                 'temperatureControl': {
                     'temperatureValue': temp,
@@ -647,7 +628,6 @@ class LaundryWasher(BaseDeviceUI):
                     'selectedTemperatureLevel': self.select_temp},
                 'onOff': {
                     'onOff': self.on_off}})
-        self.is_on_control = False
 
     def set_initial_value(self):
         """
@@ -726,14 +706,12 @@ class LaundryWasher(BaseDeviceUI):
         :param data: Value of on-off attribute, 0: False, other True
         """
         logging.info("RPC SET On/Off: " + str(data))
-        self.mutex.acquire(timeout=1)
         if data == 0:
             self.client.set({'onOff': {'onOff': False}})
             self.check_onoff(False)
         else:
             self.client.set({'onOff': {'onOff': True}})
             self.check_onoff(True)
-        self.mutex.release()
 
     def on_device_status_changed(self, result):
         """
@@ -22,9 +22,7 @@ from qtwidgets import Toggle
 import logging
 import threading
 import os
-import time
 from rpc.refrigerator_client import RefrigeratorClient
-from ..stoppablethread import UpdateStatusThread
 from ..constants_device import *
 from constants import *
 from ..device_base_ui import *
@@ -52,6 +50,8 @@ class Refrigerator(BaseDeviceUI):
         :param parent: An UI object load Refrigerator device UI controller.
         """
         super().__init__(parent)
+        self.emit_changed_status_only = True
+        self.skip_poll_on_control = True
         self.system_mode = 0
 
         self.temp_freeze = 0
@@ -305,10 +305,8 @@ class Refrigerator(BaseDeviceUI):
         :param feature: Alarm feature map value
         """
         logging.info("RPC SET alarm feature: " + str(feature))
-        self.mutex.acquire(timeout=1)
         self.client.SetRefrigerator(
             {"refrigeratorAlarmFeature": {"featureMap": feature}})
-        self.mutex.release()
 
     def handle_alarm_state_changed(self, alarm):
         """
@@ -316,10 +314,8 @@ class Refrigerator(BaseDeviceUI):
         :param alarm: Alarm state value
         """
         logging.info("RPC SET alarm state: " + str(bool(alarm)))
-        self.mutex.acquire(timeout=1)
         self.client.SetRefrigerator(
             {"refrigeratorAlarm": {"alarm": bool(alarm)}})
-        self.mutex.release()
 
     def handle_cold_temp_feature_changed(self, cold_feature):
         """
@@ -331,10 +327,8 @@ class Refrigerator(BaseDeviceUI):
         self.select_temp_level_cold = False
         self.step_on_cold = False
         self.clear_layout_cold()
-        self.mutex.acquire(timeout=1)
         self.client.SetColdCabinet(
             {"coldTempControlFeature": {"featureMap": cold_feature}})
-        self.mutex.release()
         if cold_feature == TEMP_NUMBER_FEATURE:
             self.number_temp_cold = True
             self.lb_cold_title = QLabel()
@@ -414,10 +408,8 @@ class Refrigerator(BaseDeviceUI):
         self.select_temp_level_freeze = False
         self.step_on_freeze = False
         self.clear_layout_freeze()
-        self.mutex.acquire(timeout=1)
         self.client.SetFreezeCabinet(
             {"freezeTempControlFeature": {"featureMap": freeze_feature}})
-        self.mutex.release()
         if freeze_feature == TEMP_NUMBER_FEATURE:
             self.number_temp_freeze = True
             self.lb_freezer_title = QLabel()
@@ -503,14 +495,12 @@ class Refrigerator(BaseDeviceUI):
         :param level_mode: Temperature level corressponding to index of combo box
         """
         logging.info("RPC SET level temp cold: " + str(level_mode))
-        self.mutex.acquire(timeout=1)
         self.client.SetColdCabinet(
             {
                 'refTemperatureControl': {
                     'temperatureControl': self.temp_cold,
                     'step': self.step_cold,
                     'selectedTemperatureLevel': level_mode}})
-        self.mutex.release()
 
     def handle_level_box_changed_freeze(self, level_mode):
         """
@@ -518,14 +508,12 @@ class Refrigerator(BaseDeviceUI):
         :param level_mode: Temperature level corressponding to index of combo box
         """
         logging.info("RPC SET level temp freeze: " + str(level_mode))
-        self.mutex.acquire(timeout=1)
         self.client.SetFreezeCabinet(
             {
                 'refTemperatureControl': {
                     'temperatureControl': self.temp_freeze,
                     'step': self.step_freeze,
                     'selectedTemperatureLevel': level_mode}})
-        self.mutex.release()
 
     def on_return_pressed_step_cold(self):
         """Handle set temperature step for cold cabinet when set from line edit"""
@@ -682,10 +670,8 @@ class Refrigerator(BaseDeviceUI):
         """
         logging.info("RPC SET Refrigerator Mode: " + str(mode))
         system_mode = self.mod_box.currentIndex()
-        self.mutex.acquire(timeout=1)
         self.client.SetRefrigerator(
             {"refrigeratorMode": {"currentMode": system_mode}})
-        self.mutex.release()
         self.is_on_control = False
 
     def update_lb_cold(self, value):
@@ -709,15 +695,13 @@ class Refrigerator(BaseDeviceUI):
         """
         level = self.sl_freezer_level.value()
         logging.info("RPC SET Freezer Temp level: " + str(level))
-        self.mutex.acquire(timeout=1)
         data = {
             "refTemperatureControl": {
                 "temperatureControl": level,
                 'step': self.step_freeze,
                 'selectedTemperatureLevel': self.temp_level_freeze}}
-        self.client.SetFreezeCabinet(data)
-        self.mutex.release()
-        self.is_on_control = False
+        self.queue_control_write(
+            'freezeCabinet', self.client.SetFreezeCabinet, data)
 
     def dimming_cold(self):
         """
@@ -726,15 +710,13 @@ class Refrigerator(BaseDeviceUI):
         """
         level = self.sl_cold_level.value()
         logging.info("RPC SET Cold cabinet Temp level: " + str(level))
-        self.mutex.acquire(timeout=1)
         data = {
             "refTemperatureControl": {
                 "temperatureControl": level,
                 'step': self.step_cold,
                 'selectedTemperatureLevel': self.temp_level_cold}}
-        self.client.SetColdCabinet(data)
-        self.mutex.release()
-        self.is_on_control = False
+        self.queue_control_write(
+            'coldCabinet', self.client.SetColdCabinet, data)
 
     def on_device_status_changed(self, result):
         """
@@ -847,35 +829,6 @@ class Refrigerator(BaseDeviceUI):
         except Exception as e:
             logging.error("Error: " + str(e))
 
-    def update_device_status(self):
-        """
-        Update value for all attributes on UI
-        when set timer for change random attribute value
-        """
-        try:
-            while self.check_condition_update_status(
-                    self.update_device_status_thread):
-                try:
-                    if not self.is_on_control:
-                        self.mutex.acquire(timeout=1)
-                        device_refri_status = self.client.GetRefrigerator()
-                        device_cold_status = self.client.GetColdCabinet()
-                        device_free_status = self.client.GetFreezeCabinet()
-                        device_state = self.client.get_device_state()
-                        self.mutex.release()
-                        self.sig_device_status_changed.emit(
-                            {
-                                'device_refri_status': device_refri_status,
-                                'device_cold_status': device_cold_status,
-                                'device_free_status': device_free_status,
-                                'device_state': device_state})
-                    time.sleep(0.5)
-                except Exception as e:
-                    logging.error(
-                        f'{str(e)} , RPC Port: {str(self.parent.rpcPort)}')
-        except Exception as e:
-            logging.error(str(e))
-
     def stop(self):
         """
         Stop thread update device state
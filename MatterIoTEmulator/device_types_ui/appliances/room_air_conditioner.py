@@ -22,9 +22,7 @@ from qtwidgets import Toggle
 import logging
 import threading
 import os
-import time
 from rpc.roomairconditioner_client import RoomAirConditionerClient
-from ..stoppablethread import UpdateStatusThread
 from ..constants_device import *
 from constants import *
 from ..device_base_ui import *
@@ -101,6 +99,8 @@ class RoomAirConditioner(BaseDeviceUI):
         :param parent: An UI object load RoomAirConditioner device UI controller.
         """
         super().__init__(parent)
+        self.emit_changed_status_only = True
+        self.skip_poll_on_control = True
         self.fan_mode = 0
         self.fan_mode_sequence = 2
         self.ther_mode = 0
@@ -111,6 +111,8 @@ class RoomAirConditioner(BaseDeviceUI):
         self.feature_thermostat = 0
         self.feature_fan = 0
         self.on_off = False
+        self.level_cool = 0
+        self.level_heat = 0
         self.enable_update = True
         self.time_repeat = 10
         self.time_sleep = 0
@@ -330,8 +332,6 @@ class RoomAirConditioner(BaseDeviceUI):
         logging.info("RPC SET fan feature: " + str(feature_type))
         self.client.SetRoomAirConditionerSensor(
             {'fanFeatureMap': {'featureMap': feature_type}})
-        self.mutex.acquire(timeout=1)
-        self.mutex.release()
 
     def thermostat_feature_changed(self, feature_type):
         """
@@ -347,8 +347,6 @@ class RoomAirConditioner(BaseDeviceUI):
                     'systemMode': THER_MODE_OFF,
                     'occupiedCoolingSetpoint': self.cooling,
                     'occupiedHeatingSetpoint': self.heating}})
-        self.mutex.acquire(timeout=1)
-        self.mutex.release()
 
     def enable_update_mode(self):
         """Enable attribute 'enable_update' for enable update value of combo box"""
@@ -424,11 +422,9 @@ class RoomAirConditioner(BaseDeviceUI):
         logging.info("RPC SET Fan Mode: " + str(mode))
         self.enable_update = False
         QTimer.singleShot(1, self.enable_update_mode)
-        self.mutex.acquire(timeout=1)
         self.client.SetRoomAirConditionerSensor(
             {'fanControl': {'fanMode': mode,
                             'fanModeSequence': self.fan_mode_sequence}})
-        self.mutex.release()
 
     def handle_thermostat_mode_changed(self, mode):
         """
@@ -441,7 +437,6 @@ class RoomAirConditioner(BaseDeviceUI):
         index = self.mod_box.currentIndex()
         level_cool = self.sl_cool_level.value()
         level_heat = self.sl_heat_level.value()
-        self.mutex.acquire(timeout=1)
         self.check_system_mode(index)
         if index == INDEX_OFF:
             self.ther_mode = THER_MODE_OFF
@@ -475,7 +470,6 @@ class RoomAirConditioner(BaseDeviceUI):
                     'systemMode': self.ther_mode,
                     'occupiedCoolingSetpoint': level_cool,
                     'occupiedHeatingSetpoint': level_heat}})
-        self.mutex.release()
         self.is_on_control = False
 
     def check_system_mode(self, index):
@@ -601,7 +595,6 @@ class RoomAirConditioner(BaseDeviceUI):
         :param data: Value of on-off attribute, 0: False, other True
         """
         logging.info("RPC SET On/Off: " + str(data))
-        self.mutex.acquire(timeout=1)
         if data == 0:
             self.client.SetRoomAirConditionerSensor(
                 {'onOff': {'onOff': False}})
@@ -611,57 +604,50 @@ class RoomAirConditioner(BaseDeviceUI):
             self.client.SetRoomAirConditionerSensor({'onOff': {'onOff': True}})
             self.is_stop_clicked = False
             self.check_onoff(True)
-        self.mutex.release()
 
     def handle_level_cooling_changed(self):
         """
         Handle set OccupiedCooling value to matter device(backend)
         through rpc service when OccupiedCooling slider change
         """
-        level_cool = self.sl_cool_level.value()
-        level_heat = self.sl_heat_level.value()
-        logging.info("RPC SET Cool level: " + str(level_cool))
-        self.mutex.acquire(timeout=1)
+        self.level_cool = self.sl_cool_level.value()
+        self.level_heat = self.sl_heat_level.value()
+        logging.info("RPC SET Cool level: " + str(self.level_cool))
         if "On" in self.lbl_main_status.text():
             self.on_off = True
         else:
             self.on_off = False
 
-        self.client.SetRoomAirConditionerSensor(
-            {
-                'onOff': {
-                    'onOff': self.on_off},
-                'thermostat': {
-                    'systemMode': self.ther_mode,
-                    'occupiedCoolingSetpoint': level_cool,
-                    'occupiedHeatingSetpoint': level_heat}})
-        self.mutex.release()
-        self.is_on_control = False
+        self.queue_control_write('thermostat', self.set_thermostat)
 
     def handle_level_heating_changed(self):
         """
         Handle set OccupiedHeating value to matter device(backend)
         through rpc service when OccupiedHeating slider change
         """
-        level_heat = self.sl_heat_level.value()
-        level_cool = self.sl_cool_level.value()
-        logging.info("RPC SET Heat level: " + str(level_heat))
-        self.mutex.acquire(timeout=1)
+        self.level_heat = self.sl_heat_level.value()
+        self.level_cool = self.sl_cool_level.value()
+        logging.info("RPC SET Heat level: " + str(self.level_heat))
         if "On" in self.lbl_main_status.text():
             self.on_off = True
         else:
             self.on_off = False
 
+        self.queue_control_write('thermostat', self.set_thermostat)
+
+    def set_thermostat(self):
+        """
+        Set on/off, system mode and setpoints to matter device(backend)
+        through rpc service, read when the queued write is sent
+        """
         self.client.SetRoomAirConditionerSensor(
             {
                 'onOff': {
                     'onOff': self.on_off},
                 'thermostat': {
                     'systemMode': self.ther_mode,
-                    'occupiedCoolingSetpoint': level_cool,
-                    'occupiedHeatingSetpoint': level_heat}})
-        self.mutex.release()
-        self.is_on_control = False
+                    'occupiedCoolingSetpoint': self.level_cool,
+                    'occupiedHeatingSetpoint': self.level_heat}})
 
     def check_enable_fan_feature(self, feature_type):
         """
@@ -816,35 +802,6 @@ class RoomAirConditioner(BaseDeviceUI):
         except Exception as e:
             logging.error("Error: " + str(e))
 
-    def update_device_status(self):
-        """
-        Update value for all attributes on UI
-        when set timer for change random attribute value
-        """
-        try:
-            while self.check_condition_update_status(
-                    self.update_device_status_thread):
-                try:
-                    if not self.is_on_control:
-                        self.mutex.acquire(timeout=1)
-                        device_hum_status = self.client.GetHumiditySensorValue()
-                        device_tem_status = self.client.GetTempValue()
-                        device_room_status = self.client.GetRoomAirConditionerSensor()
-                        device_state = self.client.get_device_state()
-                        self.mutex.release()
-                        self.sig_device_status_changed.emit(
-                            {
-                                'device_hum_status': device_hum_status,
-                                'device_tem_status': device_tem_status,
-                                'device_room_status': device_room_status,
-                                'device_state': device_state})
-                    time.sleep(0.5)
-                except Exception as e:
-                    logging.error(
-                        f'{str(e)} , RPC Port: {str(self.parent.rpcPort)}')
-        except Exception as e:
-            logging.error(str(e))
-
     def stop(self):
         """
         Stop thread update device state
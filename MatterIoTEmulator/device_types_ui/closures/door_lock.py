@@ -21,13 +21,10 @@ from PySide2.QtCore import Qt as Qt_core
 from PySide2.QtWidgets import *
 import logging
 import threading
-import time
-import random
 import os
 import json
 from qtwidgets import Toggle
 from rpc.lock_client import LockClient
-from ..stoppablethread import UpdateStatusThread
 from constants import *
 from ..device_base_ui import *
 
@@ -107,7 +104,10 @@ class DoorLock(BaseDeviceUI):
         self.set_initial_value()
 
         self.start_update_device_status_thread()
-        self.start_update_value_status_thread()
+        # Update the door state every second on the worker pool
+        # of the poll scheduler shared by all devices
+        self.door_state_task = PollScheduler.instance().call_every(
+            1.0, self.sig_value_status_changed.emit)
 
         logging.debug("Init door lock done")
 
@@ -131,9 +131,7 @@ class DoorLock(BaseDeviceUI):
         INCOMPLETE_LOCKED = 0, LOCKED = 1, UN_LOCKED = 2
         """
         logging.info("RPC SET lock/unlock: " + str(data))
-        self.mutex.acquire(timeout=1)
         self.client.set({"klockState": int(data)})
-        self.mutex.release()
 
     def on_device_status_changed(self, result):
         """
@@ -192,13 +190,9 @@ class DoorLock(BaseDeviceUI):
         """
         if self.lock_state != self.previous_lock_state:
             if "UnLocked" in self.lbl_main_status_clock.text():
-                self.mutex.acquire(timeout=1)
                 self.client.set({'doorState': OPENED})
-                self.mutex.release()
             else:
-                self.mutex.acquire(timeout=1)
                 self.client.set({'doorState': CLOSED})
-                self.mutex.release()
             self.previous_lock_state = self.lock_state
 
     def stop(self):
@@ -207,6 +201,7 @@ class DoorLock(BaseDeviceUI):
         Stop thread update device state
         Stop rpc client
         """
+        self.door_state_task.cancel()
         self.stop_update_status_thread()
         self.stop_update_state_thread()
         self.stop_client_rpc()
@@ -23,9 +23,7 @@ import logging
 import threading
 from threading import Timer
 import os
-import time
 from rpc.window_client import WindowClient
-from ..stoppablethread import UpdateStatusThread
 from constants import *
 from ..device_base_ui import *
 
@@ -69,8 +67,8 @@ class WindowCovering(BaseDeviceUI):
         :param parent: An UI object load WindowCovering device UI controller.
         """
         super().__init__(parent)
-        self.timer_tilt = None
-        self.timer_lift = None
+        self.emit_changed_status_only = True
+        self.skip_poll_on_control = True
 
         # Show Icon
         self.lbl_main_icon = QLabel()
@@ -187,45 +185,39 @@ class WindowCovering(BaseDeviceUI):
         self.lb_tilt_value.setText(str(value) + '°')
 
     def destroy_timer_window_covering(self):
-        """Destroy lift timer object and tilt timer object"""
+        """Cancel pending current lift and tilt percentage writes"""
         self.destroy_timer_tilt()
         self.destroy_timer_lift()
 
     def destroy_timer_tilt(self):
-        """Destroy lift timer object"""
+        """Cancel pending current tilt percentage write"""
         dict_data = self.__dict__
-        if ('timer_tilt' in dict_data):
-            if self.timer_tilt is not None:
-                self.timer_tilt.stop()
-                self.timer_tilt = None
+        if ('write_queue' in dict_data):
+            self.write_queue.cancel('current_position_tilt_percent100')
 
     def destroy_timer_lift(self):
-        """Destroy lift timer object"""
+        """Cancel pending current lift percentage write"""
         dict_data = self.__dict__
-        if ('timer_lift' in dict_data):
-            if self.timer_lift is not None:
-                self.timer_lift.stop()
-                self.timer_lift = None
+        if ('write_queue' in dict_data):
+            self.write_queue.cancel('current_position_lift_percent100')
 
     def handle_lift_value_change(self):
         """
-        Setup timer for setting current lift percentage after
-        slider lift release in a interval
-        Connect to slot function to set when timer timeout
+        Queue setting current lift percentage after the slider lift
+        stays still for an interval, each change restarts the interval
         """
-        self.timer_lift = QTimer()
-        self.timer_lift.start(OPERATION_WINDOW_TIMER)
-        self.timer_lift.timeout.connect(self.set_current_lift_position)
+        self.queue_write('current_position_lift_percent100',
+                         self.set_current_lift_position,
+                         delay=OPERATION_WINDOW_TIMER / 1000, debounce=True)
 
     def handle_tilt_value_change(self):
         """
-        Setup timer for setting current tilt percentage after
-        slider tilt release in a interval
-        Connect to slot function to set when timer timeout
+        Queue setting current tilt percentage after the slider tilt
+        stays still for an interval, each change restarts the interval
         """
-        self.timer_tilt = QTimer()
-        self.timer_tilt.start(OPERATION_WINDOW_TIMER)
-        self.timer_tilt.timeout.connect(self.set_current_tilt_position)
+        self.queue_write('current_position_tilt_percent100',
+                         self.set_current_tilt_position,
+                         delay=OPERATION_WINDOW_TIMER / 1000, debounce=True)
 
     def set_current_lift_position(self):
         """
@@ -235,7 +227,6 @@ class WindowCovering(BaseDeviceUI):
         level_lift = round((100 - self.target_lift) * 100)
         if (self.client is not None):
             self.client.set({'current_position_lift_percent100': level_lift})
-        self.destroy_timer_lift()
 
     def set_current_tilt_position(self):
         """
@@ -245,7 +236,6 @@ class WindowCovering(BaseDeviceUI):
         level_tilt = round((100 - self.target_tilt) * 100)
         if (self.client is not None):
             self.client.set({'current_position_tilt_percent100': level_tilt})
-        self.destroy_timer_tilt()
 
     def handle_lift_release(self):
         """
@@ -253,10 +243,9 @@ class WindowCovering(BaseDeviceUI):
         """
         level_lift = round((100 - self.sl_lift.value()) * 100)
         logging.info("RPC SET lift level : " + str(level_lift))
-        self.mutex.acquire(timeout=1)
-        self.client.set({'liftPercent100': level_lift})
-        self.mutex.release()
-        self.is_on_control = False
+        self.queue_control_write(
+            'liftPercent100', self.client.set,
+            {'liftPercent100': level_lift})
 
     def handle_tilt_release(self):
         """
@@ -264,10 +253,9 @@ class WindowCovering(BaseDeviceUI):
         """
         level_tilt = ((100 - self.sl_tilt.value()) * 100)
         logging.info("RPC SET tilt level : " + str(level_tilt))
-        self.mutex.acquire(timeout=1)
-        self.client.set({'tiltPercent100': level_tilt})
-        self.mutex.release()
-        self.is_on_control = False
+        self.queue_control_write(
+            'tiltPercent100', self.client.set,
+            {'tiltPercent100': level_tilt})
 
     def handle_operational_status(self, op_status):
         """
@@ -337,29 +325,6 @@ class WindowCovering(BaseDeviceUI):
         except Exception as e:
             logging.error("Error: " + str(e))
 
-    def update_device_status(self):
-        """
-        Update value for all attributes on UI
-        when set timer for change random attribute value
-        """
-        try:
-            while self.check_condition_update_status(
-                    self.update_device_status_thread):
-                try:
-                    if not self.is_on_control:
-                        self.mutex.acquire(timeout=1)
-                        device_status = self.client.get()
-                        device_state = self.client.get_device_state()
-                        self.mutex.release()
-                        self.sig_device_status_changed.emit(
-                            {'device_status': device_status, 'device_state': device_state})
-                    time.sleep(0.5)
-                except Exception as e:
-                    logging.error(
-                        f'{str(e)} , RPC Port: {str(self.parent.rpcPort)}')
-        except Exception as e:
-            logging.error(str(e))
-
     def stop(self):
         """
         Stop thread update device state
@@ -0,0 +1,92 @@
+# Copyright (c) 2024 LG Electronics, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import importlib
+
+# Module and class of the UI controller of each device type. Controllers
+# are imported on first use, so only the rpc client and protos of the
+# device types actually started are loaded.
+DEVICE_CONTROLLERS = {
+    "Dimmable Light(0x0101)":
+        ("device_types_ui.lighting.dimmable_light", "DimmableLight"),
+    "On/Off Light(0x0100)":
+        ("device_types_ui.lighting.on_off_light", "OnOffLight"),
+    "Color Temperature Light(0x010C)":
+        ("device_types_ui.lighting.color_temperature_light",
+         "ColorTemperatureLight"),
+    "Extended Color Light(0x010D)":
+        ("device_types_ui.lighting.extended_color_light",
+         "ExtendedColorLight"),
+    "On/Off Plug-in Unit(0x010A)":
+        ("device_types_ui.smart_plug.on_off_plugin_unit", "OnOffPluginUnit"),
+    "Dimmable Plug-in Unit(0x010B)":
+        ("device_types_ui.smart_plug.dimmable_plugin_unit",
+         "DimmablePluginUnit"),
+    "Pump(0x0303)": ("device_types_ui.pump.pump", "Pump"),
+    "Contact Sensor(0x0015)":
+        ("device_types_ui.sensors.contact_sensor", "ContactSensor"),
+    "Light Sensor(0x0106)":
+        ("device_types_ui.sensors.light_sensor", "LightSensor"),
+    "Occupancy Sensor(0x0107)":
+        ("device_types_ui.sensors.occupancy_sensor", "OccupancySensor"),
+    "Temperature Sensor(0x0302)":
+        ("device_types_ui.sensors.temperature_sensor", "TemperatureSensor"),
+    "Pressure Sensor(0x0305)":
+        ("device_types_ui.sensors.pressure_sensor", "PressureSensor"),
+    "Flow Sensor(0x0306)":
+        ("device_types_ui.sensors.flow_sensor", "FlowSensor"),
+    "Humidity Sensor(0x0307)":
+        ("device_types_ui.sensors.humidity_sensor", "HumiditySensor"),
+    "Door Lock(0x000A)": ("device_types_ui.closures.door_lock", "DoorLock"),
+    "Window Covering(0x0202)":
+        ("device_types_ui.closures.window_covering", "WindowCovering"),
+    "Fan(0x002B)": ("device_types_ui.HVAC.fan", "Fan"),
+    "Thermostat(0x0301)": ("device_types_ui.HVAC.thermostat", "Thermostat"),
+    "HeatingCoolingUnit(0x0300)":
+        ("device_types_ui.HVAC.heating_cooling_unit", "HeatingCooling"),
+    "Air Purifier(0x002D)":
+        ("device_types_ui.HVAC.air_purifier", "AirPurifier"),
+    "Air Quality Sensor(0x002C)":
+        ("device_types_ui.sensors.air_quality_sensor", "AirQualitySensor"),
+    "Dishwasher(0x0075)":
+        ("device_types_ui.appliances.dishwasher", "Dishwasher"),
+    "Laundry Washer(0x0073)":
+        ("device_types_ui.appliances.laundry_washer", "LaundryWasher"),
+    "Room Air Conditioner(0x0072)":
+        ("device_types_ui.appliances.room_air_conditioner",
+         "RoomAirConditioner"),
+    "Refrigerator(0x0070)":
+        ("device_types_ui.appliances.refrigerator", "Refrigerator"),
+    "Smoke&Carbon Alarm(0x0076)":
+        ("device_types_ui.sensors.smoke_co_alarm", "SmokeCoAlarm"),
+    "Robot Vaccum Cleaner(0x0074)":
+        ("device_types_ui.robotic.robotic_vacuum_cleaner", "RobotVacuum"),
+    "Generic Switch(0x000F)":
+        ("device_types_ui.switchs.generic_switch", "GenericSwitch")}
+
+
+def load_controller(device_type):
+    """
+    Return the UI controller class of a device type, or None if the
+    device type has no controller.
+    :param device_type {str}: The device type, e.g. "Pump(0x0303)"
+    """
+    entry = DEVICE_CONTROLLERS.get(device_type)
+    if entry is None:
+        return None
+    module_name, class_name = entry
+    return getattr(importlib.import_module(module_name), class_name)
@@ -21,12 +21,19 @@ from PySide2.QtCore import Qt as Qt_core
 from PySide2.QtWidgets import *
 import logging
 import threading
-import time
-import random
 import os
 import json
+import math
 from qtwidgets import Toggle
-from device_types_ui.stoppablethread import UpdateStatusThread
+from rpc.poll_scheduler import PollJob, PollScheduler
+from device_types_ui.widget_binding import WidgetBinder
+from rpc.device_actor import DeviceBusyError
+from rpc.rpc_session import DeviceUnavailableError
+from rpc.write_queue import WriteQueue, get_write_queue_config
+from utils.timer_wheel import TimerWheel
+from utils.trace_replay import (TraceReplay, get_trace_replay_config,
+                                map_columns, merge_record, read_trace)
+from utils.value_generator import ValueGenerator, get_value_generator_config
 from constants import *
 
 
@@ -36,7 +43,11 @@ class BaseDeviceUI(QObject):
     and endpoints corresspoding to Matter Specification v1.2
     """
     sig_device_status_changed = Signal(dict)
+    sig_device_attributes_changed = Signal(dict)
     sig_value_status_changed = Signal()
+    sig_value_timer_finished = Signal()
+    # Trace columns replayed by default, see map_columns of trace_replay
+    TRACE_COLUMNS = {}
 
     def __init__(self, parent) -> None:
         """
@@ -48,18 +59,53 @@ class BaseDeviceUI(QObject):
 
         self.sig_device_status_changed.connect(self.on_device_status_changed)
         self.sig_value_status_changed.connect(self.on_value_status_changed)
+        self.sig_value_timer_finished.connect(self.on_value_timer_finished)
+        # Widgets bound to device attributes, see bind_attribute()
+        self.binder = WidgetBinder()
+        self.sig_device_attributes_changed.connect(
+            self.on_device_attributes_changed)
 
         # Init rpc
         rpc_port = str(self.parent.rpcPort)
-        self.mutex = threading.Lock()
         self.config = "localhost:" + rpc_port
         self.client = None
 
         self.is_on_control = False
+        # Skip 'sig_device_status_changed' when a poll changed nothing,
+        # only for controllers whose handler just applies device state
+        self.emit_changed_status_only = False
+        # Do not poll while the user is changing a control
+        self.skip_poll_on_control = False
+        # While the tab is hidden the last polled status is kept
+        # and applied once when the tab is shown
+        self.ui_visible = getattr(self.parent, 'tab_visible', True)
+        self.hidden_status = None
+        self.hidden_changes = {}
+        self.hidden_lock = threading.Lock()
 
         self.parent.is_rpc_timer_running = True
-        self.update_device_status_thread = None
-        self.update_value_status_thread = None
+        self.value_timer = None
+        self.value_model = None
+        # Models of sensors with several random values, by name
+        self.value_models = {}
+        self.trace_replay = None
+        # Replayed records not sent yet, merged into one write
+        self.trace_record = {}
+        self.trace_lock = threading.Lock()
+        self.poll_job = None
+        # Name of the random streams of the device, stable across runs
+        # whatever the order the tabs start: the vendor id, product id
+        # and serial number of the device
+        device_type = getattr(self.parent, 'current_device_type', None)
+        target_id = getattr(self.parent, 'targetId', '')
+        if not target_id:
+            target_id = self.parent.generate_targetId()
+        self.stream_name = f'{device_type}#{target_id}'
+
+        # Writes of sliders and dials are merged per attribute
+        write_config = get_write_queue_config(self.read_polling_config())
+        self.write_queue = WriteQueue(write_config['merge_window'])
+        self.write_flush_on_release = write_config['flush_on_release']
 
     def set_initial_value(self):
         """
@@ -69,16 +115,6 @@ class BaseDeviceUI(QObject):
         # ToDo: set initial rpc value here
         pass
 
-    def check_condition_update_status(self, thread_instance):
-        """
-        Check condition of thread to update status
-        :param thread_instance: thread instance object
-        """
-        if (thread_instance is None):
-            return False
-        return ((not thread_instance.stop_flag)
-                and self.parent.is_rpc_timer_running)
-
     def on_device_status_changed(self, result):
         """
         Interval update all attributes value
@@ -102,27 +138,131 @@ class BaseDeviceUI(QObject):
         # ToDo: Do update value when run random set value from UI
         pass
 
-    def update_device_status(self):
+    def bind_attribute(self, paths, widget, setter, convert=None,
+                       block_signals=True, enabled=None, mute=()):
+        """
+        Declare the widget showing device attributes, it is set
+        from the polled values only when they change
+        :param paths {str|tuple}: Dotted attribute path(s), e.g.
+        'device_status.level'
+        :param widget {QWidget}: The widget to update
+        :param setter {str|callable}: Widget method name, e.g. 'setValue',
+        or function called with widget and value
+        :param convert {callable}: Function of the attribute values
+        returning the widget value
+        :param block_signals {bool}: Do not emit the widget signals
+        while setting it, so the value is not written back to the device
+        :param enabled {callable}: Function returning False while the
+        widget must not be updated
+        :param mute {tuple}: (signal, slot) pairs disconnected instead
+        of blocking all signals, e.g. the write handler of a Toggle
+        :return: The binding
         """
-        Use for emit signal 'sig_device_status_changed' to update value of
-        attributes on UI from Backend (matter device)
+        return self.binder.bind(paths, widget, setter, convert,
+                                block_signals, enabled, mute)
+
+    def on_device_attributes_changed(self, changes):
+        """
+        Update the widgets bound to the changed attributes
+        :param changes {dict}: Attributes changed since last poll by path
         """
         try:
-            while self.check_condition_update_status(
-                    self.update_device_status_thread):
-                try:
-                    self.mutex.acquire(timeout=1)
-                    device_status = self.client.get()
-                    device_state = self.client.get_device_state()
-                    self.mutex.release()
-                    self.sig_device_status_changed.emit(
-                        {'device_status': device_status, 'device_state': device_state})
-                    time.sleep(0.5)
-                except Exception as e:
-                    logging.error(
-                        f'{str(e)} , RPC Port: {str(self.parent.rpcPort)}')
+            self.binder.apply(changes)
         except Exception as e:
-            logging.error(str(e))
+            logging.error("Error: " + str(e))
+
+    def emit_device_status(self, device_status, changes):
+        """
+        Emit the polled device status and the changed attributes
+        :param device_status {dict}: Snapshot of the device from rpc service
+        :param changes {dict}: Attributes changed since last poll by path
+        """
+        with self.hidden_lock:
+            if not self.ui_visible:
+                self.hidden_status = device_status
+                if changes:
+                    self.hidden_changes.update(changes)
+                return
+        if changes:
+            self.sig_device_attributes_changed.emit(changes)
+        if changes or not self.emit_changed_status_only:
+            self.sig_device_status_changed.emit(device_status)
+
+    def set_ui_visible(self, visible):
+        """
+        Update widgets live only while the tab of the device is shown,
+        apply the last polled status when it is shown again
+        :param visible {bool}: True when the tab is shown
+        """
+        with self.hidden_lock:
+            self.ui_visible = visible
+            if not visible:
+                return
+            device_status, self.hidden_status = self.hidden_status, None
+            changes, self.hidden_changes = self.hidden_changes, {}
+        if device_status is not None:
+            if changes:
+                self.sig_device_attributes_changed.emit(changes)
+            self.sig_device_status_changed.emit(device_status)
+
+    def queue_write(self, key, func, *args, delay=None, debounce=False):
+        """
+        Queue a write to the device on the write queue, a newer write
+        of the same attribute replaces it until it is sent
+        :param key {str}: The attribute changed by the write
+        :param func {callable}: Client method sending the write
+        :param delay {float}: Wait time instead of the merge window
+        :param debounce {bool}: Restart the wait on each write
+        """
+        self.write_queue.submit(key, func, *args,
+                                delay=delay, debounce=debounce)
+
+    def queue_control_write(self, key, func, *args):
+        """
+        Queue the write of a released slider or dial, it is sent at once
+        when flush on release is enabled, then polling resumes
+        :param key {str}: The attribute changed by the write
+        :param func {callable}: Client method sending the write
+        """
+        self.write_queue.submit(key, self.write_control, func, *args,
+                                flush=self.write_flush_on_release)
+
+    def write_control(self, func, *args):
+        """
+        Send the write of a released control and resume polling
+        :param func {callable}: Client method sending the write
+        """
+        try:
+            func(*args)
+        finally:
+            self.is_on_control = False
+
+    def poll_device_status(self, reads=None):
+        """
+        Poll the device once and emit signal 'sig_device_status_changed'
+        to update value of attributes on UI from Backend (matter device)
+        :param reads {tuple}: (result key, client method) pairs to poll
+        :return: The changed attributes, None if the poll was skipped
+        """
+        if not self.parent.is_rpc_timer_running:
+            return None
+        if self.skip_poll_on_control and self.is_on_control:
+            return None
+        try:
+            device_status, changes = self.client.poll(reads)
+            self.emit_device_status(device_status, changes)
+            return changes
+        except DeviceUnavailableError:
+            # Back off while the session reconnects, it kicks the poll
+            # when the device is back
+            return {}
+        except DeviceBusyError:
+            # Writes are waiting for the device, poll again later
+            return None
+        except Exception as e:
+            logging.error(
+                f'{str(e)} , RPC Port: {str(self.parent.rpcPort)}')
+            return None
 
     def update_value_status(self):
         """
@@ -130,48 +270,248 @@ class BaseDeviceUI(QObject):
         of attributes on UI when update random value by timer
         """
         try:
-            while self.check_condition_update_status(
-                    self.update_value_status_thread):
-                self.sig_value_status_changed.emit()
-                time.sleep(1)
+            self.sig_value_status_changed.emit()
         except Exception as e:
             logging.error(str(e))
 
-    def start_update_device_status_thread(self):
+    def read_polling_config(self):
         """
-        Use for start thread update device value from Backend (matter device)
+        Return the content of config file holding the polling intervals
         """
-        self.update_device_status_thread = UpdateStatusThread(
-            target=self.update_device_status, name="update device status thread")
-        self.update_device_status_thread.start()
+        try:
+            return self.parent.read_config()
+        except Exception as e:
+            logging.warning("Can't read polling config: " + str(e))
+            return {}
 
-    def start_update_value_status_thread(self):
+    def start_update_device_status_thread(self):
         """
-        Use for start thread update device value
-        when update random value by timer on UI
+        Use for start polling device value from Backend (matter device)
+        on the poll scheduler shared by all devices
         """
-        self.update_value_status_thread = UpdateStatusThread(
-            target=self.update_value_status, name="update value status thread")
-        self.update_value_status_thread.start()
+        self.poll_job = PollJob.from_config(
+            self.poll_device_status, self.client.SNAPSHOT_READS,
+            self.read_polling_config(),
+            getattr(self.parent, 'current_device_type', None),
+            name=f'RPC Port: {str(self.parent.rpcPort)}')
+        self.client.add_write_listener(self.poll_job.kick)
+        PollScheduler.instance().add(self.poll_job)
 
     def stop_update_status_thread(self):
         """
-        Use for stop thread update device value from Backend (matter device)
+        Use for stop the timer update device value
+        """
+        self.stop_value_timer()
+        if self.value_model is not None:
+            ValueGenerator.instance().remove(self.value_model)
+            self.value_model = None
+        for handle in self.value_models.values():
+            ValueGenerator.instance().remove(handle)
+        self.value_models = {}
+        self.stop_trace_replay()
+
+    def start_value_timer(self, interval, count):
+        """
+        Use for emit signal 'sig_value_status_changed' count times,
+        every interval seconds, on the timer wheel shared by all devices,
+        then signal 'sig_value_timer_finished'
+        :param interval {int}: seconds between two random values
+        :param count {int}: number of random values
+        """
+        self.stop_value_timer()
+        if count > 0:
+            self.value_timer = TimerWheel.instance().call_repeat(
+                max(interval, 1), count, self.sig_value_status_changed.emit,
+                on_finished=self.sig_value_timer_finished.emit)
+
+    def pause_value_timer(self):
+        """
+        Use for pause the random value timer
+        """
+        if self.value_timer is not None:
+            self.value_timer.pause()
+
+    def resume_value_timer(self):
+        """
+        Use for resume the random value timer
+        """
+        if self.value_timer is not None:
+            self.value_timer.resume()
+
+    def stop_value_timer(self):
+        """
+        Use for stop the random value timer
+        """
+        if self.value_timer is not None:
+            self.value_timer.cancel()
+            self.value_timer = None
+
+    def is_value_timer_running(self):
+        """
+        Return True while the random value timer has values left
+        """
+        return self.value_timer is not None and self.value_timer.active
+
+    def value_timer_remaining(self):
+        """
+        Return the seconds left until the next random value
+        and the number of random values left
+        """
+        if not self.is_value_timer_running():
+            return 0, 0
+        return (math.ceil(self.value_timer.remaining_time()),
+                self.value_timer.remaining_count)
+
+    def on_value_timer_finished(self):
+        """
+        Handle the random value timer after the last value,
+        called on the UI thread through 'sig_value_timer_finished'
+        """
+        pass
+
+    def add_value_model(self, low, high, model='uniform', name=None,
+                        **params):
+        """
+        Add the model of the random values of the sensor to the value
+        generator shared by all sensors, the entry of the device type in
+        the 'value_generator' section of config.json overrides it
+        :param low {int}: The smallest value
+        :param high {int}: The largest value
+        :param model {str}: The model preset, see MODELS of value_generator
+        :param name {str}: The name of one of several models of the sensor,
+        its override is the entry of that name in the device type entry
+        :param params: The model parameters, see MODEL_PARAMS
+        """
+        config = self.read_polling_config()
+        override = get_value_generator_config(
+            config, getattr(self.parent, 'current_device_type', None))['model']
+        stream = self.stream_name
+        if name is not None:
+            override = dict(override.get(name, {}))
+            stream = f'{self.stream_name}:{name}'
+        model = override.pop('model', model)
+        params.update(override)
+        generator = ValueGenerator.instance(config)
+        try:
+            handle = generator.add(low, high, model, stream=stream, **params)
+        except KeyError as e:
+            logging.error(f'Unknown value model {str(e)}, use uniform values')
+            handle = generator.add(low, high, stream=stream)
+        if name is None:
+            self.value_model = handle
+        else:
+            self.value_models[name] = handle
+
+    def next_random_value(self):
+        """
+        Return the current value of the model of the sensor,
+        see add_value_model()
+        """
+        return ValueGenerator.instance().value(self.value_model)
+
+    def next_random_values(self):
+        """
+        Return the current values of the named models of the sensor by
+        name, read together, see add_value_model()
+        """
+        names = list(self.value_models)
+        return dict(zip(names, ValueGenerator.instance().value_list(
+            [self.value_models[name] for name in names])))
+
+    def start_trace_replay(self, path, speed=1.0, columns=None,
+                           time_column='timestamp'):
+        """
+        Use for replay a recorded CSV or binary trace to the device,
+        streamed from the file, speed times faster than recorded
+        :param path {str}: The trace file
+        :param speed {float}: The replay speed, e.g. 10 for 10x
+        :param columns {dict}: The attributes of the trace columns,
+        default TRACE_COLUMNS
+        :param time_column {str}: The time column of a CSV trace
+        """
+        self.stop_trace_replay()
+        records = map_columns(read_trace(path, time_column),
+                              columns or self.TRACE_COLUMNS)
+        self.trace_replay = TraceReplay(
+            records, self.write_trace_record, speed,
+            on_finished=self.on_trace_replay_finished)
+        self.trace_replay.start()
+
+    def start_configured_trace_replay(self):
+        """
+        Use for start the trace replay of the device type configured in
+        the 'trace_replay' section of config.json, if any
+        """
+        settings = get_trace_replay_config(
+            self.read_polling_config(),
+            getattr(self.parent, 'current_device_type', None))
+        if settings is None:
+            return
+        try:
+            self.start_trace_replay(settings['file'], settings['speed'],
+                                    settings['columns'],
+                                    settings['time_column'])
+            logging.info(f'Replay trace {settings["file"]} at '
+                         f'{settings["speed"]}x')
+        except Exception as e:
+            logging.error(f'Can not replay trace {settings["file"]}: '
+                          + str(e))
+
+    def stop_trace_replay(self):
+        """
+        Use for stop the trace replay
+        """
+        if self.trace_replay is not None:
+            self.trace_replay.stop()
+            self.trace_replay = None
+
+    def write_trace_record(self, data):
+        """
+        Queue the attributes of a replayed trace record as one write,
+        the records are merged until it is sent when the replay is faster
+        than the device
+        :param data {dict}: The attributes to set through the rpc client
+        """
+        with self.trace_lock:
+            merge_record(self.trace_record, data)
+        self.queue_write('trace_record', self.send_trace_record)
+
+    def send_trace_record(self):
+        """
+        Send the merged replayed records, on the write queue
+        """
+        with self.trace_lock:
+            data, self.trace_record = self.trace_record, {}
+        if data:
+            self.set_trace_record(data)
+
+    def set_trace_record(self, data):
+        """
+        Set the attributes of the merged replayed records in one rpc call
+        :param data {dict}: The attributes to set through the rpc client
+        """
+        self.client.set(data)
+
+    def on_trace_replay_finished(self):
+        """
+        Handle the trace replay after the last record
         """
-        if self.update_value_status_thread is not None:
-            self.update_value_status_thread.stop()
+        logging.info(f'Trace replay finished, RPC Port: '
+                     f'{str(self.parent.rpcPort)}')
 
     def stop_update_state_thread(self):
         """
-        Use for stop thread update device value
-        when update random value by timer on UI
+        Use for stop polling device value from Backend (matter device)
         """
-        if self.update_device_status_thread is not None:
-            self.update_device_status_thread.stop()
+        if self.poll_job is not None:
+            PollScheduler.instance().remove(self.poll_job)
+            self.client.remove_write_listener(self.poll_job.kick)
+            self.poll_job = None
 
     def stop_client_rpc(self):
         """
         Stop rpc client process
         """
+        self.write_queue.cancel()
         if self.client is not None:
             self.client.stop()
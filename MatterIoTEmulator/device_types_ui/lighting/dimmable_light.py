@@ -22,9 +22,7 @@ from qtwidgets import Toggle
 import logging
 import threading
 import os
-import time
 from rpc.lighting_client import LightingClient
-from ..stoppablethread import UpdateStatusThread
 from constants import *
 from ..device_base_ui import *
 
@@ -47,6 +45,8 @@ class DimmableLight(BaseDeviceUI):
         :param parent: An UI object load DimmableLight device UI controller.
         """
         super().__init__(parent)
+        self.emit_changed_status_only = True
+        self.skip_poll_on_control = True
         self.on_off = True
         self.level = 25
 
@@ -88,6 +88,21 @@ class DimmableLight(BaseDeviceUI):
         self.sl_level.sliderPressed.connect(self.on_pressed_event)
         self.parent.ui.lo_controller.addWidget(self.sl_level)
 
+        # Widgets set from the polled attributes, the sliders keep
+        # their signals to refresh their labels
+        self.bind_attribute(
+            'device_status.on', self.sw, 'setCheckState',
+            lambda on: Qt.Checked if on else Qt.Unchecked,
+            block_signals=False,
+            mute=((self.sw.stateChanged, self.handle_onoff_changed),))
+        self.bind_attribute(('device_status.on', 'device_status.level'),
+                            self.lbl_main_status, 'setText',
+                            lambda on, level: 'Light {}\n{}%'.format(
+                                'On' if on else 'Off', round(level / 2.54)))
+        self.bind_attribute('device_status.level', self.sl_level, 'setValue',
+                            lambda level: round(level / 2.54),
+                            block_signals=False)
+
         # Init rpc
         self.client = LightingClient(self.config)
         self.set_initial_value()
@@ -129,13 +144,11 @@ class DimmableLight(BaseDeviceUI):
         :param data: Value of on-off attribute, 0: False, other True
         """
         logging.info("RPC SET On/Off: " + str(data))
-        self.mutex.acquire(timeout=1)
         if data == 0:
             self.on_off = False
         else:
             self.on_off = True
         self.client.set({"on": self.on_off})
-        self.mutex.release()
 
     def handle_level_changed(self):
         """
@@ -144,10 +157,14 @@ class DimmableLight(BaseDeviceUI):
         """
         self.level = round(self.sl_level.value() * 2.54)
         logging.info("RPC SET Level: " + str(self.level))
-        self.mutex.acquire(timeout=1)
+        self.queue_control_write('level', self.set_level)
+
+    def set_level(self):
+        """
+        Set on/off and level attribute to matter device(backend)
+        through rpc service, read when the queued write is sent
+        """
         self.client.set({'on': self.on_off, "level": self.level})
-        self.mutex.release()
-        self.is_on_control = False
 
     def on_device_status_changed(self, result):
         """
@@ -162,44 +179,10 @@ class DimmableLight(BaseDeviceUI):
             device_state = result['device_state']
             self.parent.update_device_state(device_state)
             if device_status['status'] == 'OK':
-                self.level = round(device_status['reply'].get('level') / 2.54)
-                self.sl_level.setValue(int(self.level))
-
                 self.on_off = device_status['reply'].get('on')
-                if self.on_off:
-                    self.lbl_main_status.setText(
-                        'Light On\n{}%'.format(self.level))
-                    self.sw.setCheckState(Qt.Checked)
-                else:
-                    self.lbl_main_status.setText(
-                        'Light Off\n{}%'.format(self.level))
-                    self.sw.setCheckState(Qt.Unchecked)
         except Exception as e:
             logging.error("Error: " + str(e))
 
-    def update_device_status(self):
-        """
-        Update value for all attributes on UI
-        when set timer for change random attribute value
-        """
-        try:
-            while self.check_condition_update_status(
-                    self.update_device_status_thread):
-                try:
-                    if not self.is_on_control:
-                        self.mutex.acquire(timeout=1)
-                        device_status = self.client.get()
-                        device_state = self.client.get_device_state()
-                        self.mutex.release()
-                        self.sig_device_status_changed.emit(
-                            {'device_status': device_status, 'device_state': device_state})
-                    time.sleep(0.5)
-                except Exception as e:
-                    logging.error(
-                        f'{str(e)} , RPC Port: {str(self.parent.rpcPort)}')
-        except Exception as e:
-            logging.error(str(e))
-
     def stop(self):
         """
         Stop thread update device status
@@ -23,9 +23,7 @@ import colorsys
 import logging
 import threading
 import os
-import time
 from rpc.lighting_client import LightingClient
-from ..stoppablethread import UpdateStatusThread
 from constants import *
 from ..device_base_ui import *
 
@@ -48,6 +46,8 @@ class ExtendedColorLight(BaseDeviceUI):
         :param parent: An UI object load ExtendedColorLight device UI controller.
         """
         super().__init__(parent)
+        self.emit_changed_status_only = True
+        self.skip_poll_on_control = True
         self.on_off = True
         self.level = 25
         self.color_hue = 30
@@ -135,6 +135,26 @@ class ExtendedColorLight(BaseDeviceUI):
         self.grid_layout.addWidget(self.lb_color, 6, 0)
         self.parent.ui.lo_controller.addLayout(self.grid_layout)
 
+        # Widgets set from the polled attributes, the sliders keep
+        # their signals to refresh their labels
+        self.bind_attribute(
+            'device_status.on', self.sw, 'setCheckState',
+            lambda on: Qt.Checked if on else Qt.Unchecked,
+            block_signals=False,
+            mute=((self.sw.stateChanged, self.handle_onoff_changed),))
+        self.bind_attribute(('device_status.on', 'device_status.level'),
+                            self.lbl_main_status, 'setText',
+                            lambda on, level: 'Light {}\n{}%'.format(
+                                'On' if on else 'Off', round(level / 2.54)))
+        self.bind_attribute('device_status.level', self.sl_level, 'setValue',
+                            lambda level: round(level / 2.54),
+                            block_signals=False)
+        self.bind_attribute('device_status.color.hue', self.sl_hue, 'setValue',
+                            round, block_signals=False)
+        self.bind_attribute('device_status.color.saturation',
+                            self.sl_saturation, 'setValue', round,
+                            block_signals=False)
+
         # Init rpc
         self.client = LightingClient(self.config)
         self.set_initial_value()
@@ -248,13 +268,11 @@ class ExtendedColorLight(BaseDeviceUI):
         :param data: Value of on-off attribute, 0: False, other True
         """
         logging.info("RPC SET On/Off: " + str(data))
-        self.mutex.acquire(timeout=1)
         if data == 0:
             self.on_off = False
         else:
             self.on_off = True
         self.client.set({"on": self.on_off})
-        self.mutex.release()
 
     def handle_level_changed(self):
         """
@@ -263,10 +281,14 @@ class ExtendedColorLight(BaseDeviceUI):
         """
         self.level = round(self.sl_level.value() * 2.54)
         logging.info("RPC SET Level: " + str(self.level))
-        self.mutex.acquire(timeout=1)
+        self.queue_control_write('level', self.set_level)
+
+    def set_level(self):
+        """
+        Set on/off and level attribute to matter device(backend)
+        through rpc service, read when the queued write is sent
+        """
         self.client.set({'on': self.on_off, "level": self.level})
-        self.mutex.release()
-        self.is_on_control = False
 
     def handle_color_hue_changed(self):
         """
@@ -275,12 +297,7 @@ class ExtendedColorLight(BaseDeviceUI):
         """
         self.color_hue = self.sl_hue.value()
         logging.info("RPC SET Hue: " + str(self.color_hue))
-        self.mutex.acquire(timeout=1)
-        self.client.set({'on': self.on_off,
-                         'color': {'hue': self.color_hue,
-                                   'saturation': self.color_saturation}})
-        self.mutex.release()
-        self.is_on_control = False
+        self.queue_control_write('color', self.set_color)
 
     def handle_color_saturation_changed(self):
         """
@@ -289,12 +306,17 @@ class ExtendedColorLight(BaseDeviceUI):
         """
         self.color_saturation = self.sl_saturation.value()
         logging.info("RPC SET Color Saturation: " + str(self.color_saturation))
-        self.mutex.acquire(timeout=1)
+        self.queue_control_write('color', self.set_color)
+
+    def set_color(self):
+        """
+        Set on/off, current hue and current saturation attribute to matter
+        device(backend) through rpc service, read when the queued write
+        is sent
+        """
         self.client.set({'on': self.on_off,
                          'color': {'hue': self.color_hue,
                                    'saturation': self.color_saturation}})
-        self.mutex.release()
-        self.is_on_control = False
 
     def on_device_status_changed(self, result):
         """
@@ -309,50 +331,10 @@ class ExtendedColorLight(BaseDeviceUI):
             device_state = result['device_state']
             self.parent.update_device_state(device_state)
             if device_status['status'] == 'OK':
-                self.level = round(device_status['reply'].get('level') / 2.54)
-                self.color_hue = round(device_status['reply']['color']['hue'])
-                self.color_saturation = round(
-                    device_status['reply']['color']['saturation'])
-
-                self.sl_level.setValue(int(self.level))
-                self.sl_hue.setValue(int(self.color_hue))
-                self.sl_saturation.setValue(int(self.color_saturation))
-
                 self.on_off = device_status['reply'].get('on')
-                if self.on_off:
-                    self.lbl_main_status.setText(
-                        'Light On\n{}%'.format(self.level))
-                    self.sw.setCheckState(Qt.Checked)
-                else:
-                    self.lbl_main_status.setText(
-                        'Light Off\n{}%'.format(self.level))
-                    self.sw.setCheckState(Qt.Unchecked)
         except Exception as e:
             logging.error("Error: " + str(e))
 
-    def update_device_status(self):
-        """
-        Update value for all attributes on UI
-        when set timer for change random attribute value
-        """
-        try:
-            while self.check_condition_update_status(
-                    self.update_device_status_thread):
-                try:
-                    if not self.is_on_control:
-                        self.mutex.acquire(timeout=1)
-                        device_status = self.client.get()
-                        device_state = self.client.get_device_state()
-                        self.mutex.release()
-                        self.sig_device_status_changed.emit(
-                            {'device_status': device_status, 'device_state': device_state})
-                    time.sleep(0.5)
-                except Exception as e:
-                    logging.error(
-                        f'{str(e)} , RPC Port: {str(self.parent.rpcPort)}')
-        except Exception as e:
-            logging.error(str(e))
-
     def stop(self):
         """
         Stop thread update device status
@@ -22,9 +22,7 @@ from qtwidgets import Toggle
 import logging
 import threading
 import os
-import time
 from rpc.lighting_client import LightingClient
-from ..stoppablethread import UpdateStatusThread
 from constants import *
 from ..device_base_ui import *
 
@@ -47,6 +45,7 @@ class OnOffLight(BaseDeviceUI):
         :param parent: An UI object load OnOffLight device UI controller.
         """
         super().__init__(parent)
+        self.emit_changed_status_only = True
         self.on_off = True
 
         # Show icon
@@ -70,6 +69,15 @@ class OnOffLight(BaseDeviceUI):
         self.sw.stateChanged.connect(self.handle_onoff_changed)
         self.parent.ui.lo_controller.addWidget(self.sw)
 
+        # Widgets set from the polled attributes
+        self.bind_attribute(
+            'device_status.on', self.sw, 'setCheckState',
+            lambda on: Qt.Checked if on else Qt.Unchecked,
+            block_signals=False,
+            mute=((self.sw.stateChanged, self.handle_onoff_changed),))
+        self.bind_attribute('device_status.on', self.lbl_main_status,
+                            'setText', lambda on: 'On' if on else 'Off')
+
         # Init rpc
         self.client = LightingClient(self.config)
         self.set_initial_value()
@@ -99,13 +107,11 @@ class OnOffLight(BaseDeviceUI):
         :param data: Value of on-off attribute, 0: False, other True
         """
         logging.info("RPC SET On/Off: " + str(data))
-        self.mutex.acquire(timeout=1)
         if data == 0:
             self.on_off = False
         else:
             self.on_off = True
         self.client.set({"on": self.on_off})
-        self.mutex.release()
 
     def on_device_status_changed(self, result):
         """
@@ -121,12 +127,6 @@ class OnOffLight(BaseDeviceUI):
             self.parent.update_device_state(device_state)
             if device_status['status'] == 'OK':
                 self.on_off = device_status['reply'].get('on')
-                if self.on_off:
-                    self.lbl_main_status.setText('On')
-                    self.sw.setCheckState(Qt.Checked)
-                else:
-                    self.lbl_main_status.setText('Off')
-                    self.sw.setCheckState(Qt.Unchecked)
         except Exception as e:
             logging.error("Error: " + str(e))
 
@@ -23,8 +23,6 @@ import logging
 from rpc.pump_client import PumpClient
 import threading
 import os
-import time
-from ..stoppablethread import UpdateStatusThread
 from ..constants_device import *
 from constants import *
 from ..device_base_ui import *
@@ -49,6 +47,8 @@ class Pump(BaseDeviceUI):
         :param parent: An UI object load Pump device UI controller.
         """
         super().__init__(parent)
+        self.emit_changed_status_only = True
+        self.skip_poll_on_control = True
         self.on_off = True
         self.level = 25
         self.value_temp = 3197
@@ -308,13 +308,11 @@ class Pump(BaseDeviceUI):
         :param data: Value of on-off attribute, 0: False, other True
         """
         logging.info("RPC SET On/Off: " + str(data))
-        self.mutex.acquire(timeout=1)
         if data == 0:
             self.on_off = False
         else:
             self.on_off = True
         self.client.set({"on": self.on_off})
-        self.mutex.release()
 
     def handle_level_changed(self):
         """
@@ -323,10 +321,14 @@ class Pump(BaseDeviceUI):
         """
         self.level = round(self.sl_level.value() * 2)
         logging.info("RPC SET Level: " + str(self.level))
-        self.mutex.acquire(timeout=1)
+        self.queue_control_write('level', self.set_level)
+
+    def set_level(self):
+        """
+        Set on/off and level attribute to matter device(backend)
+        through rpc service, read when the queued write is sent
+        """
         self.client.set({'on': self.on_off, "level": self.level})
-        self.mutex.release()
-        self.is_on_control = False
 
     def handle_operation_mode_changed(self, mode):
         """
@@ -345,8 +347,6 @@ class Pump(BaseDeviceUI):
         else:
             self.client.set({'on': self.on_off, "operation_mode": mode})
             self.sl_level.setEnabled(False)
-        self.mutex.acquire(timeout=1)
-        self.mutex.release()
 
     def on_device_status_changed(self, result):
         """
@@ -407,29 +407,6 @@ class Pump(BaseDeviceUI):
         except Exception as e:
             logging.error("Error: " + str(e))
 
-    def update_device_status(self):
-        """
-        Update value for all attributes on UI
-        when set timer for change random attribute value
-        """
-        try:
-            while self.check_condition_update_status(
-                    self.update_device_status_thread):
-                try:
-                    if not self.is_on_control:
-                        self.mutex.acquire(timeout=1)
-                        device_status = self.client.get()
-                        device_state = self.client.get_device_state()
-                        self.mutex.release()
-                        self.sig_device_status_changed.emit(
-                            {'device_status': device_status, 'device_state': device_state})
-                    time.sleep(0.5)
-                except Exception as e:
-                    logging.error(
-                        f'{str(e)} , RPC Port: {str(self.parent.rpcPort)}')
-        except Exception as e:
-            logging.error(str(e))
-
     def stop(self):
         """
         Stop thread update device status
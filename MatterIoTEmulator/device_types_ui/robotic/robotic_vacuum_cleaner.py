@@ -21,12 +21,9 @@ from PySide2.QtWidgets import *
 from qtwidgets import Toggle
 import logging
 import threading
-from threading import Timer
 import os
-import random
-import time
 from rpc.robotvacuum_client import RobotVacuumClient
-from ..stoppablethread import UpdateStatusThread
+from rpc.poll_scheduler import PollScheduler
 from constants import *
 from ..device_base_ui import *
 
@@ -252,8 +249,7 @@ class RobotVacuum(BaseDeviceUI):
                 {'rvcOpStatePhase': {'currentPhase': self.cr_phase}})
             self.client.set({'runMode': {'currentMode': IDLE}})
             self.lbl_time.setText('...Cleaning process Done...')
-            dockingTimer = Timer(5, self.set_crphase_drying)
-            dockingTimer.start()
+            PollScheduler.instance().call_later(5, self.set_crphase_drying)
 
         elif 20 < self.countdown_time <= 30:
             self.cr_phase = CLEANING_PHASE
@@ -350,13 +346,11 @@ class RobotVacuum(BaseDeviceUI):
                 return
 
         self.disable_error_text()
-        self.mutex.acquire(timeout=1)
         if ((newMode == MAPPING) or (newMode == IDLE)):
             self.countdown_time = 20
         else:
             pass
         self.client.set({'runMode': {'currentMode': newMode}})
-        self.mutex.release()
 
     def handle_clean_mode_changed(self, newMode):
         """
@@ -374,9 +368,7 @@ class RobotVacuum(BaseDeviceUI):
             return
 
         self.disable_error_text()
-        self.mutex.acquire(timeout=1)
         self.client.set({'cleanMode': {'currentMode': newMode}})
-        self.mutex.release()
 
     def notify_process_stopped(self):
         """Notify process of run mode stopped"""
@@ -387,7 +379,6 @@ class RobotVacuum(BaseDeviceUI):
         Handle operational state command when operational state index change
         :param mode: A new mode of rvc operational state cluster
         """
-        self.mutex.acquire(timeout=1)
         self.lbl_error_status_mode.setText("")
         if mode == STOP:
             if (self.run_mode != MAPPING):
@@ -403,8 +394,7 @@ class RobotVacuum(BaseDeviceUI):
                 {'rvcOpStatePhase': {'currentPhase': self.cr_phase}})
             self.run_mode = IDLE
             self.client.set({'runMode': {'currentMode': self.run_mode}})
-            statusTimer = Timer(2, self.notify_process_stopped)
-            statusTimer.start()
+            QTimer.singleShot(2000, self.notify_process_stopped)
 
         elif mode == START:
             self.client.set({'rvcOpStateIndex': {
@@ -447,7 +437,6 @@ class RobotVacuum(BaseDeviceUI):
                 {'rvcOpStateIndex': {'errState': self.cr_error_state, 'crOpStateIndex': RESUME}})
             self.client.set(
                 {'rvcOpStatePhase': {'currentPhase': self.cr_phase}})
-        self.mutex.release()
 
     def on_pressed_event(self):
         """Slider pressed handler"""
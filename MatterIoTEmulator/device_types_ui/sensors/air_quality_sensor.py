@@ -20,11 +20,8 @@ from PySide2.QtGui import *
 from PySide2.QtWidgets import *
 import logging
 import threading
-import random
 import os
-import time
 from rpc.airqualitysensor_client import AirqualityClient
-from ..stoppablethread import UpdateStatusThread
 from ..constants_device import *
 from constants import *
 from ..device_base_ui import *
@@ -44,12 +41,145 @@ POOR = 4
 VERY_POOR = 5
 EXTREMELY_POOR = 6
 
+# Text and style of the air quality button by air quality value
+AIR_QUALITY_STYLES = {
+    UNKNOWN: ('Unknown', "background-color: green"),
+    GOOD: ('Good', "background-color: #66FF00; color: black"),
+    FAIR: ('Fair', "background-color: #FFFF33; color: black"),
+    MODERATE: ('Moderate', "background-color: #FF9900; color: black"),
+    POOR: ('Poor', "background-color: #FF6699; color: black"),
+    VERY_POOR: ('Very Poor', "background-color: #CC66CC; color: black"),
+    EXTREMELY_POOR: ('Extremely Poor',
+                     "background-color: #996699; color: black")}
+
+PM25_PATH = 'device_status.pm25ConcentrationMeasurement.measuredValue'
+AIR_QUALITY_PATH = 'device_status.airQuality.airQuality'
+
+# Measurements of the sensor: name, cluster, line edit, scale of the
+# line edit value, largest attribute value, range message and edit flag.
+# Temperature and humidity are set in 0.01 units
+MEASUREMENTS = (
+    ('temperature', 'temperatureMeasurement', 'line_edit_temp', 100, 10000,
+     ER_TEMP, 'is_edit_temp'),
+    ('humidity', 'relativeHumidityMeasurement', 'line_edit_hum', 100,
+     10000, ER_HUM, 'is_edit_hum'),
+    ('pm25', 'pm25ConcentrationMeasurement', 'line_edit_pm25', 1, 300,
+     ER_PM25, 'is_edit_pm25'),
+    ('co', 'carbonMonoxideConcentrationMeasurement', 'line_edit_co', 1,
+     300, ER_CO, 'is_edit_co'),
+    ('co2', 'carbonDioxideConcentrationMeasurement', 'line_edit_co2', 1,
+     300, ER_CO2, 'is_edit_co2'),
+    ('no2', 'nitrogenDioxideConcentrationMeasurement', 'line_edit_no2', 1,
+     300, ER_NO2, 'is_edit_no2'),
+    ('o3', 'ozoneConcentrationMeasurement', 'line_edit_o3', 1, 300, ER_O3,
+     'is_edit_o3'),
+    ('ch2o', 'formaldehydeConcentrationMeasurement', 'line_edit_ch2o', 1,
+     300, ER_CH2O, 'is_edit_ch2o'),
+    ('pm1', 'pm1ConcentrationMeasurement', 'line_edit_pm1', 1, 300, ER_PM1,
+     'is_edit_pm1'),
+    ('pm10', 'pm10ConcentrationMeasurement', 'line_edit_pm10', 1, 300,
+     ER_PM10, 'is_edit_pm10'),
+    ('radon', 'radonConcentrationMeasurement', 'line_edit_rn', 1, 300,
+     ER_RN, 'is_edit_rn'),
+    ('tvoc', 'totalVolatileOrganicCompoundsConcentrationMeasurement',
+     'line_edit_tvoc', 1, 300, ER_TVOC, 'is_edit_tvoc'))
+
+# Models of the random measurements in 0.01 units, by measurement name.
+# The concentrations drift around their base, pm2.5 also jumps now and
+# then so the air quality changes
+RANDOM_MODELS = {
+    'temperature': ('diurnal', {'base': 2200, 'amplitude': 400,
+                                'peak': 15 * 3600, 'walk': 5, 'noise': 10,
+                                'group': 'climate', 'correlation': 0.8}),
+    'humidity': ('diurnal', {'base': 5000, 'amplitude': -800,
+                             'peak': 15 * 3600, 'walk': 10, 'noise': 20,
+                             'group': 'climate', 'correlation': 0.8}),
+    'pm25': ('step', {'base': 2000, 'step_rate': 1 / 60.0,
+                      'step_size': 5000, 'walk': 50, 'revert': 0.005,
+                      'noise': 20})}
+CONCENTRATION_MODEL = ('random_walk', {'base': 500, 'walk': 20,
+                                       'revert': 0.01, 'noise': 5})
+
+
+def air_quality_of(pm25):
+    """
+    Return the air quality of a pm2.5 measurement
+    :param pm25 {float}: Value of pm2.5 measurement
+    """
+    for limit, quality in ((50, GOOD), (100, FAIR), (150, MODERATE),
+                           (200, POOR), (250, VERY_POOR),
+                           (300, EXTREMELY_POOR)):
+        if 0 < pm25 <= limit:
+            return quality
+    return UNKNOWN
+
+
+def parse_measurement(text, scale):
+    """
+    Return the attribute value of a line edit text
+    :param text {str}: The text of the line edit
+    :param scale {int}: 100 for a value set in 0.01 units
+    """
+    if scale == 1:
+        return round(float(text), 2)
+    return round(float(text) * scale)
+
+
+def set_air_quality_button(button, style):
+    """
+    Show an air quality on the air quality button
+    :param button {QPushButton}: The air quality button
+    :param style {tuple}: Text and style sheet of the air quality
+    """
+    if style is None:
+        return
+    button.setText(style[0])
+    button.setStyleSheet(style[1])
+    button.adjustSize()
+
 
 class AirQualitySensor(BaseDeviceUI):
     """
     AirQualitySensor device UI controller represent some attribues, clusters
     and endpoints corresspoding to Matter Specification v1.2
     """
+    # Measurements of recorded traces, temperature in C and humidity in %
+    # are set in 0.01 units
+    TRACE_COLUMNS = {
+        'temperature': {'attribute': 'temperatureMeasurement.measuredValue',
+                        'scale': 100},
+        'humidity': {
+            'attribute': 'relativeHumidityMeasurement.measuredValue',
+            'scale': 100},
+        'pm25': {'attribute': 'pm25ConcentrationMeasurement.measuredValue',
+                 'type': 'float'},
+        'pm1': {'attribute': 'pm1ConcentrationMeasurement.measuredValue',
+                'type': 'float'},
+        'pm10': {'attribute': 'pm10ConcentrationMeasurement.measuredValue',
+                 'type': 'float'},
+        'co': {
+            'attribute':
+                'carbonMonoxideConcentrationMeasurement.measuredValue',
+            'type': 'float'},
+        'co2': {
+            'attribute': 'carbonDioxideConcentrationMeasurement.measuredValue',
+            'type': 'float'},
+        'no2': {
+            'attribute':
+                'nitrogenDioxideConcentrationMeasurement.measuredValue',
+            'type': 'float'},
+        'o3': {'attribute': 'ozoneConcentrationMeasurement.measuredValue',
+               'type': 'float'},
+        'ch2o': {
+            'attribute': 'formaldehydeConcentrationMeasurement.measuredValue',
+            'type': 'float'},
+        'radon': {'attribute': 'radonConcentrationMeasurement.measuredValue',
+                  'type': 'float'},
+        'tvoc': {
+            'attribute':
+                'totalVolatileOrganicCompoundsConcentrationMeasurement'
+                '.measuredValue',
+            'type': 'float'}}
 
     def __init__(self, parent) -> None:
         """
@@ -57,8 +187,8 @@ class AirQualitySensor(BaseDeviceUI):
         :param parent: An UI object load AirQualitySensor device UI controller.
         """
         super().__init__(parent)
-        self.temperature = 0
-        self.humidity = 0
+        self.emit_changed_status_only = True
+        self.pm25 = 0
         self.concentration = 0
         self.airquality = UNKNOWN
         self.time_repeat = 0
@@ -421,11 +551,82 @@ class AirQualitySensor(BaseDeviceUI):
         self.line_edit_rn.returnPressed.connect(self.on_return_pressed)
         self.parent.ui.lo_controller.addLayout(self.grid_layout_rn)
 
+        # Add UI for set timer UI, every tick sets random values of all
+        # measurements in one rpc call
+        self.lbl_remaining_time_interval = QLabel()
+        self.lbl_remaining_time_interval.setText(
+            'Remaining time of interval: 0 sec')
+        self.lbl_remaining_time_interval.setAlignment(Qt.AlignCenter)
+        self.parent.ui.lo_controller.addWidget(
+            self.lbl_remaining_time_interval)
+        self.lbl_remain_repeat_time = QLabel()
+        self.lbl_remain_repeat_time.setText('Remaining count: 0')
+        self.lbl_remain_repeat_time.setAlignment(Qt.AlignCenter)
+        self.parent.ui.lo_controller.addWidget(self.lbl_remain_repeat_time)
+        # Label time interval
+        self.lbl_time_edit = QLabel()
+        self.lbl_time_edit.setText("Interval(sec)")
+        # Time Edit
+        self.time_edit = QTimeEdit()
+        self.time_edit.setDisplayFormat('ss')
+        self.time_edit.setFixedHeight(30)
+        self.time_edit.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        # Label count repeat
+        self.lbl_count_repeat = QLabel()
+        self.lbl_count_repeat.setText("Count")
+        self.qline_count = QLineEdit("0")
+        self.qline_count.setValidator(QIntValidator(0, 6000, self))
+        self.qline_count.setFixedHeight(30)
+        self.qline_count.setSizePolicy(
+            QSizePolicy.Expanding, QSizePolicy.Fixed)
+        self.set_time_button = QPushButton()
+        self.set_time_button.setText("Start")
+        self.set_time_button.setMaximumSize(QSize(120, 100))
+        self.set_time_button.clicked.connect(self.click_set)
+        self.stop_button = QPushButton()
+        self.stop_button.setText("Stop")
+        self.stop_button.setMaximumSize(QSize(120, 100))
+        self.stop_button.clicked.connect(self.on_stop_button_clicked)
+        # Layout widget
+        self.grid_layout_timer = QGridLayout()
+        self.grid_layout_timer.setSpacing(10)
+        self.grid_layout_timer.addWidget(self.lbl_time_edit, 0, 0)
+        self.grid_layout_timer.addWidget(self.time_edit, 0, 1)
+        self.grid_layout_timer.addWidget(self.lbl_count_repeat, 1, 0)
+        self.grid_layout_timer.addWidget(self.qline_count, 1, 1)
+        self.grid_layout_button = QGridLayout()
+        self.grid_layout_button.addWidget(self.set_time_button, 2, 0)
+        self.grid_layout_button.addWidget(self.stop_button, 2, 1)
+
+        self.parent.ui.lo_controller.addWidget(QLabel(""))
+        self.parent.ui.lo_controller.addLayout(self.grid_layout_timer)
+        self.parent.ui.lo_controller.addWidget(QLabel(""))
+        self.parent.ui.lo_controller.addLayout(self.grid_layout_button)
+
+        # Widgets set from the polled attributes, the line edits
+        # only while the user is not editing them
+        self.bind_attribute(
+            AIR_QUALITY_PATH, self.bt_air, set_air_quality_button,
+            AIR_QUALITY_STYLES.get)
+        for _, cluster, line_edit, scale, _, _, edit_flag in MEASUREMENTS:
+            self.bind_attribute(
+                'device_status.' + cluster + '.measuredValue',
+                getattr(self, line_edit), 'setText',
+                lambda value, scale=scale: str(round(float(value) / scale, 2)),
+                enabled=lambda edit_flag=edit_flag: getattr(self, edit_flag))
+
+        # Random values of all measurements, read together every tick
+        for name, _, _, scale, high, _, _ in MEASUREMENTS:
+            model, params = RANDOM_MODELS.get(name, CONCENTRATION_MODEL)
+            self.add_value_model(0, high * 100 // scale, model, name=name,
+                                 **params)
+
         # Init rpc
         self.client = AirqualityClient(self.config)
         self.contact_value = True
         self.set_initial_value()
         self.start_update_device_status_thread()
+        self.start_configured_trace_replay()
 
         logging.debug("Init contact sensor done")
 
@@ -495,135 +696,64 @@ class AirQualitySensor(BaseDeviceUI):
         """
         Handle update all concentrance measurement attributes
         to matter device(backend) through rpc service
-        after enter value to line edit done
+        after enter value to line edit done, the changed measurements
+        and the air quality are sent in one rpc call
         """
+        measurements = {}
+        errors = []
+        for _, cluster, line_edit, scale, high, error, edit_flag in \
+                MEASUREMENTS:
+            line_edit = getattr(self, line_edit)
+            try:
+                value = parse_measurement(line_edit.text(), scale)
+            except ValueError:
+                value = None
+            if value is None or not 0 <= value <= high:
+                errors.append(error)
+                self.binder.refresh(line_edit)
+                continue
+            setattr(self, edit_flag, True)
+            path = 'device_status.' + cluster + '.measuredValue'
+            if value != self.binder.get(path):
+                measurements[cluster] = value
         try:
-            value_temp = round(float(self.line_edit_temp.text()) * 100)
-            value_hum = round(float(self.line_edit_hum.text()) * 100)
-            value_pm25 = round(float(self.line_edit_pm25.text()), 2)
-            value_co = round(float(self.line_edit_co.text()), 2)
-            value_co2 = round(float(self.line_edit_co2.text()), 2)
-            value_no2 = round(float(self.line_edit_no2.text()), 2)
-            value_o3 = round(float(self.line_edit_o3.text()), 2)
-            value_ch2o = round(float(self.line_edit_ch2o.text()), 2)
-            value_pm1 = round(float(self.line_edit_pm1.text()), 2)
-            value_pm10 = round(float(self.line_edit_pm10.text()), 2)
-            value_tvoc = round(float(self.line_edit_tvoc.text()), 2)
-            value_rn = round(float(self.line_edit_rn.text()), 2)
-
-            if 0 <= value_temp <= 10000:
-                data = {
-                    'temperatureMeasurement': {
-                        'measuredValue': value_temp}}
-                self.client.set(data)
-                self.is_edit_temp = True
-            else:
-                self.message_box(ER_TEMP)
-                self.line_edit_temp.setText(str(self.temperature))
-
-            if 0 <= value_hum <= 10000:
-                data = {
-                    'relativeHumidityMeasurement': {
-                        'measuredValue': value_hum}}
-                self.client.set(data)
-                self.is_edit_hum = True
-            else:
-                self.message_box(ER_HUM)
-                self.line_edit_hum.setText(str(self.humidity))
-
-            if 0 <= value_pm25 <= 300:
-                data = {
-                    'pm25ConcentrationMeasurement': {
-                        'measuredValue': value_pm25}}
-                self.client.set(data)
-                self.is_edit_pm25 = True
-            else:
-                self.message_box(ER_PM25)
-                self.line_edit_pm25.setText(str(self.pm25))
-
-            if 0 <= value_co <= 300:
-                data = {'carbonMonoxideConcentrationMeasurement':
-                            {'measuredValue': value_co}}
-                self.client.set(data)
-                self.is_edit_co = True
-            else:
-                self.message_box(ER_CO)
-                self.line_edit_co.setText(str(self.co))
-
-            if 0 <= value_co2 <= 300:
-                data = {'carbonDioxideConcentrationMeasurement':
-                            {'measuredValue': value_co2}}
-                self.client.set(data)
-                self.is_edit_co2 = True
-            else:
-                self.message_box(ER_CO2)
-                self.line_edit_co2.setText(str(self.co2))
-
-            if 0 <= value_no2 <= 300:
-                data = {'nitrogenDioxideConcentrationMeasurement':
-                            {'measuredValue': value_no2}}
-                self.client.set(data)
-                self.is_edit_no2 = True
-            else:
-                self.message_box(ER_NO2)
-                self.line_edit_no2.setText(str(self.no2))
-            if 0 <= value_o3 <= 300:
-                data = {'ozoneConcentrationMeasurement':
-                            {'measuredValue': value_o3}}
-                self.client.set(data)
-                self.is_edit_o3 = True
-            else:
-                self.message_box(ER_O3)
-                self.line_edit_o3.setText(str(self.o3))
-            if 0 <= value_ch2o <= 300:
-                data = {
-                    'formaldehydeConcentrationMeasurement': {
-                        'measuredValue': value_ch2o}}
-                self.client.set(data)
-                self.is_edit_ch2o = True
-            else:
-                self.message_box(ER_CH2O)
-                self.line_edit_ch2o.setText(str(self.ch2o))
-            if 0 <= value_pm1 <= 300:
-                data = {
-                    'pm1ConcentrationMeasurement': {
-                        'measuredValue': value_pm1}}
-                self.client.set(data)
-                self.is_edit_pm1 = True
-            else:
-                self.message_box(ER_PM1)
-                self.line_edit_pm1.setText(str(self.pm1))
-            if 0 <= value_pm10 <= 300:
-                data = {
-                    'pm10ConcentrationMeasurement': {
-                        'measuredValue': value_pm10}}
-                self.client.set(data)
-                self.is_edit_pm10 = True
-            else:
-                self.message_box(ER_PM10)
-                self.line_edit_pm10.setText(str(self.pm10))
-            if 0 <= value_rn <= 300:
-                data = {
-                    'radonConcentrationMeasurement': {
-                        'measuredValue': value_rn}}
-                self.client.set(data)
-                self.is_edit_rn = True
-            else:
-                self.message_box(ER_RN)
-                self.line_edit_rn.setText(str(self.rn))
-
-            if 0 <= value_tvoc <= 300:
-                data = {
-                    'totalVolatileOrganicCompoundsConcentrationMeasurement': {
-                        'measuredValue': value_tvoc}}
-                self.client.set(data)
-                self.is_edit_tvoc = True
-            else:
-                self.message_box(ER_TVOC)
-                self.line_edit_tvoc.setText(str(self.tvoc))
-
+            self.set_measurements(measurements)
         except Exception as e:
             logging.error("Error: " + str(e))
+        if errors:
+            self.message_box('\n'.join(errors))
+
+    def set_measurements(self, measurements, attributes=None):
+        """
+        Set measurements and the air quality of the pm2.5 measurement
+        to matter device(backend) in one rpc call
+        :param measurements {dict}: Measured values by cluster
+        :param attributes {dict}: Other attributes set in the same call
+        """
+        data = dict(attributes or {})
+        data.update({cluster: {'measuredValue': value}
+                     for cluster, value in measurements.items()})
+        pm25 = measurements.get('pm25ConcentrationMeasurement')
+        if pm25 is not None:
+            self.pm25 = pm25
+            data['airQuality'] = {'airQuality': air_quality_of(pm25)}
+        if data:
+            self.client.set(data)
+
+    def set_trace_record(self, data):
+        """
+        Set the measurements of replayed trace records in one rpc call,
+        the air quality follows the replayed pm2.5 measurement
+        :param data {dict}: The attributes to set through the rpc client
+        """
+        measurements = {}
+        attributes = {}
+        for cluster, value in data.items():
+            if isinstance(value, dict) and 'measuredValue' in value:
+                measurements[cluster] = value['measuredValue']
+            else:
+                attributes[cluster] = value
+        self.set_measurements(measurements, attributes)
 
     def message_box(self, message):
         """
@@ -667,30 +797,78 @@ class AirQualitySensor(BaseDeviceUI):
 
     def check_pm25(self, pm25):
         """
-        Check value of pm2.5 measurement to set air quality attribute
+        Check value of pm2.5 measurement to set air quality attribute,
+        only when the device holds another air quality
         :param pm25: Value of pm2.5 measurement
         """
-        if 0 < self.pm25 <= 50:
-            data_air = {'airQuality': {'airQuality': GOOD}}
-            self.client.set(data_air)
-        elif 50 < self.pm25 <= 100:
-            data_air = {'airQuality': {'airQuality': FAIR}}
-            self.client.set(data_air)
-        elif 100 < self.pm25 <= 150:
-            data_air = {'airQuality': {'airQuality': MODERATE}}
-            self.client.set(data_air)
-        elif 150 < self.pm25 <= 200:
-            data_air = {'airQuality': {'airQuality': POOR}}
-            self.client.set(data_air)
-        elif 200 < self.pm25 <= 250:
-            data_air = {'airQuality': {'airQuality': VERY_POOR}}
-            self.client.set(data_air)
-        elif 250 < self.pm25 <= 300:
-            data_air = {'airQuality': {'airQuality': EXTREMELY_POOR}}
-            self.client.set(data_air)
+        air_quality = air_quality_of(pm25)
+        if air_quality != self.binder.get(AIR_QUALITY_PATH):
+            self.client.set({'airQuality': {'airQuality': air_quality}})
+
+    def get_time_info(self):
+        """
+        Get value of timer interval and repeat count
+        :return time_sleep, time_repeat: value of timer interval
+        and repeat count
+        """
+        value = self.time_edit.time()
+        time_sleep = value.second()
+        time_repeat = int(self.qline_count.text())
+        return time_sleep, time_repeat
+
+    def click_set(self):
+        """Handle when click start generate random value"""
+        try:
+            self.is_stop_clicked = False
+            self.set_time_button.setText("Restart")
+            self.stop_button.setText("Stop")
+            self.time_sleep, self.time_repeat = self.get_time_info()
+            self.start_value_timer(self.time_sleep, self.time_repeat)
+        except Exception as e:
+            logging.error("Error: " + str(e))
+
+    def on_stop_button_clicked(self):
+        """Handle when click stop generate random value"""
+        if self.is_value_timer_running():
+            if self.is_stop_clicked:
+                self.is_stop_clicked = False
+                self.stop_button.setText("Stop")
+                self.resume_value_timer()
+            else:
+                self.is_stop_clicked = True
+                self.stop_button.setText("Resume")
+                self.pause_value_timer()
         else:
-            data_air = {'airQuality': {'airQuality': UNKNOWN}}
-            self.client.set(data_air)
+            self.is_stop_clicked = False
+
+    def on_value_status_changed(self):
+        """
+        Update random values of all measurements and the air quality
+        to matter device(backend) in one rpc call
+        """
+        values = self.next_random_values()
+        measurements = {}
+        for name, cluster, _, scale, _, _, edit_flag in MEASUREMENTS:
+            setattr(self, edit_flag, True)
+            if scale == 1:
+                measurements[cluster] = round(values[name] / 100.0, 2)
+            else:
+                measurements[cluster] = values[name]
+        try:
+            self.set_measurements(measurements)
+        except Exception as e:
+            logging.error("Error: " + str(e))
+        remaining_time, remaining_count = self.value_timer_remaining()
+        self.lbl_remain_repeat_time.setText(
+            'Remaining count: ' + str(remaining_count))
+        self.lbl_remaining_time_interval.setText(
+            'Remaining time of interval: ' + str(remaining_time) + " sec")
+
+    def on_value_timer_finished(self):
+        """
+        Handle the random value timer after the last value
+        """
+        self.set_time_button.setText("Start")
 
     def on_device_status_changed(self, result):
         """
@@ -701,103 +879,22 @@ class AirQualitySensor(BaseDeviceUI):
         """
         # logging.info(f'on_device_status_changed {result}, RPC Port: {str(self.parent.rpcPort)}')
         try:
-            device_status = result['device_status']
             device_state = result['device_state']
             self.parent.update_device_state(device_state)
-            self.pm25 = round(
-                float(
-                    device_status['reply']['pm25ConcentrationMeasurement']['measuredValue']), 2)
-            if self.is_edit_pm25:
-                self.line_edit_pm25.setText(str(self.pm25))
-            self.check_pm25(self.pm25)
-            if device_status['status'] == 'OK':
-                self.airquality = device_status['reply']['airQuality']['airQuality']
-                if self.airquality == UNKNOWN:
-                    self.bt_air.setText('Unknown')
-                    self.bt_air.setStyleSheet("background-color: green")
-                elif self.airquality == GOOD:
-                    self.bt_air.setText('Good')
-                    self.bt_air.setStyleSheet(
-                        "background-color: #66FF00; color: black")
-                elif self.airquality == FAIR:
-                    self.bt_air.setText('Fair')
-                    self.bt_air.setStyleSheet(
-                        "background-color: #FFFF33; color: black")
-                elif self.airquality == MODERATE:
-                    self.bt_air.setText('Moderate')
-                    self.bt_air.setStyleSheet(
-                        "background-color: #FF9900; color: black")
-                elif self.airquality == POOR:
-                    self.bt_air.setText('Poor')
-                    self.bt_air.setStyleSheet(
-                        "background-color: #FF6699; color: black")
-                elif self.airquality == VERY_POOR:
-                    self.bt_air.setText('Very Poor')
-                    self.bt_air.setStyleSheet(
-                        "background-color: #CC66CC; color: black")
-                elif self.airquality == EXTREMELY_POOR:
-                    self.bt_air.setText('Extremely Poor')
-                    self.bt_air.setStyleSheet(
-                        "background-color: #996699; color: black")
-                self.bt_air.adjustSize()
-            self.temperature = round(
-                (device_status['reply']['temperatureMeasurement']['measuredValue']) / 100.0, 2)
-            if self.is_edit_temp:
-                self.line_edit_temp.setText(str(self.temperature))
-
-            self.humidity = round(
-                (device_status['reply']['relativeHumidityMeasurement']['measuredValue']) / 100.0, 2)
-            if self.is_edit_hum:
-                self.line_edit_hum.setText(str(self.humidity))
-
-            self.co = round(
-                float(
-                    device_status['reply']['carbonMonoxideConcentrationMeasurement']['measuredValue']), 2)
-            if self.is_edit_co:
-                self.line_edit_co.setText(str(self.co))
-            self.co2 = round(
-                float(
-                    device_status['reply']['carbonDioxideConcentrationMeasurement']['measuredValue']), 2)
-            if self.is_edit_co2:
-                self.line_edit_co2.setText(str(self.co2))
-            self.no2 = round(
-                float(
-                    device_status['reply']['nitrogenDioxideConcentrationMeasurement']['measuredValue']), 2)
-            if self.is_edit_no2:
-                self.line_edit_no2.setText(str(self.no2))
-            self.o3 = round(
-                float(
-                    device_status['reply']['ozoneConcentrationMeasurement']['measuredValue']), 2)
-            if self.is_edit_o3:
-                self.line_edit_o3.setText(str(self.o3))
-            self.ch2o = round(
-                float(
-                    device_status['reply']['formaldehydeConcentrationMeasurement']['measuredValue']), 2)
-            if self.is_edit_ch2o:
-                self.line_edit_ch2o.setText(str(self.ch2o))
-            self.pm1 = round(
-                float(
-                    device_status['reply']['pm1ConcentrationMeasurement']['measuredValue']), 2)
-            if self.is_edit_pm1:
-                self.line_edit_pm1.setText(str(self.pm1))
-            self.pm10 = round(
-                float(
-                    device_status['reply']['pm10ConcentrationMeasurement']['measuredValue']), 2)
-            if self.is_edit_pm10:
-                self.line_edit_pm10.setText(str(self.pm10))
-            self.rn = round(
-                float(
-                    device_status['reply']['radonConcentrationMeasurement']['measuredValue']), 2)
-            if self.is_edit_rn:
-                self.line_edit_rn.setText(str(self.rn))
-            self.tvoc = round(
-                float(
-                    device_status['reply']['totalVolatileOrganicCompoundsConcentrationMeasurement']['measuredValue']), 2)
-            if self.is_edit_tvoc:
-                self.line_edit_tvoc.setText(str(self.tvoc))
-
-            # self.lbl_remain_repeat_time.setText('Remaining count: ' + str(self.time_repeat))
-            # self.lbl_remaining_time_interval.setText('Remaining time of interval: ' + str(self.remaining_time_interval) + " sec")
+        except Exception as e:
+            logging.error("Error: " + str(e))
+
+    def on_device_attributes_changed(self, changes):
+        """
+        Update the bound widgets, and the air quality attribute
+        when the pm2.5 measurement changed
+        :param changes {dict}: Attributes changed since last poll by path
+        """
+        super().on_device_attributes_changed(changes)
+        try:
+            if changes.get(PM25_PATH) is not None:
+                self.pm25 = round(float(changes[PM25_PATH]), 2)
+                self.check_pm25(self.pm25)
         except Exception as e:
             logging.error("Error: " + str(e))
 
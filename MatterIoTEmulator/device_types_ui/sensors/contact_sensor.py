@@ -20,11 +20,8 @@ from PySide2.QtGui import *
 from PySide2.QtWidgets import *
 import logging
 import threading
-import random
 import os
-import time
 from rpc.sensor_client import SensorClient
-from ..stoppablethread import UpdateStatusThread
 from constants import *
 from ..device_base_ui import *
 
@@ -40,6 +37,9 @@ class ContactSensor(BaseDeviceUI):
     ContactSensor device UI controller represent some attribues, clusters
     and endpoints corresspoding to Matter Specification v1.2
     """
+    # Contact state of recorded traces, e.g. 1/0, true/false or open/closed
+    TRACE_COLUMNS = {
+        'contact': {'attribute': 'booleanState', 'type': 'bool'}}
 
     def __init__(self, parent) -> None:
         """
@@ -144,7 +144,7 @@ class ContactSensor(BaseDeviceUI):
         self.set_initial_value()
 
         self.start_update_device_status_thread()
-        self.start_update_value_status_thread()
+        self.start_configured_trace_replay()
 
         logging.debug("Init contact sensor done")
 
@@ -177,19 +177,21 @@ class ContactSensor(BaseDeviceUI):
             self.set_time_button.setText("Restart")
             self.stop_button.setText("Stop")
             self.time_sleep, self.time_repeat = self.get_time_info()
-            self.remaining_time_interval = self.time_sleep
+            self.start_value_timer(self.time_sleep, self.time_repeat)
         except Exception as e:
             logging.error("Error: " + str(e))
 
     def on_stop_button_clicked(self):
         """Handle when click stop generate random value"""
-        if self.time_repeat != 0:
+        if self.is_value_timer_running():
             if self.is_stop_clicked:
                 self.is_stop_clicked = False
                 self.stop_button.setText("Stop")
+                self.resume_value_timer()
             else:
                 self.is_stop_clicked = True
                 self.stop_button.setText("Resume")
+                self.pause_value_timer()
         else:
             self.is_stop_clicked = False
 
@@ -211,10 +213,11 @@ class ContactSensor(BaseDeviceUI):
                     self.lbl_main_status_contact.setText('Status: Open')
                 else:
                     self.lbl_main_status_contact.setText('Status: Close')
+            remaining_time, remaining_count = self.value_timer_remaining()
             self.lbl_remain_repeat_time.setText(
-                'Remaining count: ' + str(self.time_repeat))
+                'Remaining count: ' + str(remaining_count))
             self.lbl_remaining_time_interval.setText(
-                'Remaining time of interval: ' + str(self.remaining_time_interval) + " sec")
+                'Remaining time of interval: ' + str(remaining_time) + " sec")
         except Exception as e:
             logging.error("Error: " + str(e))
 
@@ -225,35 +228,13 @@ class ContactSensor(BaseDeviceUI):
         """
         # logging.info('on_value_status_changed')
         self.contact_value = not self.contact_value
-        self.mutex.acquire(timeout=1)
         self.client.set({'booleanState': self.contact_value})
-        self.mutex.release()
 
-    def update_value_status(self):
+    def on_value_timer_finished(self):
         """
-        Handle timer thread when start generate random value
-        Emit signal value status changed
+        Handle the random value timer after the last value
         """
-        try:
-            while self.check_condition_update_status(
-                    self.update_value_status_thread):
-                if (self.time_repeat > 0) and (not self.is_stop_clicked):
-                    if self.remaining_time_interval > 0:
-                        self.remaining_time_interval -= 1
-                    else:
-                        self.sig_value_status_changed.emit()
-                        self.time_repeat -= 1
-                        if self.time_repeat == 0:
-                            self.set_time_button.setText("Start")
-                            self.remaining_time_interval = 0
-                        else:
-                            self.remaining_time_interval = self.time_sleep
-                elif self.time_repeat == 0:
-                    self.set_time_button.setText("Start")
-                    self.remaining_time_interval = 0
-                time.sleep(1)
-        except Exception as e:
-            logging.error(str(e))
+        self.set_time_button.setText("Start")
 
     def stop(self):
         """
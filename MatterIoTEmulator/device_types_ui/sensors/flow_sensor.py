@@ -21,10 +21,7 @@ from PySide2.QtWidgets import *
 import logging
 import threading
 import os
-import time
-import random
 from rpc.sensor_client import SensorClient
-from ..stoppablethread import UpdateStatusThread
 from ..constants_device import *
 from constants import *
 from ..device_base_ui import *
@@ -156,13 +153,16 @@ class FlowSensor(BaseDeviceUI):
 
         self.is_edit = True
 
+        # Flow in 0.1 m3/h: steady flow changing in steps
+        self.add_value_model(0, 65535, 'step', base=100, step_rate=1 / 60.0,
+                             step_size=50, noise=2)
+
         # Init rpc
         self.client = SensorClient(self.config)
         self.is_set_running = False
         self.set_initial_value()
 
         self.start_update_device_status_thread()
-        self.start_update_value_status_thread()
 
         logging.debug("Init Temperature sensor done")
 
@@ -231,19 +231,21 @@ class FlowSensor(BaseDeviceUI):
             self.set_time_button.setText("Restart")
             self.stop_button.setText("Stop")
             self.time_sleep, self.time_repeat = self.get_time_info()
-            self.remaining_time_interval = self.time_sleep
+            self.start_value_timer(self.time_sleep, self.time_repeat)
         except Exception as e:
             logging.error("Error: " + str(e))
 
     def on_stop_button_clicked(self):
         """Handle when click stop generate random value"""
-        if self.time_repeat != 0:
+        if self.is_value_timer_running():
             if self.is_stop_clicked:
                 self.is_stop_clicked = False
                 self.stop_button.setText("Stop")
+                self.resume_value_timer()
             else:
                 self.is_stop_clicked = True
                 self.stop_button.setText("Resume")
+                self.pause_value_timer()
         else:
             self.is_stop_clicked = False
 
@@ -266,10 +268,11 @@ class FlowSensor(BaseDeviceUI):
                 1)
             if self.is_edit:
                 self.line_edit_flow.setText(str(self.flow))
+            remaining_time, remaining_count = self.value_timer_remaining()
             self.lbl_remain_repeat_time.setText(
-                'Remaining count: ' + str(self.time_repeat))
+                'Remaining count: ' + str(remaining_count))
             self.lbl_remaining_time_interval.setText(
-                'Remaining time of interval: ' + str(self.remaining_time_interval) + " sec")
+                'Remaining time of interval: ' + str(remaining_time) + " sec")
         except Exception as e:
             logging.error("Error: " + str(e))
 
@@ -279,37 +282,15 @@ class FlowSensor(BaseDeviceUI):
         through rpc service
         """
         # logging.info('on_value_status_changed')
-        value = random.randrange(0, 65535, 1)
+        value = self.next_random_value()
         self.is_edit = True
-        self.mutex.acquire(timeout=1)
         self.client.set({'flowValue': value})
-        self.mutex.release()
 
-    def update_value_status(self):
+    def on_value_timer_finished(self):
         """
-        Handle timer thread when start generate random value
-        Emit signal value status changed
+        Handle the random value timer after the last value
         """
-        try:
-            while self.check_condition_update_status(
-                    self.update_value_status_thread):
-                if (self.time_repeat > 0) and (not self.is_stop_clicked):
-                    if self.remaining_time_interval > 0:
-                        self.remaining_time_interval -= 1
-                    else:
-                        self.sig_value_status_changed.emit()
-                        self.time_repeat -= 1
-                        if self.time_repeat == 0:
-                            self.set_time_button.setText("Start")
-                            self.remaining_time_interval = 0
-                        else:
-                            self.remaining_time_interval = self.time_sleep
-                elif self.time_repeat == 0:
-                    self.set_time_button.setText("Start")
-                    self.remaining_time_interval = 0
-                time.sleep(1)
-        except Exception as e:
-            logging.error(str(e))
+        self.set_time_button.setText("Start")
 
     def stop(self):
         """
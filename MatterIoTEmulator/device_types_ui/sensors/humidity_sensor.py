@@ -21,10 +21,7 @@ from PySide2.QtWidgets import *
 import logging
 import threading
 import os
-import time
-import random
 from rpc.sensor_client import SensorClient
-from ..stoppablethread import UpdateStatusThread
 from ..constants_device import *
 from constants import *
 from ..device_base_ui import *
@@ -41,6 +38,9 @@ class HumiditySensor(BaseDeviceUI):
     HumiditySensor device UI controller represent some attribues, clusters
     and endpoints corresspoding to Matter Specification v1.2
     """
+    # Relative humidity in % of recorded traces, set in 0.01 %
+    TRACE_COLUMNS = {
+        'humidity': {'attribute': 'humidityValue', 'scale': 100}}
 
     def __init__(self, parent) -> None:
         """
@@ -154,6 +154,12 @@ class HumiditySensor(BaseDeviceUI):
         self.remaining_time_interval = 0
         self.is_stop_clicked = False
 
+        # Relative humidity in 0.01 %: daily cycle around 50 %, lowest
+        # when the temperature is highest
+        self.add_value_model(0, 10000, 'diurnal', group='climate',
+                             base=5000, amplitude=-800, peak=15 * 3600,
+                             walk=10, noise=20, correlation=0.8)
+
         # Init rpc
         self.client = SensorClient(self.config)
         self.is_set_running = False
@@ -161,7 +167,7 @@ class HumiditySensor(BaseDeviceUI):
         self.is_edit_hum = True
 
         self.start_update_device_status_thread()
-        self.start_update_value_status_thread()
+        self.start_configured_trace_replay()
 
         logging.debug("Init Humidity sensor done")
 
@@ -230,19 +236,21 @@ class HumiditySensor(BaseDeviceUI):
             self.set_time_button.setText("Restart")
             self.stop_button.setText("Stop")
             self.time_sleep, self.time_repeat = self.get_time_info()
-            self.remaining_time_interval = self.time_sleep
+            self.start_value_timer(self.time_sleep, self.time_repeat)
         except Exception as e:
             logging.error("Error: " + str(e))
 
     def on_stop_button_clicked(self):
         """Handle when click stop generate random value"""
-        if self.time_repeat != 0:
+        if self.is_value_timer_running():
             if self.is_stop_clicked:
                 self.is_stop_clicked = False
                 self.stop_button.setText("Stop")
+                self.resume_value_timer()
             else:
                 self.is_stop_clicked = True
                 self.stop_button.setText("Resume")
+                self.pause_value_timer()
         else:
             self.is_stop_clicked = False
 
@@ -265,10 +273,11 @@ class HumiditySensor(BaseDeviceUI):
                 2)
             if self.is_edit_hum:
                 self.line_edit_hum.setText(str(self.humidity))
+            remaining_time, remaining_count = self.value_timer_remaining()
             self.lbl_remain_repeat_time.setText(
-                'Remaining count: ' + str(self.time_repeat))
+                'Remaining count: ' + str(remaining_count))
             self.lbl_remaining_time_interval.setText(
-                'Remaining time of interval: ' + str(self.remaining_time_interval) + " sec")
+                'Remaining time of interval: ' + str(remaining_time) + " sec")
         except Exception as e:
             logging.error("Error: " + str(e))
 
@@ -278,37 +287,15 @@ class HumiditySensor(BaseDeviceUI):
         through rpc service
         """
         # logging.info('on_value_status_changed')
-        value = random.randrange(0, 10000, 1)
+        value = self.next_random_value()
         self.is_edit_hum = True
-        self.mutex.acquire(timeout=1)
         self.client.set({'humidityValue': value})
-        self.mutex.release()
 
-    def update_value_status(self):
+    def on_value_timer_finished(self):
         """
-        Handle timer thread when start generate random value
-        Emit signal value status changed
+        Handle the random value timer after the last value
         """
-        try:
-            while self.check_condition_update_status(
-                    self.update_value_status_thread):
-                if (self.time_repeat > 0) and (not self.is_stop_clicked):
-                    if self.remaining_time_interval > 0:
-                        self.remaining_time_interval -= 1
-                    else:
-                        self.sig_value_status_changed.emit()
-                        self.time_repeat -= 1
-                        if self.time_repeat == 0:
-                            self.set_time_button.setText("Start")
-                            self.remaining_time_interval = 0
-                        else:
-                            self.remaining_time_interval = self.time_sleep
-                elif self.time_repeat == 0:
-                    self.set_time_button.setText("Start")
-                    self.remaining_time_interval = 0
-                time.sleep(1)
-        except Exception as e:
-            logging.error(str(e))
+        self.set_time_button.setText("Start")
 
     def stop(self):
         """
@@ -20,12 +20,9 @@ from PySide2.QtGui import *
 from PySide2.QtWidgets import *
 import logging
 import threading
-import random
 import os
-import time
 
 from rpc.smokecoalarm_client import SmokeCoAlarmClient
-from ..stoppablethread import UpdateStatusThread
 from ..constants_device import *
 from constants import *
 from ..device_base_ui import *
@@ -314,9 +311,7 @@ class SmokeCoAlarm(BaseDeviceUI):
         through rpc service
         :param feature_type: current index of smoke feature map combo box
         """
-        self.mutex.acquire(timeout=1)
         self.client.set({'featureMap': {'featureMap': feature_type}})
-        self.mutex.release()
 
     def smoke_sense_level_box_changed(self, smoke_sense_level):
         """
@@ -324,7 +319,6 @@ class SmokeCoAlarm(BaseDeviceUI):
         through rpc service
         :param smoke_sense_level: current index of smoke sense combo box
         """
-        self.mutex.acquire(timeout=1)
         self.client.set(
             {
                 'smokeCOAlarmCluster': {
@@ -333,7 +327,6 @@ class SmokeCoAlarm(BaseDeviceUI):
                     'batteryAlert': self.battery_status,
                     'coState': self.co_state,
                     'smokeSensitivityLevel': smoke_sense_level}})
-        self.mutex.release()
 
     def enable_update_mode(self):
         """Enable 'enable_update' attribute to enable update value for combo box"""
@@ -348,7 +341,6 @@ class SmokeCoAlarm(BaseDeviceUI):
         logging.info("RPC set battery: " + str(battery_index))
         self.enable_update = False
         QTimer.singleShot(1.2, self.enable_update_mode)
-        self.mutex.acquire(timeout=1)
         self.client.set(
             {
                 'smokeCOAlarmCluster': {
@@ -357,7 +349,6 @@ class SmokeCoAlarm(BaseDeviceUI):
                     'batteryAlert': battery_index,
                     'coState': self.co_state,
                     'smokeSensitivityLevel': self.smoke_sense_level}})
-        self.mutex.release()
 
     def on_text_edited_bat(self):
         """Enable 'is_edit_bat' attribute
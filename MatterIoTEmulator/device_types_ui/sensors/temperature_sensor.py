@@ -21,11 +21,8 @@ from PySide2.QtWidgets import *
 from qtwidgets import Toggle
 import logging
 import threading
-import time
 import os
-import random
 from rpc.sensor_client import SensorClient
-from ..stoppablethread import UpdateStatusThread
 from ..constants_device import *
 from constants import *
 from ..device_base_ui import *
@@ -42,6 +39,9 @@ class TemperatureSensor(BaseDeviceUI):
     TemperatureSensor device UI controller represent some attribues, clusters
     and endpoints corresspoding to Matter Specification v1.2
     """
+    # Temperature in C of recorded traces, set in 0.01 C
+    TRACE_COLUMNS = {
+        'temperature': {'attribute': 'temperatureValue', 'scale': 100}}
 
     def __init__(self, parent) -> None:
         """
@@ -158,12 +158,18 @@ class TemperatureSensor(BaseDeviceUI):
         self.parent.ui.lo_controller.addWidget(QLabel(""))
         self.parent.ui.lo_controller.addLayout(self.grid_layout_2)
 
+        # Temperature in 0.01 C: daily cycle around 22 C, warmest at
+        # 15:00, moving with the other climate sensors
+        self.add_value_model(0, 10000, 'diurnal', group='climate',
+                             base=2200, amplitude=400, peak=15 * 3600,
+                             walk=5, noise=10, correlation=0.8)
+
         # Init rpc
         self.client = SensorClient(self.config)
         self.set_initial_value()
 
         self.start_update_device_status_thread()
-        self.start_update_value_status_thread()
+        self.start_configured_trace_replay()
         logging.debug("Init Temperature sensor done")
 
     def set_initial_value(self):
@@ -232,19 +238,21 @@ class TemperatureSensor(BaseDeviceUI):
             self.set_time_button.setText("Restart")
             self.stop_button.setText("Stop")
             self.time_sleep, self.time_repeat = self.get_time_info()
-            self.remaining_time_interval = self.time_sleep
+            self.start_value_timer(self.time_sleep, self.time_repeat)
         except Exception as e:
             logging.error("Error: " + str(e))
 
     def on_stop_button_clicked(self):
         """Handle when click stop generate random value"""
-        if self.time_repeat != 0:
+        if self.is_value_timer_running():
             if self.is_stop_clicked:
                 self.is_stop_clicked = False
                 self.stop_button.setText("Stop")
+                self.resume_value_timer()
             else:
                 self.is_stop_clicked = True
                 self.stop_button.setText("Resume")
+                self.pause_value_timer()
         else:
             self.is_stop_clicked = False
 
@@ -267,10 +275,11 @@ class TemperatureSensor(BaseDeviceUI):
                 2)
             if self.is_edit_temp:
                 self.line_edit_temp.setText(str(self.temperature))
+            remaining_time, remaining_count = self.value_timer_remaining()
             self.lbl_remain_repeat_time.setText(
-                'Remaining count: ' + str(self.time_repeat))
+                'Remaining count: ' + str(remaining_count))
             self.lbl_remaining_time_interval.setText(
-                'Remaining time of interval: ' + str(self.remaining_time_interval) + " sec")
+                'Remaining time of interval: ' + str(remaining_time) + " sec")
         except Exception as e:
             logging.error("Error: " + str(e))
 
@@ -280,37 +289,15 @@ class TemperatureSensor(BaseDeviceUI):
         through rpc service
         """
         # logging.info('on_value_status_changed')
-        value = random.randrange(0, 10000, 1)
+        value = self.next_random_value()
         self.is_edit_temp = True
-        self.mutex.acquire(timeout=1)
         self.client.set({'temperatureValue': value})
-        self.mutex.release()
 
-    def update_value_status(self):
+    def on_value_timer_finished(self):
         """
-        Handle timer thread when start generate random value
-        Emit signal value status changed
+        Handle the random value timer after the last value
         """
-        try:
-            while self.check_condition_update_status(
-                    self.update_value_status_thread):
-                if (self.time_repeat > 0) and (not self.is_stop_clicked):
-                    if self.remaining_time_interval > 0:
-                        self.remaining_time_interval -= 1
-                    else:
-                        self.sig_value_status_changed.emit()
-                        self.time_repeat -= 1
-                        if self.time_repeat == 0:
-                            self.set_time_button.setText("Start")
-                            self.remaining_time_interval = 0
-                        else:
-                            self.remaining_time_interval = self.time_sleep
-                elif self.time_repeat == 0:
-                    self.set_time_button.setText("Start")
-                    self.remaining_time_interval = 0
-                time.sleep(1)
-        except Exception as e:
-            logging.error(str(e))
+        self.set_time_button.setText("Start")
 
     def stop(self):
         """
@@ -23,8 +23,6 @@ import logging
 from rpc.plug_client import PlugClient
 import threading
 import os
-import time
-from ..stoppablethread import UpdateStatusThread
 from constants import *
 from ..device_base_ui import *
 
@@ -51,6 +49,8 @@ class DimmablePluginUnit(BaseDeviceUI):
         :param parent: An UI object load DimmablePluginUnit device UI controller.
         """
         super().__init__(parent)
+        self.emit_changed_status_only = True
+        self.skip_poll_on_control = True
         self.cr_feature_type = 0
         self.on_off = True
         self.level = 15
@@ -154,7 +154,6 @@ class DimmablePluginUnit(BaseDeviceUI):
         :param data: Value of on-off attribute, 0: False, other True
         """
         logging.info("RPC SET On/Off: " + str(data))
-        self.mutex.acquire(timeout=1)
         if data == 0:
             self.on_off = False
             self.client.set({"on": self.on_off})
@@ -163,7 +162,6 @@ class DimmablePluginUnit(BaseDeviceUI):
             if (self.level <= 1):
                 self.level = 5
             self.client.set({"on": self.on_off, 'level': self.level})
-        self.mutex.release()
 
     def handle_level_changed(self):
         """
@@ -172,10 +170,14 @@ class DimmablePluginUnit(BaseDeviceUI):
         """
         self.level = round(self.sl_level.value() * 2.54)
         logging.info("RPC SET Level: " + str(self.level))
-        self.mutex.acquire(timeout=1)
+        self.queue_control_write('level', self.set_level)
+
+    def set_level(self):
+        """
+        Set on/off and level attribute to matter device(backend)
+        through rpc service, read when the queued write is sent
+        """
         self.client.set({'on': self.on_off, "level": self.level})
-        self.mutex.release()
-        self.is_on_control = False
 
     def level_feature_changed(self, feature_type):
         """
@@ -183,10 +185,8 @@ class DimmablePluginUnit(BaseDeviceUI):
         through rpc service when level feature map value change
         :param feature_type: A new value of level feature map
         """
-        self.mutex.acquire(timeout=1)
         self.client.set({'featureMap': {'featureMap': feature_type},
                         'level': self.level, 'on': self.on_off})
-        self.mutex.release()
 
     def on_device_status_changed(self, result):
         """
@@ -222,29 +222,6 @@ class DimmablePluginUnit(BaseDeviceUI):
         except Exception as e:
             logging.error("Error: " + str(e))
 
-    def update_device_status(self):
-        """
-        Update value for all attributes on UI
-        when set timer for change random attribute value
-        """
-        try:
-            while self.check_condition_update_status(
-                    self.update_device_status_thread):
-                try:
-                    if not self.is_on_control:
-                        self.mutex.acquire(timeout=1)
-                        device_status = self.client.get()
-                        device_state = self.client.get_device_state()
-                        self.mutex.release()
-                        self.sig_device_status_changed.emit(
-                            {'device_status': device_status, 'device_state': device_state})
-                    time.sleep(0.5)
-                except Exception as e:
-                    logging.error(
-                        f'{str(e)} , RPC Port: {str(self.parent.rpcPort)}')
-        except Exception as e:
-            logging.error(str(e))
-
     def stop(self):
         """
         Stop thread update device status
@@ -23,11 +23,9 @@ import logging
 import threading
 import os
 from threading import Timer
-import time
 from rpc.lighting_client import LightingClient
 from rpc.generic_switch_client import GenericSwitchClient
 
-from ..stoppablethread import UpdateStatusThread
 from constants import *
 from ..device_base_ui import *
 
@@ -175,7 +173,6 @@ class GenericSwitch(BaseDeviceUI):
         when select feature of switch combo box
         :param mode: Current index of switch combo box
         """
-        self.mutex.acquire(timeout=1)
         self.current_position = 0
         self.client.set(
             {
@@ -186,7 +183,6 @@ class GenericSwitch(BaseDeviceUI):
                     'numberOfPress': 0},
                 'featureMap': {
                     'featureMap': mode}})
-        self.mutex.release()
         self.clear_layout()
         if mode == 0:
             self.sw_title_on = QLabel()
@@ -282,7 +278,6 @@ class GenericSwitch(BaseDeviceUI):
         :param data: Current positionof switch latch feature
         """
         logging.info("RPC SET Position: " + str(data))
-        self.mutex.acquire(timeout=1)
         if data == 0:
             self.current_position = 0
         else:
@@ -294,7 +289,6 @@ class GenericSwitch(BaseDeviceUI):
                 'currentPosition': self.current_position}}
         self.client.set(rpc_data)
         self.client.OnSwitchLatch(rpc_data)
-        self.mutex.release()
 
     def init_press(self):
         """Set event Initial Press to matter device through rpc service"""
@@ -0,0 +1,168 @@
+# Copyright (c) 2024 LG Electronics, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import logging
+
+_UNSET = object()
+
+
+class Binding:
+    """
+    Binding of one widget to one or more device attributes
+    """
+
+    def __init__(self, paths, widget, setter, convert=None,
+                 block_signals=True, enabled=None, mute=()):
+        """
+        Create a new `Binding`.
+        :param paths {tuple}: Dotted attribute paths read by the binding
+        :param widget {QWidget}: The widget to update
+        :param setter {str|callable}: Name of the widget method called with
+        the value, e.g. 'setText', or function called with widget and value
+        :param convert {callable}: Function called with the values of the
+        paths, returning the widget value, default the value of the path
+        :param block_signals {bool}: Block the widget signals while setting
+        the value, so the update is not written back to the device
+        :param enabled {callable}: Function returning False while the
+        widget must not be updated, e.g. while the user edits it
+        :param mute {tuple}: (signal, slot) pairs disconnected while setting
+        the value, for widgets which need their own signals, e.g. Toggle
+        """
+        self.paths = paths
+        self.widget = widget
+        self.setter = setter
+        self.convert = convert
+        self.block_signals = block_signals
+        self.enabled = enabled
+        self.mute = tuple(mute)
+        self.value = _UNSET
+
+    def apply(self, values, force=False):
+        """
+        Set the widget value from the attribute values
+        :param values {dict}: Last attribute values by path
+        :param force {bool}: Set the value even if it did not change
+        :return: True if the widget was updated
+        """
+        if not force and self.enabled is not None and not self.enabled():
+            return False
+        args = [values.get(path) for path in self.paths]
+        value = self.convert(*args) if self.convert else args[0]
+        if not force and value == self.value:
+            return False
+        blocked = False
+        if self.block_signals:
+            blocked = self.widget.blockSignals(True)
+        for signal, slot in self.mute:
+            signal.disconnect(slot)
+        try:
+            if callable(self.setter):
+                self.setter(self.widget, value)
+            else:
+                getattr(self.widget, self.setter)(value)
+        finally:
+            for signal, slot in self.mute:
+                signal.connect(slot)
+            if self.block_signals:
+                self.widget.blockSignals(blocked)
+        self.value = value
+        return True
+
+
+class WidgetBinder:
+    """
+    WidgetBinder class applying the attribute changes of a device to the
+    widgets bound to them.
+
+    Only the bindings of changed attributes are applied and a widget is
+    only set when its value changes, so a poll which changed nothing costs
+    no Qt call.
+    """
+
+    def __init__(self):
+        """
+        Create a new `WidgetBinder`.
+        """
+        self.values = {}
+        self.bindings = []
+        self._by_path = {}
+        self._stale = []
+
+    def bind(self, paths, widget, setter, convert=None, block_signals=True,
+             enabled=None, mute=()):
+        """
+        Bind a widget to device attributes, see `Binding`
+        :param paths {str|tuple}: Dotted attribute path(s),
+        e.g. 'device_status.level'
+        :return: The new binding
+        """
+        if isinstance(paths, str):
+            paths = (paths,)
+        binding = Binding(tuple(paths), widget, setter, convert,
+                          block_signals, enabled, mute)
+        self.bindings.append(binding)
+        for path in binding.paths:
+            self._by_path.setdefault(path, []).append(binding)
+        if all(path in self.values for path in binding.paths):
+            self._apply(binding)
+        return binding
+
+    def apply(self, changes):
+        """
+        Apply the changed attributes to the bound widgets
+        :param changes {dict}: Changed attribute values by path
+        :return: Number of widgets updated
+        """
+        self.values.update(changes)
+        pending, self._stale = self._stale, []
+        for path in changes:
+            for binding in self._by_path.get(path, ()):
+                if binding not in pending:
+                    pending.append(binding)
+        return sum(1 for binding in pending if self._apply(binding))
+
+    def refresh(self, widget=None):
+        """
+        Set bound widgets again from the last attribute values,
+        e.g. to undo an invalid user input
+        :param widget {QWidget}: Only refresh this widget, default all
+        """
+        for binding in self.bindings:
+            if widget is None or binding.widget is widget:
+                if all(path in self.values for path in binding.paths):
+                    self._apply(binding, force=True)
+
+    def get(self, path, default=None):
+        """
+        Return the last value of an attribute
+        :param path {str}: Dotted attribute path
+        """
+        return self.values.get(path, default)
+
+    def _apply(self, binding, force=False):
+        """
+        Apply a binding, keep it for the next changes while it is disabled
+        """
+        try:
+            if (not force and binding.enabled is not None
+                    and not binding.enabled()):
+                self._stale.append(binding)
+                return False
+            return binding.apply(self.values, force)
+        except Exception as e:
+            logging.error(f'Failed to bind {binding.paths}: {str(e)}')
+            return False
@@ -0,0 +1,730 @@
+# Copyright (c) 2024 LG Electronics, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import argparse
+import concurrent.futures
+import datetime
+import json
+import logging
+import os
+import re
+import signal
+import threading
+import time
+
+from constants import (CHIP_FACTORY_FILE, CONFIG_FILE, FLAG_BIND_IP_FAIL,
+                       FLAG_COMMISSIONING_FAIL, FLAG_CONNECTED,
+                       FLAG_CONNECTING, FLAG_DEVICE_STARTED,
+                       FLAG_RPC_INIT_DONE, INVALID_PASSCODES, TEMP_PATH)
+from credentials.development.gen_dac_cert import GenDacTool
+from rpc.device_client import DeviceClient
+from rpc.poll_scheduler import PollScheduler
+from setup_payload.generate_setup_payload import SetupPayload
+from utils.device_runner import DeviceRunner
+from utils.getIP import CreateIpAddress
+from utils.handle_recover import HandleRecoverDevices
+
+SOURCE_PATH = os.path.dirname(os.path.realpath(__file__))
+CONFIG_FILE_PATH = os.path.join(SOURCE_PATH, CONFIG_FILE)
+
+RPC_PORT_DEFAULT = 33000
+# Seconds to wait for the new ip addresses to answer
+IP_UP_TIMEOUT = 60
+DEFAULT_START_WORKERS = 4
+DEFAULT_MONITOR_INTERVAL = 5.0
+# Device parameters of the manifest and their parameter constraints
+PARAMETERS = (('serial_number', 'serial_number'),
+              ('vendor_id', 'vendor_id'),
+              ('product_id', 'product_id'),
+              ('discriminator', 'discriminator'),
+              ('pin_code', 'pin_code'))
+LOG_PATTERN = re.compile(
+    "(?:\\[\\d+\\.\\d+\\])(?:\\[\\d+:\\d+\\]){0,1}\\s*(.+)")
+
+# States of a headless device
+STATE_PENDING = 'PENDING'
+STATE_STARTING = 'STARTING'
+STATE_STARTED = 'STARTED'
+STATE_CONNECTING = 'CONNECTING'
+STATE_CONNECTED = 'CONNECTED'
+STATE_COMMISSIONING_FAIL = 'COMMISSIONING_FAIL'
+STATE_FAILED = 'FAILED'
+STATE_EXITED = 'EXITED'
+STATE_STOPPED = 'STOPPED'
+
+
+class FleetError(Exception):
+    """
+    Raised by a fleet manifest which can not be loaded.
+    """
+
+
+def read_config():
+    """
+    Return the content of config.json.
+    """
+    with open(CONFIG_FILE_PATH) as config_file:
+        return json.load(config_file)
+
+
+def load_manifest(path):
+    """
+    Load a fleet manifest from a JSON file, or a YAML file when PyYAML is
+    installed.
+
+    Arguments:
+        path {str} -- the manifest file, .json, .yaml or .yml
+    Raises:
+        FleetError: if the file can not be read
+    """
+    try:
+        with open(path) as manifest_file:
+            if os.path.splitext(path)[1].lower() in ('.yaml', '.yml'):
+                try:
+                    import yaml
+                except ImportError:
+                    raise FleetError(
+                        'PyYAML is needed for YAML manifests, '
+                        'use a JSON manifest or install pyyaml')
+                return yaml.safe_load(manifest_file)
+            return json.load(manifest_file)
+    except (OSError, ValueError) as e:
+        raise FleetError(f'Can not load manifest {path}: {str(e)}')
+
+
+def get_device_info(config, device_type):
+    """
+    Return the device_types entry of config.json of a device, None if the
+    device type is unknown.
+
+    Arguments:
+        config {dict} -- the content of config.json
+        device_type {str} -- the device name, e.g. 'Pump(0x0303)'
+    """
+    if device_type not in config.get('device_list', []):
+        return None
+    device_id = device_type.split('(')[-1][:-1]
+    for info in config.get('device_types', []):
+        if info.get('device_id') == device_id:
+            return info
+    return None
+
+
+def check_parameters(params, constraints):
+    """
+    Return the error of the first device parameter out of the parameter
+    constraints of config.json, None if all are valid.
+
+    Arguments:
+        params {dict} -- the device parameters, see PARAMETERS
+        constraints {dict} -- the parameter_constraints of config.json
+    """
+    for name, constraint_name in PARAMETERS:
+        constraint = constraints[constraint_name]
+        value = params[name]
+        if name == 'vendor_id':
+            if value != int(constraint['default_value']):
+                return f'Vendor ID {value} is invalid'
+        elif value not in range(constraint['range'][0],
+                                constraint['range'][-1] + 1):
+            return f'{name} {value} is out of range {constraint["range"]}'
+    if params['pin_code'] in INVALID_PASSCODES:
+        return f'Pin code {params["pin_code"]} is insecure and unusable'
+    return None
+
+
+def expand_devices(manifest, config):
+    """
+    Return the parameters of every device of a manifest.
+
+    The manifest holds 'defaults' and a list of 'devices'. An entry names
+    its 'device_type' as in the device list of config.json and may set
+    'serial_number', 'vendor_id', 'product_id', 'discriminator' and
+    'pin_code'; the missing ones come from the defaults, then from the
+    parameter constraints of config.json. An entry with a 'count' starts
+    that many devices with consecutive serial numbers.
+
+    Arguments:
+        manifest {dict} -- the loaded manifest
+        config {dict} -- the content of config.json
+    Raises:
+        FleetError: if an entry is malformed or out of the constraints
+    """
+    constraints = config['parameter_constraints']
+    defaults = {name: constraints[constraint_name]['default_value']
+                for name, constraint_name in PARAMETERS}
+    defaults.update(manifest.get('defaults', {}))
+    devices = []
+    target_ids = set()
+    for index, entry in enumerate(manifest.get('devices', [])):
+        device_type = entry.get('device_type')
+        info = get_device_info(config, device_type)
+        if info is None:
+            raise FleetError(f'Entry {index} has an unknown device type '
+                             f'{device_type}')
+        params = dict(defaults)
+        params.update({name: entry[name] for name, _ in PARAMETERS
+                       if name in entry})
+        try:
+            params = {name: int(params[name]) for name, _ in PARAMETERS}
+        except (TypeError, ValueError) as e:
+            raise FleetError(f'Entry {index} has a bad parameter: {str(e)}')
+        for count in range(int(entry.get('count', 1))):
+            device = dict(params, device_type=device_type,
+                          sub_path=info['sub_path'])
+            device['serial_number'] += count
+            error = check_parameters(device, constraints)
+            if error is not None:
+                raise FleetError(f'Entry {index}: {error}')
+            device['target_id'] = CreateIpAddress().generateTargetId(
+                device['vendor_id'], device['product_id'],
+                device['serial_number'])
+            if device['target_id'] in target_ids:
+                raise FleetError(f'Entry {index}: duplicate device '
+                                 f'{device["target_id"]}')
+            target_ids.add(device['target_id'])
+            devices.append(device)
+    return devices
+
+
+class HeadlessDevice:
+    """
+    HeadlessDevice class running one device app without UI.
+
+    It does what a tab of the emulator does when its device is started:
+    writes the factory config, generates the DAC, creates the ip
+    addresses, runs the device app and follows its log for the
+    commissioning state. Once the device is up, its rpc client reads the
+    device state on the poll scheduler shared by all devices.
+    """
+
+    def __init__(self, params, today, time_start):
+        """
+        Initialize a HeadlessDevice instance.
+
+        Arguments:
+            params {dict} -- the device parameters, see expand_devices()
+            today {str} -- the log folder of the day
+            time_start {str} -- the start time in the log file names
+        """
+        self.params = params
+        self.targetId = params['target_id']
+        self.state = STATE_PENDING
+        self.reason = ''
+        self.ip_value = None
+        self.ipv4 = ''
+        self.ipv6 = ''
+        self.interfaceName = ''
+        self.interface_index = ''
+        self.rpcPort = None
+        self.is_recover = ''
+        self.unique_id = ''
+        self.create_time = int(time.time())
+        self.qrcode = ''
+        self.manual_code = ''
+        self.device_state = None
+        self.client = None
+        self.monitor_task = None
+        self._runner = None
+        self._lock = threading.Lock()
+        self.path_log = SOURCE_PATH + "/log/{}/{}--{}--{}".format(
+            today, time_start, params['device_type'].split('(')[-1][:-1],
+            self.targetId)
+
+    def config_file(self):
+        """
+        Return the factory config file of the device.
+        """
+        return SOURCE_PATH + TEMP_PATH + "{}/{}".format(
+            self.targetId, CHIP_FACTORY_FILE)
+
+    def recover(self):
+        """
+        Take the ip addresses and the rpc port of a commissioned device of
+        an earlier run, so it keeps its fabric, and return True if any.
+        """
+        if not os.path.exists(self.config_file()):
+            return False
+        factory = HandleRecoverDevices.read_config_file(
+            self.config_file(), self.targetId)
+        if (factory.get('is_recover') != '1' or not factory.get('ipv4')
+                or not factory.get('ipv6')):
+            return False
+        self.ipv4 = factory['ipv4']
+        self.ipv6 = factory['ipv6']
+        self.interface_index = int(factory['interface_index'])
+        self.rpcPort = int(factory['rpc-port'])
+        self.is_recover = factory['is_recover']
+        self.unique_id = factory.get('unique-id', '')
+        self.create_time = factory.get('create-time', self.create_time)
+        return True
+
+    def prepare(self):
+        """
+        Write the factory config and generate the DAC of the device,
+        return True if done.
+        """
+        if not self.recover():
+            HandleRecoverDevices().remove_storage_folder(self.targetId)
+            HandleRecoverDevices().create_storage_folder(
+                SOURCE_PATH, self.targetId)
+        self.update_factory_config_file()
+        if not GenDacTool(self.targetId).gen_dac_cert():
+            self.fail(STATE_FAILED, 'DAC generation failed')
+            return False
+        payloads = SetupPayload()
+        self.qrcode = payloads.generate_qrcode(
+            self.params['pin_code'],
+            discriminator=self.params['discriminator'],
+            vid=self.params['vendor_id'], pid=self.params['product_id'])
+        self.manual_code = payloads.generate_manualcode(
+            self.params['pin_code'],
+            discriminator=self.params['discriminator'],
+            vid=self.params['vendor_id'], pid=self.params['product_id'])
+        return True
+
+    def create_ip(self):
+        """
+        Create the ip addresses of the device and wait for them to
+        answer, return True if done. The caller serializes the calls, the
+        free addresses are found by ping.
+        """
+        self.ip_value = CreateIpAddress()
+        if self.is_recover:
+            if ((not self.ip_value.pingOnlyOne(self.ipv4))
+                    or (not self.ip_value.pingOnlyOne(self.ipv6))):
+                self.fail(STATE_FAILED, 'Recovered ip address is in use')
+                return False
+            self.ip_value.is_base_ip = False
+            self.ip_value.interface_index = self.interface_index
+            self.ip_value.scanAndCreateIp([self.ipv4, self.ipv6])
+        else:
+            self.ip_value.scanAndCreateIp([])
+        self.ipv4 = self.ip_value.getIpv4Address()
+        self.ipv6 = self.ip_value.getIpv6Address()
+        self.interfaceName = self.ip_value.interface
+        self.interface_index = self.ip_value.interface_index
+        if not self.ipv4 or not self.ipv6:
+            self.fail(STATE_FAILED, 'Ip address generation failed')
+            return False
+        started = time.monotonic()
+        while (self.ip_value.pingOnlyOne(self.ipv6)
+               or self.ip_value.pingOnlyOne(self.ipv4)):
+            if time.monotonic() - started > IP_UP_TIMEOUT:
+                break
+        # Later devices must not take the addresses or the interface
+        for values, value in (
+                (HandleRecoverDevices.list_recover_ipv4, self.ipv4),
+                (HandleRecoverDevices.list_recover_ipv6, self.ipv6),
+                (HandleRecoverDevices.list_recover_interface_index,
+                 self.interface_index)):
+            if value not in values:
+                values.append(value)
+        return True
+
+    def start(self, rpc_port):
+        """
+        Run the device app on the rpc port, unless the device recovered
+        its own, and follow its log on a thread.
+
+        Arguments:
+            rpc_port {int} -- the rpc port of a new device
+        """
+        if self.rpcPort is None:
+            self.rpcPort = rpc_port
+        self.update_factory_config_file()
+        cmd = self.get_running_app_command()
+        logging.info(cmd)
+        with self._lock:
+            if self.state == STATE_STOPPED:
+                return
+            self.state = STATE_STARTING
+            self._runner = DeviceRunner(cmd)
+            self._runner.execute()
+        log_thread = threading.Thread(target=self.device_running,
+                                      name=f'device-{self.targetId}')
+        log_thread.daemon = True
+        log_thread.start()
+
+    def get_running_app_command(self):
+        """
+        Return the command running the device app.
+        """
+        return (SOURCE_PATH + self.params['sub_path']
+                + " --wifi --discriminator "
+                + str(self.params['discriminator'])
+                + " --passcode " + str(self.params['pin_code'])
+                + " --vendor-id " + str(self.params['vendor_id'])
+                + " --product-id " + str(self.params['product_id'])
+                + " --capabilities 6"
+                + " --KVS {}{}{}/chip_kvs_".format(
+                    SOURCE_PATH, TEMP_PATH, self.targetId) + self.targetId
+                + " --RPC-server-port " + str(self.rpcPort)
+                + " --IPv4-Addr " + self.ipv4
+                + " --IPv6-Addr " + self.ipv6)
+
+    def update_factory_config_file(self):
+        """
+        Update factory information to config file.
+        """
+        DeviceRunner("cd").update_SN_config_file(
+            self.config_file(),
+            self.params['serial_number'],
+            self.params['product_id'],
+            self.params['discriminator'],
+            self.params['pin_code'],
+            self.params['device_type'],
+            self.create_time,
+            self.ipv4,
+            self.ipv6,
+            self.rpcPort if self.rpcPort is not None else '',
+            self.interface_index,
+            self.is_recover,
+            self.params['vendor_id'],
+            self.unique_id)
+
+    def device_running(self):
+        """
+        Follow the log of the device app until it exits.
+        """
+        try:
+            with open(self.path_log, 'a', encoding='utf8') as log_file:
+                for line in self._runner.get_log():
+                    value = LOG_PATTERN.findall(line)
+                    if value:
+                        log_file.write("[{}]{}\n".format(
+                            datetime.datetime.now(), value[-1]))
+                    self.on_log_line(line)
+        except Exception as e:
+            logging.error(f'Failed to follow log of {self.targetId}: '
+                          + str(e))
+        with self._lock:
+            if self.state != STATE_STOPPED:
+                self.state = STATE_EXITED
+                logging.warning(f'Device {self.targetId} exited')
+
+    def on_log_line(self, line):
+        """
+        Update the state of the device from a line of its log.
+
+        Arguments:
+            line {str} -- the log line
+        """
+        if FLAG_BIND_IP_FAIL in line:
+            self.fail(STATE_FAILED, 'Device can not bind its ip address')
+        elif FLAG_RPC_INIT_DONE in line and self.client is None:
+            self.client = DeviceClient("localhost:" + str(self.rpcPort))
+        elif FLAG_DEVICE_STARTED in line and self.state == STATE_STARTING:
+            self.set_state(STATE_CONNECTED if self.is_recover
+                           else STATE_STARTED)
+        elif FLAG_CONNECTING in line:
+            self.set_state(STATE_CONNECTING)
+        elif FLAG_CONNECTED in line and self.state != STATE_CONNECTED:
+            self.set_state(STATE_CONNECTED)
+            # Keep the addresses and the fabric for the next run
+            self.is_recover = 1
+            factory = HandleRecoverDevices.read_config_file(
+                self.config_file(), self.targetId)
+            self.unique_id = factory.get('unique-id', '')
+            self.update_factory_config_file()
+        elif FLAG_COMMISSIONING_FAIL in line:
+            self.set_state(STATE_COMMISSIONING_FAIL)
+
+    def set_state(self, state):
+        """
+        Change the state of a running device.
+        """
+        with self._lock:
+            if self.state in (STATE_STOPPED, STATE_FAILED):
+                return
+            self.state = state
+        logging.info(f'Device {self.targetId}: {state}')
+
+    def fail(self, state, reason):
+        """
+        Mark the device failed.
+        """
+        with self._lock:
+            self.state = state
+            self.reason = reason
+        logging.error(f'Device {self.targetId}: {reason}')
+
+    def monitor(self):
+        """
+        Read the device state through the rpc client.
+        """
+        if self.client is None or not self.client.available:
+            return
+        try:
+            self.device_state = self.client.get_device_state()
+        except Exception as e:
+            logging.warning(f'Can not read state of {self.targetId}: '
+                            + str(e))
+
+    def stop(self):
+        """
+        Stop the device app, remove its ip addresses and its storage
+        folder unless it was commissioned.
+        """
+        with self._lock:
+            running = self.state not in (STATE_PENDING, STATE_STOPPED)
+            self.state = STATE_STOPPED
+        if self.monitor_task is not None:
+            self.monitor_task.cancel()
+            self.monitor_task = None
+        if self.client is not None:
+            self.client.stop()
+            self.client = None
+        if self._runner is not None:
+            self._runner.stop()
+            self._runner = None
+        if running and self.ip_value is not None:
+            self.ip_value.removeIpAfterStopDevice()
+            if self.rpcPort is not None:
+                self.ip_value.releaseRpcPort(self.rpcPort)
+        if not self.is_recover:
+            HandleRecoverDevices().remove_storage_folder(self.targetId)
+
+    def status(self):
+        """
+        Return the state of the device for the status file.
+        """
+        fabric = None
+        try:
+            fabric_info = self.device_state['reply']['fabricInfo']
+            if fabric_info:
+                fabric = {'fabricId': fabric_info[0]['fabricId'],
+                          'nodeId': fabric_info[0]['nodeId']}
+        except (KeyError, TypeError):
+            pass
+        return {
+            'targetId': self.targetId,
+            'device_type': self.params['device_type'],
+            'serial_number': self.params['serial_number'],
+            'state': self.state,
+            'reason': self.reason,
+            'interface': self.interfaceName,
+            'ipv4': self.ipv4,
+            'ipv6': self.ipv6,
+            'rpc_port': self.rpcPort,
+            'rpc_available': (self.client is not None
+                              and self.client.available),
+            'qrcode': self.qrcode,
+            'manual_code': self.manual_code,
+            'fabric': fabric}
+
+
+class Fleet:
+    """
+    Fleet class starting, monitoring and stopping the devices of a
+    manifest without UI.
+
+    The devices are prepared on a small pool of start workers; the ip
+    addresses are created one device at a time, as free addresses are
+    found by ping. There is no limit on the number of devices, only the
+    host resources and the free addresses and rpc ports.
+    """
+
+    def __init__(self, devices, start_workers=DEFAULT_START_WORKERS,
+                 monitor_interval=DEFAULT_MONITOR_INTERVAL,
+                 status_file=None):
+        """
+        Initialize a Fleet instance.
+
+        Arguments:
+            devices {list} -- the device parameters, see expand_devices()
+            start_workers {int} -- devices prepared at the same time
+                                   (default 4)
+            monitor_interval {float} -- seconds between two reads of the
+                                        device states (default 5.0)
+            status_file {str} -- JSON file updated with the state of all
+                                 devices (default None)
+        """
+        today = str(datetime.date.today())
+        try:
+            os.makedirs(SOURCE_PATH + "/log/" + today, exist_ok=True)
+        except OSError as e:
+            logging.error("Can not create log folder: " + str(e))
+        time_start = time.strftime("%H-%M-%S", time.localtime())
+        self.devices = [HeadlessDevice(params, today, time_start)
+                        for params in devices]
+        self.start_workers = max(1, start_workers)
+        self.monitor_interval = monitor_interval
+        self.status_file = status_file
+        self.status_task = None
+        self._ip_lock = threading.Lock()
+        self._port_lock = threading.Lock()
+        self._next_port = RPC_PORT_DEFAULT + 1
+        self._stopping = threading.Event()
+
+    def next_rpc_port(self):
+        """
+        Return a free rpc port.
+        """
+        with self._port_lock:
+            used = set(HandleRecoverDevices.list_recover_rpc_port)
+            used.update(device.rpcPort for device in self.devices)
+            while self._next_port in used:
+                self._next_port += 1
+            port = self._next_port
+            self._next_port += 1
+            return port
+
+    def start_device(self, device):
+        """
+        Prepare and start one device on a start worker.
+        """
+        if self._stopping.is_set():
+            return
+        try:
+            if not device.prepare():
+                return
+            with self._ip_lock:
+                if self._stopping.is_set() or not device.create_ip():
+                    return
+            if device.rpcPort is not None:
+                HandleRecoverDevices.list_recover_rpc_port.append(
+                    device.rpcPort)
+            device.start(self.next_rpc_port())
+            device.monitor_task = PollScheduler.instance().call_every(
+                self.monitor_interval, device.monitor)
+        except Exception as e:
+            device.fail(STATE_FAILED, 'Can not start device: ' + str(e))
+
+    def start(self):
+        """
+        Start all devices and return when all were started.
+        """
+        logging.info(f'Start {len(self.devices)} devices')
+        if self.status_file is not None:
+            self.status_task = PollScheduler.instance().call_every(
+                self.monitor_interval, self.save_status)
+        with concurrent.futures.ThreadPoolExecutor(
+                self.start_workers, thread_name_prefix='fleet-start') \
+                as executor:
+            list(executor.map(self.start_device, self.devices))
+        logging.info(f'Devices started: {self.summary()}')
+
+    def stop(self):
+        """
+        Stop all devices.
+        """
+        self._stopping.set()
+        if self.status_task is not None:
+            self.status_task.cancel()
+            self.status_task = None
+        for device in self.devices:
+            try:
+                device.stop()
+            except Exception as e:
+                logging.error(f'Can not stop device {device.targetId}: '
+                              + str(e))
+        if self.status_file is not None:
+            self.save_status()
+        logging.info(f'Devices stopped: {self.summary()}')
+
+    def summary(self):
+        """
+        Return the number of devices by state.
+        """
+        counts = {}
+        for device in self.devices:
+            counts[device.state] = counts.get(device.state, 0) + 1
+        return counts
+
+    def save_status(self):
+        """
+        Write the state of all devices to the status file.
+        """
+        status = {'updated': datetime.datetime.now().isoformat(),
+                  'summary': self.summary(),
+                  'devices': [device.status() for device in self.devices]}
+        try:
+            with open(self.status_file + '.tmp', 'w') as status_file:
+                json.dump(status, status_file, indent=4)
+            os.replace(self.status_file + '.tmp', self.status_file)
+        except OSError as e:
+            logging.error(f'Can not save status {self.status_file}: '
+                          + str(e))
+
+    def request_stop(self):
+        """
+        Make wait() return and skip the devices not started yet, safe to
+        call from a signal handler.
+        """
+        self._stopping.set()
+
+    def wait(self):
+        """
+        Wait until request_stop() or stop() is called.
+        """
+        self._stopping.wait()
+
+
+def main():
+    """
+    Run the devices of a manifest until SIGINT or SIGTERM.
+    """
+    parser = argparse.ArgumentParser(
+        description='Run emulated Matter devices from a manifest '
+                    'without UI')
+    parser.add_argument('manifest', help='JSON or YAML fleet manifest')
+    parser.add_argument('--status-file',
+                        help='JSON file updated with the device states')
+    parser.add_argument('--start-workers', type=int, default=None,
+                        help='devices prepared at the same time')
+    parser.add_argument('--monitor-interval', type=float, default=None,
+                        help='seconds between two reads of the states')
+    arguments = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="[%(asctime)s] [%(threadName)s] [%(filename)s:%(lineno)d] "
+               "%(levelname)s - %(message)s")
+    try:
+        config = read_config()
+        manifest = load_manifest(arguments.manifest)
+        devices = expand_devices(manifest, config)
+    except (OSError, ValueError, KeyError, FleetError) as e:
+        logging.error(str(e))
+        return 1
+    fleet = Fleet(
+        devices,
+        arguments.start_workers or manifest.get(
+            'start_workers', DEFAULT_START_WORKERS),
+        arguments.monitor_interval or manifest.get(
+            'monitor_interval', DEFAULT_MONITOR_INTERVAL),
+        arguments.status_file or manifest.get('status_file'))
+
+    def on_signal(signum, frame):
+        logging.info(f'Signal {signum}, stopping devices')
+        fleet.request_stop()
+
+    signal.signal(signal.SIGINT, on_signal)
+    signal.signal(signal.SIGTERM, on_signal)
+    starter = threading.Thread(target=fleet.start, name='fleet')
+    starter.daemon = True
+    starter.start()
+    fleet.wait()
+    starter.join()
+    fleet.stop()
+    PollScheduler.instance().stop()
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
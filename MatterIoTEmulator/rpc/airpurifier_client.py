@@ -15,7 +15,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
-from rpc.device_client import DeviceClient
+from rpc.device_client import AsyncDeviceClient, DeviceClient
 from google.protobuf import json_format
 from airpurifier_service import airpurifier_service_pb2
 import time
@@ -33,6 +33,16 @@ class AirPurifierClient(DeviceClient):
     AirPurifier Client class for creating a device.
     """
 
+    PROTOS = DeviceClient.PROTOS + ('airpurifier_service',)
+
+    SNAPSHOT_READS = (('air_purifier_status', 'GetAirPurifierSensor'),
+                      ('ep2_temp_measure_status', 'GetTempValue'),
+                      ('hepa_filter_status', 'GetCondition'),
+                      ('ep3_humidity_measure_status', 'GetHumidityValue'),
+                      ('device_air_status', 'GetAirQuality'),
+                      ('device_concentration_status', 'GetPM25'),
+                      ('device_state', 'get_device_state'))
+
     def __init__(self, socket_addr=None):
         """
         Initialize a AirPurifier client instance.
@@ -46,11 +56,9 @@ class AirPurifierClient(DeviceClient):
         """
         Return Air Purifier state.
         """
-        result = self.rpcs.chip.rpc.AirPurifier.GetAirPurifierSensor()
-        # logging.info(result)
-        reply = json_format.MessageToDict(
-            result[1], airpurifier_service_pb2.AirPurifierState())
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(
+            self.rpcs.chip.rpc.AirPurifier.GetAirPurifierSensor,
+            include_defaults=True)
 
     def SetAirPurifierSensor(self, data):
         """
@@ -62,18 +70,15 @@ class AirPurifierClient(DeviceClient):
         arg = airpurifier_service_pb2.AirPurifierState()
         json_format.ParseDict(data, arg)
         # logging.info(arg)
-        result = self.rpcs.chip.rpc.AirPurifier.SetAirPurifierSensor(arg)
-        reply = json_format.MessageToDict(result[1])
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(
+            self.rpcs.chip.rpc.AirPurifier.SetAirPurifierSensor, arg)
 
     def GetTempValue(self):
         """
         Return measured value.
         """
-        result = self.rpcs.chip.rpc.AirPurifier.GetTempValue()
-        reply = json_format.MessageToDict(
-            result[1], airpurifier_service_pb2.TemperatureMeasurementAirPurifier())
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(
+            self.rpcs.chip.rpc.AirPurifier.GetTempValue, include_defaults=True)
 
     def SetTempValue(self, data):
         """
@@ -84,18 +89,15 @@ class AirPurifierClient(DeviceClient):
         """
         arg = airpurifier_service_pb2.TemperatureMeasurementAirPurifier()
         json_format.ParseDict(data, arg)
-        result = self.rpcs.chip.rpc.AirPurifier.SetTempValue(arg)
-        reply = json_format.MessageToDict(result[1])
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(self.rpcs.chip.rpc.AirPurifier.SetTempValue, arg)
 
     def GetHumidityValue(self):
         """
         Return humidity value.
         """
-        result = self.rpcs.chip.rpc.AirPurifier.GetHumidityValue()
-        reply = json_format.MessageToDict(
-            result[1], airpurifier_service_pb2.RelativeHumidityMeasurementAirPurifier())
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(
+            self.rpcs.chip.rpc.AirPurifier.GetHumidityValue,
+            include_defaults=True)
 
     def SetHumidityValue(self, data):
         """
@@ -106,18 +108,16 @@ class AirPurifierClient(DeviceClient):
         """
         arg = airpurifier_service_pb2.RelativeHumidityMeasurementAirPurifier()
         json_format.ParseDict(data, arg)
-        result = self.rpcs.chip.rpc.AirPurifier.SetHumidityValue(arg)
-        reply = json_format.MessageToDict(result[1])
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(
+            self.rpcs.chip.rpc.AirPurifier.SetHumidityValue, arg)
 
     def GetAirQuality(self):
         """
         Return AirQuality value.
         """
-        result = self.rpcs.chip.rpc.AirPurifier.GetAirQuality()
-        reply = json_format.MessageToDict(
-            result[1], airpurifier_service_pb2.AirQualityAirPurifier())
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(
+            self.rpcs.chip.rpc.AirPurifier.GetAirQuality,
+            include_defaults=True)
 
     def SetAirQuality(self, data):
         """
@@ -128,18 +128,14 @@ class AirPurifierClient(DeviceClient):
         """
         arg = airpurifier_service_pb2.AirQualityAirPurifier()
         json_format.ParseDict(data, arg)
-        result = self.rpcs.chip.rpc.AirPurifier.SetAirQuality(arg)
-        reply = json_format.MessageToDict(result[1])
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(self.rpcs.chip.rpc.AirPurifier.SetAirQuality, arg)
 
     def GetCondition(self):
         """
         Return AirCondition value.
         """
-        result = self.rpcs.chip.rpc.AirPurifier.GetCondition()
-        reply = json_format.MessageToDict(
-            result[1], airpurifier_service_pb2.HEPAFilterMonitoringAirPurifier())
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(
+            self.rpcs.chip.rpc.AirPurifier.GetCondition, include_defaults=True)
 
     def SetCondition(self, data):
         """
@@ -150,19 +146,15 @@ class AirPurifierClient(DeviceClient):
         """
         arg = airpurifier_service_pb2.HEPAFilterMonitoringAirPurifier()
         json_format.ParseDict(data, arg)
-        result = self.rpcs.chip.rpc.AirPurifier.SetCondition(arg)
-        reply = json_format.MessageToDict(result[1])
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(self.rpcs.chip.rpc.AirPurifier.SetCondition, arg)
 
     # PM25
     def GetPM25(self):
         """
         Return PM25 value.
         """
-        result = self.rpcs.chip.rpc.AirPurifier.GetPM25()
-        reply = json_format.MessageToDict(
-            result[1], airpurifier_service_pb2.PM25ConcentrationMeasurementAirPurifier())
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(
+            self.rpcs.chip.rpc.AirPurifier.GetPM25, include_defaults=True)
 
     def SetPM25(self, data):
         """
@@ -173,19 +165,16 @@ class AirPurifierClient(DeviceClient):
         """
         arg = airpurifier_service_pb2.PM25ConcentrationMeasurementAirPurifier()
         json_format.ParseDict(data, arg)
-        result = self.rpcs.chip.rpc.AirPurifier.SetPM25(arg)
-        reply = json_format.MessageToDict(result[1])
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(self.rpcs.chip.rpc.AirPurifier.SetPM25, arg)
     
     # Thermostat
     def GetThermostat(self):
         """
         Return Thermostat value.
         """
-        result = self.rpcs.chip.rpc.AirPurifier.GetThermostat()
-        reply = json_format.MessageToDict(
-            result[1], airpurifier_service_pb2.ThermostatAirPurifier())
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(
+            self.rpcs.chip.rpc.AirPurifier.GetThermostat,
+            include_defaults=True)
 
     def SetThermostat(self, data):
         """
@@ -196,9 +185,13 @@ class AirPurifierClient(DeviceClient):
         """
         arg = airpurifier_service_pb2.ThermostatAirPurifier()
         json_format.ParseDict(data, arg)
-        result = self.rpcs.chip.rpc.AirPurifier.SetThermostat(arg)
-        reply = json_format.MessageToDict(result[1])
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(self.rpcs.chip.rpc.AirPurifier.SetThermostat, arg)
+
+
+class AsyncAirPurifierClient(AsyncDeviceClient, AirPurifierClient):
+    """
+    AirPurifier client class returning awaitable results.
+    """
 
 
 if __name__ == '__main__':
@@ -15,7 +15,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
-from rpc.device_client import DeviceClient
+from rpc.device_client import AsyncDeviceClient, DeviceClient
 from google.protobuf import json_format
 from airqualitysensor_service import airqualitysensor_service_pb2
 import time
@@ -26,6 +26,8 @@ class AirqualityClient(DeviceClient):
     AirQuality client class for creating a device.
     """
 
+    PROTOS = DeviceClient.PROTOS + ('airqualitysensor_service',)
+
     def __init__(self, socket_addr=None):
         """
         Initialize a AirQuality client instance.
@@ -39,10 +41,8 @@ class AirqualityClient(DeviceClient):
         """
         Return AirQuality sensor state.
         """
-        result = self.rpcs.chip.rpc.AirQualitySensor.Get()
-        reply = json_format.MessageToDict(
-            result[1], airqualitysensor_service_pb2.AirQualitySensorState())
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(
+            self.rpcs.chip.rpc.AirQualitySensor.Get, include_defaults=True)
 
     def set(self, data):
         """
@@ -53,9 +53,13 @@ class AirqualityClient(DeviceClient):
         """
         arg = airqualitysensor_service_pb2.AirQualitySensorState()
         json_format.ParseDict(data, arg)
-        result = self.rpcs.chip.rpc.AirQualitySensor.Set(arg)
-        reply = json_format.MessageToDict(result[1])
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(self.rpcs.chip.rpc.AirQualitySensor.Set, arg)
+
+
+class AsyncAirqualityClient(AsyncDeviceClient, AirqualityClient):
+    """
+    AirQuality client class returning awaitable results.
+    """
 
 
 if __name__ == '__main__':
@@ -0,0 +1,168 @@
+# Copyright (c) 2024 LG Electronics, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import heapq
+import itertools
+import threading
+
+# Request priorities, lower runs first
+PRIORITY_WRITE = 0
+PRIORITY_READ = 1
+PRIORITY_POLL = 2
+
+DEFAULT_MAX_PENDING = 16
+
+
+class DeviceBusyError(Exception):
+    """
+    Raised by a request refused or dropped because the request queue of
+    the device is full.
+    """
+
+    def __init__(self, name, pending):
+        self.name = name
+        self.pending = pending
+        super().__init__(
+            f'Device {name} is busy: {pending} requests pending')
+
+
+class _Request:
+    """
+    _Request class of a call waiting in a DeviceActor queue.
+    """
+
+    __slots__ = ('priority', 'seq', 'func', 'args', 'done', 'result',
+                 'error')
+
+    def __init__(self, priority, seq, func, args):
+        self.priority = priority
+        self.seq = seq
+        self.func = func
+        self.args = args
+        self.done = False
+        self.result = None
+        self.error = None
+
+    def __lt__(self, other):
+        return (self.priority, self.seq) < (other.priority, other.seq)
+
+
+class DeviceActor:
+    """
+    DeviceActor class running the requests of one device one at a time.
+
+    Requests wait in a queue ordered by priority, then by arrival, so user
+    writes go ahead of background polls. The actor has no thread of its
+    own: the first caller finding it idle runs the queued requests, its own
+    included, and hands over to the next waiting caller once its request
+    is done. A request made while running another one, e.g. a client
+    method calling another, runs at once.
+
+    The queue holds at most max_pending requests. When it is full a new
+    request takes the place of the last pending one of lower priority,
+    which fails with DeviceBusyError, or fails itself.
+    """
+
+    def __init__(self, name, max_pending=DEFAULT_MAX_PENDING):
+        """
+        Initialize a DeviceActor instance.
+
+        Arguments:
+            name {str} -- name of the device used in errors
+            max_pending {int} -- size of the request queue (default 16)
+        """
+        self.name = name
+        self.max_pending = max_pending
+        self.dropped_count = 0
+        self._queue = []
+        self._counter = itertools.count()
+        self._cond = threading.Condition()
+        self._owner = None
+
+    @property
+    def pending(self):
+        """
+        Return the number of queued requests.
+        """
+        return len(self._queue)
+
+    def call(self, priority, func, *args):
+        """
+        Queue a request, wait for its turn and return its result.
+
+        Arguments:
+            priority {int} -- one of the PRIORITY_* values
+            func {callable} -- the function running the request
+        Raises:
+            DeviceBusyError: if the queue is full
+        """
+        current = threading.current_thread()
+        if self._owner is current:
+            return func(*args)
+        request = _Request(priority, next(self._counter), func, args)
+        with self._cond:
+            self._push(request)
+            while not request.done and self._owner is not None:
+                self._cond.wait()
+            if not request.done:
+                self._owner = current
+        if not request.done:
+            self._drain(request)
+        if request.error is not None:
+            raise request.error
+        return request.result
+
+    def _push(self, request):
+        """
+        Queue a request, make room for it when the queue is full, the
+        caller holds the lock.
+        """
+        if len(self._queue) >= self.max_pending:
+            victim = max(self._queue)
+            if victim.priority <= request.priority:
+                self.dropped_count += 1
+                raise DeviceBusyError(self.name, len(self._queue))
+            self._queue.remove(victim)
+            heapq.heapify(self._queue)
+            victim.error = DeviceBusyError(self.name, len(self._queue))
+            victim.done = True
+            self.dropped_count += 1
+            self._cond.notify_all()
+        heapq.heappush(self._queue, request)
+
+    def _drain(self, mine):
+        """
+        Run the queued requests in order until mine is done, then let the
+        next waiting caller take over.
+        """
+        try:
+            while True:
+                with self._cond:
+                    if mine.done or not self._queue:
+                        break
+                    request = heapq.heappop(self._queue)
+                try:
+                    request.result = request.func(*request.args)
+                except BaseException as e:
+                    request.error = e
+                with self._cond:
+                    request.done = True
+                    self._cond.notify_all()
+        finally:
+            with self._cond:
+                self._owner = None
+                self._cond.notify_all()
@@ -15,132 +15,59 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
+import asyncio
+import concurrent.futures
+import collections
 import logging
 import re
-import socket
 import sys
+import threading
+import time
 from typing import Any, BinaryIO, Collection
 
-from pw_hdlc.rpc import HdlcRpcClient, default_channels
+import pw_rpc
+from pw_hdlc.rpc import default_channels
 from pw_rpc import callback_client
 
 from pw_tokenizer.detokenize import Detokenizer
 from pw_tokenizer import tokens
-from ui.ui_matter import Ui_Matter
-# Protos
-from attributes_service import attributes_service_pb2
-from button_service import button_service_pb2
-from descriptor_service import descriptor_service_pb2
+# Protos, the other services are loaded by the clients which use them
 from device_service import device_service_pb2
-from echo_service import echo_pb2
-from lighting_service import lighting_service_pb2
-from locking_service import locking_service_pb2
-from ot_cli_service import ot_cli_service_pb2
-from thread_service import thread_service_pb2
-from wifi_service import wifi_service_pb2
-from pump_service import pump_service_pb2
-from plug_service import plug_service_pb2
-from sensor_service import sensor_service_pb2
 from google.protobuf import json_format
-from window_service import window_service_pb2
-from lock_service import lock_service_pb2
-from fan_service import fan_service_pb2
-from hvac_service import hvac_service_pb2
-from thermostat_service import thermostat_service_pb2
-from airpurifier_service import airpurifier_service_pb2
-from airqualitysensor_service import airqualitysensor_service_pb2
-from dishwasher_service import dishwasher_service_pb2
-from laundrywasher_service import laundrywasher_service_pb2
-from roomairconditioner_service import roomairconditioner_service_pb2
-from refrigerator_service import refrigerator_service_pb2
-from smokecoalarm_service import smokecoalarm_service_pb2
-from rvc_service import rvc_service_pb2
-from generic_switch_service import generic_switch_service_pb2
+from rpc.device_actor import (PRIORITY_POLL, PRIORITY_READ, PRIORITY_WRITE,
+                              DeviceActor)
+from rpc.proto_registry import load_services
+from rpc.rpc_metrics import (OUTCOME_ERROR, OUTCOME_OK, OUTCOME_TIMEOUT,
+                             OUTCOME_UNAVAILABLE, RpcMetrics)
+from rpc.rpc_result import RpcResult
+from rpc.rpc_session import DeviceUnavailableError, RpcSession
+from rpc.state_cache import DeviceStateCache
+from rpc.subscription import SubscriptionManager
 
 _LOG = logging.getLogger(__name__)
 _DEVICE_LOG = logging.getLogger('rpc_device')
 
-PW_RPC_MAX_PACKET_SIZE = 256
 SOCKET_SERVER = 'localhost'
 SOCKET_PORT = 33000
 
-PROTOS = [attributes_service_pb2,
-          button_service_pb2,
-          descriptor_service_pb2,
-          device_service_pb2,
-          echo_pb2,
-          lighting_service_pb2,
-          pump_service_pb2,
-          locking_service_pb2,
-          ot_cli_service_pb2,
-          thread_service_pb2,
-          plug_service_pb2,
-          sensor_service_pb2,
-          window_service_pb2,
-          wifi_service_pb2,
-          lock_service_pb2,
-          fan_service_pb2,
-          hvac_service_pb2,
-          thermostat_service_pb2,
-          airpurifier_service_pb2,
-          airqualitysensor_service_pb2,
-          dishwasher_service_pb2,
-          laundrywasher_service_pb2,
-          roomairconditioner_service_pb2,
-          refrigerator_service_pb2,
-          smokecoalarm_service_pb2,
-          rvc_service_pb2,
-          generic_switch_service_pb2]
-
-
-class SocketClientImpl:
-    """
-    SocketClientImpl class for creating common socket.
-    """
+# Result modes: plain dictionaries or RpcResult converting replies lazily
+RESULT_MODE_DICT = 'dict'
+RESULT_MODE_LAZY = 'lazy'
 
-    def __init__(self, config: str):
-        """
-        Initialize a SocketClientImpl instance.
 
-        Arguments:
-            config {str} -- configuration about ip address and port
-        Raises:
-            Exception: if socket creation has an error
-        """
-        try:
-            # self.ui = Ui_Matter()
-            # SOCKET_PORT = self.ui.txt_productid.text()
-            self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            socket_server = ''
-            socket_port = 0
-
-            if config == 'default':
-                socket_server = SOCKET_SERVER
-                socket_port = SOCKET_PORT
-            else:
-                socket_server, socket_port_str = config.split(':')
-                socket_port = int(socket_port_str)
-            self.socket.connect((socket_server, socket_port))
-        except Exception as e:
-            logging.error("Failed to initial RPC: " + str(e))
-
-    def write(self, data: bytes):
-        """
-        Send data to network via a socket connection.
-
-        Arguments:
-            data {[byte]} -- the number of bytes need to write
-        """
-        self.socket.sendall(data)
-
-    def read(self, num_bytes: int = PW_RPC_MAX_PACKET_SIZE):
-        """
-        Return the numbers of bytes read from network via a socket connection.
+def parse_socket_address(config: str):
+    """
+    Return the (host, port) pair of a socket configuration.
 
-        Arguments:
-            num_bytes {int} -- the number of bytes to be read (default 256)
-        """
-        return self.socket.recv(num_bytes)
+    Arguments:
+        config {str} -- 'default' or 'host:port'
+    Raises:
+        ValueError: if the configuration is not valid
+    """
+    if config == 'default':
+        return SOCKET_SERVER, SOCKET_PORT
+    socket_server, socket_port_str = config.split(':')
+    return socket_server, int(socket_port_str)
 
 
 def write_to_output(data: bytes,
@@ -157,11 +84,25 @@ def write_to_output(data: bytes,
     pass
 
 
+_PendingUnary = collections.namedtuple(
+    '_PendingUnary', ['method', 'future', 'include_defaults'])
+
+
 class DeviceClient():
     """
     DeviceClient class for creating a device.
     """
 
+    # rpc services registered to the client, see rpc.proto_registry
+    PROTOS = ('device_service',)
+
+    # (result key, client method) of the reads snapshot() issues together
+    SNAPSHOT_READS = (('device_status', 'get'),
+                      ('device_state', 'get_device_state'))
+
+    # Default result mode of the client methods, see set_result_mode()
+    result_mode = RESULT_MODE_DICT
+
     def __init__(self, socket_addr=None) -> None:
         """
         Initialize a DeviceClient instance.
@@ -171,14 +112,30 @@ class DeviceClient():
         Raises:
             Exception: if socket creation has an error
         """
+        self._client = None
+        self.session = None
+        self.metrics = None
+        self._call_lock = threading.Lock()
+        # Reads, writes and polls of the device run one at a time
+        self.actor = DeviceActor(str(socket_addr or 'default'))
+        # Pending calls, added by the calling threads and removed by the
+        # transport thread
+        self._inflight = set()
+        self._inflight_lock = threading.Lock()
+        self._deferred = threading.local()
+        self.state_cache = DeviceStateCache()
+        self._last_snapshot = {}
+        self._write_listeners = []
+        self._subscriptions = None
+        self.last_poll_time = 0.0
         try:
             if not socket_addr:
                 socket_addr = 'default'
             output = sys.stdout.buffer
             try:
-                self.socket_device = SocketClientImpl(socket_addr)
-                read = self.socket_device.read
-                write = self.socket_device.write
+                address = parse_socket_address(socket_addr)
+                self.session = RpcSession(address)
+                self.metrics = RpcMetrics('{}:{}'.format(*address))
             except ValueError:
                 _LOG.exception(
                     'Failed to initialize socket at %s',
@@ -194,11 +151,21 @@ class DeviceClient():
                 default_unary_timeout_s=10.0,
                 default_stream_timeout_s=None,
             )
-            self._client = HdlcRpcClient(read, PROTOS, default_channels(write),
-                                         lambda data: write_to_output(
-                                             data, output, detokenizer),
-                                         client_impl=callback_client_impl)
-            self._rpcs = self._client.client.channel(1).rpcs
+            # Service descriptors are shared, only the channel is per device
+            self._client = pw_rpc.Client(
+                callback_client_impl, default_channels(self.session.write),
+                load_services(self.PROTOS))
+            # Responses are read by the transport shared by all devices,
+            # the session reconnects in the background when the device is
+            # down
+            self.session.add_listener(self._on_session_changed)
+            self.session.open(self._client,
+                              lambda data: write_to_output(
+                                  data, output, detokenizer))
+            if not self.session.available:
+                logging.error("Failed to initial RPC: " +
+                              str(self.session.reason))
+            self._rpcs = self._client.channel(1).rpcs
         except Exception as e:
             logging.error("Failed to initial RPC: " + str(e))
 
@@ -213,34 +180,391 @@ class DeviceClient():
         """
         Close a rpc client socket.
         """
+        if self._subscriptions is not None:
+            self._subscriptions.close()
         if (self._client is not None):
-            self._client.close()
-            del self._client
-            self.socket_device.socket.close()
+            self.session.close()
+            self.metrics.close()
+            self._client = None
+
+    @property
+    def available(self):
+        """
+        Return True while the rpc session of the device is connected.
+        """
+        return self.session is not None and self.session.available
+
+    def _on_session_changed(self, available):
+        """
+        Fail the pending calls when the device goes down, start over with
+        an empty state cache and wake the pollers up when it comes back.
+        """
+        if not available:
+            error = DeviceUnavailableError(self.session.address,
+                                           self.session.reason)
+            with self._inflight_lock:
+                futures = list(self._inflight)
+            for future in futures:
+                try:
+                    future.set_exception(error)
+                except concurrent.futures.InvalidStateError:
+                    pass
+            return
+        self.state_cache.clear()
+        self._last_snapshot = {}
+        self._notify_write()
+
+    def _call_done(self, call, future, name, started):
+        """
+        Record the outcome of a call in the metrics and session health.
+        """
+        with self._inflight_lock:
+            self._inflight.discard(future)
+        latency = time.monotonic() - started
+        if future.cancelled():
+            # Calls are cancelled when they time out
+            self._cancel_call(call)
+            self.session.record_timeout()
+            self.metrics.record(name, OUTCOME_TIMEOUT, latency)
+        elif future.exception() is None:
+            self.session.record_success()
+            outcome = OUTCOME_OK if future.result()[0].ok() else OUTCOME_ERROR
+            self.metrics.record(name, outcome, latency)
+        elif isinstance(future.exception(), DeviceUnavailableError):
+            self._cancel_call(call)
+            self.metrics.record(name, OUTCOME_UNAVAILABLE, latency)
+        else:
+            self.metrics.record(name, OUTCOME_ERROR, latency)
+
+    def _cancel_call(self, call):
+        """
+        Cancel a pw_rpc call, ignoring a device which is down.
+        """
+        try:
+            call.cancel()
+        except DeviceUnavailableError:
+            pass
+
+    def _start_unary(self, method, request=None):
+        """
+        Send a unary rpc without waiting and return a Future of its
+        (status, response) pair. Cancelling the Future cancels the rpc.
+
+        Arguments:
+            method {_UnaryMethodClient} -- the rpc method to call
+            request {Message} -- the request message (default None)
+        Raises:
+            DeviceUnavailableError: if the device is down
+        """
+        name = f'{method.method.service.name}.{method.method.name}'
+        future = concurrent.futures.Future()
+
+        def on_completed(call, status):
+            if not future.done():
+                future.set_result((status, call.response))
+
+        def on_error(call, error):
+            if not future.done():
+                future.set_exception(callback_client.RpcError(method, error))
+
+        # pw_rpc allocates call ids and writes the socket without locking
+        started = time.monotonic()
+        try:
+            self.session.check()
+            with self._call_lock:
+                call = method.invoke(request, on_completed=on_completed,
+                                     on_error=on_error)
+        except DeviceUnavailableError:
+            self.metrics.record(name, OUTCOME_UNAVAILABLE)
+            raise
+        # A device going down fails the calls in flight, so a call added
+        # after it went down fails here
+        with self._inflight_lock:
+            self._inflight.add(future)
+            available = self.session.available
+        if not available:
+            try:
+                future.set_exception(DeviceUnavailableError(
+                    self.session.address, self.session.reason))
+            except concurrent.futures.InvalidStateError:
+                pass
+        future.add_done_callback(
+            lambda f: self._call_done(call, f, name, started))
+        if not method.method.name.startswith('Get'):
+            self._notify_write()
+        return future
+
+    def add_write_listener(self, callback):
+        """
+        Call a function each time the client sends a write rpc or
+        reconnects to the device.
+
+        Arguments:
+            callback {callable} -- function called without argument
+        """
+        self._write_listeners.append(callback)
+
+    def remove_write_listener(self, callback):
+        """
+        Stop calling a function added by add_write_listener().
+
+        Arguments:
+            callback {callable} -- the function to remove
+        """
+        if callback in self._write_listeners:
+            self._write_listeners.remove(callback)
+
+    def _notify_write(self):
+        """
+        Call the write listeners.
+        """
+        for callback in list(self._write_listeners):
+            try:
+                callback()
+            except Exception as e:
+                logging.error("Write listener failed: " + str(e))
+
+    def set_result_mode(self, mode):
+        """
+        Select the type of the results returned by the client methods.
+
+        Arguments:
+            mode {str} -- RESULT_MODE_DICT to return dictionaries or
+                          RESULT_MODE_LAZY to return RpcResult objects which
+                          convert the reply to a dictionary only when read
+        """
+        if mode not in (RESULT_MODE_DICT, RESULT_MODE_LAZY):
+            raise ValueError("Unknown result mode: " + str(mode))
+        self.result_mode = mode
+
+    def _to_result(self, response, include_defaults=False, latency=None):
+        """
+        Convert a (status, response) pair to the result of the result mode.
+
+        Arguments:
+            response {tuple} -- the rpc status and response message
+            include_defaults {bool} -- keep fields with default values
+                                       in the reply (default False)
+            latency {float} -- the call latency in seconds (default None)
+        """
+        if self.result_mode == RESULT_MODE_LAZY:
+            return RpcResult(response[0], response[1],
+                             include_defaults, latency)
+        reply = json_format.MessageToDict(response[1], include_defaults)
+        result = {'status': response[0].name, 'reply': reply}
+        if latency is not None:
+            result['latency'] = latency
+        return result
+
+    def _is_deferred(self):
+        """
+        Return True while client methods only start their rpc.
+        """
+        return getattr(self._deferred, 'enabled', False)
+
+    def _unary(self, method, request=None, include_defaults=False):
+        """
+        Call a unary rpc, wait for the response and return the result.
+
+        The call waits for its turn in the request queue of the device,
+        writes go ahead of reads and polls.
+
+        Arguments:
+            method {_UnaryMethodClient} -- the rpc method to call
+            request {Message} -- the request message (default None)
+            include_defaults {bool} -- keep fields with default values
+                                       in the reply (default False)
+        Raises:
+            RpcTimeout: if no response is received in time
+            RpcError: if the rpc is terminated by an error
+            DeviceBusyError: if the request queue of the device is full
+        """
+        if self._is_deferred():
+            future = self._start_unary(method, request)
+            return _PendingUnary(method, future, include_defaults)
+        if method.method.name.startswith('Get'):
+            priority = PRIORITY_READ
+        else:
+            priority = PRIORITY_WRITE
+        return self.actor.call(priority, self._call_unary, method, request,
+                               include_defaults)
+
+    def _call_unary(self, method, request, include_defaults):
+        """
+        Send a unary rpc and wait for the result, run by the actor.
+        """
+        future = self._start_unary(method, request)
+        try:
+            response = future.result(method.default_timeout_s)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise callback_client.RpcTimeout(method, method.default_timeout_s)
+        return self._to_result(response, include_defaults)
+
+    def _start_snapshot(self, reads):
+        """
+        Start every read of a snapshot and return the pending calls.
+
+        Arguments:
+            reads {tuple} -- (result key, client method name) pairs
+        """
+        pending = collections.OrderedDict()
+        finished = {}
+        started = time.monotonic()
+        self._deferred.enabled = True
+        try:
+            for key, name in reads:
+                pending[key] = getattr(self, name)()
+                pending[key].future.add_done_callback(
+                    lambda f, key=key: finished.__setitem__(
+                        key, time.monotonic() - started))
+        except Exception:
+            for call in pending.values():
+                call.future.cancel()
+            raise
+        finally:
+            self._deferred.enabled = False
+        return pending, finished
+
+    def _snapshot_timeout(self, pending):
+        """
+        Return the longest default timeout of the pending calls.
+        """
+        timeouts = [call.method.default_timeout_s
+                    for call in pending.values()]
+        if None in timeouts:
+            return None
+        return max(timeouts, default=None)
+
+    def _snapshot_timeout_error(self, pending, timeout):
+        """
+        Return the RpcTimeout of the first read without a response.
+        """
+        methods = [call.method for call in pending.values()
+                   if call.future.cancelled() or not call.future.done()]
+        if not methods:
+            methods = [call.method for call in pending.values()]
+        return callback_client.RpcTimeout(methods[0], timeout)
+
+    def _snapshot_result(self, pending, finished, timestamp):
+        """
+        Combine the results of the completed snapshot reads.
+        """
+        snapshot = {'timestamp': timestamp,
+                    'latency': max(finished.values(), default=0.0)}
+        for key, call in pending.items():
+            snapshot[key] = self._to_result(call.future.result(),
+                                            call.include_defaults,
+                                            finished.get(key))
+        return snapshot
+
+    def snapshot(self, reads=None):
+        """
+        Issue all reads of the device type concurrently and return one
+        combined result with the read time and per call latency.
+
+        Arguments:
+            reads {tuple} -- (result key, client method name) pairs
+                             (default SNAPSHOT_READS)
+        Raises:
+            RpcTimeout: if a read gets no response in time
+            RpcError: if a read is terminated by an error
+            DeviceBusyError: if the request queue of the device is full
+        """
+        return self.actor.call(PRIORITY_READ, self._call_snapshot, reads)
+
+    def _call_snapshot(self, reads):
+        """
+        Issue the reads of a snapshot and wait for them, run by the actor.
+        """
+        timestamp = time.time()
+        pending, finished = self._start_snapshot(
+            reads or self.SNAPSHOT_READS)
+        futures = [call.future for call in pending.values()]
+        timeout = self._snapshot_timeout(pending)
+        _, not_done = concurrent.futures.wait(futures, timeout)
+        if not_done:
+            error = self._snapshot_timeout_error(pending, timeout)
+            for future in not_done:
+                future.cancel()
+            raise error
+        return self._snapshot_result(pending, finished, timestamp)
+
+    def _merge_snapshot(self, snapshot, changes):
+        """
+        Merge a snapshot of some reads with the last results of the others
+        and hand the changes to the subscriptions.
+        """
+        merged = dict(self._last_snapshot)
+        merged.update(snapshot)
+        self._last_snapshot = merged
+        self.last_poll_time = time.monotonic()
+        if self._subscriptions is not None:
+            self._subscriptions.dispatch(changes)
+        return merged
+
+    def subscribe(self, attribute_path, callback, min_interval=0.0,
+                  max_interval=None):
+        """
+        Subscribe to the changes of an attribute and return the
+        Subscription, whose cancel() method ends it.
+
+        Arguments:
+            attribute_path {str} -- dotted attribute path, e.g.
+                                    'device_status.temperatureValue', a path
+                                    of a message subscribes to all its fields
+            callback {callable} -- called with a {path: value} dictionary
+            min_interval {float} -- shortest time between two reports,
+                                    changes in between are merged (default 0)
+            max_interval {float} -- longest time without report, the current
+                                    values are reported again (default None)
+        """
+        if self._subscriptions is None:
+            self._subscriptions = SubscriptionManager(self)
+        return self._subscriptions.add(attribute_path, callback,
+                                       min_interval, max_interval)
+
+    def poll(self, reads=None):
+        """
+        Read a snapshot of the device, store it in the state cache and
+        return the last result of every read with the attributes changed
+        since last poll.
+
+        Polls wait behind the reads and writes queued for the device.
+
+        Arguments:
+            reads {tuple} -- (result key, client method name) pairs
+                             (default SNAPSHOT_READS)
+        Raises:
+            DeviceBusyError: if the request queue of the device is full
+        """
+        return self.actor.call(PRIORITY_POLL, self._call_poll, reads)
+
+    def _call_poll(self, reads):
+        """
+        Read a snapshot and update the state cache, run by the actor.
+        """
+        snapshot = self.snapshot(reads)
+        changes = self.state_cache.update(snapshot)
+        return self._merge_snapshot(snapshot, changes), changes
 
     def factory_reset(self):
         """
         Factory reset device and return the result.
         """
-        result = self._rpcs.chip.rpc.Device.FactoryReset()
-        reply = json_format.MessageToDict(result[1])
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(self.rpcs.chip.rpc.Device.FactoryReset)
 
     def reboot(self):
         """
         Reboot device and return the result.
         """
-        result = self._rpcs.chip.rpc.Device.Reboot()
-        reply = json_format.MessageToDict(result[1])
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(self.rpcs.chip.rpc.Device.Reboot)
 
     def trigger_ota(self):
         """
         Return current device information.
         """
-        result = self._rpcs.chip.rpc.Device.TriggerOta()
-        reply = json_format.MessageToDict(result[1])
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(self.rpcs.chip.rpc.Device.TriggerOta)
 
     def set_ota_metadata_for_provider(self, data):
         """
@@ -248,27 +572,22 @@ class DeviceClient():
         """
         arg = device_service_pb2.MetadataForProvider()
         json_format.ParseDict(data, arg)
-        result = self.rpcs.chip.rpc.Device.SetOtaMetadataForProvider(arg)
-        reply = json_format.MessageToDict(result[1])
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(
+            self.rpcs.chip.rpc.Device.SetOtaMetadataForProvider, arg)
 
     def get_device_info(self):
         """
         Return current device information.
         """
-        result = self._rpcs.chip.rpc.Device.GetDeviceInfo()
-        reply = json_format.MessageToDict(
-            result[1], device_service_pb2.DeviceInfo())
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(
+            self.rpcs.chip.rpc.Device.GetDeviceInfo, include_defaults=True)
 
     def get_device_state(self):
         """
         Return current device state.
         """
-        result = self._rpcs.chip.rpc.Device.GetDeviceState()
-        reply = json_format.MessageToDict(
-            result[1], device_service_pb2.DeviceState())
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(
+            self.rpcs.chip.rpc.Device.GetDeviceState, include_defaults=True)
 
     def set_pairing_state(self, data):
         """
@@ -279,18 +598,14 @@ class DeviceClient():
         """
         arg = device_service_pb2.PairingState()
         json_format.ParseDict(data, arg)
-        result = self.rpcs.chip.rpc.Device.SetPairingState(arg)
-        reply = json_format.MessageToDict(result[1])
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(self.rpcs.chip.rpc.Device.SetPairingState, arg)
 
     def get_pairing_state(self):
         """
         Return current pairing state of a device.
         """
-        result = self._rpcs.chip.rpc.Device.GetPairingState()
-        reply = json_format.MessageToDict(
-            result[1], device_service_pb2.PairingState())
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(
+            self.rpcs.chip.rpc.Device.GetPairingState, include_defaults=True)
 
     def set_pairing_info(self, data):
         """
@@ -301,18 +616,14 @@ class DeviceClient():
         """
         arg = device_service_pb2.PairingInfo()
         json_format.ParseDict(data, arg)
-        result = self.rpcs.chip.rpc.Device.SetPairingInfo(arg)
-        reply = json_format.MessageToDict(result[1])
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(self.rpcs.chip.rpc.Device.SetPairingInfo, arg)
 
     def get_spake_info(self):
         """
         Return spake infomation.
         """
-        result = self._rpcs.chip.rpc.Device.GetSpakeInfo()
-        reply = json_format.MessageToDict(
-            result[1], device_service_pb2.SpakeInfo())
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(
+            self.rpcs.chip.rpc.Device.GetSpakeInfo, include_defaults=True)
 
     def set_spake_info(self, data):
         """
@@ -323,6 +634,81 @@ class DeviceClient():
         """
         arg = device_service_pb2.SpakeInfo()
         json_format.ParseDict(data, arg)
-        result = self.rpcs.chip.rpc.Device.SetSpakeInfo(arg)
-        reply = json_format.MessageToDict(result[1])
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(self.rpcs.chip.rpc.Device.SetSpakeInfo, arg)
+
+
+class AsyncDeviceClient(DeviceClient):
+    """
+    AsyncDeviceClient class for creating a device with awaitable rpc calls.
+
+    Every client method sends its request immediately and returns an
+    awaitable of the same result, so many calls to one device or to
+    several devices can be in flight at the same time.
+    """
+
+    def _unary(self, method, request=None, include_defaults=False):
+        """
+        Call a unary rpc and return an awaitable of the result.
+
+        Arguments:
+            method {_UnaryMethodClient} -- the rpc method to call
+            request {Message} -- the request message (default None)
+            include_defaults {bool} -- keep fields with default values
+                                       in the reply (default False)
+        """
+        future = self._start_unary(method, request)
+        if self._is_deferred():
+            return _PendingUnary(method, future, include_defaults)
+        return self._wait_unary(method, future, include_defaults)
+
+    async def _wait_unary(self, method, future, include_defaults):
+        """
+        Wait for a unary rpc started by _start_unary and return the result.
+
+        Raises:
+            RpcTimeout: if no response is received in time
+            RpcError: if the rpc is terminated by an error
+        """
+        try:
+            response = await asyncio.wait_for(
+                asyncio.wrap_future(future), method.default_timeout_s)
+        except asyncio.TimeoutError:
+            raise callback_client.RpcTimeout(method, method.default_timeout_s)
+        return self._to_result(response, include_defaults)
+
+    async def snapshot(self, reads=None):
+        """
+        Issue all reads of the device type concurrently and return an
+        awaitable of the combined result.
+
+        Arguments:
+            reads {tuple} -- (result key, client method name) pairs
+                             (default SNAPSHOT_READS)
+        Raises:
+            RpcTimeout: if a read gets no response in time
+            RpcError: if a read is terminated by an error
+        """
+        timestamp = time.time()
+        pending, finished = self._start_snapshot(
+            reads or self.SNAPSHOT_READS)
+        timeout = self._snapshot_timeout(pending)
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*(asyncio.wrap_future(call.future)
+                                 for call in pending.values())), timeout)
+        except asyncio.TimeoutError:
+            raise self._snapshot_timeout_error(pending, timeout)
+        return self._snapshot_result(pending, finished, timestamp)
+
+    async def poll(self, reads=None):
+        """
+        Read a snapshot of the device, store it in the state cache and
+        return an awaitable of the snapshot and the changed attributes.
+
+        Arguments:
+            reads {tuple} -- (result key, client method name) pairs
+                             (default SNAPSHOT_READS)
+        """
+        snapshot = await self.snapshot(reads)
+        changes = self.state_cache.update(snapshot)
+        return self._merge_snapshot(snapshot, changes), changes
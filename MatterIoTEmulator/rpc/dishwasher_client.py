@@ -15,7 +15,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
-from rpc.device_client import DeviceClient
+from rpc.device_client import AsyncDeviceClient, DeviceClient
 from google.protobuf import json_format
 from dishwasher_service import dishwasher_service_pb2
 import time
@@ -26,6 +26,8 @@ class DishwasherClient(DeviceClient):
     Dishwasher client class for creating a device.
     """
 
+    PROTOS = DeviceClient.PROTOS + ('dishwasher_service',)
+
     def __init__(self, socket_addr=None):
         """
         Initialize a Dishwasher client instance.
@@ -39,10 +41,8 @@ class DishwasherClient(DeviceClient):
         """
         Return Dishwasher state.
         """
-        result = self.rpcs.chip.rpc.Dishwasher.Get()
-        reply = json_format.MessageToDict(
-            result[1], dishwasher_service_pb2.DishwasherState())
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(
+            self.rpcs.chip.rpc.Dishwasher.Get, include_defaults=True)
 
     def set(self, data):
         """
@@ -53,9 +53,13 @@ class DishwasherClient(DeviceClient):
         """
         arg = dishwasher_service_pb2.DishwasherState()
         json_format.ParseDict(data, arg)
-        result = self.rpcs.chip.rpc.Dishwasher.Set(arg)
-        reply = json_format.MessageToDict(result[1])
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(self.rpcs.chip.rpc.Dishwasher.Set, arg)
+
+
+class AsyncDishwasherClient(AsyncDeviceClient, DishwasherClient):
+    """
+    Dishwasher client class returning awaitable results.
+    """
 
 
 if __name__ == '__main__':
@@ -15,7 +15,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
-from rpc.device_client import DeviceClient
+from rpc.device_client import AsyncDeviceClient, DeviceClient
 from google.protobuf import json_format
 from fan_service import fan_service_pb2
 import time
@@ -26,6 +26,8 @@ class FanClient(DeviceClient):
     Fan client class for creating a device.
     """
 
+    PROTOS = DeviceClient.PROTOS + ('fan_service',)
+
     def __init__(self, socket_addr=None):
         """
         Initialize a FAN client instance.
@@ -39,10 +41,7 @@ class FanClient(DeviceClient):
         """
         Return Fan state.
         """
-        result = self.rpcs.chip.rpc.Fan.Get()
-        reply = json_format.MessageToDict(
-            result[1], fan_service_pb2.FanState())
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(self.rpcs.chip.rpc.Fan.Get, include_defaults=True)
 
     def set(self, data):
         """
@@ -53,9 +52,13 @@ class FanClient(DeviceClient):
         """
         arg = fan_service_pb2.FanState()
         json_format.ParseDict(data, arg)
-        result = self.rpcs.chip.rpc.Fan.Set(arg)
-        reply = json_format.MessageToDict(result[1])
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(self.rpcs.chip.rpc.Fan.Set, arg)
+
+
+class AsyncFanClient(AsyncDeviceClient, FanClient):
+    """
+    Fan client class returning awaitable results.
+    """
 
 
 if __name__ == '__main__':
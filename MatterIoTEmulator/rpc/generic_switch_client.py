@@ -15,7 +15,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
-from rpc.device_client import DeviceClient
+from rpc.device_client import AsyncDeviceClient, DeviceClient
 from google.protobuf import json_format
 from generic_switch_service import generic_switch_service_pb2
 import time
@@ -26,6 +26,8 @@ class GenericSwitchClient(DeviceClient):
     GenericSwitch client class for creating a device.
     """
 
+    PROTOS = DeviceClient.PROTOS + ('generic_switch_service',)
+
     def __init__(self, socket_addr=None):
         """
         Initialize a GenericSwitch client instance.
@@ -39,10 +41,8 @@ class GenericSwitchClient(DeviceClient):
         """
         Return GenericSwitch state.
         """
-        result = self.rpcs.chip.rpc.GenericSwitchService.Get()
-        reply = json_format.MessageToDict(
-            result[1], generic_switch_service_pb2.GenericSwitchState())
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(
+            self.rpcs.chip.rpc.GenericSwitchService.Get, include_defaults=True)
 
     def set(self, data):
         """
@@ -53,9 +53,7 @@ class GenericSwitchClient(DeviceClient):
         """
         arg = generic_switch_service_pb2.GenericSwitchState()
         json_format.ParseDict(data, arg)
-        result = self.rpcs.chip.rpc.GenericSwitchService.Set(arg)
-        reply = json_format.MessageToDict(result[1])
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(self.rpcs.chip.rpc.GenericSwitchService.Set, arg)
 
     def OnSwitchLatch(self, data):
         """
@@ -66,9 +64,8 @@ class GenericSwitchClient(DeviceClient):
         """
         arg = generic_switch_service_pb2.GenericSwitchState()
         json_format.ParseDict(data, arg)
-        result = self.rpcs.chip.rpc.GenericSwitchService.OnSwitchLatch(arg)
-        reply = json_format.MessageToDict(result[1])
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(
+            self.rpcs.chip.rpc.GenericSwitchService.OnSwitchLatch, arg)
 
     def OnInitialPress(self, data):
         """
@@ -79,9 +76,8 @@ class GenericSwitchClient(DeviceClient):
         """
         arg = generic_switch_service_pb2.GenericSwitchState()
         json_format.ParseDict(data, arg)
-        result = self.rpcs.chip.rpc.GenericSwitchService.OnInitialPress(arg)
-        reply = json_format.MessageToDict(result[1])
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(
+            self.rpcs.chip.rpc.GenericSwitchService.OnInitialPress, arg)
 
     def OnLongPress(self, data):
         """
@@ -92,9 +88,8 @@ class GenericSwitchClient(DeviceClient):
         """
         arg = generic_switch_service_pb2.GenericSwitchState()
         json_format.ParseDict(data, arg)
-        result = self.rpcs.chip.rpc.GenericSwitchService.OnLongPress(arg)
-        reply = json_format.MessageToDict(result[1])
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(
+            self.rpcs.chip.rpc.GenericSwitchService.OnLongPress, arg)
 
     def OnShortRelease(self, data):
         """
@@ -105,9 +100,8 @@ class GenericSwitchClient(DeviceClient):
         """
         arg = generic_switch_service_pb2.GenericSwitchState()
         json_format.ParseDict(data, arg)
-        result = self.rpcs.chip.rpc.GenericSwitchService.OnShortRelease(arg)
-        reply = json_format.MessageToDict(result[1])
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(
+            self.rpcs.chip.rpc.GenericSwitchService.OnShortRelease, arg)
 
     def OnLongRelease(self, data):
         """
@@ -118,9 +112,8 @@ class GenericSwitchClient(DeviceClient):
         """
         arg = generic_switch_service_pb2.GenericSwitchState()
         json_format.ParseDict(data, arg)
-        result = self.rpcs.chip.rpc.GenericSwitchService.OnLongRelease(arg)
-        reply = json_format.MessageToDict(result[1])
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(
+            self.rpcs.chip.rpc.GenericSwitchService.OnLongRelease, arg)
 
     def OnMultiPressOngoing(self, data):
         """
@@ -131,10 +124,8 @@ class GenericSwitchClient(DeviceClient):
         """
         arg = generic_switch_service_pb2.GenericSwitchState()
         json_format.ParseDict(data, arg)
-        result = self.rpcs.chip.rpc.GenericSwitchService.OnMultiPressOngoing(
-            arg)
-        reply = json_format.MessageToDict(result[1])
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(
+            self.rpcs.chip.rpc.GenericSwitchService.OnMultiPressOngoing, arg)
 
     def OnMultiPressComplete(self, data):
         """
@@ -145,10 +136,14 @@ class GenericSwitchClient(DeviceClient):
         """
         arg = generic_switch_service_pb2.GenericSwitchState()
         json_format.ParseDict(data, arg)
-        result = self.rpcs.chip.rpc.GenericSwitchService.OnMultiPressComplete(
-            arg)
-        reply = json_format.MessageToDict(result[1])
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(
+            self.rpcs.chip.rpc.GenericSwitchService.OnMultiPressComplete, arg)
+
+
+class AsyncGenericSwitchClient(AsyncDeviceClient, GenericSwitchClient):
+    """
+    GenericSwitch client class returning awaitable results.
+    """
 
 
 if __name__ == '__main__':
@@ -0,0 +1,193 @@
+# Copyright (c) 2024 LG Electronics, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import logging
+import socket
+import threading
+import time
+import zlib
+
+from pw_hdlc import encode, protocol
+from pw_hdlc.decode import Frame, FrameDecoder, FrameStatus
+
+_LOG = logging.getLogger(__name__)
+
+DEFAULT_READ_BUFFER_SIZE = 4096
+
+_FLAG = protocol.FLAG
+_FLAG_BYTE = bytes([protocol.FLAG])
+_ESCAPE_BYTE = bytes([protocol.ESCAPE])
+_ESCAPED_FLAG = bytes([protocol.ESCAPE, protocol.escape(protocol.FLAG)])
+_ESCAPED_ESCAPE = bytes([protocol.ESCAPE, protocol.escape(protocol.ESCAPE)])
+_MIN_FRAME_SIZE = 6  # 1 B address + 1 B control + 4 B CRC-32
+
+
+def decode_frame(data, start=0, end=None):
+    """
+    Decode the escaped bytes between two HDLC flags into a pw_hdlc Frame.
+
+    The content is checked in place through a memoryview of data, and
+    copied once into the bytes of the frame. The raw_encoded bytes of the
+    frame are the escaped content, without the flags.
+
+    Arguments:
+        data {bytes} -- the buffer holding the frame content
+        start {int} -- offset of the content in data (default 0)
+        end {int} -- offset after the content (default the end of data)
+    """
+    end = len(data) if end is None else end
+    with memoryview(data)[start:end] as view:
+        if data.find(_ESCAPE_BYTE, start, end) < 0:
+            if len(view) < _MIN_FRAME_SIZE:
+                status = FrameStatus.FRAMING_ERROR
+            elif (zlib.crc32(view[:-4])
+                  != int.from_bytes(view[-4:], 'little')):
+                status = FrameStatus.FCS_MISMATCH
+            else:
+                status = FrameStatus.OK
+            raw = bytes(view)
+            return Frame(raw, raw, status)
+        raw = bytes(view)
+    escapes = raw.count(_ESCAPED_FLAG) + raw.count(_ESCAPED_ESCAPE)
+    if raw.count(_ESCAPE_BYTE) != escapes:
+        return Frame(raw, raw, FrameStatus.FRAMING_ERROR)
+    decoded = raw.replace(_ESCAPED_FLAG, _FLAG_BYTE).replace(
+        _ESCAPED_ESCAPE, _ESCAPE_BYTE)
+    if len(decoded) < _MIN_FRAME_SIZE:
+        return Frame(raw, decoded, FrameStatus.FRAMING_ERROR)
+    if zlib.crc32(decoded[:-4]) != int.from_bytes(decoded[-4:], 'little'):
+        return Frame(raw, decoded, FrameStatus.FCS_MISMATCH)
+    return Frame(raw, decoded)
+
+
+class HdlcReader:
+    """
+    HdlcReader class reading HDLC frames from a socket.
+
+    Data is received with recv_into() into one reusable buffer, and frames
+    are cut out of it by searching the flag bytes, instead of receiving
+    small bytes objects and decoding them byte by byte. A frame is checked
+    in place by its offsets in the buffer and copied once, into the bytes
+    of the frame; only a frame split over two reads is first gathered in
+    a second buffer. The frames are the pw_hdlc Frame objects returned by
+    FrameDecoder, see decode_frame() for their raw_encoded bytes.
+    """
+
+    def __init__(self, buffer_size=DEFAULT_READ_BUFFER_SIZE):
+        """
+        Initialize a HdlcReader instance.
+
+        Arguments:
+            buffer_size {int} -- the receive buffer size (default 4096)
+        """
+        self._buffer = bytearray(buffer_size)
+        self._view = memoryview(self._buffer)
+        self._partial = bytearray()
+        self._in_frame = False
+
+    def read(self, sock):
+        """
+        Receive the available data of a socket and return the valid frames,
+        or None when the socket was closed by the peer.
+
+        Arguments:
+            sock {socket} -- a readable socket
+        """
+        size = sock.recv_into(self._view)
+        if not size:
+            return None
+        return list(self.process(self._buffer, size))
+
+    def process(self, data, size=None):
+        """
+        Decode and yield the valid frames of the received data.
+
+        Arguments:
+            data {bytes} -- received data
+            size {int} -- number of bytes of data to use (default all)
+        """
+        size = len(data) if size is None else size
+        start = 0
+        while start < size:
+            end = data.find(_FLAG, start, size)
+            if end < 0:
+                if self._in_frame:
+                    self._partial += memoryview(data)[start:size]
+                return
+            if self._partial:
+                self._partial += memoryview(data)[start:end]
+                frame_data, frame_start, frame_end = (
+                    self._partial, 0, len(self._partial))
+            else:
+                frame_data, frame_start, frame_end = data, start, end
+            if self._in_frame and frame_end > frame_start:
+                frame = decode_frame(frame_data, frame_start, frame_end)
+                if frame.ok():
+                    yield frame
+                else:
+                    _LOG.warning(
+                        'Failed to decode frame: %s; discarded %d bytes',
+                        frame.status.value, len(frame.raw_encoded))
+            elif frame_end > frame_start:
+                _LOG.warning('Discarded %d bytes outside of frames',
+                             frame_end - frame_start)
+            self._partial.clear()
+            self._in_frame = True
+            start = end + 1
+
+
+def benchmark(count=2000, payload_size=600, recv_size=256):
+    """
+    Compare the frames per second of HdlcReader with the recv() and
+    FrameDecoder path over a local socket pair and return both rates.
+
+    Arguments:
+        count {int} -- number of frames sent (default 2000)
+        payload_size {int} -- payload bytes per frame (default 600)
+        recv_size {int} -- recv() size of the FrameDecoder path
+                           (default 256)
+    """
+    payload = bytes(range(256)) * (payload_size // 256 + 1)
+    stream = encode.ui_frame(1, payload[:payload_size]) * count
+
+    def run(read):
+        reader_sock, writer_sock = socket.socketpair()
+        sender = threading.Thread(target=writer_sock.sendall, args=(stream,))
+        started = time.perf_counter()
+        sender.start()
+        received = 0
+        while received < count:
+            received += read(reader_sock)
+        elapsed = time.perf_counter() - started
+        sender.join()
+        reader_sock.close()
+        writer_sock.close()
+        return count / elapsed
+
+    decoder = FrameDecoder()
+    reader = HdlcReader()
+    rates = {
+        'recv+FrameDecoder': run(lambda sock: len(list(
+            decoder.process_valid_frames(sock.recv(recv_size))))),
+        'HdlcReader': run(lambda sock: len(reader.read(sock)))}
+    return rates
+
+
+if __name__ == '__main__':
+    # Micro benchmark of the socket reader
+    for name, rate in benchmark().items():
+        print(f'{name}: {rate:.0f} frames/s')
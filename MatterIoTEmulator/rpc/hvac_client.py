@@ -15,7 +15,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
-from rpc.device_client import DeviceClient
+from rpc.device_client import AsyncDeviceClient, DeviceClient
 from google.protobuf import json_format
 from hvac_service import hvac_service_pb2
 import time
@@ -26,6 +26,8 @@ class HvacClient(DeviceClient):
     Hvac client class for creating a device.
     """
 
+    PROTOS = DeviceClient.PROTOS + ('hvac_service',)
+
     def __init__(self, socket_addr=None):
         """
         Initialize a Hvac client instance.
@@ -42,10 +44,7 @@ class HvacClient(DeviceClient):
         Arguments:
             data {str} -- the Hvac state
         """
-        result = self.rpcs.chip.rpc.Hvac.Get()
-        reply = json_format.MessageToDict(
-            result[1], hvac_service_pb2.HvacState())
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(self.rpcs.chip.rpc.Hvac.Get, include_defaults=True)
 
     def set(self, data):
         """
@@ -56,9 +55,13 @@ class HvacClient(DeviceClient):
         """
         arg = hvac_service_pb2.HvacState()
         json_format.ParseDict(data, arg)
-        result = self.rpcs.chip.rpc.Hvac.Set(arg)
-        reply = json_format.MessageToDict(result[1])
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(self.rpcs.chip.rpc.Hvac.Set, arg)
+
+
+class AsyncHvacClient(AsyncDeviceClient, HvacClient):
+    """
+    Hvac client class returning awaitable results.
+    """
 
 
 if __name__ == '__main__':
@@ -15,7 +15,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
-from rpc.device_client import DeviceClient
+from rpc.device_client import AsyncDeviceClient, DeviceClient
 from google.protobuf import json_format
 from laundrywasher_service import laundrywasher_service_pb2
 import time
@@ -26,6 +26,8 @@ class LaundryWasherClient(DeviceClient):
     LaundryWasher client class for creating a device.
     """
 
+    PROTOS = DeviceClient.PROTOS + ('laundrywasher_service',)
+
     def __init__(self, socket_addr=None):
         """
         Initialize a LaundryWasher client instance.
@@ -39,10 +41,8 @@ class LaundryWasherClient(DeviceClient):
         """
         Return LaundryWasher state.
         """
-        result = self.rpcs.chip.rpc.LaundryWasherService.Get()
-        reply = json_format.MessageToDict(
-            result[1], laundrywasher_service_pb2.LaundryWasherState())
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(
+            self.rpcs.chip.rpc.LaundryWasherService.Get, include_defaults=True)
 
     def set(self, data):
         """
@@ -53,9 +53,13 @@ class LaundryWasherClient(DeviceClient):
         """
         arg = laundrywasher_service_pb2.LaundryWasherState()
         json_format.ParseDict(data, arg)
-        result = self.rpcs.chip.rpc.LaundryWasherService.Set(arg)
-        reply = json_format.MessageToDict(result[1])
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(self.rpcs.chip.rpc.LaundryWasherService.Set, arg)
+
+
+class AsyncLaundryWasherClient(AsyncDeviceClient, LaundryWasherClient):
+    """
+    LaundryWasher client class returning awaitable results.
+    """
 
 
 if __name__ == '__main__':
@@ -15,7 +15,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
-from rpc.device_client import DeviceClient
+from rpc.device_client import AsyncDeviceClient, DeviceClient
 from google.protobuf import json_format
 from lighting_service import lighting_service_pb2
 import time
@@ -26,6 +26,8 @@ class LightingClient(DeviceClient):
     Lighting client class for creating a device.
     """
 
+    PROTOS = DeviceClient.PROTOS + ('lighting_service',)
+
     def __init__(self, socket_addr=None):
         """
         Initialize a Lighting client instance.
@@ -39,10 +41,8 @@ class LightingClient(DeviceClient):
         """
         Return Lighting state.
         """
-        result = self.rpcs.chip.rpc.Lighting.Get()
-        reply = json_format.MessageToDict(
-            result[1], lighting_service_pb2.LightingState())
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(
+            self.rpcs.chip.rpc.Lighting.Get, include_defaults=True)
 
     def set(self, data):
         """
@@ -53,9 +53,13 @@ class LightingClient(DeviceClient):
         """
         arg = lighting_service_pb2.LightingState()
         json_format.ParseDict(data, arg)
-        result = self.rpcs.chip.rpc.Lighting.Set(arg)
-        reply = json_format.MessageToDict(result[1])
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(self.rpcs.chip.rpc.Lighting.Set, arg)
+
+
+class AsyncLightingClient(AsyncDeviceClient, LightingClient):
+    """
+    Lighting client class returning awaitable results.
+    """
 
 
 if __name__ == '__main__':
@@ -0,0 +1,457 @@
+# Copyright (c) 2024 LG Electronics, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import argparse
+import asyncio
+import importlib
+import inspect
+import itertools
+import json
+import logging
+import random
+import threading
+import time
+
+from rpc.device_actor import DeviceBusyError
+from rpc.rpc_metrics import LatencyHistogram
+from utils import sim_random
+
+PATTERN_UNIFORM = 'uniform'
+PATTERN_POISSON = 'poisson'
+PATTERN_BURST = 'burst'
+
+DEFAULT_BURST_SIZE = 10
+DEFAULT_MAX_INFLIGHT = 4
+
+
+def arrival_times(rate, pattern=PATTERN_UNIFORM,
+                  burst_size=DEFAULT_BURST_SIZE, rng=None):
+    """
+    Yield the seconds from the start of the attribute changes.
+
+    Arguments:
+        rate {float} -- changes per second
+        pattern {str} -- PATTERN_UNIFORM, evenly spaced, PATTERN_POISSON,
+                         exponential gaps, or PATTERN_BURST, burst_size
+                         changes at once (default PATTERN_UNIFORM)
+        burst_size {int} -- changes of a burst (default 10)
+        rng {Random} -- the random generator (default a new one)
+    Raises:
+        ValueError: if the pattern is unknown
+    """
+    rng = rng or random.Random()
+    if pattern == PATTERN_UNIFORM:
+        for count in itertools.count():
+            yield count / rate
+    elif pattern == PATTERN_POISSON:
+        offset = 0.0
+        while True:
+            yield offset
+            offset += rng.expovariate(rate)
+    elif pattern == PATTERN_BURST:
+        for count in itertools.count():
+            for _ in range(burst_size):
+                yield count * burst_size / rate
+    else:
+        raise ValueError(f'Unknown arrival pattern {pattern}')
+
+
+def random_change(attribute, low, high):
+    """
+    Return a change function setting an attribute to random integers.
+
+    Arguments:
+        attribute {str} -- the attribute set through the client
+        low {int} -- smallest value
+        high {int} -- largest value
+    """
+    def change(rng):
+        return 'set', ({attribute: rng.randint(low, high)},)
+    return change
+
+
+def toggle_change(attribute, values=(True, False)):
+    """
+    Return a change function setting an attribute to values in turn.
+
+    Arguments:
+        attribute {str} -- the attribute set through the client
+        values {tuple} -- the values (default True and False)
+    """
+    cycle = itertools.cycle(values)
+
+    def change(rng):
+        return 'set', ({attribute: next(cycle)},)
+    return change
+
+
+# Client and attribute change of the devices the command line can drive
+LOAD_PROFILES = {
+    'temperature': ('rpc.sensor_client', 'AsyncSensorClient',
+                    lambda: random_change('temperatureValue', 0, 10000)),
+    'humidity': ('rpc.sensor_client', 'AsyncSensorClient',
+                 lambda: random_change('humidityValue', 0, 10000)),
+    'pressure': ('rpc.sensor_client', 'AsyncSensorClient',
+                 lambda: random_change('pressureValue', 0, 32767)),
+    'illuminance': ('rpc.sensor_client', 'AsyncSensorClient',
+                    lambda: random_change('illuminanceValue', 0, 65534)),
+    'flow': ('rpc.sensor_client', 'AsyncSensorClient',
+             lambda: random_change('flowValue', 0, 65535)),
+    'occupancy': ('rpc.sensor_client', 'AsyncSensorClient',
+                  lambda: toggle_change('occupancyValue', (1, 0))),
+    'contact': ('rpc.sensor_client', 'AsyncSensorClient',
+                lambda: toggle_change('booleanState')),
+    'light': ('rpc.lighting_client', 'AsyncLightingClient',
+              lambda: toggle_change('on')),
+    'level': ('rpc.lighting_client', 'AsyncLightingClient',
+              lambda: random_change('level', 1, 254)),
+    'plug': ('rpc.plug_client', 'AsyncPlugClient',
+             lambda: toggle_change('on'))}
+
+
+class TokenBucket:
+    """
+    TokenBucket class limiting the rate of the changes of one device.
+    """
+
+    __slots__ = ('rate', 'capacity', 'tokens', 'updated')
+
+    def __init__(self, rate, capacity):
+        """
+        Initialize a full TokenBucket instance.
+
+        Arguments:
+            rate {float} -- tokens added per second
+            capacity {float} -- largest number of tokens
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def take(self, now):
+        """
+        Take a token and return True, or return False if none is left.
+
+        Arguments:
+            now {float} -- the monotonic time
+        """
+        self.tokens = min(self.capacity,
+                          self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens < 1.0:
+            return False
+        self.tokens -= 1.0
+        return True
+
+
+class LoadTarget:
+    """
+    LoadTarget class of a device driven by the load generator.
+    """
+
+    def __init__(self, name, client, change, blocking=None):
+        """
+        Initialize a LoadTarget instance.
+
+        Arguments:
+            name {str} -- the device name used in the report
+            client {DeviceClient} -- the rpc client of the device
+            change {callable} -- called with a Random, returns the client
+                                 method name and arguments of a change,
+                                 see random_change() and toggle_change()
+            blocking {bool} -- True if the client methods wait for the
+                               result, False if they return awaitables
+                               (default None, found from the client)
+        """
+        self.name = name
+        self.client = client
+        self.change = change
+        if blocking is None:
+            blocking = not inspect.iscoroutinefunction(
+                getattr(client, '_wait_unary', None))
+        self.blocking = blocking
+        self.bucket = None
+        self.rng = None
+        self.inflight = 0
+        self.counts = {'sent': 0, 'ok': 0, 'failed': 0, 'busy': 0}
+        self.latency = LatencyHistogram()
+
+    def to_dict(self):
+        """
+        Return the counters and latency summary of the device.
+        """
+        result = {'device': self.name}
+        result.update(self.counts)
+        result['latency'] = self.latency.to_dict()
+        return result
+
+
+class LoadGenerator:
+    """
+    LoadGenerator class writing attribute changes to many devices at a
+    target aggregate rate.
+
+    The changes arrive on one clock following the arrival pattern and are
+    handed round robin to the devices; each device has a token bucket
+    refilled at its share of the rate, so a slow device does not take the
+    share of the others and bursts stay bounded. A change finding no
+    device with a token and a free slot is counted as throttled.
+
+    The changes run on an asyncio loop of their own: the calls of async
+    clients are all in flight at the same time, the calls of blocking
+    clients run on the default executor. The report gives the offered
+    and achieved rates and the rpc latency per device and overall.
+    """
+
+    def __init__(self, targets, rate, pattern=PATTERN_UNIFORM,
+                 burst_size=DEFAULT_BURST_SIZE, duration=None,
+                 max_inflight=DEFAULT_MAX_INFLIGHT, device_rate=None,
+                 seed=None):
+        """
+        Initialize a LoadGenerator instance.
+
+        Arguments:
+            targets {list} -- the LoadTarget devices
+            rate {float} -- target changes per second of all devices
+            pattern {str} -- the arrival pattern, see arrival_times()
+                             (default PATTERN_UNIFORM)
+            burst_size {int} -- changes of a burst (default 10)
+            duration {float} -- seconds to run (default None, until
+                                stop())
+            max_inflight {int} -- calls in flight per device (default 4)
+            device_rate {float} -- changes per second of one device
+                                   (default the even share of rate)
+            seed {int} -- seed of the random streams (default None, the
+                          run seed of sim_random)
+        """
+        if not targets or rate <= 0:
+            raise ValueError('A load needs devices and a positive rate')
+        self.targets = list(targets)
+        self.rate = rate
+        self.pattern = pattern
+        self.burst_size = burst_size
+        self.duration = duration
+        self.max_inflight = max_inflight
+        # The arrivals and the changes of each device draw from their own
+        # random streams, so a device gets the same changes in every run
+        # with the same seed
+        self.seed = seed
+        self.rng = self._stream('load:arrivals')
+        share = device_rate or rate / len(self.targets)
+        # A device may catch up with one second of its share
+        capacity = max(share, 2.0)
+        for target in self.targets:
+            target.bucket = TokenBucket(share, capacity)
+            target.rng = self._stream(f'load:{target.name}')
+        self.counts = {'offered': 0, 'throttled': 0}
+        self.latency = LatencyHistogram()
+        self.started = None
+        self.finished = None
+        self._next = 0
+        self._stopping = False
+        self._loop = None
+        self._thread = None
+        self._done = threading.Event()
+
+    def _stream(self, name):
+        """
+        Return the random.Random of a named random stream.
+        """
+        if self.seed is None:
+            return sim_random.stream(name)
+        return random.Random(sim_random.derive_seed(self.seed, name))
+
+    def start(self):
+        """
+        Start the load on the load generator thread.
+        """
+        self._thread = threading.Thread(
+            target=self._main, name="load generator thread", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stop sending changes, the calls in flight finish.
+        """
+        self._stopping = True
+
+    def wait(self, timeout=None):
+        """
+        Wait for the end of the load and return True if it ended.
+
+        Arguments:
+            timeout {float} -- seconds to wait (default None, no limit)
+        """
+        return self._done.wait(timeout)
+
+    def _main(self):
+        """
+        Run the load loop.
+        """
+        self._loop = asyncio.new_event_loop()
+        try:
+            self._loop.run_until_complete(self._run())
+        except Exception as e:
+            logging.error(f'Load generator failed: {str(e)}')
+        finally:
+            self._loop.close()
+            self._done.set()
+
+    async def _run(self):
+        """
+        Dispatch the changes at their arrival time.
+        """
+        tasks = set()
+        self.started = time.monotonic()
+        for offset in arrival_times(self.rate, self.pattern,
+                                    self.burst_size, self.rng):
+            if self._stopping or (self.duration is not None
+                                  and offset >= self.duration):
+                break
+            delay = self.started + offset - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            task = self._dispatch()
+            if task is not None:
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        self.finished = time.monotonic()
+
+    def _dispatch(self):
+        """
+        Hand a change to the next device with a token and a free slot.
+        """
+        self.counts['offered'] += 1
+        now = time.monotonic()
+        count = len(self.targets)
+        for step in range(count):
+            index = (self._next + step) % count
+            target = self.targets[index]
+            if (target.inflight < self.max_inflight
+                    and target.bucket.take(now)):
+                self._next = index + 1
+                return self._loop.create_task(self._send(target))
+        self.counts['throttled'] += 1
+        return None
+
+    async def _send(self, target):
+        """
+        Send one change to a device and record its latency.
+        """
+        method, args = target.change(target.rng)
+        call = getattr(target.client, method)
+        target.inflight += 1
+        target.counts['sent'] += 1
+        started = time.monotonic()
+        try:
+            if target.blocking:
+                result = await self._loop.run_in_executor(None, call, *args)
+            else:
+                result = call(*args)
+            if inspect.isawaitable(result):
+                result = await result
+            latency = time.monotonic() - started
+            status = result['status'] if result is not None else 'OK'
+            if status == 'OK':
+                target.counts['ok'] += 1
+                target.latency.add(latency)
+                self.latency.add(latency)
+            else:
+                target.counts['failed'] += 1
+        except DeviceBusyError:
+            target.counts['busy'] += 1
+        except Exception as e:
+            target.counts['failed'] += 1
+            logging.debug(f'Load change of {target.name} failed: {str(e)}')
+        finally:
+            target.inflight -= 1
+
+    def report(self):
+        """
+        Return the offered and achieved rates, the counters and the
+        latency summary of the load, overall and per device.
+        """
+        end = self.finished or time.monotonic()
+        elapsed = end - self.started if self.started is not None else 0.0
+        totals = dict(self.counts)
+        for key in ('sent', 'ok', 'failed', 'busy'):
+            totals[key] = sum(target.counts[key] for target in self.targets)
+        return {
+            'pattern': self.pattern,
+            'target_rate': self.rate,
+            'elapsed_s': round(elapsed, 3),
+            'achieved_rate': (round(totals['ok'] / elapsed, 2)
+                              if elapsed > 0 else 0.0),
+            'counts': totals,
+            'latency': self.latency.to_dict(),
+            'devices': [target.to_dict() for target in self.targets]}
+
+
+def create_target(spec):
+    """
+    Create a LoadTarget from a command line spec.
+
+    Arguments:
+        spec {str} -- '<profile>@<rpc port>', e.g. 'temperature@33000',
+                      see LOAD_PROFILES
+    Raises:
+        ValueError: if the spec or profile is unknown
+    """
+    profile, _, port = spec.partition('@')
+    if profile not in LOAD_PROFILES or not port:
+        raise ValueError(f'Bad load target {spec}, use <profile>@<port> '
+                         f'with a profile of {sorted(LOAD_PROFILES)}')
+    module_name, class_name, change = LOAD_PROFILES[profile]
+    client_class = getattr(importlib.import_module(module_name), class_name)
+    return LoadTarget(spec, client_class('localhost:' + port), change())
+
+
+if __name__ == '__main__':
+    # Drive running devices from the command line
+    parser = argparse.ArgumentParser(
+        description='Write attribute changes to devices at a target rate')
+    parser.add_argument('targets', nargs='+',
+                        help='devices as <profile>@<rpc port>')
+    parser.add_argument('--rate', type=float, default=100.0,
+                        help='changes per second of all devices')
+    parser.add_argument('--pattern', default=PATTERN_UNIFORM,
+                        choices=(PATTERN_UNIFORM, PATTERN_POISSON,
+                                 PATTERN_BURST))
+    parser.add_argument('--burst-size', type=int,
+                        default=DEFAULT_BURST_SIZE)
+    parser.add_argument('--duration', type=float, default=10.0,
+                        help='seconds to run')
+    parser.add_argument('--max-inflight', type=int,
+                        default=DEFAULT_MAX_INFLIGHT)
+    parser.add_argument('--seed', type=int, default=None,
+                        help='seed of the random streams, drawn if not set')
+    arguments = parser.parse_args()
+    generator = LoadGenerator(
+        [create_target(spec) for spec in arguments.targets], arguments.rate,
+        arguments.pattern, arguments.burst_size, arguments.duration,
+        arguments.max_inflight, seed=arguments.seed)
+    generator.start()
+    generator.wait()
+    report = generator.report()
+    report['seed'] = (arguments.seed if arguments.seed is not None
+                      else sim_random.run_seed())
+    print(json.dumps(report, indent=4))
+    for target in generator.targets:
+        target.client.stop()
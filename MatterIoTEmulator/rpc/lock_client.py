@@ -15,7 +15,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
-from rpc.device_client import DeviceClient
+from rpc.device_client import AsyncDeviceClient, DeviceClient
 from google.protobuf import json_format
 from locking_service import locking_service_pb2
 import time
@@ -26,6 +26,8 @@ class LockClient(DeviceClient):
     Lock client class for creating a device.
     """
 
+    PROTOS = DeviceClient.PROTOS + ('locking_service',)
+
     def __init__(self, socket_addr=None):
         """
         Initialize a Lock client instance.
@@ -39,10 +41,8 @@ class LockClient(DeviceClient):
         """
         Return Lock state.
         """
-        result = self.rpcs.chip.rpc.Locking.Get()
-        reply = json_format.MessageToDict(
-            result[1], locking_service_pb2.LockingState())
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(
+            self.rpcs.chip.rpc.Locking.Get, include_defaults=True)
 
     def set(self, data):
         """
@@ -53,9 +53,13 @@ class LockClient(DeviceClient):
         """
         arg = locking_service_pb2.LockingState()
         json_format.ParseDict(data, arg)
-        result = self.rpcs.chip.rpc.Locking.Set(arg)
-        reply = json_format.MessageToDict(result[1])
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(self.rpcs.chip.rpc.Locking.Set, arg)
+
+
+class AsyncLockClient(AsyncDeviceClient, LockClient):
+    """
+    Lock client class returning awaitable results.
+    """
 
 
 if __name__ == '__main__':
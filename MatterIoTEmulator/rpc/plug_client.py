@@ -15,7 +15,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
-from rpc.device_client import DeviceClient
+from rpc.device_client import AsyncDeviceClient, DeviceClient
 from google.protobuf import json_format
 from plug_service import plug_service_pb2
 import time
@@ -26,6 +26,8 @@ class PlugClient(DeviceClient):
     Plug client class for creating a device.
     """
 
+    PROTOS = DeviceClient.PROTOS + ('plug_service',)
+
     def __init__(self, socket_addr=None):
         """
         Initialize a Plug client instance.
@@ -39,10 +41,7 @@ class PlugClient(DeviceClient):
         """
         Return Plug state.
         """
-        result = self.rpcs.chip.rpc.Plug.Get()
-        reply = json_format.MessageToDict(
-            result[1], plug_service_pb2.PlugState())
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(self.rpcs.chip.rpc.Plug.Get, include_defaults=True)
 
     def set(self, data):
         """
@@ -53,9 +52,13 @@ class PlugClient(DeviceClient):
         """
         arg = plug_service_pb2.PlugState()
         json_format.ParseDict(data, arg)
-        result = self.rpcs.chip.rpc.Plug.Set(arg)
-        reply = json_format.MessageToDict(result[1])
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(self.rpcs.chip.rpc.Plug.Set, arg)
+
+
+class AsyncPlugClient(AsyncDeviceClient, PlugClient):
+    """
+    Plug client class returning awaitable results.
+    """
 
 
 if __name__ == '__main__':
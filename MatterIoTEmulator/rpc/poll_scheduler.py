@@ -0,0 +1,443 @@
+# Copyright (c) 2024 LG Electronics, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import concurrent.futures
+import heapq
+import itertools
+import logging
+import threading
+import time
+
+DEFAULT_POLL_INTERVAL = 0.5
+DEFAULT_MAX_POLL_INTERVAL = 8.0
+DEFAULT_POLL_BACKOFF = 2.0
+DEFAULT_POLL_WORKERS = 4
+
+
+def get_polling_config(config, device_type=None):
+    """
+    Return the polling settings of a device type.
+
+    The 'polling' section of config.json holds the default 'interval',
+    'max_interval', 'backoff' and per read 'reads' intervals, which the
+    entry of the device type in 'device_types' can override.
+
+    Arguments:
+        config {dict} -- the content of config.json
+        device_type {str} -- the device name, e.g. 'Pump(0x0303)'
+    """
+    polling = dict((config or {}).get('polling', {}))
+    device_types = polling.pop('device_types', {})
+    settings = {
+        'interval': polling.get('interval', DEFAULT_POLL_INTERVAL),
+        'max_interval': polling.get('max_interval',
+                                    DEFAULT_MAX_POLL_INTERVAL),
+        'backoff': polling.get('backoff', DEFAULT_POLL_BACKOFF),
+        'reads': dict(polling.get('reads', {}))}
+    override = device_types.get(device_type, {})
+    for key in ('interval', 'max_interval', 'backoff'):
+        if key in override:
+            settings[key] = override[key]
+    settings['reads'].update(override.get('reads', {}))
+    return settings
+
+
+class PollJob:
+    """
+    PollJob class polling one device with adaptive intervals.
+
+    Every read of the device is polled at its own interval. While polls
+    find no change the intervals grow by 'backoff' up to 'max_interval';
+    a change or a write (see kick()) brings them back to the base values.
+    """
+
+    def __init__(self, poll, reads, interval=DEFAULT_POLL_INTERVAL,
+                 max_interval=DEFAULT_MAX_POLL_INTERVAL,
+                 backoff=DEFAULT_POLL_BACKOFF, read_intervals=None,
+                 name=None):
+        """
+        Initialize a PollJob instance.
+
+        Arguments:
+            poll {callable} -- polls the given reads and returns the changed
+                               attributes, or None if it skipped the poll
+            reads {tuple} -- (result key, client method name) pairs
+            interval {float} -- base poll interval in seconds (default 0.5)
+            max_interval {float} -- longest interval when idle (default 8.0)
+            backoff {float} -- interval factor per idle poll (default 2.0)
+            read_intervals {dict} -- base interval by read key (default None)
+            name {str} -- name of the job used in logs (default None)
+        """
+        self.poll = poll
+        self.reads = tuple(reads)
+        self.interval = interval
+        self.max_interval = max(max_interval, interval)
+        self.backoff = max(backoff, 1.0)
+        self.read_intervals = dict(read_intervals or {})
+        self.name = name
+        self.factor = 1.0
+        self.scheduler = None
+        self._next = {key: 0.0 for key, _ in self.reads}
+
+    @classmethod
+    def from_config(cls, poll, reads, config, device_type=None, name=None):
+        """
+        Create a PollJob with the polling settings of a device type.
+
+        Arguments:
+            poll {callable} -- see PollJob()
+            reads {tuple} -- (result key, client method name) pairs
+            config {dict} -- the content of config.json
+            device_type {str} -- the device name (default None)
+            name {str} -- name of the job used in logs (default None)
+        """
+        settings = get_polling_config(config, device_type)
+        return cls(poll, reads, settings['interval'],
+                   settings['max_interval'], settings['backoff'],
+                   settings['reads'], name or device_type)
+
+    def base_interval(self, key):
+        """
+        Return the interval of a read when the device is active.
+        """
+        return self.read_intervals.get(key, self.interval)
+
+    def current_interval(self, key):
+        """
+        Return the interval of a read with the current back-off applied.
+        """
+        base = self.base_interval(key)
+        return min(base * self.factor, max(self.max_interval, base))
+
+    def kick(self):
+        """
+        Poll every read as soon as possible and drop the back-off,
+        e.g. right after a write to the device.
+        """
+        self.factor = 1.0
+        for key in self._next:
+            self._next[key] = 0.0
+        if self.scheduler is not None:
+            self.scheduler.wake(self)
+
+    def run(self):
+        """
+        Poll the due reads and return the monotonic time of the next poll.
+        """
+        now = time.monotonic()
+        due = tuple((key, name) for key, name in self.reads
+                    if self._next[key] <= now)
+        changes = None
+        try:
+            changes = self.poll(due) if due else None
+        finally:
+            if changes:
+                self.factor = 1.0
+                for key in self._next:
+                    self._next[key] = min(self._next[key],
+                                          now + self.base_interval(key))
+            elif changes is not None:
+                self.factor = min(self.factor * self.backoff,
+                                  self.max_interval / self.interval)
+            for key, _ in due:
+                self._next[key] = now + self.current_interval(key)
+        return min(self._next.values(), default=now + self.interval)
+
+
+class _Entry:
+    """
+    _Entry class of an item scheduled in the PollScheduler heap.
+    """
+
+    __slots__ = ('job', 'func', 'args', 'cancelled')
+
+    def __init__(self, job=None, func=None, args=()):
+        self.job = job
+        self.func = func
+        self.args = args
+        self.cancelled = False
+
+    def cancel(self):
+        """
+        Cancel the scheduled call.
+        """
+        self.cancelled = True
+
+
+class PeriodicTask:
+    """
+    PeriodicTask class calling a function at a fixed interval on the
+    worker pool, see PollScheduler.call_every().
+    """
+
+    def __init__(self, scheduler, interval, func, args):
+        """
+        Initialize a PeriodicTask instance.
+
+        Arguments:
+            scheduler {PollScheduler} -- the scheduler running the task
+            interval {float} -- seconds between two calls
+            func {callable} -- the function to call
+            args {tuple} -- arguments of func
+        """
+        self.scheduler = scheduler
+        self.interval = interval
+        self.func = func
+        self.args = args
+        self.cancelled = False
+        self._entry = None
+        self._lock = threading.Lock()
+
+    def start(self, delay):
+        """
+        Schedule the first call after a delay.
+        """
+        with self._lock:
+            if not self.cancelled:
+                self._entry = self.scheduler.call_later(delay, self._run)
+
+    def cancel(self):
+        """
+        Stop the task, a call already running finishes.
+        """
+        with self._lock:
+            self.cancelled = True
+            if self._entry is not None:
+                self._entry.cancel()
+                self._entry = None
+
+    def _run(self):
+        """
+        Call the function and schedule the next call.
+        """
+        started = time.monotonic()
+        try:
+            if not self.cancelled:
+                self.func(*self.args)
+        except Exception as e:
+            logging.error(f'Periodic call of {self.func} failed: {str(e)}')
+        finally:
+            elapsed = time.monotonic() - started
+            self.start(max(self.interval - elapsed, 0.0))
+
+
+class PollScheduler:
+    """
+    PollScheduler class owning the polling and timers of all devices.
+
+    One thread keeps the due times of every job, delayed call and periodic
+    task in a heap and hands the due ones to a small worker pool, so a
+    slow device does not delay others and no thread is needed per device.
+    A job or periodic task is never run twice at the same time.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def instance(cls):
+        """
+        Return the scheduler shared by all devices, start it if needed.
+        """
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+                cls._instance.start()
+            return cls._instance
+
+    def __init__(self, max_workers=DEFAULT_POLL_WORKERS):
+        """
+        Initialize a PollScheduler instance.
+
+        Arguments:
+            max_workers {int} -- number of worker threads (default 4)
+        """
+        self._heap = []
+        self._counter = itertools.count()
+        self._cond = threading.Condition()
+        self._entries = {}
+        self._running_jobs = set()
+        self._woken_jobs = set()
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix='poll worker')
+        self._thread = None
+        self._running = False
+
+    def start(self):
+        """
+        Start the scheduler thread.
+        """
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+        self._thread = threading.Thread(
+            target=self._run, name="poll scheduler thread", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stop the scheduler thread and the workers.
+        """
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+        self._executor.shutdown(wait=False)
+
+    def add(self, job, delay=0.0):
+        """
+        Start polling a job.
+
+        Arguments:
+            job {PollJob} -- the job to poll
+            delay {float} -- seconds before the first poll (default 0.0)
+        """
+        job.scheduler = self
+        with self._cond:
+            self._push_job(job, time.monotonic() + delay)
+
+    def remove(self, job):
+        """
+        Stop polling a job.
+
+        Arguments:
+            job {PollJob} -- the job to remove
+        """
+        with self._cond:
+            entry = self._entries.pop(job, None)
+            if entry is not None:
+                entry.cancel()
+            self._woken_jobs.discard(job)
+        job.scheduler = None
+
+    def wake(self, job):
+        """
+        Run a job as soon as possible.
+
+        Arguments:
+            job {PollJob} -- a job added to the scheduler
+        """
+        with self._cond:
+            if job.scheduler is not self:
+                return
+            if job in self._running_jobs:
+                self._woken_jobs.add(job)
+            else:
+                self._push_job(job, time.monotonic())
+
+    def call_later(self, delay, func, *args):
+        """
+        Run a function on the worker pool after a delay and return a handle
+        whose cancel() method cancels the call.
+
+        Arguments:
+            delay {float} -- seconds to wait
+            func {callable} -- the function to call
+        """
+        entry = _Entry(func=func, args=args)
+        with self._cond:
+            heapq.heappush(self._heap, (time.monotonic() + delay,
+                                        next(self._counter), entry))
+            self._cond.notify()
+        return entry
+
+    def call_every(self, interval, func, *args, delay=None):
+        """
+        Run a function on the worker pool every interval seconds and
+        return the PeriodicTask, whose cancel() method stops it.
+
+        Arguments:
+            interval {float} -- seconds between two calls
+            func {callable} -- the function to call
+            delay {float} -- seconds before the first call
+                             (default interval)
+        """
+        task = PeriodicTask(self, interval, func, args)
+        task.start(interval if delay is None else delay)
+        return task
+
+    def _push_job(self, job, due):
+        """
+        (Re)schedule a job, the caller holds the condition lock.
+        """
+        previous = self._entries.get(job)
+        if previous is not None:
+            previous.cancel()
+        entry = _Entry(job=job)
+        self._entries[job] = entry
+        heapq.heappush(self._heap, (due, next(self._counter), entry))
+        self._cond.notify()
+
+    def _run(self):
+        """
+        Scheduler loop: wait for the next due item and dispatch it.
+        """
+        while True:
+            with self._cond:
+                while self._running:
+                    while self._heap and self._heap[0][2].cancelled:
+                        heapq.heappop(self._heap)
+                    if self._heap:
+                        timeout = self._heap[0][0] - time.monotonic()
+                        if timeout <= 0:
+                            break
+                    else:
+                        timeout = None
+                    self._cond.wait(timeout)
+                if not self._running:
+                    return
+                _, _, entry = heapq.heappop(self._heap)
+                if entry.job is not None:
+                    if self._entries.get(entry.job) is entry:
+                        del self._entries[entry.job]
+                    self._running_jobs.add(entry.job)
+            try:
+                if entry.job is not None:
+                    self._executor.submit(self._run_job, entry.job)
+                else:
+                    self._executor.submit(self._run_call, entry)
+            except RuntimeError:
+                return
+
+    def _run_call(self, entry):
+        """
+        Run a function scheduled by call_later().
+        """
+        if entry.cancelled:
+            return
+        try:
+            entry.func(*entry.args)
+        except Exception:
+            logging.exception("Exception in scheduled call")
+
+    def _run_job(self, job):
+        """
+        Poll a job on a worker thread and schedule its next poll.
+        """
+        next_poll = time.monotonic() + job.interval
+        try:
+            next_poll = job.run()
+        except Exception as e:
+            logging.error(f'Poll of {job.name} failed: {str(e)}')
+        with self._cond:
+            self._running_jobs.discard(job)
+            if job.scheduler is not self:
+                return
+            if job in self._woken_jobs:
+                self._woken_jobs.discard(job)
+                next_poll = time.monotonic()
+            self._push_job(job, next_poll)
@@ -0,0 +1,118 @@
+# Copyright (c) 2024 LG Electronics, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import importlib
+import threading
+
+from pw_rpc.descriptors import Service
+
+# Generated protobuf module of each rpc service package
+PROTO_MODULES = {
+    'airpurifier_service': 'airpurifier_service.airpurifier_service_pb2',
+    'airqualitysensor_service':
+        'airqualitysensor_service.airqualitysensor_service_pb2',
+    'attributes_service': 'attributes_service.attributes_service_pb2',
+    'button_service': 'button_service.button_service_pb2',
+    'descriptor_service': 'descriptor_service.descriptor_service_pb2',
+    'device_service': 'device_service.device_service_pb2',
+    'dishwasher_service': 'dishwasher_service.dishwasher_service_pb2',
+    'echo_service': 'echo_service.echo_pb2',
+    'fan_service': 'fan_service.fan_service_pb2',
+    'generic_switch_service':
+        'generic_switch_service.generic_switch_service_pb2',
+    'hvac_service': 'hvac_service.hvac_service_pb2',
+    'laundrywasher_service': 'laundrywasher_service.laundrywasher_service_pb2',
+    'lighting_service': 'lighting_service.lighting_service_pb2',
+    'lock_service': 'lock_service.lock_service_pb2',
+    'locking_service': 'locking_service.locking_service_pb2',
+    'ot_cli_service': 'ot_cli_service.ot_cli_service_pb2',
+    'plug_service': 'plug_service.plug_service_pb2',
+    'pump_service': 'pump_service.pump_service_pb2',
+    'refrigerator_service': 'refrigerator_service.refrigerator_service_pb2',
+    'roomairconditioner_service':
+        'roomairconditioner_service.roomairconditioner_service_pb2',
+    'rvc_service': 'rvc_service.rvc_service_pb2',
+    'sensor_service': 'sensor_service.sensor_service_pb2',
+    'smokecoalarm_service': 'smokecoalarm_service.smokecoalarm_service_pb2',
+    'thermostat_service': 'thermostat_service.thermostat_service_pb2',
+    'thread_service': 'thread_service.thread_service_pb2',
+    'wifi_service': 'wifi_service.wifi_service_pb2',
+    'window_service': 'window_service.window_service_pb2'}
+
+_loaded = {}
+_services = {}
+_lock = threading.Lock()
+
+
+def load_proto(name):
+    """
+    Return the protobuf module of a rpc service, import it on first use.
+
+    Arguments:
+        name {str} -- the service package, e.g. 'lighting_service'
+    Raises:
+        KeyError: if the service is unknown
+    """
+    with _lock:
+        module = _loaded.get(name)
+        if module is None:
+            module = importlib.import_module(PROTO_MODULES[name])
+            _loaded[name] = module
+        return module
+
+
+def load_protos(names):
+    """
+    Return the protobuf modules of some rpc services, see load_proto().
+
+    Arguments:
+        names {iterable} -- the service packages
+    """
+    return [load_proto(name) for name in names]
+
+
+def load_services(names):
+    """
+    Return the pw_rpc Service descriptors of some rpc services.
+
+    The descriptors, with their methods and message classes, are built
+    once per process and shared by every client, only the channels are
+    created per device.
+
+    Arguments:
+        names {iterable} -- the service packages, see load_proto()
+    """
+    services = []
+    for name in names:
+        with _lock:
+            cached = _services.get(name)
+        if cached is None:
+            module = load_proto(name)
+            cached = tuple(Service.from_descriptor(descriptor) for descriptor
+                           in module.DESCRIPTOR.services_by_name.values())
+            with _lock:
+                cached = _services.setdefault(name, cached)
+        services.extend(cached)
+    return services
+
+
+def loaded_protos():
+    """
+    Return the names of the services whose protobuf module is loaded.
+    """
+    with _lock:
+        return sorted(_loaded)
@@ -15,7 +15,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
-from rpc.device_client import DeviceClient
+from rpc.device_client import AsyncDeviceClient, DeviceClient
 from google.protobuf import json_format
 from pump_service import pump_service_pb2
 import time
@@ -26,6 +26,8 @@ class PumpClient(DeviceClient):
     Pump client class for creating a device.
     """
 
+    PROTOS = DeviceClient.PROTOS + ('pump_service',)
+
     def __init__(self, socket_addr=None):
         """
         Initialize a Pump client instance.
@@ -39,10 +41,7 @@ class PumpClient(DeviceClient):
         """
         Return Pump state.
         """
-        result = self.rpcs.chip.rpc.Pump.Get()
-        reply = json_format.MessageToDict(
-            result[1], pump_service_pb2.PumpState())
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(self.rpcs.chip.rpc.Pump.Get, include_defaults=True)
 
     def set(self, data):
         """
@@ -53,9 +52,13 @@ class PumpClient(DeviceClient):
         """
         arg = pump_service_pb2.PumpState()
         json_format.ParseDict(data, arg)
-        result = self.rpcs.chip.rpc.Pump.Set(arg)
-        reply = json_format.MessageToDict(result[1])
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(self.rpcs.chip.rpc.Pump.Set, arg)
+
+
+class AsyncPumpClient(AsyncDeviceClient, PumpClient):
+    """
+    Pump client class returning awaitable results.
+    """
 
 
 if __name__ == '__main__':
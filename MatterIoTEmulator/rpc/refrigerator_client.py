@@ -15,7 +15,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
-from rpc.device_client import DeviceClient
+from rpc.device_client import AsyncDeviceClient, DeviceClient
 from google.protobuf import json_format
 from refrigerator_service import refrigerator_service_pb2
 import time
@@ -26,6 +26,13 @@ class RefrigeratorClient(DeviceClient):
     Refrigerator client class for creating a device.
     """
 
+    PROTOS = DeviceClient.PROTOS + ('refrigerator_service',)
+
+    SNAPSHOT_READS = (('device_refri_status', 'GetRefrigerator'),
+                      ('device_cold_status', 'GetColdCabinet'),
+                      ('device_free_status', 'GetFreezeCabinet'),
+                      ('device_state', 'get_device_state'))
+
     def __init__(self, socket_addr=None):
         """
         Initialize a Refrigerator client instance.
@@ -39,10 +46,9 @@ class RefrigeratorClient(DeviceClient):
         """
         Return Refrigerator state.
         """
-        result = self.rpcs.chip.rpc.Refrigerator.GetRefrigerator()
-        reply = json_format.MessageToDict(
-            result[1], refrigerator_service_pb2.RefrigeratorState())
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(
+            self.rpcs.chip.rpc.Refrigerator.GetRefrigerator,
+            include_defaults=True)
 
     def SetRefrigerator(self, data):
         """
@@ -53,18 +59,16 @@ class RefrigeratorClient(DeviceClient):
         """
         arg = refrigerator_service_pb2.RefrigeratorState()
         json_format.ParseDict(data, arg)
-        result = self.rpcs.chip.rpc.Refrigerator.SetRefrigerator(arg)
-        reply = json_format.MessageToDict(result[1])
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(
+            self.rpcs.chip.rpc.Refrigerator.SetRefrigerator, arg)
 
     def GetColdCabinet(self):
         """
         Return cold cabinet value.
         """
-        result = self.rpcs.chip.rpc.Refrigerator.GetColdCabinet()
-        reply = json_format.MessageToDict(
-            result[1], refrigerator_service_pb2.ColdCabinetState())
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(
+            self.rpcs.chip.rpc.Refrigerator.GetColdCabinet,
+            include_defaults=True)
 
     def SetColdCabinet(self, data):
         """
@@ -75,18 +79,15 @@ class RefrigeratorClient(DeviceClient):
         """
         arg = refrigerator_service_pb2.ColdCabinetState()
         json_format.ParseDict(data, arg)
-        result = self.rpcs.chip.rpc.Refrigerator.SetColdCabinet(arg)
-        reply = json_format.MessageToDict(result[1])
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(self.rpcs.chip.rpc.Refrigerator.SetColdCabinet, arg)
 
     def GetFreezeCabinet(self):
         """
         Return Freeze cabinet value.
         """
-        result = self.rpcs.chip.rpc.Refrigerator.GetFreezeCabinet()
-        reply = json_format.MessageToDict(
-            result[1], refrigerator_service_pb2.FreezeCabinetState())
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(
+            self.rpcs.chip.rpc.Refrigerator.GetFreezeCabinet,
+            include_defaults=True)
 
     def SetFreezeCabinet(self, data):
         """
@@ -97,9 +98,14 @@ class RefrigeratorClient(DeviceClient):
         """
         arg = refrigerator_service_pb2.FreezeCabinetState()
         json_format.ParseDict(data, arg)
-        result = self.rpcs.chip.rpc.Refrigerator.SetFreezeCabinet(arg)
-        reply = json_format.MessageToDict(result[1])
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(
+            self.rpcs.chip.rpc.Refrigerator.SetFreezeCabinet, arg)
+
+
+class AsyncRefrigeratorClient(AsyncDeviceClient, RefrigeratorClient):
+    """
+    Refrigerator client class returning awaitable results.
+    """
 
 
 if __name__ == '__main__':
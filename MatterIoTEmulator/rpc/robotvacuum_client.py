@@ -15,7 +15,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
-from rpc.device_client import DeviceClient
+from rpc.device_client import AsyncDeviceClient, DeviceClient
 from google.protobuf import json_format
 from rvc_service import rvc_service_pb2
 import time
@@ -26,6 +26,8 @@ class RobotVacuumClient(DeviceClient):
     RobotVacuum client class for creating a device.
     """
 
+    PROTOS = DeviceClient.PROTOS + ('rvc_service',)
+
     def __init__(self, socket_addr=None):
         """
         Initialize a RobotVacuum client instance.
@@ -39,10 +41,8 @@ class RobotVacuumClient(DeviceClient):
         """
         Return RobotVacuum state.
         """
-        result = self.rpcs.chip.rpc.RVCService.Get()
-        reply = json_format.MessageToDict(
-            result[1], rvc_service_pb2.RVCState())
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(
+            self.rpcs.chip.rpc.RVCService.Get, include_defaults=True)
 
     def set(self, data):
         """
@@ -53,51 +53,59 @@ class RobotVacuumClient(DeviceClient):
         """
         arg = rvc_service_pb2.RVCState()
         json_format.ParseDict(data, arg)
-        result = self.rpcs.chip.rpc.RVCService.Set(arg)
-        reply = json_format.MessageToDict(result[1])
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(self.rpcs.chip.rpc.RVCService.Set, arg)
 
     def HandleClearErrorMessage(self):
         """
         Handle Clear Error message.
         """
-        self.rpcs.chip.rpc.RVCService.HandleClearErrorMessage()
+        return self._unary(
+            self.rpcs.chip.rpc.RVCService.HandleClearErrorMessage)
 
     def HandleChargedMessage(self):
         """
         Handle Charged message.
         """
-        self.rpcs.chip.rpc.RVCService.HandleChargedMessage()
+        return self._unary(self.rpcs.chip.rpc.RVCService.HandleChargedMessage)
 
     def HandleChargingMessage(self):
         """
         Handle Charging message.
         """
-        self.rpcs.chip.rpc.RVCService.HandleChargingMessage()
+        return self._unary(self.rpcs.chip.rpc.RVCService.HandleChargingMessage)
 
     def HandleDockedMessage(self):
         """
         Handle Docked message.
         """
-        self.rpcs.chip.rpc.RVCService.HandleDockedMessage()
+        return self._unary(self.rpcs.chip.rpc.RVCService.HandleDockedMessage)
 
     def HandleChargerFoundMessage(self):
         """
         Handle Charger message.
         """
-        self.rpcs.chip.rpc.RVCService.HandleChargerFoundMessage()
+        return self._unary(
+            self.rpcs.chip.rpc.RVCService.HandleChargerFoundMessage)
 
     def HandleLowChargeMessage(self):
         """
         Handle Low Charge message.
         """
-        self.rpcs.chip.rpc.RVCService.HandleLowChargeMessage()
+        return self._unary(
+            self.rpcs.chip.rpc.RVCService.HandleLowChargeMessage)
 
     def HandleActivityCompleteEvent(self):
         """
         Handle Activity Complete event.
         """
-        self.rpcs.chip.rpc.RVCService.HandleActivityCompleteEvent()
+        return self._unary(
+            self.rpcs.chip.rpc.RVCService.HandleActivityCompleteEvent)
+
+
+class AsyncRobotVacuumClient(AsyncDeviceClient, RobotVacuumClient):
+    """
+    RobotVacuum client class returning awaitable results.
+    """
 
 
 if __name__ == '__main__':
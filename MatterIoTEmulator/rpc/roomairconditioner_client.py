@@ -15,7 +15,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
-from rpc.device_client import DeviceClient
+from rpc.device_client import AsyncDeviceClient, DeviceClient
 from google.protobuf import json_format
 from roomairconditioner_service import roomairconditioner_service_pb2
 import time
@@ -27,6 +27,13 @@ class RoomAirConditionerClient(DeviceClient):
     Room Air Conditioner client class for creating a device.
     """
 
+    PROTOS = DeviceClient.PROTOS + ('roomairconditioner_service',)
+
+    SNAPSHOT_READS = (('device_hum_status', 'GetHumiditySensorValue'),
+                      ('device_tem_status', 'GetTempValue'),
+                      ('device_room_status', 'GetRoomAirConditionerSensor'),
+                      ('device_state', 'get_device_state'))
+
     def __init__(self, socket_addr=None):
         """
         Initialize a Room Air Conditioner client instance.
@@ -40,10 +47,9 @@ class RoomAirConditionerClient(DeviceClient):
         """
         Return Measured value.
         """
-        result = self.rpcs.chip.rpc.RoomAirConditioner.GetTempValue()
-        reply = json_format.MessageToDict(
-            result[1], roomairconditioner_service_pb2.TemperatureSensorRoomAir())
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(
+            self.rpcs.chip.rpc.RoomAirConditioner.GetTempValue,
+            include_defaults=True)
 
     def SetTempValue(self, data):
         """
@@ -54,18 +60,16 @@ class RoomAirConditionerClient(DeviceClient):
         """
         arg = roomairconditioner_service_pb2.TemperatureSensorRoomAir()
         json_format.ParseDict(data, arg)
-        result = self.rpcs.chip.rpc.RoomAirConditioner.SetTempValue(arg)
-        reply = json_format.MessageToDict(result[1])
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(
+            self.rpcs.chip.rpc.RoomAirConditioner.SetTempValue, arg)
 
     def GetHumiditySensorValue(self):
         """
         Return Humidity sensor state.
         """
-        result = self.rpcs.chip.rpc.RoomAirConditioner.GetHumiditySensorValue()
-        reply = json_format.MessageToDict(
-            result[1], roomairconditioner_service_pb2.HumiditySensorRoomAir())
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(
+            self.rpcs.chip.rpc.RoomAirConditioner.GetHumiditySensorValue,
+            include_defaults=True)
 
     def SetHumiditySensorValue(self, data):
         """
@@ -76,19 +80,16 @@ class RoomAirConditionerClient(DeviceClient):
         """
         arg = roomairconditioner_service_pb2.HumiditySensorRoomAir()
         json_format.ParseDict(data, arg)
-        result = self.rpcs.chip.rpc.RoomAirConditioner.SetHumiditySensorValue(
-            arg)
-        reply = json_format.MessageToDict(result[1])
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(
+            self.rpcs.chip.rpc.RoomAirConditioner.SetHumiditySensorValue, arg)
 
     def GetRoomAirConditionerSensor(self):
         """
         Return Room Air Conditioner sensor state.
         """
-        result = self.rpcs.chip.rpc.RoomAirConditioner.GetRoomAirConditionerSensor()
-        reply = json_format.MessageToDict(
-            result[1], roomairconditioner_service_pb2.RoomAirConditionerState())
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(
+            self.rpcs.chip.rpc.RoomAirConditioner.GetRoomAirConditionerSensor,
+            include_defaults=True)
 
     def SetRoomAirConditionerSensor(self, data):
         """
@@ -99,10 +100,16 @@ class RoomAirConditionerClient(DeviceClient):
         """
         arg = roomairconditioner_service_pb2.RoomAirConditionerState()
         json_format.ParseDict(data, arg)
-        result = self.rpcs.chip.rpc.RoomAirConditioner.SetRoomAirConditionerSensor(
+        return self._unary(
+            self.rpcs.chip.rpc.RoomAirConditioner.SetRoomAirConditionerSensor,
             arg)
-        reply = json_format.MessageToDict(result[1])
-        return {'status': result[0].name, 'reply': reply}
+
+
+class AsyncRoomAirConditionerClient(AsyncDeviceClient,
+                                    RoomAirConditionerClient):
+    """
+    Room Air Conditioner client class returning awaitable results.
+    """
 
 
 if __name__ == '__main__':
@@ -0,0 +1,253 @@
+# Copyright (c) 2024 LG Electronics, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import bisect
+import json
+import threading
+import time
+
+OUTCOME_OK = 'ok'
+OUTCOME_ERROR = 'error'
+OUTCOME_TIMEOUT = 'timeout'
+OUTCOME_UNAVAILABLE = 'unavailable'
+
+# Upper bounds of the latency buckets in seconds, 0.25 ms to about 16 s
+LATENCY_BUCKETS = tuple(0.00025 * 2 ** (i / 2) for i in range(33))
+
+
+class LatencyHistogram:
+    """
+    LatencyHistogram class counting latencies in fixed log-spaced buckets.
+
+    Percentiles are interpolated inside the buckets, each about 41 % wider
+    than the previous one, which is enough to compare devices and methods
+    without keeping every sample.
+    """
+
+    __slots__ = ('counts', 'count', 'total', 'minimum', 'maximum')
+
+    def __init__(self):
+        """
+        Initialize an empty LatencyHistogram instance.
+        """
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.minimum = None
+        self.maximum = None
+
+    def add(self, latency):
+        """
+        Count a latency.
+
+        Arguments:
+            latency {float} -- the latency in seconds
+        """
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS, latency)] += 1
+        self.count += 1
+        self.total += latency
+        if self.minimum is None or latency < self.minimum:
+            self.minimum = latency
+        if self.maximum is None or latency > self.maximum:
+            self.maximum = latency
+
+    def percentile(self, percent):
+        """
+        Return the estimated latency below which percent of the calls are,
+        or None without sample.
+
+        Arguments:
+            percent {float} -- the percentile, e.g. 95
+        """
+        if not self.count:
+            return None
+        rank = percent / 100.0 * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            if count and seen + count >= rank:
+                # Interpolate inside the bucket
+                lower = LATENCY_BUCKETS[index - 1] if index else 0.0
+                upper = (LATENCY_BUCKETS[index]
+                         if index < len(LATENCY_BUCKETS) else self.maximum)
+                lower = max(lower, self.minimum)
+                upper = max(min(upper, self.maximum), lower)
+                return lower + (upper - lower) * (rank - seen) / count
+            seen += count
+        return self.maximum
+
+    def to_dict(self):
+        """
+        Return the summary of the histogram, latencies in milliseconds.
+        """
+        def ms(value):
+            return None if value is None else round(value * 1000, 3)
+        return {
+            'count': self.count,
+            'mean_ms': ms(self.total / self.count) if self.count else None,
+            'min_ms': ms(self.minimum),
+            'max_ms': ms(self.maximum),
+            'p50_ms': ms(self.percentile(50)),
+            'p95_ms': ms(self.percentile(95)),
+            'p99_ms': ms(self.percentile(99))}
+
+
+class MethodStats:
+    """
+    MethodStats class holding the counters of one rpc method.
+    """
+
+    __slots__ = ('outcomes', 'latency')
+
+    def __init__(self):
+        """
+        Initialize a MethodStats instance.
+        """
+        self.outcomes = {OUTCOME_OK: 0, OUTCOME_ERROR: 0,
+                         OUTCOME_TIMEOUT: 0, OUTCOME_UNAVAILABLE: 0}
+        self.latency = LatencyHistogram()
+
+    def to_dict(self):
+        """
+        Return the counters and latency summary of the method.
+        """
+        result = {'calls': sum(self.outcomes.values())}
+        result.update(self.outcomes)
+        result['latency'] = self.latency.to_dict()
+        return result
+
+
+class RpcMetrics:
+    """
+    RpcMetrics class recording the rpc calls of one device: call counts
+    by outcome and latency histograms per method.
+
+    The metrics of every device client are kept in a registry, see
+    get_metrics(), all_metrics() and dump_metrics().
+    """
+
+    _registry = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(self, device):
+        """
+        Initialize a RpcMetrics instance and register it.
+
+        Arguments:
+            device {str} -- name of the device, e.g. its rpc address
+        """
+        self.device = device
+        self.started = time.time()
+        self._lock = threading.Lock()
+        self._methods = {}
+        with self._registry_lock:
+            self._registry[device] = self
+
+    def record(self, method, outcome, latency=None):
+        """
+        Record a finished call.
+
+        Arguments:
+            method {str} -- the rpc method name, e.g. 'Device.GetDeviceState'
+            outcome {str} -- one of the OUTCOME_* values
+            latency {float} -- the call latency in seconds, None when the
+                               call was not sent (default None)
+        """
+        with self._lock:
+            stats = self._methods.get(method)
+            if stats is None:
+                stats = self._methods[method] = MethodStats()
+            stats.outcomes[outcome] += 1
+            if latency is not None and outcome != OUTCOME_TIMEOUT:
+                stats.latency.add(latency)
+
+    def stats(self, method=None):
+        """
+        Return the statistics of a method, or of all methods by name.
+
+        Arguments:
+            method {str} -- the rpc method name (default None)
+        """
+        with self._lock:
+            if method is not None:
+                stats = self._methods.get(method)
+                return stats.to_dict() if stats is not None else None
+            return {name: stats.to_dict()
+                    for name, stats in sorted(self._methods.items())}
+
+    def reset(self):
+        """
+        Drop every recorded call.
+        """
+        with self._lock:
+            self._methods.clear()
+            self.started = time.time()
+
+    def to_dict(self):
+        """
+        Return the device name, recording start time and method statistics.
+        """
+        return {'device': self.device, 'since': self.started,
+                'methods': self.stats()}
+
+    def dump(self, path):
+        """
+        Write the metrics of the device to a JSON file.
+
+        Arguments:
+            path {str} -- the file path
+        """
+        with open(path, 'w', encoding='utf8') as file:
+            json.dump(self.to_dict(), file, indent=4)
+
+    def close(self):
+        """
+        Remove the metrics from the registry.
+        """
+        with self._registry_lock:
+            if self._registry.get(self.device) is self:
+                del self._registry[self.device]
+
+
+def get_metrics(device):
+    """
+    Return the RpcMetrics of a device, or None.
+
+    Arguments:
+        device {str} -- name of the device, e.g. 'localhost:33000'
+    """
+    with RpcMetrics._registry_lock:
+        return RpcMetrics._registry.get(device)
+
+
+def all_metrics():
+    """
+    Return the metrics of every device by device name.
+    """
+    with RpcMetrics._registry_lock:
+        metrics = list(RpcMetrics._registry.values())
+    return {item.device: item.to_dict() for item in metrics}
+
+
+def dump_metrics(path):
+    """
+    Write the metrics of every device to a JSON file.
+
+    Arguments:
+        path {str} -- the file path
+    """
+    with open(path, 'w', encoding='utf8') as file:
+        json.dump(all_metrics(), file, indent=4)
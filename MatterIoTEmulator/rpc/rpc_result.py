@@ -0,0 +1,123 @@
+# Copyright (c) 2024 LG Electronics, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+from google.protobuf import json_format
+
+_KEYS = ('status', 'reply', 'latency')
+
+
+class RpcResult:
+    """
+    RpcResult class holding the status and the response message of a rpc.
+
+    It can be read like the {'status': ..., 'reply': ...} dictionary
+    returned by the clients, but the response message is converted to
+    a dictionary only the first time the reply is read.
+    """
+
+    __slots__ = ('status_code', 'message', 'include_defaults',
+                 'latency', '_reply')
+
+    def __init__(self, status, message, include_defaults=False, latency=None):
+        """
+        Initialize a RpcResult instance.
+
+        Arguments:
+            status {Status} -- the rpc status
+            message {Message} -- the response message
+            include_defaults {bool} -- keep fields with default values
+                                       in the reply (default False)
+            latency {float} -- the call latency in seconds (default None)
+        """
+        self.status_code = status
+        self.message = message
+        self.include_defaults = include_defaults
+        self.latency = latency
+        self._reply = None
+
+    @property
+    def status(self):
+        """
+        Return the name of the rpc status.
+        """
+        return self.status_code.name
+
+    @property
+    def ok(self):
+        """
+        Return True if the rpc completed with OK status.
+        """
+        return self.status_code.name == 'OK'
+
+    @property
+    def reply(self):
+        """
+        Return the response message as dictionary, convert it on first use.
+        """
+        if self._reply is None:
+            self._reply = json_format.MessageToDict(
+                self.message, self.include_defaults)
+        return self._reply
+
+    def to_dict(self):
+        """
+        Return the result as the dictionary returned in dict result mode.
+        """
+        result = {'status': self.status, 'reply': self.reply}
+        if self.latency is not None:
+            result['latency'] = self.latency
+        return result
+
+    def keys(self):
+        """
+        Return the keys of the result dictionary.
+        """
+        return self.to_dict().keys()
+
+    def get(self, key, default=None):
+        """
+        Return the value of a result key or default if it is not set.
+
+        Arguments:
+            key {str} -- 'status', 'reply' or 'latency'
+            default {Any} -- value returned for an unknown key
+        """
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __getitem__(self, key):
+        if key not in _KEYS or (key == 'latency' and self.latency is None):
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key):
+        return key in _KEYS and (key != 'latency' or self.latency is not None)
+
+    def __eq__(self, other):
+        if isinstance(other, RpcResult):
+            return (self.status_code == other.status_code
+                    and self.message == other.message)
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(self.to_dict())
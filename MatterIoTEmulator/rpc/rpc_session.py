@@ -0,0 +1,260 @@
+# Copyright (c) 2024 LG Electronics, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import logging
+import socket
+import threading
+
+from rpc.poll_scheduler import PollScheduler
+from rpc.rpc_transport import RpcTransport
+
+SESSION_CONNECTED = 'connected'
+SESSION_DOWN = 'down'
+SESSION_CLOSED = 'closed'
+
+DEFAULT_CONNECT_TIMEOUT = 2.0
+DEFAULT_RETRY_DELAY = 0.5
+DEFAULT_MAX_RETRY_DELAY = 5.0
+DEFAULT_FAILURE_THRESHOLD = 3
+
+
+class DeviceUnavailableError(Exception):
+    """
+    Raised by a call to a device whose rpc session is down.
+    """
+
+    def __init__(self, address, reason=None):
+        self.address = address
+        self.reason = reason
+        message = f'Device at {address} is unavailable'
+        if reason:
+            message += f': {reason}'
+        super().__init__(message)
+
+
+class RpcSession:
+    """
+    RpcSession class owning the rpc connection of one device.
+
+    The session tracks the health of the connection. While the device is
+    down, calls fail at once with DeviceUnavailableError instead of waiting
+    for their timeout, and the session reconnects on the poll scheduler
+    with exponential back-off. A closed socket, a failed write or several
+    timeouts in a row take the session down.
+    """
+
+    def __init__(self, address, connect_timeout=DEFAULT_CONNECT_TIMEOUT,
+                 retry_delay=DEFAULT_RETRY_DELAY,
+                 max_retry_delay=DEFAULT_MAX_RETRY_DELAY,
+                 failure_threshold=DEFAULT_FAILURE_THRESHOLD):
+        """
+        Initialize a RpcSession instance.
+
+        Arguments:
+            address {tuple} -- (host, port) of the device rpc server
+            connect_timeout {float} -- seconds to wait for a connection
+                                       (default 2.0)
+            retry_delay {float} -- first reconnect delay (default 0.5)
+            max_retry_delay {float} -- longest reconnect delay (default 5.0)
+            failure_threshold {int} -- timeouts in a row which take the
+                                       session down (default 3)
+        """
+        self.address = address
+        self.connect_timeout = connect_timeout
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self.failure_threshold = failure_threshold
+        self.state = SESSION_DOWN
+        self.reason = 'not connected'
+        self.failures = 0
+        self.reconnect_count = 0
+        self.socket = None
+        self._connected_once = False
+        self._client = None
+        self._output = None
+        self._listeners = []
+        self._lock = threading.Lock()
+        self._next_delay = retry_delay
+        self._retry_handle = None
+
+    @property
+    def available(self):
+        """
+        Return True while the device is connected.
+        """
+        return self.state == SESSION_CONNECTED
+
+    def add_listener(self, callback):
+        """
+        Call a function with True when the session connects and with False
+        when it goes down.
+
+        Arguments:
+            callback {callable} -- function called with the new availability
+        """
+        self._listeners.append(callback)
+
+    def open(self, client, output=None):
+        """
+        Connect to the device, on failure keep retrying in the background.
+
+        Arguments:
+            client {pw_rpc.Client} -- the client which handles rpc packets
+            output {callable} -- handler for "stdout" frames (default None)
+        """
+        self._client = client
+        self._output = output
+        if not self._connect():
+            self._schedule_retry()
+
+    def close(self):
+        """
+        Close the session and stop reconnecting.
+        """
+        with self._lock:
+            self.state = SESSION_CLOSED
+            sock, self.socket = self.socket, None
+            if self._retry_handle is not None:
+                self._retry_handle.cancel()
+                self._retry_handle = None
+        if sock is not None:
+            RpcTransport.instance().unregister(sock)
+
+    def check(self):
+        """
+        Raise DeviceUnavailableError unless the device is connected.
+        """
+        if self.state != SESSION_CONNECTED:
+            raise DeviceUnavailableError(self.address, self.reason)
+
+    def write(self, data):
+        """
+        Send data to the device, the output of the rpc channel.
+
+        Arguments:
+            data {bytes} -- the encoded packet
+        Raises:
+            DeviceUnavailableError: if the device is down
+        """
+        sock = self.socket
+        if sock is None or self.state != SESSION_CONNECTED:
+            raise DeviceUnavailableError(self.address, self.reason)
+        try:
+            sock.sendall(data)
+        except OSError as e:
+            self._down(sock, 'write failed: ' + str(e))
+            raise DeviceUnavailableError(self.address, self.reason)
+
+    def record_success(self):
+        """
+        Record a call answered by the device.
+        """
+        self.failures = 0
+
+    def record_timeout(self):
+        """
+        Record a call without response, the session goes down after
+        failure_threshold timeouts in a row.
+        """
+        self.failures += 1
+        if self.failures >= self.failure_threshold:
+            self._down(self.socket, f'{self.failures} calls timed out')
+
+    def _connect(self):
+        """
+        Open the socket and register it to the rpc transport.
+        """
+        try:
+            sock = socket.create_connection(self.address,
+                                            self.connect_timeout)
+            sock.settimeout(None)
+        except OSError as e:
+            with self._lock:
+                self.reason = 'connect failed: ' + str(e)
+            return False
+        with self._lock:
+            if self.state == SESSION_CLOSED:
+                sock.close()
+                return True
+            was_down, self._connected_once = self._connected_once, True
+            self.socket = sock
+            self.state = SESSION_CONNECTED
+            self.reason = None
+            self.failures = 0
+            self._next_delay = self.retry_delay
+        RpcTransport.instance().register(sock, self._client, self._output,
+                                         self._on_disconnect)
+        if was_down:
+            self.reconnect_count += 1
+            logging.info(f'RPC session to {self.address} restored')
+        self._notify(True)
+        return True
+
+    def _on_disconnect(self, sock):
+        """
+        Handle the socket closed by the device, called by the transport.
+        """
+        self._down(sock, 'connection closed')
+
+    def _down(self, sock, reason):
+        """
+        Take the session down if sock is its current socket.
+        """
+        with self._lock:
+            if (self.state != SESSION_CONNECTED or sock is None
+                    or sock is not self.socket):
+                return
+            self.state = SESSION_DOWN
+            self.reason = reason
+            self.socket = None
+        logging.warning(f'RPC session to {self.address} is down: {reason}')
+        RpcTransport.instance().unregister(sock)
+        self._notify(False)
+        self._schedule_retry()
+
+    def _schedule_retry(self):
+        """
+        Try to reconnect after the current back-off delay.
+        """
+        with self._lock:
+            if self.state != SESSION_DOWN or self._retry_handle is not None:
+                return
+            delay = self._next_delay
+            self._next_delay = min(delay * 2, self.max_retry_delay)
+            self._retry_handle = PollScheduler.instance().call_later(
+                delay, self._retry)
+
+    def _retry(self):
+        """
+        Reconnect attempt run on the poll scheduler.
+        """
+        with self._lock:
+            self._retry_handle = None
+            if self.state != SESSION_DOWN:
+                return
+        if not self._connect():
+            self._schedule_retry()
+
+    def _notify(self, available):
+        """
+        Call the listeners with the availability of the device.
+        """
+        for callback in list(self._listeners):
+            try:
+                callback(available)
+            except Exception as e:
+                logging.error("RPC session listener failed: " + str(e))
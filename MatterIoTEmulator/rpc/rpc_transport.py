@@ -0,0 +1,245 @@
+# Copyright (c) 2024 LG Electronics, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import collections
+import logging
+import selectors
+import socket
+import threading
+
+from pw_hdlc.rpc import DEFAULT_ADDRESS, STDOUT_ADDRESS
+
+from rpc.hdlc_reader import HdlcReader
+
+_LOG = logging.getLogger(__name__)
+
+
+class _Connection:
+    """
+    _Connection class holding the state of one device rpc socket.
+    """
+
+    def __init__(self, sock, client, output, on_disconnect):
+        """
+        Initialize a _Connection instance.
+
+        Arguments:
+            sock {socket} -- the connected device socket
+            client {pw_rpc.Client} -- the client which handles rpc packets
+            output {callable} -- handler for "stdout" frames of the device
+            on_disconnect {callable} -- called when the socket is closed
+        """
+        self.socket = sock
+        self.client = client
+        self.output = output
+        self.on_disconnect = on_disconnect
+        self.reader = HdlcReader()
+
+
+class RpcTransport:
+    """
+    RpcTransport class owning all device rpc sockets.
+
+    One selector loop reads every registered socket, decodes the HDLC
+    frames and dispatches the rpc packets to the pw_rpc client of the
+    device, so no reader thread is needed per device.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def instance(cls):
+        """
+        Return the transport shared by all device clients, start it if needed.
+        """
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+                cls._instance.start()
+            return cls._instance
+
+    def __init__(self):
+        """
+        Initialize a RpcTransport instance.
+        """
+        self._selector = selectors.DefaultSelector()
+        self._wakeup_r, self._wakeup_w = socket.socketpair()
+        self._wakeup_r.setblocking(False)
+        self._selector.register(self._wakeup_r, selectors.EVENT_READ, None)
+        self._tasks = collections.deque()
+        self._connections = {}
+        self._thread = None
+        self._running = False
+
+    def start(self):
+        """
+        Start the selector loop thread.
+        """
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(
+            target=self._run, name="rpc transport thread", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stop the selector loop thread and close every registered socket.
+        """
+        self._running = False
+        self._wakeup()
+        if (self._thread is not None
+                and self._thread is not threading.current_thread()):
+            self._thread.join()
+        for conn in list(self._connections.values()):
+            self._remove(conn.socket, True)
+
+    def register(self, sock, client, output=None, on_disconnect=None):
+        """
+        Add a device socket to the selector loop.
+
+        Arguments:
+            sock {socket} -- the connected device socket
+            client {pw_rpc.Client} -- the client which handles rpc packets
+            output {callable} -- handler for "stdout" frames (default None)
+            on_disconnect {callable} -- called with the socket when
+                                        the device closes it (default None)
+        """
+        conn = _Connection(sock, client, output, on_disconnect)
+        self._call_soon(self._add, conn)
+
+    def unregister(self, sock, close=True):
+        """
+        Remove a device socket from the selector loop.
+
+        Arguments:
+            sock {socket} -- the device socket
+            close {bool} -- close the socket once removed (default True)
+        """
+        self._call_soon(self._remove, sock, close)
+
+    def _call_soon(self, func, *args):
+        """
+        Run a function on the selector loop thread.
+        """
+        self._tasks.append((func, args))
+        self._wakeup()
+
+    def _wakeup(self):
+        """
+        Wake the selector loop up from select().
+        """
+        try:
+            self._wakeup_w.send(b'\0')
+        except OSError:
+            pass
+
+    def _add(self, conn):
+        """
+        Register a connection to the selector.
+        """
+        try:
+            self._selector.register(conn.socket, selectors.EVENT_READ, conn)
+            self._connections[conn.socket] = conn
+        except (ValueError, KeyError, OSError) as e:
+            _LOG.error("Failed to register RPC socket: " + str(e))
+
+    def _remove(self, sock, close):
+        """
+        Unregister a socket from the selector and close it if requested.
+        """
+        conn = self._connections.pop(sock, None)
+        if conn is not None:
+            try:
+                self._selector.unregister(sock)
+            except (ValueError, KeyError, OSError):
+                pass
+        if close:
+            try:
+                sock.close()
+            except OSError:
+                pass
+
+    def _disconnected(self, conn, error=None):
+        """
+        Handle a socket closed by the device.
+        """
+        if error is not None:
+            _LOG.warning("RPC socket error: " + str(error))
+        self._remove(conn.socket, False)
+        if conn.on_disconnect is not None:
+            try:
+                conn.on_disconnect(conn.socket)
+            except Exception:
+                _LOG.exception("Exception in RPC disconnect handler")
+
+    def _read(self, conn):
+        """
+        Read available data of a connection and dispatch decoded frames.
+        """
+        try:
+            frames = conn.reader.read(conn.socket)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError as e:
+            self._disconnected(conn, e)
+            return
+        if frames is None:
+            self._disconnected(conn)
+            return
+        for frame in frames:
+            self._handle_frame(conn, frame)
+
+    def _handle_frame(self, conn, frame):
+        """
+        Dispatch a decoded HDLC frame to the handler of its address.
+        """
+        try:
+            if frame.address == DEFAULT_ADDRESS:
+                if not conn.client.process_packet(frame.data):
+                    _LOG.error(
+                        'Packet not handled by RPC client: %s', frame.data)
+            elif frame.address == STDOUT_ADDRESS:
+                if conn.output is not None:
+                    conn.output(frame.data)
+            else:
+                _LOG.warning(
+                    'Unhandled frame for address %d: %s', frame.address, frame)
+        except Exception:
+            _LOG.exception('Exception in HDLC frame handler')
+
+    def _run(self):
+        """
+        Selector loop: read every ready socket and run queued tasks.
+        """
+        while self._running:
+            for key, _ in self._selector.select():
+                if key.data is None:
+                    try:
+                        while self._wakeup_r.recv(64):
+                            pass
+                    except (BlockingIOError, InterruptedError):
+                        pass
+                else:
+                    self._read(key.data)
+            while self._tasks:
+                func, args = self._tasks.popleft()
+                try:
+                    func(*args)
+                except Exception:
+                    _LOG.exception('Exception in RPC transport task')
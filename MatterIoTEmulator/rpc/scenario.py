@@ -0,0 +1,282 @@
+# Copyright (c) 2024 LG Electronics, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import json
+import logging
+import os
+import threading
+import time
+
+from rpc.poll_scheduler import PollScheduler
+
+
+class ScenarioError(Exception):
+    """
+    Raised by a scenario file which can not be loaded.
+    """
+
+
+def load_scenario(path):
+    """
+    Load a scenario from a JSON file, or a YAML file when PyYAML is
+    installed.
+
+    Arguments:
+        path {str} -- the scenario file, .json, .yaml or .yml
+    Raises:
+        ScenarioError: if the file can not be read
+    """
+    try:
+        with open(path) as scenario_file:
+            if os.path.splitext(path)[1].lower() in ('.yaml', '.yml'):
+                try:
+                    import yaml
+                except ImportError:
+                    raise ScenarioError(
+                        'PyYAML is needed for YAML scenarios, '
+                        'use a JSON scenario or install pyyaml')
+                return yaml.safe_load(scenario_file)
+            return json.load(scenario_file)
+    except (OSError, ValueError) as e:
+        raise ScenarioError(f'Can not load scenario {path}: {str(e)}')
+
+
+class ScenarioStep:
+    """
+    ScenarioStep class of one action of a scenario timeline.
+    """
+
+    __slots__ = ('time', 'device', 'method', 'args', 'kwargs', 'event',
+                 'planned', 'actual', 'duration', 'status')
+
+    def __init__(self, time, device=None, method=None, args=(),
+                 kwargs=None, event=None):
+        self.time = time
+        self.device = device
+        self.method = method
+        self.args = tuple(args)
+        self.kwargs = kwargs or {}
+        self.event = event
+        self.planned = None
+        self.actual = None
+        self.duration = None
+        self.status = 'PENDING'
+
+    def to_dict(self):
+        """
+        Return the step and its timing for the report.
+        """
+        skew = None
+        if self.actual is not None:
+            skew = round((self.actual - self.planned) * 1000.0, 3)
+        return {
+            'time': self.time,
+            'device': self.device,
+            'action': self.event if self.event is not None else self.method,
+            'status': self.status,
+            'skew_ms': skew,
+            'duration_ms': (None if self.duration is None
+                            else round(self.duration * 1000.0, 3))}
+
+
+def parse_steps(scenario):
+    """
+    Return the steps of a scenario ordered by time.
+
+    A scenario holds 'devices', aliases of the device targets, and
+    'steps'. A step starts 'at' seconds from the start, or 'after'
+    seconds from the previous step, and either sets attributes of a
+    'device' with 'set', calls the rpc client method 'call' of a device
+    with 'args' and 'kwargs', or marks an 'event'. 'device' may be a list
+    to run the step on several devices. The steps are repeated 'repeat'
+    times, every 'period' seconds, which is then required.
+
+    Arguments:
+        scenario {dict} -- the loaded scenario
+    Raises:
+        ScenarioError: if a step is malformed
+    """
+    aliases = scenario.get('devices', {})
+    steps = []
+    previous = 0.0
+    for index, entry in enumerate(scenario.get('steps', [])):
+        if 'at' in entry:
+            start = float(entry['at'])
+        else:
+            start = previous + float(entry.get('after', 0.0))
+        previous = start
+        if 'event' in entry:
+            steps.append(ScenarioStep(start, event=str(entry['event'])))
+            continue
+        devices = entry.get('device')
+        if devices is None:
+            raise ScenarioError(f'Step {index} has no device')
+        if not isinstance(devices, list):
+            devices = [devices]
+        if 'set' in entry:
+            method, args = 'set', (entry['set'],)
+        elif 'call' in entry:
+            method, args = entry['call'], entry.get('args', ())
+        else:
+            raise ScenarioError(f'Step {index} has no set, call or event')
+        for device in devices:
+            steps.append(ScenarioStep(
+                start, aliases.get(device, device), method, args,
+                entry.get('kwargs')))
+    repeat = int(scenario.get('repeat', 1))
+    if repeat < 1:
+        raise ScenarioError(f'Bad repeat {repeat}')
+    period = 0.0
+    if repeat > 1:
+        if 'period' not in scenario:
+            raise ScenarioError('A repeated scenario needs a period')
+        period = float(scenario['period'])
+        if period <= 0:
+            raise ScenarioError(f'Bad period {period}')
+    timeline = []
+    for count in range(repeat):
+        for step in steps:
+            timeline.append(ScenarioStep(
+                step.time + count * period, step.device, step.method,
+                step.args, step.kwargs, step.event))
+    timeline.sort(key=lambda step: step.time)
+    return timeline
+
+
+class ScenarioRunner:
+    """
+    ScenarioRunner class playing a scenario on one monotonic clock.
+
+    Every step is scheduled on the poll scheduler at the start time plus
+    its time in the scenario and runs the rpc client method of its
+    device on the worker pool; the calls of a device are ordered by its
+    request queue. The runner records when each step actually started,
+    so the report gives the skew between the planned and actual timing.
+    """
+
+    def __init__(self, scenario, resolve, scheduler=None):
+        """
+        Initialize a ScenarioRunner instance.
+
+        Arguments:
+            scenario {dict} -- the loaded scenario, see parse_steps()
+            resolve {callable} -- returns the rpc client of a device
+                                  target, or None if it is unknown
+            scheduler {PollScheduler} -- the scheduler running the steps
+                                         (default the shared one)
+        """
+        self.name = scenario.get('name', 'scenario')
+        self.steps = parse_steps(scenario)
+        self.resolve = resolve
+        self.scheduler = scheduler or PollScheduler.instance()
+        self.start_time = None
+        self._entries = []
+        self._left = len(self.steps)
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+        if not self.steps:
+            self._done.set()
+
+    def start(self):
+        """
+        Schedule all steps from now.
+        """
+        self.start_time = time.monotonic()
+        for step in self.steps:
+            step.planned = self.start_time + step.time
+            self._entries.append(self.scheduler.call_later(
+                max(step.planned - time.monotonic(), 0), self._run, step))
+        logging.info(f'Scenario {self.name} started: '
+                     f'{len(self.steps)} steps')
+
+    def cancel(self):
+        """
+        Cancel the steps not started yet.
+        """
+        for entry in self._entries:
+            entry.cancel()
+        with self._lock:
+            for step in self.steps:
+                if step.status == 'PENDING':
+                    step.status = 'CANCELLED'
+        self._done.set()
+
+    def wait(self, timeout=None):
+        """
+        Wait for the end of the scenario and return True if it ended.
+
+        Arguments:
+            timeout {float} -- seconds to wait (default None, no limit)
+        """
+        return self._done.wait(timeout)
+
+    def _run(self, step):
+        """
+        Run one step on a worker.
+        """
+        step.actual = time.monotonic()
+        try:
+            if step.event is not None:
+                logging.info(f'Scenario {self.name} event: {step.event}')
+                step.status = 'OK'
+            else:
+                client = self.resolve(step.device)
+                if client is None:
+                    step.status = 'NO_DEVICE'
+                else:
+                    getattr(client, step.method)(*step.args, **step.kwargs)
+                    step.status = 'OK'
+        except Exception as e:
+            step.status = 'FAILED'
+            logging.error(f'Scenario {self.name} step {step.method} of '
+                          f'{step.device} failed: {str(e)}')
+        step.duration = time.monotonic() - step.actual
+        with self._lock:
+            self._left -= 1
+            if self._left <= 0:
+                self._done.set()
+
+    def report(self):
+        """
+        Return the steps with their status, skew and duration, and the
+        skew summary in milliseconds.
+        """
+        steps = [step.to_dict() for step in self.steps]
+        skews = sorted(step['skew_ms'] for step in steps
+                       if step['skew_ms'] is not None)
+        summary = {
+            'steps': len(steps),
+            'ok': sum(1 for step in steps if step['status'] == 'OK'),
+            'failed': sum(1 for step in steps
+                          if step['status'] not in ('OK', 'PENDING'))}
+        if skews:
+            summary.update({
+                'mean_skew_ms': round(sum(skews) / len(skews), 3),
+                'p95_skew_ms': skews[min(int(len(skews) * 0.95),
+                                         len(skews) - 1)],
+                'max_skew_ms': skews[-1]})
+        return {'name': self.name, 'summary': summary, 'steps': steps}
+
+    def save_report(self, path):
+        """
+        Write the report to a JSON file.
+
+        Arguments:
+            path {str} -- the report file
+        """
+        with open(path, 'w') as report_file:
+            json.dump(self.report(), report_file, indent=4)
@@ -15,7 +15,7 @@
 # SPDX-License-Identifier: Apache-2.0s
 
 
-from rpc.device_client import DeviceClient
+from rpc.device_client import AsyncDeviceClient, DeviceClient
 from google.protobuf import json_format
 from sensor_service import sensor_service_pb2
 import time
@@ -26,6 +26,8 @@ class SensorClient(DeviceClient):
     Sensor client class for creating a device.
     """
 
+    PROTOS = DeviceClient.PROTOS + ('sensor_service',)
+
     def __init__(self, socket_addr=None):
         """
         Initialize a Sensor client instance.
@@ -39,10 +41,8 @@ class SensorClient(DeviceClient):
         """
         Return Sensor state.
         """
-        result = self.rpcs.chip.rpc.Sensor.Get()
-        reply = json_format.MessageToDict(
-            result[1], sensor_service_pb2.SensorState())
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(
+            self.rpcs.chip.rpc.Sensor.Get, include_defaults=True)
 
     def set(self, data):
         """
@@ -53,9 +53,13 @@ class SensorClient(DeviceClient):
         """
         arg = sensor_service_pb2.SensorState()
         json_format.ParseDict(data, arg)
-        result = self.rpcs.chip.rpc.Sensor.Set(arg)
-        reply = json_format.MessageToDict(result[1])
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(self.rpcs.chip.rpc.Sensor.Set, arg)
+
+
+class AsyncSensorClient(AsyncDeviceClient, SensorClient):
+    """
+    Sensor client class returning awaitable results.
+    """
 
 
 if __name__ == '__main__':
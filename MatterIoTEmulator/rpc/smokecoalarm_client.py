@@ -15,7 +15,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
-from rpc.device_client import DeviceClient
+from rpc.device_client import AsyncDeviceClient, DeviceClient
 from google.protobuf import json_format
 from smokecoalarm_service import smokecoalarm_service_pb2
 import time
@@ -26,6 +26,8 @@ class SmokeCoAlarmClient(DeviceClient):
     Fan client class for creating a device.
     """
 
+    PROTOS = DeviceClient.PROTOS + ('smokecoalarm_service',)
+
     def __init__(self, socket_addr=None):
         """
         Initialize a Smoke Co Alarm client instance.
@@ -39,10 +41,8 @@ class SmokeCoAlarmClient(DeviceClient):
         """
         Return Smoke Co Alarm state.
         """
-        result = self.rpcs.chip.rpc.SmokeCoAlarm.Get()
-        reply = json_format.MessageToDict(
-            result[1], smokecoalarm_service_pb2.SmokeCoAlarmState())
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(
+            self.rpcs.chip.rpc.SmokeCoAlarm.Get, include_defaults=True)
 
     def set(self, data):
         """
@@ -53,9 +53,13 @@ class SmokeCoAlarmClient(DeviceClient):
         """
         arg = smokecoalarm_service_pb2.SmokeCoAlarmState()
         json_format.ParseDict(data, arg)
-        result = self.rpcs.chip.rpc.SmokeCoAlarm.Set(arg)
-        reply = json_format.MessageToDict(result[1])
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(self.rpcs.chip.rpc.SmokeCoAlarm.Set, arg)
+
+
+class AsyncSmokeCoAlarmClient(AsyncDeviceClient, SmokeCoAlarmClient):
+    """
+    SmokeCoAlarm client class returning awaitable results.
+    """
 
 
 if __name__ == '__main__':
@@ -0,0 +1,117 @@
+# Copyright (c) 2024 LG Electronics, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import threading
+
+# Snapshot keys which are not rpc results
+SNAPSHOT_INFO_KEYS = ('timestamp', 'latency')
+
+
+def flatten_reply(value, prefix, out):
+    """
+    Store the leaf values of a reply dictionary by dotted path.
+
+    Arguments:
+        value {Any} -- the reply or one of its values
+        prefix {str} -- the path of value
+        out {dict} -- the dictionary receiving path: value items
+    """
+    if isinstance(value, dict) and value:
+        for key, item in value.items():
+            flatten_reply(item, prefix + '.' + key if prefix else key, out)
+    else:
+        out[prefix] = value
+
+
+class DeviceStateCache:
+    """
+    DeviceStateCache class keeping the last known attributes of a device.
+
+    Attributes are stored by dotted path, made of the snapshot key and the
+    reply field names, e.g. 'device_cold_status.refTemperatureControl.step'.
+    """
+
+    def __init__(self):
+        """
+        Initialize a DeviceStateCache instance.
+        """
+        self._lock = threading.Lock()
+        self._paths = {}
+        self._messages = {}
+
+    def update(self, snapshot):
+        """
+        Store a device snapshot and return the attributes it changed.
+
+        Results which are not OK keep the previous values. Paths which
+        disappeared from a reply are reported with None value.
+
+        Arguments:
+            snapshot {dict} -- the result of DeviceClient.snapshot()
+        """
+        changes = {}
+        with self._lock:
+            for key, result in snapshot.items():
+                if key in SNAPSHOT_INFO_KEYS or result.get('status') != 'OK':
+                    continue
+                # RpcResult replies need no conversion if the message is equal
+                message = getattr(result, 'message', None)
+                if (message is not None
+                        and self._messages.get(key) == message):
+                    continue
+                paths = {}
+                flatten_reply(result['reply'], key, paths)
+                previous = self._paths.get(key, {})
+                for path, value in paths.items():
+                    if path not in previous or previous[path] != value:
+                        changes[path] = value
+                for path in previous.keys() - paths.keys():
+                    changes[path] = None
+                self._paths[key] = paths
+                if message is not None:
+                    self._messages[key] = message
+        return changes
+
+    def get(self, path, default=None):
+        """
+        Return the cached value of an attribute path.
+
+        Arguments:
+            path {str} -- the dotted attribute path
+            default {Any} -- value returned for an unknown path
+        """
+        key = path.split('.', 1)[0]
+        with self._lock:
+            return self._paths.get(key, {}).get(path, default)
+
+    def state(self):
+        """
+        Return a copy of all cached attributes by path.
+        """
+        state = {}
+        with self._lock:
+            for paths in self._paths.values():
+                state.update(paths)
+        return state
+
+    def clear(self):
+        """
+        Forget all cached attributes, the next update reports every path.
+        """
+        with self._lock:
+            self._paths.clear()
+            self._messages.clear()
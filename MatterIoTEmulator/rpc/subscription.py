@@ -0,0 +1,276 @@
+# Copyright (c) 2024 LG Electronics, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import logging
+import threading
+import time
+
+from rpc.poll_scheduler import (DEFAULT_MAX_POLL_INTERVAL,
+                                DEFAULT_POLL_INTERVAL, PollJob, PollScheduler)
+from rpc.rpc_session import DeviceUnavailableError
+
+
+def subscribe(device, attribute_path, callback, min_interval=0.0,
+              max_interval=None):
+    """
+    Subscribe to the changes of an attribute of a device.
+
+    Arguments:
+        device {DeviceClient} -- the client of the device
+        attribute_path {str} -- dotted attribute path, a path of a message
+                                subscribes to all its fields, '' to all
+        callback {callable} -- called with a {path: value} dictionary
+        min_interval {float} -- shortest time between two reports, changes
+                                in between are merged (default 0.0)
+        max_interval {float} -- longest time without report, the current
+                                values are reported again (default None)
+    """
+    return device.subscribe(attribute_path, callback, min_interval,
+                            max_interval)
+
+
+class Subscription:
+    """
+    Subscription class reporting the changes of an attribute path,
+    modeled on Matter subscribe min and max intervals.
+    """
+
+    def __init__(self, manager, path, callback, min_interval, max_interval):
+        """
+        Initialize a Subscription instance, see subscribe().
+        """
+        self.manager = manager
+        self.path = path
+        self.callback = callback
+        self.min_interval = min_interval or 0.0
+        self.max_interval = max_interval
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._last_report = 0.0
+        self._flush_handle = None
+        self._heartbeat_handle = None
+        self.active = True
+
+    def matches(self, path):
+        """
+        Return True if an attribute path belongs to the subscription.
+        """
+        return (not self.path or path == self.path
+                or path.startswith(self.path + '.'))
+
+    def cancel(self):
+        """
+        Stop the subscription.
+        """
+        self.manager.remove(self)
+
+    def _stop(self):
+        """
+        Cancel the pending reports of the subscription.
+        """
+        with self._lock:
+            self.active = False
+            self._pending.clear()
+            for handle in (self._flush_handle, self._heartbeat_handle):
+                if handle is not None:
+                    handle.cancel()
+            self._flush_handle = None
+            self._heartbeat_handle = None
+
+    def _on_changes(self, changes):
+        """
+        Queue the matching changes and report them when min_interval allows.
+        """
+        matched = {path: value for path, value in changes.items()
+                   if self.matches(path)}
+        if not matched:
+            return
+        with self._lock:
+            if not self.active:
+                return
+            self._pending.update(matched)
+            wait = self._last_report + self.min_interval - time.monotonic()
+            if wait > 0:
+                if self._flush_handle is None:
+                    self._flush_handle = self.manager.scheduler.call_later(
+                        wait, self._flush)
+                return
+            values = self._take_pending()
+        self._report(values)
+
+    def _take_pending(self):
+        """
+        Return the queued changes and mark them reported, under the lock.
+        """
+        values, self._pending = self._pending, {}
+        self._last_report = time.monotonic()
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._heartbeat_handle is not None:
+            self._heartbeat_handle.cancel()
+        if self.max_interval:
+            self._heartbeat_handle = self.manager.scheduler.call_later(
+                self.max_interval, self._heartbeat)
+        return values
+
+    def _flush(self):
+        """
+        Report the changes merged during min_interval.
+        """
+        with self._lock:
+            self._flush_handle = None
+            if not self.active or not self._pending:
+                return
+            values = self._take_pending()
+        self._report(values)
+
+    def _heartbeat(self):
+        """
+        Report the current values when max_interval passed without report.
+        """
+        state = self.manager.client.state_cache.state()
+        with self._lock:
+            if not self.active:
+                return
+            self._pending = {path: value for path, value in state.items()
+                             if self.matches(path)}
+            values = self._take_pending()
+        self._report(values)
+
+    def _report(self, values):
+        """
+        Call the subscription callback.
+        """
+        try:
+            self.callback(values)
+        except Exception as e:
+            logging.error(f'Subscription callback of {self.path} failed: '
+                          f'{str(e)}')
+
+
+class SubscriptionManager:
+    """
+    SubscriptionManager class sharing the polls of one device between
+    all its subscriptions.
+
+    Every poll of the client, including the polls of the device UI, feeds
+    the subscriptions. While there are subscriptions the manager also
+    polls the device on the poll scheduler, skipping polls when the
+    device was just polled by someone else.
+    """
+
+    def __init__(self, client, scheduler=None):
+        """
+        Initialize a SubscriptionManager instance.
+
+        Arguments:
+            client {DeviceClient} -- the client of the device
+            scheduler {PollScheduler} -- (default the shared scheduler)
+        """
+        self.client = client
+        self.scheduler = scheduler or PollScheduler.instance()
+        self._lock = threading.Lock()
+        self._subscriptions = []
+        self._job = None
+
+    def add(self, path, callback, min_interval=0.0, max_interval=None):
+        """
+        Add a subscription and return it, see subscribe().
+        """
+        subscription = Subscription(self, path, callback, min_interval,
+                                    max_interval)
+        with self._lock:
+            self._subscriptions.append(subscription)
+            if self._job is None:
+                self._start_job()
+        # Prime the subscription with the values already known
+        known = self.client.state_cache.state()
+        if known:
+            self.scheduler.call_later(0.0, subscription._on_changes, known)
+        return subscription
+
+    def remove(self, subscription):
+        """
+        Remove a subscription, stop polling after the last one.
+        """
+        subscription._stop()
+        with self._lock:
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+            if not self._subscriptions:
+                self._stop_job()
+
+    def close(self):
+        """
+        Remove every subscription.
+        """
+        with self._lock:
+            subscriptions, self._subscriptions = self._subscriptions, []
+            self._stop_job()
+        for subscription in subscriptions:
+            subscription._stop()
+
+    def dispatch(self, changes):
+        """
+        Hand the changes of a poll to the subscriptions.
+
+        Arguments:
+            changes {dict} -- the changed attributes by path
+        """
+        if not changes:
+            return
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+        for subscription in subscriptions:
+            subscription._on_changes(changes)
+
+    def _start_job(self):
+        """
+        Start polling the device, the caller holds the lock.
+        """
+        self._job = PollJob(self._poll, self.client.SNAPSHOT_READS,
+                            DEFAULT_POLL_INTERVAL, DEFAULT_MAX_POLL_INTERVAL,
+                            name='subscriptions')
+        self.client.add_write_listener(self._job.kick)
+        self.scheduler.add(self._job)
+
+    def _stop_job(self):
+        """
+        Stop polling the device, the caller holds the lock.
+        """
+        if self._job is not None:
+            self.scheduler.remove(self._job)
+            self.client.remove_write_listener(self._job.kick)
+            self._job = None
+
+    def _poll(self, reads):
+        """
+        Poll the device unless another poller has just done it.
+        """
+        job = self._job
+        if job is None:
+            # Stopped since the scheduler picked the job up
+            return None
+        elapsed = time.monotonic() - self.client.last_poll_time
+        if elapsed < job.interval / 2:
+            return None
+        try:
+            _, changes = self.client.poll(reads)
+        except DeviceUnavailableError:
+            return {}
+        return changes
@@ -15,7 +15,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
-from rpc.device_client import DeviceClient
+from rpc.device_client import AsyncDeviceClient, DeviceClient
 from google.protobuf import json_format
 from thermostat_service import thermostat_service_pb2
 import time
@@ -26,6 +26,8 @@ class ThermostatClient(DeviceClient):
     Thermostat client class for creating a device.
     """
 
+    PROTOS = DeviceClient.PROTOS + ('thermostat_service',)
+
     def __init__(self, socket_addr=None):
         """
         Initialize a Thermostat client instance.
@@ -39,10 +41,8 @@ class ThermostatClient(DeviceClient):
         """
         Return Thermostat state.
         """
-        result = self.rpcs.chip.rpc.Thermostat.Get()
-        reply = json_format.MessageToDict(
-            result[1], thermostat_service_pb2.ThermostatState())
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(
+            self.rpcs.chip.rpc.Thermostat.Get, include_defaults=True)
 
     def set(self, data):
         """
@@ -53,9 +53,13 @@ class ThermostatClient(DeviceClient):
         """
         arg = thermostat_service_pb2.ThermostatState()
         json_format.ParseDict(data, arg)
-        result = self.rpcs.chip.rpc.Thermostat.Set(arg)
-        reply = json_format.MessageToDict(result[1])
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(self.rpcs.chip.rpc.Thermostat.Set, arg)
+
+
+class AsyncThermostatClient(AsyncDeviceClient, ThermostatClient):
+    """
+    Thermostat client class returning awaitable results.
+    """
 
 
 if __name__ == '__main__':
@@ -15,7 +15,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
-from rpc.device_client import DeviceClient
+from rpc.device_client import AsyncDeviceClient, DeviceClient
 from google.protobuf import json_format
 from window_service import window_service_pb2
 import time
@@ -26,6 +26,8 @@ class WindowClient(DeviceClient):
     Window client class for creating a device.
     """
 
+    PROTOS = DeviceClient.PROTOS + ('window_service',)
+
     def __init__(self, socket_addr=None):
         """
         Initialize a Window client instance.
@@ -39,10 +41,8 @@ class WindowClient(DeviceClient):
         """
         Return Window state.
         """
-        result = self.rpcs.chip.rpc.Window.Get()
-        reply = json_format.MessageToDict(
-            result[1], window_service_pb2.WindowState())
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(
+            self.rpcs.chip.rpc.Window.Get, include_defaults=True)
 
     def set(self, data):
         """
@@ -53,9 +53,13 @@ class WindowClient(DeviceClient):
         """
         arg = window_service_pb2.WindowState()
         json_format.ParseDict(data, arg)
-        result = self.rpcs.chip.rpc.Window.Set(arg)
-        reply = json_format.MessageToDict(result[1])
-        return {'status': result[0].name, 'reply': reply}
+        return self._unary(self.rpcs.chip.rpc.Window.Set, arg)
+
+
+class AsyncWindowClient(AsyncDeviceClient, WindowClient):
+    """
+    Window client class returning awaitable results.
+    """
 
 
 if __name__ == '__main__':
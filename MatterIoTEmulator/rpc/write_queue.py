@@ -0,0 +1,147 @@
+# Copyright (c) 2024 LG Electronics, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import logging
+import threading
+
+from rpc.poll_scheduler import PollScheduler
+
+DEFAULT_MERGE_WINDOW = 0.2
+DEFAULT_FLUSH_ON_RELEASE = True
+
+
+def get_write_queue_config(config):
+    """
+    Return the write queue settings from the 'write_queue' section of
+    config.json: 'merge_window' in seconds and 'flush_on_release'.
+
+    Arguments:
+        config {dict} -- the content of config.json
+    """
+    section = (config or {}).get('write_queue', {})
+    return {
+        'merge_window': section.get('merge_window', DEFAULT_MERGE_WINDOW),
+        'flush_on_release': section.get('flush_on_release',
+                                        DEFAULT_FLUSH_ON_RELEASE)}
+
+
+class WriteQueue:
+    """
+    WriteQueue class merging the writes of one device.
+
+    A write is queued under the attribute it changes. Until it is sent,
+    a newer write of the same attribute replaces it, so only the latest
+    value goes to the device. Writes are sent one at a time on the worker
+    pool of the poll scheduler, never on the caller thread.
+    """
+
+    def __init__(self, merge_window=DEFAULT_MERGE_WINDOW, scheduler=None):
+        """
+        Initialize a WriteQueue instance.
+
+        Arguments:
+            merge_window {float} -- seconds a write waits for newer values
+                                    of the same attribute (default 0.2)
+            scheduler {PollScheduler} -- (default the shared scheduler)
+        """
+        self.merge_window = merge_window
+        self.scheduler = scheduler or PollScheduler.instance()
+        self.merged_count = 0
+        self.sent_count = 0
+        self._lock = threading.Lock()
+        self._send_lock = threading.Lock()
+        self._pending = {}
+        self._handles = {}
+
+    def submit(self, key, func, *args, delay=None, debounce=False,
+               flush=False):
+        """
+        Queue a write of an attribute.
+
+        Arguments:
+            key {str} -- the attribute changed by the write
+            func {callable} -- the function sending the write
+            args -- arguments of func
+            delay {float} -- wait time instead of the merge window
+            debounce {bool} -- restart the wait on each write of the
+                               attribute instead of sending after the
+                               first one (default False)
+            flush {bool} -- send the write now (default False)
+        """
+        with self._lock:
+            if key in self._pending:
+                self.merged_count += 1
+            self._pending[key] = (func, args)
+            handle = self._handles.get(key)
+            if handle is not None and not (flush or debounce):
+                return
+            if handle is not None:
+                handle.cancel()
+            wait = 0.0 if flush else (
+                self.merge_window if delay is None else delay)
+            self._handles[key] = self.scheduler.call_later(
+                wait, self._send, key)
+
+    def flush(self, key=None):
+        """
+        Send the queued write of an attribute, or all writes, now.
+
+        Arguments:
+            key {str} -- the attribute, None for all (default None)
+        """
+        with self._lock:
+            keys = list(self._pending) if key is None else [key]
+            for item in keys:
+                if item not in self._pending:
+                    continue
+                handle = self._handles.get(item)
+                if handle is not None:
+                    handle.cancel()
+                self._handles[item] = self.scheduler.call_later(
+                    0.0, self._send, item)
+
+    def cancel(self, key=None):
+        """
+        Drop the queued write of an attribute, or all writes.
+
+        Arguments:
+            key {str} -- the attribute, None for all (default None)
+        """
+        with self._lock:
+            keys = list(self._pending) if key is None else [key]
+            for item in keys:
+                self._pending.pop(item, None)
+                handle = self._handles.pop(item, None)
+                if handle is not None:
+                    handle.cancel()
+
+    def _send(self, key):
+        """
+        Send the latest queued write of an attribute.
+        """
+        with self._lock:
+            self._handles.pop(key, None)
+            item = self._pending.pop(key, None)
+        if item is None:
+            return
+        func, args = item
+        with self._send_lock:
+            try:
+                func(*args)
+                self.sent_count += 1
+            except Exception as e:
+                logging.error(f'Write of {key} failed: {str(e)}')
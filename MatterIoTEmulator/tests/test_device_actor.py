@@ -0,0 +1,132 @@
+# Copyright (c) 2024 LG Electronics, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import threading
+import time
+import unittest
+
+from rpc.device_actor import (PRIORITY_POLL, PRIORITY_READ, PRIORITY_WRITE,
+                              DeviceActor, DeviceBusyError)
+
+
+class DeviceActorTest(unittest.TestCase):
+    """
+    Tests of the request order and queue limit of the device actor.
+    """
+
+    def setUp(self):
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.threads = []
+        self.results = {}
+
+    def tearDown(self):
+        self.release.set()
+        for thread in self.threads:
+            thread.join(5)
+
+    def block(self, actor):
+        """
+        Run a request which holds the actor until release is set.
+        """
+        def blocker():
+            self.started.set()
+            self.release.wait(5)
+        self.spawn(actor, 'blocker', PRIORITY_POLL, blocker)
+        self.assertTrue(self.started.wait(5))
+
+    def spawn(self, actor, name, priority, func):
+        """
+        Call the actor from a new thread, store the result or the error.
+        """
+        def run():
+            try:
+                self.results[name] = actor.call(priority, func)
+            except DeviceBusyError as e:
+                self.results[name] = e
+        thread = threading.Thread(target=run)
+        thread.start()
+        self.threads.append(thread)
+
+    def wait_pending(self, actor, count):
+        """
+        Wait until count requests are queued.
+        """
+        deadline = time.monotonic() + 5
+        while actor.pending < count and time.monotonic() < deadline:
+            time.sleep(0.001)
+        self.assertEqual(actor.pending, count)
+
+    def finish(self):
+        """
+        Release the actor and wait for all calls.
+        """
+        self.release.set()
+        for thread in self.threads:
+            thread.join(5)
+
+    def test_priority_order(self):
+        actor = DeviceActor('test')
+        order = []
+        self.block(actor)
+        for count, (name, priority) in enumerate((
+                ('poll', PRIORITY_POLL), ('read', PRIORITY_READ),
+                ('write', PRIORITY_WRITE), ('write2', PRIORITY_WRITE))):
+            self.spawn(actor, name, priority,
+                       lambda name=name: order.append(name))
+            self.wait_pending(actor, count + 1)
+        self.finish()
+        self.assertEqual(order, ['write', 'write2', 'read', 'poll'])
+
+    def test_full_queue_drops_lower_priority(self):
+        actor = DeviceActor('test', max_pending=2)
+        self.block(actor)
+        self.spawn(actor, 'poll1', PRIORITY_POLL, lambda: 'poll1')
+        self.wait_pending(actor, 1)
+        self.spawn(actor, 'poll2', PRIORITY_POLL, lambda: 'poll2')
+        self.wait_pending(actor, 2)
+        # The write takes the place of the last poll
+        self.spawn(actor, 'write', PRIORITY_WRITE, lambda: 'write')
+        self.threads[-2].join(5)
+        self.assertIsInstance(self.results['poll2'], DeviceBusyError)
+        # A poll finds no request of lower priority and fails itself
+        with self.assertRaises(DeviceBusyError):
+            actor.call(PRIORITY_POLL, lambda: 'poll3')
+        self.finish()
+        self.assertEqual(self.results['poll1'], 'poll1')
+        self.assertEqual(self.results['write'], 'write')
+        self.assertEqual(actor.dropped_count, 2)
+
+    def test_nested_call_runs_at_once(self):
+        actor = DeviceActor('test')
+        result = actor.call(PRIORITY_READ, lambda: actor.call(
+            PRIORITY_WRITE, lambda: 'inner'))
+        self.assertEqual(result, 'inner')
+        self.assertEqual(actor.pending, 0)
+
+    def test_error_raised_to_caller(self):
+        actor = DeviceActor('test')
+
+        def fail():
+            raise ValueError('bad')
+        with self.assertRaises(ValueError):
+            actor.call(PRIORITY_READ, fail)
+        self.assertEqual(actor.call(PRIORITY_READ, lambda: 1), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+# Copyright (c) 2024 LG Electronics, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import socket
+import unittest
+
+try:
+    from pw_hdlc import encode
+    from rpc.hdlc_reader import HdlcReader, decode_frame
+except ImportError:
+    encode = None
+
+# Payloads holding the flag and escape bytes, which are escaped
+PAYLOADS = (b'hello', bytes(range(256)), b'\x7e\x7d\x7e', b'x' * 1000)
+
+
+@unittest.skipIf(encode is None, 'pw_hdlc is not installed')
+class HdlcReaderTest(unittest.TestCase):
+    """
+    Tests of the HDLC frame reader.
+    """
+
+    def stream(self):
+        """
+        Return the encoded frames of PAYLOADS.
+        """
+        return b''.join(encode.ui_frame(1, payload) for payload in PAYLOADS)
+
+    def test_frames_in_one_read(self):
+        frames = list(HdlcReader().process(self.stream()))
+        self.assertEqual([frame.data for frame in frames], list(PAYLOADS))
+        self.assertEqual({frame.address for frame in frames}, {1})
+
+    def test_frames_split_over_reads(self):
+        stream = self.stream()
+        for size in (1, 2, 7, 100):
+            reader = HdlcReader()
+            frames = []
+            for start in range(0, len(stream), size):
+                frames.extend(reader.process(stream[start:start + size]))
+            self.assertEqual([frame.data for frame in frames],
+                             list(PAYLOADS))
+
+    def test_process_size_of_buffer(self):
+        stream = self.stream()
+        buffer = bytearray(stream + b'\x00' * 10)
+        frames = list(HdlcReader().process(buffer, len(stream)))
+        self.assertEqual(len(frames), len(PAYLOADS))
+
+    def test_bad_frames_discarded(self):
+        good = encode.ui_frame(1, b'good')
+        bad = bytearray(encode.ui_frame(1, b'bad'))
+        bad[-2] ^= 0xFF
+        stream = b'noise' + bytes(bad) + good + b'\x7e\x01\x7e' + good
+        with self.assertLogs('rpc.hdlc_reader', 'WARNING'):
+            frames = list(HdlcReader().process(stream))
+        self.assertEqual([frame.data for frame in frames], [b'good'] * 2)
+
+    def test_decode_frame_offsets(self):
+        encoded = encode.ui_frame(1, b'payload')
+        buffer = bytearray(b'ab' + encoded[1:-1] + b'cd')
+        frame = decode_frame(buffer, 2, len(buffer) - 2)
+        self.assertTrue(frame.ok())
+        self.assertEqual(frame.data, b'payload')
+        self.assertEqual(frame.raw_encoded, encoded[1:-1])
+        self.assertIsInstance(frame.data, bytes)
+        # The frame does not keep the buffer, which can be reused
+        buffer[:] = bytes(len(buffer))
+        self.assertEqual(frame.data, b'payload')
+
+    def test_read_socket(self):
+        reader_sock, writer_sock = socket.socketpair()
+        try:
+            reader = HdlcReader(buffer_size=64)
+            writer_sock.sendall(self.stream())
+            writer_sock.shutdown(socket.SHUT_WR)
+            frames = []
+            while True:
+                read = reader.read(reader_sock)
+                if read is None:
+                    break
+                frames.extend(read)
+        finally:
+            reader_sock.close()
+            writer_sock.close()
+        self.assertEqual([frame.data for frame in frames], list(PAYLOADS))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+# Copyright (c) 2024 LG Electronics, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import os
+import subprocess
+import sys
+import unittest
+
+SOURCE_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Imports the daemon in a new interpreter and prints the Qt modules loaded
+IMPORT_SCRIPT = '''
+import sys
+try:
+    import headless
+except ModuleNotFoundError as e:
+    if e.name.split('.')[0] == 'PySide2':
+        raise
+    print('SKIP', e.name)
+    sys.exit(0)
+except SystemExit:
+    print('SKIP', 'no network interface')
+    sys.exit(0)
+print('QT', sorted(name for name in sys.modules
+                   if name.split('.')[0] == 'PySide2'))
+'''
+
+
+class HeadlessTest(unittest.TestCase):
+    """
+    Tests of the headless fleet daemon.
+    """
+
+    def test_import_without_qt(self):
+        result = subprocess.run(
+            [sys.executable, '-c', IMPORT_SCRIPT], cwd=SOURCE_PATH,
+            capture_output=True, text=True, timeout=60)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        output = result.stdout.strip().splitlines()[-1]
+        if output.startswith('SKIP'):
+            self.skipTest(f'headless dependency missing: {output[5:]}')
+        self.assertEqual(output, 'QT []')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,172 @@
+# Copyright (c) 2024 LG Electronics, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import itertools
+import random
+import statistics
+import unittest
+from unittest import mock
+
+from rpc.load_generator import (PATTERN_BURST, PATTERN_POISSON,
+                                PATTERN_UNIFORM, LoadGenerator, LoadTarget,
+                                TokenBucket, arrival_times, random_change,
+                                toggle_change)
+
+TIMEOUT = 5
+
+
+def first(iterator, count):
+    """
+    Return the first count items of an iterator.
+    """
+    return list(itertools.islice(iterator, count))
+
+
+class FakeClient:
+    """
+    Async client recording the values set.
+    """
+
+    def __init__(self):
+        self.values = []
+
+    async def set(self, values):
+        self.values.append(values)
+        return {'status': 'OK'}
+
+
+class TokenBucketTest(unittest.TestCase):
+    """
+    Tests of the rate limit of one device.
+    """
+
+    def test_rate_and_capacity(self):
+        with mock.patch('rpc.load_generator.time.monotonic',
+                        return_value=100.0):
+            bucket = TokenBucket(4.0, 2.0)
+        self.assertEqual([bucket.take(100.0) for _ in range(3)],
+                         [True, True, False])
+        # Half a second at 4 per second refills two tokens
+        self.assertEqual([bucket.take(100.5) for _ in range(3)],
+                         [True, True, False])
+        # The bucket holds no more than its capacity
+        self.assertEqual(sum(bucket.take(200.0) for _ in range(5)), 2)
+
+
+class ArrivalTimesTest(unittest.TestCase):
+    """
+    Tests of the arrival patterns of the changes.
+    """
+
+    def test_uniform(self):
+        self.assertEqual(first(arrival_times(4.0), 4),
+                         [0.0, 0.25, 0.5, 0.75])
+
+    def test_poisson_seeded(self):
+        offsets = first(arrival_times(50.0, PATTERN_POISSON,
+                                      rng=random.Random(7)), 5001)
+        self.assertEqual(offsets, first(
+            arrival_times(50.0, PATTERN_POISSON, rng=random.Random(7)),
+            5001))
+        gaps = [b - a for a, b in zip(offsets, offsets[1:])]
+        self.assertTrue(all(gap >= 0 for gap in gaps))
+        # Exponential gaps: the mean and deviation are both 1 / rate
+        self.assertAlmostEqual(statistics.mean(gaps), 0.02, delta=0.001)
+        self.assertAlmostEqual(statistics.stdev(gaps), 0.02, delta=0.002)
+
+    def test_burst(self):
+        offsets = first(arrival_times(10.0, PATTERN_BURST, burst_size=3), 9)
+        self.assertEqual(offsets, [0.0] * 3 + [0.3] * 3 + [0.6] * 3)
+
+    def test_unknown_pattern(self):
+        with self.assertRaises(ValueError):
+            next(arrival_times(1.0, 'steady'))
+
+
+class ChangeTest(unittest.TestCase):
+    """
+    Tests of the values of the attribute changes.
+    """
+
+    def test_random_change_seeded(self):
+        change = random_change('level', 1, 254)
+        values = [change(random.Random(3)) for _ in range(2)]
+        self.assertEqual(values[0], values[1])
+        rng = random.Random(3)
+        for _ in range(200):
+            method, (data,) = change(rng)
+            self.assertEqual(method, 'set')
+            self.assertTrue(1 <= data['level'] <= 254)
+
+    def test_toggle_change(self):
+        change = toggle_change('occupancyValue', (1, 0))
+        self.assertEqual([change(None)[1][0]['occupancyValue']
+                          for _ in range(3)], [1, 0, 1])
+
+
+class LoadGeneratorTest(unittest.TestCase):
+    """
+    Tests of the load generator with fake devices.
+    """
+
+    def run_load(self, targets, rate, duration, **kwargs):
+        generator = LoadGenerator(targets, rate, duration=duration,
+                                  seed=11, **kwargs)
+        generator.start()
+        self.assertTrue(generator.wait(TIMEOUT))
+        return generator.report()
+
+    def target(self, name):
+        return LoadTarget(name, FakeClient(), random_change('level', 0, 100),
+                          blocking=False)
+
+    def test_changes_spread_over_devices(self):
+        targets = [self.target('a'), self.target('b')]
+        report = self.run_load(targets, 200.0, 0.1)
+        counts = report['counts']
+        self.assertEqual(counts['offered'], 20)
+        self.assertEqual(counts['ok'] + counts['throttled'], 20)
+        self.assertEqual([target.counts['sent'] for target in targets],
+                         [10, 10])
+        self.assertEqual(report['pattern'], PATTERN_UNIFORM)
+        self.assertEqual(report['latency']['count'], counts['ok'])
+
+    def test_device_rate_throttles(self):
+        target = self.target('a')
+        report = self.run_load([target], 400.0, 0.05, device_rate=1.0)
+        # A full bucket holds two changes, the others are throttled
+        self.assertEqual(report['counts']['sent'], 2)
+        self.assertEqual(report['counts']['throttled'], 18)
+
+    def test_same_seed_same_changes(self):
+        runs = []
+        for _ in range(2):
+            target = self.target('a')
+            self.run_load([target], 100.0, 0.05)
+            runs.append(target.client.values)
+        self.assertEqual(runs[0], runs[1])
+        self.assertEqual(len(runs[0]), 5)
+
+    def test_needs_devices_and_rate(self):
+        with self.assertRaises(ValueError):
+            LoadGenerator([], 10.0)
+        with self.assertRaises(ValueError):
+            LoadGenerator([self.target('a')], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,191 @@
+# Copyright (c) 2024 LG Electronics, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import threading
+import unittest
+from unittest import mock
+
+from rpc.poll_scheduler import PollJob, PollScheduler
+
+READS = (('device_status', 'get'), ('device_state', 'get_state'))
+TIMEOUT = 5
+
+
+class PollJobTest(unittest.TestCase):
+    """
+    Tests of the adaptive intervals of a poll job.
+    """
+
+    def setUp(self):
+        patcher = mock.patch('rpc.poll_scheduler.time')
+        self.time = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.time.monotonic.return_value = 100.0
+        self.results = []
+        self.polled = []
+
+    def poll(self, reads):
+        self.polled.append(tuple(key for key, _ in reads))
+        return self.results.pop(0)
+
+    def test_backoff_while_device_unavailable(self):
+        # An unavailable device polls as {}, no change
+        job = PollJob(self.poll, READS, interval=0.5, max_interval=4.0)
+        self.results = [{}] * 5
+        next_polls = []
+        for _ in range(5):
+            next_polls.append(job.run() - 100.0)
+            job._next = dict.fromkeys(job._next, 0.0)
+        self.assertEqual(next_polls, [1.0, 2.0, 4.0, 4.0, 4.0])
+        self.assertEqual(job.factor, 8.0)
+
+    def test_change_resets_backoff(self):
+        job = PollJob(self.poll, READS, interval=0.5, max_interval=4.0)
+        self.results = [{}, {}, {'level': 1}]
+        for _ in range(2):
+            job.run()
+            job._next = dict.fromkeys(job._next, 0.0)
+        self.assertEqual(job.factor, 4.0)
+        self.assertEqual(job.run(), 100.5)
+        self.assertEqual(job.factor, 1.0)
+
+    def test_skipped_poll_keeps_backoff(self):
+        job = PollJob(self.poll, READS, interval=0.5, max_interval=4.0)
+        self.results = [{}, None]
+        job.run()
+        job._next = dict.fromkeys(job._next, 0.0)
+        job.run()
+        self.assertEqual(job.factor, 2.0)
+
+    def test_only_due_reads_polled(self):
+        job = PollJob(self.poll, READS, interval=0.5,
+                      read_intervals={'device_state': 2.0})
+        self.results = [{'level': 1}, {'level': 2}]
+        self.assertEqual(job.run(), 100.5)
+        self.time.monotonic.return_value = 100.5
+        job.run()
+        self.assertEqual(self.polled, [('device_status', 'device_state'),
+                                       ('device_status',)])
+
+    def test_kick_polls_every_read_now(self):
+        job = PollJob(self.poll, READS, interval=0.5, max_interval=4.0)
+        self.results = [{}]
+        job.run()
+        job.kick()
+        self.assertEqual(job.factor, 1.0)
+        self.assertEqual(set(job._next.values()), {0.0})
+
+    def test_config_of_device_type(self):
+        pump = {'interval': 0.25, 'reads': {'device_status': 3.0}}
+        config = {'polling': {'interval': 1.0,
+                              'reads': {'device_state': 5.0},
+                              'device_types': {'Pump(0x0303)': pump}}}
+        job = PollJob.from_config(self.poll, READS, config, 'Pump(0x0303)')
+        self.assertEqual(job.interval, 0.25)
+        self.assertEqual(job.read_intervals,
+                         {'device_state': 5.0, 'device_status': 3.0})
+        self.assertEqual(job.name, 'Pump(0x0303)')
+
+
+class PollSchedulerTest(unittest.TestCase):
+    """
+    Tests of the shared scheduler of polls and timers.
+    """
+
+    def setUp(self):
+        self.scheduler = PollScheduler(max_workers=1)
+        self.scheduler.start()
+        self.addCleanup(self.scheduler.stop)
+        self.calls = []
+
+    def call(self, name):
+        self.calls.append(name)
+
+    def wait_call(self, delay):
+        """
+        Wait for a call scheduled after every other call of the test.
+        """
+        done = threading.Event()
+        self.scheduler.call_later(delay, done.set)
+        self.assertTrue(done.wait(TIMEOUT))
+
+    def test_calls_run_in_due_order(self):
+        self.scheduler.call_later(0.15, self.call, 'c')
+        self.scheduler.call_later(0.0, self.call, 'a')
+        self.scheduler.call_later(0.05, self.call, 'b')
+        self.wait_call(0.3)
+        self.assertEqual(self.calls, ['a', 'b', 'c'])
+
+    def test_cancelled_call_skipped(self):
+        handle = self.scheduler.call_later(0.05, self.call, 'a')
+        self.scheduler.call_later(0.05, self.call, 'b')
+        handle.cancel()
+        self.wait_call(0.2)
+        self.assertEqual(self.calls, ['b'])
+
+    def test_periodic_task_cancel(self):
+        done = threading.Event()
+
+        def tick():
+            self.calls.append('tick')
+            if len(self.calls) == 3:
+                task.cancel()
+                done.set()
+        task = self.scheduler.call_every(0.02, tick, delay=0.0)
+        self.assertTrue(done.wait(TIMEOUT))
+        self.wait_call(0.1)
+        self.assertEqual(self.calls, ['tick'] * 3)
+        self.assertTrue(task.cancelled)
+
+    def test_failed_call_logged(self):
+        def fail():
+            raise RuntimeError('failed')
+        with self.assertLogs(level='ERROR'):
+            self.scheduler.call_later(0.0, fail)
+            self.wait_call(0.05)
+
+    def test_removed_job_not_polled(self):
+        polled = threading.Event()
+        job = PollJob(lambda reads: polled.set() or {}, READS, interval=0.01)
+        self.scheduler.add(job)
+        self.assertTrue(polled.wait(TIMEOUT))
+        self.scheduler.remove(job)
+        self.assertIsNone(job.scheduler)
+        self.wait_call(0.05)
+        polled.clear()
+        self.wait_call(0.1)
+        self.assertFalse(polled.is_set())
+
+    def test_kick_wakes_backed_off_job(self):
+        polls = []
+        polled = threading.Event()
+
+        def poll(reads):
+            polls.append(reads)
+            polled.set()
+            return {}
+        job = PollJob(poll, READS, interval=1.0, max_interval=8.0)
+        self.scheduler.add(job)
+        self.assertTrue(polled.wait(TIMEOUT))
+        polled.clear()
+        job.kick()
+        self.assertTrue(polled.wait(TIMEOUT))
+        self.assertEqual(len(polls), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
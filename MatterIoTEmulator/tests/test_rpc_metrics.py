@@ -0,0 +1,128 @@
+# Copyright (c) 2024 LG Electronics, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import json
+import os
+import tempfile
+import unittest
+
+from rpc.rpc_metrics import (LATENCY_BUCKETS, OUTCOME_ERROR, OUTCOME_OK,
+                             OUTCOME_TIMEOUT, OUTCOME_UNAVAILABLE,
+                             LatencyHistogram, RpcMetrics, all_metrics,
+                             dump_metrics, get_metrics)
+
+
+class LatencyHistogramTest(unittest.TestCase):
+    """
+    Tests of the log-bucket latency histogram.
+    """
+
+    def test_buckets_grow_by_square_root_of_two(self):
+        self.assertAlmostEqual(LATENCY_BUCKETS[0], 0.00025)
+        self.assertAlmostEqual(LATENCY_BUCKETS[2], 0.0005)
+        self.assertAlmostEqual(LATENCY_BUCKETS[-1], 0.00025 * 2 ** 16)
+        for lower, upper in zip(LATENCY_BUCKETS, LATENCY_BUCKETS[1:]):
+            self.assertAlmostEqual(upper / lower, 2 ** 0.5)
+
+    def test_bucket_boundaries(self):
+        histogram = LatencyHistogram()
+        # A latency equal to an upper bound counts in that bucket
+        for latency in (0.0, LATENCY_BUCKETS[0], LATENCY_BUCKETS[0] * 1.01,
+                        LATENCY_BUCKETS[-1], LATENCY_BUCKETS[-1] * 2):
+            histogram.add(latency)
+        self.assertEqual(histogram.counts[0], 2)
+        self.assertEqual(histogram.counts[1], 1)
+        self.assertEqual(histogram.counts[len(LATENCY_BUCKETS) - 1], 1)
+        self.assertEqual(histogram.counts[len(LATENCY_BUCKETS)], 1)
+        self.assertEqual(histogram.count, 5)
+        self.assertEqual(histogram.minimum, 0.0)
+        self.assertEqual(histogram.maximum, LATENCY_BUCKETS[-1] * 2)
+
+    def test_percentiles_within_sample_range(self):
+        histogram = LatencyHistogram()
+        self.assertIsNone(histogram.percentile(50))
+        for i in range(1, 101):
+            histogram.add(i / 1000)
+        p50 = histogram.percentile(50)
+        p99 = histogram.percentile(99)
+        # Interpolation error is bounded by the bucket width
+        self.assertLess(abs(p50 - 0.050), 0.050 * 0.5)
+        self.assertLess(abs(p99 - 0.099), 0.099 * 0.5)
+        self.assertLessEqual(p50, p99)
+        self.assertLessEqual(histogram.percentile(100), 0.1)
+        self.assertGreaterEqual(histogram.percentile(0), 0.001)
+
+    def test_one_sample(self):
+        histogram = LatencyHistogram()
+        histogram.add(0.012)
+        summary = histogram.to_dict()
+        self.assertEqual(summary['count'], 1)
+        for key in ('mean_ms', 'min_ms', 'max_ms', 'p50_ms', 'p99_ms'):
+            self.assertEqual(summary[key], 12.0)
+
+
+class RpcMetricsTest(unittest.TestCase):
+    """
+    Tests of the per-method call counts of a device.
+    """
+
+    def setUp(self):
+        self.metrics = RpcMetrics('localhost:33000')
+        self.addCleanup(self.metrics.close)
+
+    def test_counts_by_method_and_outcome(self):
+        self.metrics.record('Device.Get', OUTCOME_OK, 0.01)
+        self.metrics.record('Device.Get', OUTCOME_OK, 0.02)
+        self.metrics.record('Device.Get', OUTCOME_ERROR, 0.03)
+        self.metrics.record('Device.Set', OUTCOME_TIMEOUT, 10.0)
+        self.metrics.record('Device.Set', OUTCOME_UNAVAILABLE)
+        get = self.metrics.stats('Device.Get')
+        self.assertEqual((get['calls'], get[OUTCOME_OK], get[OUTCOME_ERROR]),
+                         (3, 2, 1))
+        self.assertEqual(get['latency']['count'], 3)
+        set_ = self.metrics.stats('Device.Set')
+        self.assertEqual((set_['calls'], set_[OUTCOME_TIMEOUT],
+                          set_[OUTCOME_UNAVAILABLE]), (2, 1, 1))
+        # Timeouts and calls not sent have no latency
+        self.assertEqual(set_['latency']['count'], 0)
+        self.assertEqual(list(self.metrics.stats()),
+                         ['Device.Get', 'Device.Set'])
+        self.assertIsNone(self.metrics.stats('Device.Other'))
+
+    def test_reset(self):
+        self.metrics.record('Device.Get', OUTCOME_OK, 0.01)
+        self.metrics.reset()
+        self.assertEqual(self.metrics.stats(), {})
+
+    def test_registry(self):
+        self.assertIs(get_metrics('localhost:33000'), self.metrics)
+        self.metrics.record('Device.Get', OUTCOME_OK, 0.01)
+        self.assertEqual(
+            all_metrics()['localhost:33000']['methods']['Device.Get']
+            ['calls'], 1)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'metrics.json')
+            dump_metrics(path)
+            with open(path, encoding='utf8') as file:
+                dumped = json.load(file)
+        self.assertIn('localhost:33000', dumped)
+        self.metrics.close()
+        self.assertIsNone(get_metrics('localhost:33000'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,311 @@
+# Copyright (c) 2024 LG Electronics, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import concurrent.futures
+import socket
+import unittest
+from unittest import mock
+
+try:
+    from rpc.rpc_session import (SESSION_CLOSED, SESSION_CONNECTED,
+                                 SESSION_DOWN, DeviceUnavailableError,
+                                 RpcSession)
+except ImportError:
+    RpcSession = None
+
+try:
+    from rpc.device_client import DeviceClient
+except ImportError:
+    DeviceClient = None
+
+ADDRESS = ('localhost', 33000)
+
+
+class FakeCall:
+    """
+    Call scheduled on FakeScheduler.
+    """
+
+    def __init__(self, delay, func, args):
+        self.delay = delay
+        self.func = func
+        self.args = args
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class FakeScheduler:
+    """
+    Scheduler running the scheduled calls when the test asks.
+    """
+
+    def __init__(self):
+        self.calls = []
+
+    def call_later(self, delay, func, *args):
+        call = FakeCall(delay, func, args)
+        self.calls.append(call)
+        return call
+
+    def run(self):
+        calls, self.calls = self.calls, []
+        for call in calls:
+            if not call.cancelled:
+                call.func(*call.args)
+
+
+class FakeTransport:
+    """
+    Transport recording the registered sockets.
+    """
+
+    def __init__(self):
+        self.sockets = {}
+
+    def register(self, sock, client, output=None, on_disconnect=None):
+        self.sockets[sock] = on_disconnect
+
+    def unregister(self, sock, close=True):
+        self.sockets.pop(sock, None)
+        if close:
+            sock.close()
+
+    def disconnect(self, sock):
+        self.sockets[sock](sock)
+
+
+@unittest.skipIf(RpcSession is None, 'pw_hdlc is not installed')
+class RpcSessionTest(unittest.TestCase):
+    """
+    Tests of the health and reconnection of a device rpc session.
+    """
+
+    def setUp(self):
+        self.scheduler = FakeScheduler()
+        self.transport = FakeTransport()
+        for name, fake in (('PollScheduler', self.scheduler),
+                           ('RpcTransport', self.transport)):
+            patcher = mock.patch(f'rpc.rpc_session.{name}')
+            patcher.start().instance.return_value = fake
+            self.addCleanup(patcher.stop)
+        patcher = mock.patch('rpc.rpc_session.socket.create_connection',
+                             side_effect=self.connect)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        # Connection results, True for a connected socket
+        self.connects = []
+        self.peers = []
+        self.session = RpcSession(ADDRESS)
+        self.changes = []
+        self.session.add_listener(self.changes.append)
+
+    def tearDown(self):
+        self.session.close()
+        for sock in self.peers:
+            sock.close()
+
+    def connect(self, address, timeout):
+        if not self.connects.pop(0):
+            raise ConnectionRefusedError('connection refused')
+        sock, peer = socket.socketpair()
+        self.peers.append(peer)
+        return sock
+
+    def retry_delays(self):
+        return [call.delay for call in self.scheduler.calls]
+
+    def test_calls_fail_fast_while_down(self):
+        self.connects = [False]
+        self.session.open(None)
+        self.assertEqual(self.session.state, SESSION_DOWN)
+        self.assertFalse(self.session.available)
+        with self.assertRaises(DeviceUnavailableError) as context:
+            self.session.check()
+        self.assertIn('connection refused', str(context.exception))
+        with self.assertRaises(DeviceUnavailableError):
+            self.session.write(b'packet')
+
+    def test_reconnect_backoff_doubles(self):
+        self.connects = [False] * 7
+        self.session.open(None)
+        delays = []
+        for _ in range(6):
+            delays.extend(self.retry_delays())
+            self.scheduler.run()
+        self.assertEqual(delays, [0.5, 1.0, 2.0, 4.0, 5.0, 5.0])
+        self.assertEqual(self.changes, [])
+
+    def test_reconnect_after_disconnect(self):
+        self.connects = [True, False, True]
+        self.session.open(None)
+        self.assertTrue(self.session.available)
+        sock = self.session.socket
+        self.assertIn(sock, self.transport.sockets)
+        self.transport.disconnect(sock)
+        self.assertEqual(self.session.state, SESSION_DOWN)
+        self.assertEqual(self.session.reason, 'connection closed')
+        self.assertEqual(self.retry_delays(), [0.5])
+        self.scheduler.run()
+        self.assertEqual(self.retry_delays(), [1.0])
+        self.scheduler.run()
+        self.assertEqual(self.session.state, SESSION_CONNECTED)
+        self.assertEqual(self.session.reconnect_count, 1)
+        self.assertEqual(self.changes, [True, False, True])
+        # The back-off starts over after a connection
+        self.transport.disconnect(self.session.socket)
+        self.assertEqual(self.retry_delays(), [0.5])
+
+    def test_timeouts_in_a_row_take_session_down(self):
+        self.connects = [True]
+        self.session.open(None)
+        for _ in range(2):
+            self.session.record_timeout()
+        self.session.record_success()
+        for _ in range(2):
+            self.session.record_timeout()
+        self.assertTrue(self.session.available)
+        self.session.record_timeout()
+        self.assertEqual(self.session.state, SESSION_DOWN)
+        self.assertEqual(self.session.reason, '3 calls timed out')
+        self.assertEqual(self.transport.sockets, {})
+        self.assertEqual(self.changes, [True, False])
+
+    def test_write_failure_takes_session_down(self):
+        self.connects = [True]
+        self.session.open(None)
+        self.peers[0].close()
+        self.session.socket.shutdown(socket.SHUT_WR)
+        with self.assertRaises(DeviceUnavailableError):
+            self.session.write(b'packet')
+        self.assertEqual(self.session.state, SESSION_DOWN)
+
+    def test_close_stops_reconnect(self):
+        self.connects = [False]
+        self.session.open(None)
+        retry = self.scheduler.calls[0]
+        self.session.close()
+        self.assertEqual(self.session.state, SESSION_CLOSED)
+        self.assertTrue(retry.cancelled)
+
+
+class FakeSession:
+    """
+    Session of a device whose availability the test sets.
+    """
+
+    address = ADDRESS
+    reason = 'connection closed'
+
+    def __init__(self):
+        self.available = True
+        self.timeouts = 0
+
+    def check(self):
+        pass
+
+    def record_success(self):
+        pass
+
+    def record_timeout(self):
+        self.timeouts += 1
+
+
+class FakeMetrics:
+    """
+    Metrics recording the call outcomes.
+    """
+
+    def __init__(self):
+        self.outcomes = []
+
+    def record(self, name, outcome, latency=None):
+        self.outcomes.append((name, outcome))
+
+
+class FakeMethod:
+    """
+    Unary rpc method recording its calls.
+    """
+
+    def __init__(self, name):
+        self.method = mock.Mock()
+        self.method.name = name
+        self.method.service.name = 'Device'
+        self.calls = []
+
+    def invoke(self, request, on_completed, on_error):
+        call = mock.Mock()
+        call.completed = on_completed
+        self.calls.append(call)
+        return call
+
+
+@unittest.skipIf(DeviceClient is None, 'pw_rpc is not installed')
+class CallsInFlightTest(unittest.TestCase):
+    """
+    Tests of the calls of a device client in flight while it goes down.
+    """
+
+    def setUp(self):
+        self.client = DeviceClient.__new__(DeviceClient)
+        self.client.session = FakeSession()
+        self.client.metrics = FakeMetrics()
+        self.client._call_lock = mock.MagicMock()
+        self.client._inflight = set()
+        self.client._inflight_lock = mock.MagicMock()
+        self.client._write_listeners = []
+        self.method = FakeMethod('Get')
+
+    def test_completed_call_leaves_set(self):
+        future = self.client._start_unary(self.method)
+        self.assertEqual(self.client._inflight, {future})
+        status = mock.Mock()
+        self.method.calls[0].completed(self.method.calls[0], status)
+        self.assertEqual(future.result()[0], status)
+        self.assertEqual(self.client._inflight, set())
+
+    def test_down_fails_calls_in_flight(self):
+        futures = [self.client._start_unary(self.method) for _ in range(2)]
+        self.client.session.available = False
+        self.client._on_session_changed(False)
+        for future, call in zip(futures, self.method.calls):
+            with self.assertRaises(DeviceUnavailableError):
+                future.result(0)
+            call.cancel.assert_called_once_with()
+        self.assertEqual(self.client._inflight, set())
+        self.assertEqual([outcome for _, outcome in
+                          self.client.metrics.outcomes],
+                         ['unavailable', 'unavailable'])
+
+    def test_call_added_after_down_fails(self):
+        # The device went down between the check and the add to the set
+        self.client.session.available = False
+        future = self.client._start_unary(self.method)
+        self.assertIsInstance(future.exception(0), DeviceUnavailableError)
+        self.assertEqual(self.client._inflight, set())
+
+    def test_timed_out_call_recorded(self):
+        future = self.client._start_unary(self.method)
+        future.cancel()
+        self.assertEqual(self.client.session.timeouts, 1)
+        self.assertRaises(concurrent.futures.CancelledError, future.result)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+# Copyright (c) 2024 LG Electronics, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import socket
+import threading
+import unittest
+
+try:
+    from pw_hdlc import encode
+    from pw_hdlc.rpc import DEFAULT_ADDRESS, STDOUT_ADDRESS
+    from rpc.rpc_transport import RpcTransport
+except ImportError:
+    encode = None
+
+TIMEOUT = 5
+
+
+class FakeClient:
+    """
+    Fake pw_rpc client recording the processed packets.
+    """
+
+    def __init__(self):
+        """
+        Initialize a FakeClient instance.
+        """
+        self.packets = []
+        self.received = threading.Event()
+
+    def process_packet(self, data):
+        """
+        Record a packet and signal it was received.
+        """
+        self.packets.append(data)
+        self.received.set()
+        return True
+
+
+@unittest.skipIf(encode is None, 'pw_hdlc is not installed')
+class RpcTransportTest(unittest.TestCase):
+    """
+    Tests of the shared rpc socket transport.
+    """
+
+    def setUp(self):
+        """
+        Start a transport and connect a socket pair to it.
+        """
+        self.transport = RpcTransport()
+        self.transport.start()
+        self.device, self.host = socket.socketpair()
+        self.client = FakeClient()
+
+    def tearDown(self):
+        """
+        Stop the transport and close the sockets.
+        """
+        self.transport.stop()
+        self.device.close()
+        self.host.close()
+
+    def register(self, **kwargs):
+        """
+        Register the host socket and wait until the loop has added it.
+        """
+        self.transport.register(self.host, self.client, **kwargs)
+        self.wait_tasks()
+
+    def wait_tasks(self):
+        """
+        Wait until the loop has run every queued task.
+        """
+        done = threading.Event()
+        self.transport._call_soon(done.set)
+        self.assertTrue(done.wait(TIMEOUT))
+
+    def test_register_unregister(self):
+        self.register()
+        self.assertIn(self.host, self.transport._connections)
+        self.transport.unregister(self.host, close=False)
+        self.wait_tasks()
+        self.assertNotIn(self.host, self.transport._connections)
+        self.assertNotEqual(self.host.fileno(), -1)
+        self.transport.unregister(self.host)
+        self.wait_tasks()
+        self.assertEqual(self.host.fileno(), -1)
+
+    def test_default_address_frame(self):
+        self.register()
+        self.device.sendall(encode.ui_frame(DEFAULT_ADDRESS, b'\x01\x02'))
+        self.assertTrue(self.client.received.wait(TIMEOUT))
+        self.assertEqual(self.client.packets, [b'\x01\x02'])
+
+    def test_stdout_frame(self):
+        output = []
+        received = threading.Event()
+
+        def on_output(data):
+            output.append(data)
+            received.set()
+        self.register(output=on_output)
+        self.device.sendall(encode.ui_frame(STDOUT_ADDRESS, b'log line'))
+        self.assertTrue(received.wait(TIMEOUT))
+        self.assertEqual(output, [b'log line'])
+        self.assertEqual(self.client.packets, [])
+
+    def test_disconnect(self):
+        closed = threading.Event()
+        self.register(on_disconnect=lambda sock: closed.set())
+        self.device.close()
+        self.assertTrue(closed.wait(TIMEOUT))
+        self.wait_tasks()
+        self.assertNotIn(self.host, self.transport._connections)
+
+    def test_wakeup_runs_tasks(self):
+        # The loop blocks in select() without any ready socket, so a
+        # queued task only runs once the wakeup socket is written
+        ran = threading.Event()
+        self.transport._call_soon(ran.set)
+        self.assertTrue(ran.wait(TIMEOUT))
+        # The wakeup bytes were drained before the task ran
+        with self.assertRaises(BlockingIOError):
+            self.transport._wakeup_r.recv(64)
+
+    def test_stop(self):
+        self.register()
+        self.transport.stop()
+        self.assertFalse(self.transport._thread.is_alive())
+        self.assertEqual(self.host.fileno(), -1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+# Copyright (c) 2024 LG Electronics, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import json
+import os
+import tempfile
+import unittest
+
+from rpc.scenario import ScenarioError, load_scenario, parse_steps
+
+SCENARIO = {
+    'devices': {'door': '33000', 'light': '33002'},
+    'steps': [
+        {'at': 0.0, 'device': 'door', 'set': {'booleanState': False}},
+        {'after': 0.5, 'event': 'door opened'},
+        {'after': 0.5, 'device': ['light', '33005'], 'set': {'on': True}},
+        {'at': 0.2, 'device': 'door', 'call': 'get'}]}
+
+
+class ScenarioTest(unittest.TestCase):
+    """
+    Tests of the scenario parsing.
+    """
+
+    def test_steps_ordered_by_time(self):
+        steps = parse_steps(SCENARIO)
+        self.assertEqual(
+            [(step.time, step.device, step.method, step.event)
+             for step in steps],
+            [(0.0, '33000', 'set', None), (0.2, '33000', 'get', None),
+             (0.5, None, None, 'door opened'), (1.0, '33002', 'set', None),
+             (1.0, '33005', 'set', None)])
+        self.assertEqual(steps[0].args, ({'booleanState': False},))
+
+    def test_repeat_every_period(self):
+        scenario = dict(SCENARIO, repeat=3, period=10.0)
+        times = [step.time for step in parse_steps(scenario)
+                 if step.event is not None]
+        self.assertEqual(times, [0.5, 10.5, 20.5])
+
+    def test_repeat_needs_period(self):
+        with self.assertRaises(ScenarioError):
+            parse_steps(dict(SCENARIO, repeat=2))
+        for period in (0, -1.0):
+            with self.assertRaises(ScenarioError):
+                parse_steps(dict(SCENARIO, repeat=2, period=period))
+        with self.assertRaises(ScenarioError):
+            parse_steps(dict(SCENARIO, repeat=0))
+
+    def test_malformed_steps(self):
+        with self.assertRaises(ScenarioError):
+            parse_steps({'steps': [{'at': 0, 'set': {'on': True}}]})
+        with self.assertRaises(ScenarioError):
+            parse_steps({'steps': [{'at': 0, 'device': '33000'}]})
+
+    def test_load_scenario(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'scenario.json')
+            with open(path, 'w') as scenario_file:
+                json.dump(SCENARIO, scenario_file)
+            self.assertEqual(load_scenario(path), SCENARIO)
+            with open(path, 'w') as scenario_file:
+                scenario_file.write('{')
+            with self.assertRaises(ScenarioError):
+                load_scenario(path)
+
+
+if __name__ == '__main__':
+    unittest.main()
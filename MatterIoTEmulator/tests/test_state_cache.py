@@ -0,0 +1,85 @@
+# Copyright (c) 2024 LG Electronics, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import unittest
+
+from rpc.state_cache import DeviceStateCache, flatten_reply
+
+
+def ok(reply):
+    """
+    Return a snapshot result holding a reply.
+    """
+    return {'status': 'OK', 'reply': reply}
+
+
+class DeviceStateCacheTest(unittest.TestCase):
+    """
+    Tests of the attribute changes reported by the state cache.
+    """
+
+    def test_flatten_reply(self):
+        paths = {}
+        flatten_reply({'a': {'b': 1, 'c': {}}, 'd': 2}, 'key', paths)
+        self.assertEqual(paths, {'key.a.b': 1, 'key.a.c': {}, 'key.d': 2})
+
+    def test_first_update_reports_all(self):
+        cache = DeviceStateCache()
+        changes = cache.update({
+            'timestamp': 1.0, 'latency': 0.1,
+            'device_status': ok({'onOff': {'onOff': True}, 'level': 5})})
+        self.assertEqual(changes, {'device_status.onOff.onOff': True,
+                                   'device_status.level': 5})
+        self.assertEqual(cache.get('device_status.level'), 5)
+
+    def test_update_reports_changes_only(self):
+        cache = DeviceStateCache()
+        cache.update({'device_status': ok({'on': True, 'level': 5}),
+                      'device_color': ok({'hue': 10})})
+        changes = cache.update({
+            'device_status': ok({'on': True, 'level': 6}),
+            'device_color': ok({'hue': 10})})
+        self.assertEqual(changes, {'device_status.level': 6})
+        self.assertEqual(cache.update({
+            'device_status': ok({'on': True, 'level': 6})}), {})
+
+    def test_removed_path_reported_none(self):
+        cache = DeviceStateCache()
+        cache.update({'device_status': ok({'on': True, 'level': 5})})
+        changes = cache.update({'device_status': ok({'on': True})})
+        self.assertEqual(changes, {'device_status.level': None})
+        self.assertIsNone(cache.get('device_status.level'))
+
+    def test_failed_result_keeps_values(self):
+        cache = DeviceStateCache()
+        cache.update({'device_status': ok({'level': 5})})
+        changes = cache.update({'device_status': {'status': 'DEADLINE'}})
+        self.assertEqual(changes, {})
+        self.assertEqual(cache.state(), {'device_status.level': 5})
+
+    def test_clear_reports_all_again(self):
+        cache = DeviceStateCache()
+        snapshot = {'device_status': ok({'level': 5})}
+        cache.update(snapshot)
+        cache.clear()
+        self.assertEqual(cache.state(), {})
+        self.assertEqual(cache.update(snapshot),
+                         {'device_status.level': 5})
+
+
+if __name__ == '__main__':
+    unittest.main()
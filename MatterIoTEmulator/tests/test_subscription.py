@@ -0,0 +1,191 @@
+# Copyright (c) 2024 LG Electronics, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import unittest
+from unittest import mock
+
+try:
+    from rpc.subscription import SubscriptionManager
+except ImportError:
+    SubscriptionManager = None
+
+
+class FakeCall:
+    """
+    Call scheduled on FakeScheduler.
+    """
+
+    def __init__(self, delay, func, args):
+        self.delay = delay
+        self.func = func
+        self.args = args
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class FakeScheduler:
+    """
+    Scheduler running the scheduled calls when the test asks.
+    """
+
+    def __init__(self):
+        self.calls = []
+        self.jobs = []
+
+    def add(self, job):
+        self.jobs.append(job)
+
+    def remove(self, job):
+        self.jobs.remove(job)
+
+    def call_later(self, delay, func, *args):
+        call = FakeCall(delay, func, args)
+        self.calls.append(call)
+        return call
+
+    def pending(self):
+        return [call for call in self.calls if not call.cancelled]
+
+    def run(self):
+        calls, self.calls = self.calls, []
+        for call in calls:
+            if not call.cancelled:
+                call.func(*call.args)
+
+
+class FakeStateCache:
+    """
+    State cache holding the last polled values.
+    """
+
+    def __init__(self):
+        self.values = {}
+
+    def state(self):
+        return dict(self.values)
+
+
+class FakeClient:
+    """
+    Device client counting its polls.
+    """
+
+    SNAPSHOT_READS = (('device_status', None),)
+
+    def __init__(self):
+        self.state_cache = FakeStateCache()
+        self.listeners = []
+        self.last_poll_time = 0.0
+        self.polls = 0
+
+    def add_write_listener(self, listener):
+        self.listeners.append(listener)
+
+    def remove_write_listener(self, listener):
+        self.listeners.remove(listener)
+
+    def poll(self, reads):
+        self.polls += 1
+        return {}, {'level': self.polls}
+
+
+@unittest.skipIf(SubscriptionManager is None, 'pw_hdlc is not installed')
+class SubscriptionTest(unittest.TestCase):
+    """
+    Tests of the attribute subscriptions of a device.
+    """
+
+    def setUp(self):
+        patcher = mock.patch('rpc.subscription.time')
+        self.time = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.time.monotonic.return_value = 100.0
+        self.scheduler = FakeScheduler()
+        self.client = FakeClient()
+        self.manager = SubscriptionManager(self.client, self.scheduler)
+        self.reports = []
+
+    def test_min_interval_merges_changes(self):
+        self.manager.add('level', self.reports.append, min_interval=1.0)
+        self.manager.dispatch({'level': 1})
+        self.time.monotonic.return_value = 100.2
+        self.manager.dispatch({'level': 2})
+        self.manager.dispatch({'level': 3, 'on': True})
+        self.assertEqual(self.reports, [{'level': 1}])
+        calls = self.scheduler.pending()
+        self.assertEqual(len(calls), 1)
+        self.assertAlmostEqual(calls[0].delay, 0.8)
+        self.scheduler.run()
+        self.assertEqual(self.reports, [{'level': 1}, {'level': 3}])
+
+    def test_path_of_message_matches_fields(self):
+        self.manager.add('color', self.reports.append)
+        self.manager.dispatch({'color.hue': 1, 'colorTemp': 2})
+        self.assertEqual(self.reports, [{'color.hue': 1}])
+
+    def test_max_interval_reports_current_values(self):
+        self.manager.add('level', self.reports.append, max_interval=5.0)
+        self.manager.dispatch({'level': 1})
+        calls = self.scheduler.pending()
+        self.assertEqual([call.delay for call in calls], [5.0])
+        self.client.state_cache.values = {'level': 1, 'on': True}
+        self.time.monotonic.return_value = 105.0
+        self.scheduler.run()
+        self.assertEqual(self.reports, [{'level': 1}, {'level': 1}])
+        # The next report is due max_interval after this one
+        self.assertEqual([call.delay for call in self.scheduler.pending()],
+                         [5.0])
+
+    def test_cancel_stops_reports_and_polling(self):
+        first = self.manager.add('level', self.reports.append,
+                                 min_interval=1.0)
+        second = self.manager.add('on', self.reports.append)
+        self.assertEqual(len(self.scheduler.jobs), 1)
+        self.assertEqual(len(self.client.listeners), 1)
+        self.manager.dispatch({'level': 1})
+        self.manager.dispatch({'level': 2})
+        first.cancel()
+        self.assertEqual(self.scheduler.pending(), [])
+        self.assertEqual(len(self.scheduler.jobs), 1)
+        second.cancel()
+        self.assertEqual(self.scheduler.jobs, [])
+        self.assertEqual(self.client.listeners, [])
+        self.manager.dispatch({'level': 3, 'on': True})
+        self.scheduler.run()
+        self.assertEqual(self.reports, [{'level': 1}])
+
+    def test_poll_skipped_after_recent_poll(self):
+        self.manager.add('level', self.reports.append)
+        job = self.scheduler.jobs[0]
+        self.client.last_poll_time = 100.0 - job.interval / 4
+        self.assertIsNone(self.manager._poll(self.client.SNAPSHOT_READS))
+        self.client.last_poll_time = 100.0 - job.interval
+        self.assertEqual(self.manager._poll(self.client.SNAPSHOT_READS),
+                         {'level': 1})
+
+    def test_poll_after_stop_skipped(self):
+        # The scheduler may run the job once more after it was removed
+        subscription = self.manager.add('level', self.reports.append)
+        subscription.cancel()
+        self.assertIsNone(self.manager._poll(self.client.SNAPSHOT_READS))
+        self.assertEqual(self.client.polls, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
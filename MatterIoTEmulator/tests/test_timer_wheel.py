@@ -0,0 +1,92 @@
+# Copyright (c) 2024 LG Electronics, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import unittest
+
+from utils.timer_wheel import LEVELS, SLOT_BITS, TimerWheel
+
+
+class TimerWheelTest(unittest.TestCase):
+    """
+    Tests of the timer wheel, stepped by hand without its thread.
+    """
+
+    def create(self):
+        """
+        Return a wheel whose clock stays on tick 0.
+        """
+        return TimerWheel(tick=3600.0)
+
+    def fire_ticks(self, wheel, deadlines, ticks):
+        """
+        Schedule calls at deadlines and return the tick each one expired.
+        """
+        fired = {}
+        timers = {wheel.call_at(deadline, lambda: None): deadline
+                  for deadline in deadlines}
+        for _ in range(ticks):
+            for timer in wheel._advance():
+                fired[timers[timer]] = wheel._tick
+        return fired
+
+    def test_expires_on_deadline(self):
+        wheel = self.create()
+        deadlines = [1, 2, 63, 64, 65, 127, 128, 200, 4095, 4096, 4097,
+                     5000]
+        fired = self.fire_ticks(wheel, deadlines, 5001)
+        self.assertEqual(fired, {deadline: deadline
+                                 for deadline in deadlines})
+        self.assertEqual(wheel._count, 0)
+
+    def test_expires_on_cascade_boundaries(self):
+        wheel = self.create()
+        deadlines = [1 << (SLOT_BITS * level) for level in range(1, LEVELS)]
+        fired = self.fire_ticks(wheel, deadlines, deadlines[-1])
+        self.assertEqual(fired, {deadline: deadline
+                                 for deadline in deadlines})
+
+    def test_cancelled_not_expired(self):
+        wheel = self.create()
+        timer = wheel.call_at(64, lambda: None)
+        timer.cancel()
+        expired = []
+        for _ in range(64):
+            expired.extend(wheel._advance())
+        self.assertEqual(expired, [])
+        self.assertEqual(wheel._count, 0)
+
+    def test_repeat_timer_pause_resume(self):
+        wheel = self.create()
+        calls = []
+        finished = []
+        repeat = wheel.call_repeat(0.0, 3, calls.append, 'call',
+                                   on_finished=lambda: finished.append(1))
+        for timer in wheel._advance():
+            timer.func(*timer.args)
+        repeat.pause()
+        self.assertEqual(wheel._advance(), [])
+        repeat.resume()
+        for _ in range(4):
+            for timer in wheel._advance():
+                timer.func(*timer.args)
+        self.assertEqual(calls, ['call'] * 3)
+        self.assertEqual(finished, [1])
+        self.assertFalse(repeat.active)
+
+
+if __name__ == '__main__':
+    unittest.main()
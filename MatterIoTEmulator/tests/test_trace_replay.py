@@ -0,0 +1,66 @@
+# Copyright (c) 2024 LG Electronics, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import os
+import tempfile
+import unittest
+
+from utils.trace_replay import (map_columns, merge_record, read_trace,
+                                write_binary_trace)
+
+
+class TraceReplayTest(unittest.TestCase):
+    """
+    Tests of the trace reading and record mapping.
+    """
+
+    def test_map_columns(self):
+        records = [(0.0, {'temp': '21.5', 'hum': '40'}),
+                   (1.0, {'temp': 'bad'}),
+                   (2.0, {'hum': '41.25', 'other': '1'})]
+        columns = {
+            'temp': {'attribute': 'temperatureMeasurement.measuredValue',
+                     'scale': 100},
+            'hum': {'attribute': 'humidityValue', 'scale': 100}}
+        self.assertEqual(list(map_columns(records, columns)), [
+            (0.0, {'temperatureMeasurement': {'measuredValue': 2150},
+                   'humidityValue': 4000}),
+            (2.0, {'humidityValue': 4125})])
+
+    def test_merge_record(self):
+        data = {'a': {'x': 1, 'y': 2}, 'b': 3}
+        merge_record(data, {'a': {'y': 5}, 'c': 4})
+        self.assertEqual(data, {'a': {'x': 1, 'y': 5}, 'b': 3, 'c': 4})
+
+    def test_binary_and_csv_traces(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'trace.csv')
+            with open(path, 'w') as trace:
+                trace.write('timestamp,temp\n0,20\n1.5,21\n')
+            records = list(read_trace(path))
+            self.assertEqual([stamp for stamp, _ in records], [0.0, 1.5])
+            binary = os.path.join(folder, 'trace.bin')
+            self.assertEqual(write_binary_trace(binary, ['temp'], records),
+                             2)
+            replayed = list(map_columns(read_trace(binary),
+                                        {'temp': 'temperatureValue'}))
+            self.assertEqual(replayed, [(0.0, {'temperatureValue': 20}),
+                                        (1.5, {'temperatureValue': 21})])
+
+
+if __name__ == '__main__':
+    unittest.main()
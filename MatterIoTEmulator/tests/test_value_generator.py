@@ -0,0 +1,85 @@
+# Copyright (c) 2024 LG Electronics, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import unittest
+
+from utils.value_generator import ValueGenerator
+
+
+class ValueGeneratorTest(unittest.TestCase):
+    """
+    Tests of the seeded value generator.
+    """
+
+    def create(self):
+        """
+        Return a seeded generator with a clock that never moves.
+        """
+        return ValueGenerator(tick=1.0, seed=42, clock=lambda: 1000.0)
+
+    def add_sensors(self, generator):
+        """
+        Add the same sensors to a generator and return their handles.
+        """
+        return [generator.add(0, 10000, 'random_walk', stream='temp#1',
+                              group='room', walk=50.0, correlation=0.5),
+                generator.add(0, 10000, 'diurnal', stream='temp#2',
+                              group='room', amplitude=1000.0, walk=50.0,
+                              correlation=0.5),
+                generator.add(0, 100, stream='humidity#1')]
+
+    def test_same_seed_same_values(self):
+        first, second = self.create(), self.create()
+        handles = self.add_sensors(first)
+        self.assertEqual(handles, self.add_sensors(second))
+        for _ in range(20):
+            self.assertEqual(first.value_list(handles),
+                             second.value_list(handles))
+
+    def test_streams_are_independent(self):
+        alone, shared = self.create(), self.create()
+        temp, _, _ = self.add_sensors(alone)
+        handles = self.add_sensors(shared)
+        expected = [alone.value(temp) for _ in range(10)]
+        values = []
+        for count in range(10):
+            # The other sensors read a different number of times
+            for _ in range(count % 3):
+                shared.value(handles[1])
+            shared.value(handles[2])
+            values.append(shared.value(handles[0]))
+        self.assertEqual(expected, values)
+
+    def test_stream_not_depending_on_handle(self):
+        first, second = self.create(), self.create()
+        second.add(0, 100, stream='other')
+        handle = first.add(0, 100, stream='humidity#1')
+        moved = second.add(0, 100, stream='humidity#1')
+        self.assertNotEqual(handle, moved)
+        self.assertEqual([first.value(handle) for _ in range(10)],
+                         [second.value(moved) for _ in range(10)])
+
+    def test_values_in_range(self):
+        generator = self.create()
+        handle = generator.add(10, 20, 'random_walk', stream='s',
+                               walk=100.0, step_rate=1.0, step_size=5.0)
+        for _ in range(100):
+            self.assertTrue(10 <= generator.value(handle) <= 20)
+
+
+if __name__ == '__main__':
+    unittest.main()
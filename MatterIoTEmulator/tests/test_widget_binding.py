@@ -0,0 +1,142 @@
+# Copyright (c) 2024 LG Electronics, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import unittest
+
+from device_types_ui.widget_binding import WidgetBinder
+
+
+class StubSignal:
+    """
+    Signal recording its connected slots.
+    """
+
+    def __init__(self):
+        self.slots = []
+
+    def connect(self, slot):
+        self.slots.append(slot)
+
+    def disconnect(self, slot):
+        self.slots.remove(slot)
+
+
+class StubWidget:
+    """
+    Widget recording the values set and the signal state at that time.
+    """
+
+    def __init__(self):
+        self.values = []
+        self.blocked = False
+        self.blocked_when_set = []
+        self.toggled = StubSignal()
+
+    def blockSignals(self, block):
+        previous, self.blocked = self.blocked, block
+        return previous
+
+    def setText(self, value):
+        self.values.append(value)
+        self.blocked_when_set.append(self.blocked)
+
+
+class WidgetBinderTest(unittest.TestCase):
+    """
+    Tests of the binding of widgets to device attributes.
+    """
+
+    def setUp(self):
+        self.binder = WidgetBinder()
+        self.widget = StubWidget()
+
+    def test_only_bound_path_applied(self):
+        self.binder.bind('device_status.level', self.widget, 'setText')
+        self.assertEqual(self.binder.apply({'device_status.on': True}), 0)
+        self.assertEqual(self.binder.apply({'device_status.level': 5}), 1)
+        self.assertEqual(self.widget.values, [5])
+        self.assertEqual(self.binder.get('device_status.on'), True)
+        self.assertIsNone(self.binder.get('device_status.hue'))
+
+    def test_unchanged_value_not_set(self):
+        self.binder.bind('device_status.level', self.widget, 'setText')
+        self.binder.apply({'device_status.level': 5})
+        self.assertEqual(self.binder.apply({'device_status.level': 5}), 0)
+        self.binder.apply({'device_status.level': 6})
+        self.assertEqual(self.widget.values, [5, 6])
+
+    def test_converter_of_several_paths(self):
+        self.binder.bind(('device_status.hue', 'device_status.saturation'),
+                         self.widget, 'setText',
+                         lambda hue, saturation: f'{hue}/{saturation}')
+        self.binder.apply({'device_status.hue': 10,
+                           'device_status.saturation': 20})
+        self.binder.apply({'device_status.saturation': 30})
+        self.assertEqual(self.widget.values, ['10/20', '10/30'])
+
+    def test_bind_applies_known_values(self):
+        self.binder.apply({'device_status.level': 5})
+        self.binder.bind('device_status.level', self.widget, 'setText', str)
+        self.assertEqual(self.widget.values, ['5'])
+
+    def test_line_edit_skipped_while_edited(self):
+        editing = [True]
+        self.binder.bind('device_status.level', self.widget, 'setText',
+                         enabled=lambda: not editing[0])
+        self.assertEqual(self.binder.apply({'device_status.level': 5}), 0)
+        self.assertEqual(self.widget.values, [])
+        editing[0] = False
+        # The next change of any attribute applies the skipped value
+        self.assertEqual(self.binder.apply({'device_status.on': True}), 1)
+        self.assertEqual(self.widget.values, [5])
+
+    def test_refresh_restores_edited_widget(self):
+        self.binder.bind('device_status.level', self.widget, 'setText',
+                         enabled=lambda: False)
+        self.binder.apply({'device_status.level': 5})
+        self.binder.refresh(self.widget)
+        self.binder.refresh(StubWidget())
+        self.assertEqual(self.widget.values, [5])
+
+    def test_signals_blocked_or_muted(self):
+        self.binder.bind('device_status.level', self.widget, 'setText')
+        slot = object()
+        other = StubWidget()
+        self.binder.bind('device_status.on', other,
+                         lambda widget, value: widget.setText(
+                             widget.toggled.slots[:]),
+                         block_signals=False, mute=[(other.toggled, slot)])
+        other.toggled.connect(slot)
+        self.binder.apply({'device_status.level': 5,
+                           'device_status.on': True})
+        self.assertEqual(self.widget.blocked_when_set, [True])
+        self.assertFalse(self.widget.blocked)
+        self.assertEqual(other.values, [[]])
+        self.assertEqual(other.blocked_when_set, [False])
+        self.assertEqual(other.toggled.slots, [slot])
+
+    def test_failed_binding_logged(self):
+        self.binder.bind('device_status.level', self.widget, 'setText',
+                         lambda value: 1 / value)
+        with self.assertLogs(level='ERROR'):
+            self.assertEqual(self.binder.apply({'device_status.level': 0}),
+                             0)
+        self.assertFalse(self.widget.blocked)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+# Copyright (c) 2024 LG Electronics, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import unittest
+
+from rpc.write_queue import WriteQueue
+
+
+class FakeCall:
+    """
+    Call scheduled on FakeScheduler.
+    """
+
+    def __init__(self, delay, func, args):
+        self.delay = delay
+        self.func = func
+        self.args = args
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class FakeScheduler:
+    """
+    Scheduler running the scheduled calls when the test asks.
+    """
+
+    def __init__(self):
+        self.calls = []
+
+    def call_later(self, delay, func, *args):
+        call = FakeCall(delay, func, args)
+        self.calls.append(call)
+        return call
+
+    def run(self):
+        calls, self.calls = self.calls, []
+        for call in calls:
+            if not call.cancelled:
+                call.func(*call.args)
+
+
+class WriteQueueTest(unittest.TestCase):
+    """
+    Tests of the merging of the writes of a device.
+    """
+
+    def setUp(self):
+        self.scheduler = FakeScheduler()
+        self.queue = WriteQueue(0.2, self.scheduler)
+        self.sent = []
+
+    def test_latest_write_of_attribute_sent(self):
+        for level in (10, 20, 30):
+            self.queue.submit('level', self.sent.append, {'level': level})
+        self.queue.submit('color', self.sent.append, {'hue': 5})
+        self.assertEqual(len(self.scheduler.calls), 2)
+        self.assertEqual(self.scheduler.calls[0].delay, 0.2)
+        self.scheduler.run()
+        self.assertEqual(self.sent, [{'level': 30}, {'hue': 5}])
+        self.assertEqual(self.queue.merged_count, 2)
+        self.assertEqual(self.queue.sent_count, 2)
+
+    def test_write_reads_state_when_sent(self):
+        state = {'on': True, 'level': 10}
+        self.queue.submit('level', lambda: self.sent.append(dict(state)))
+        state['on'] = False
+        state['level'] = 20
+        self.scheduler.run()
+        self.assertEqual(self.sent, [{'on': False, 'level': 20}])
+
+    def test_flush_sends_now(self):
+        self.queue.submit('level', self.sent.append, 1)
+        self.queue.submit('level', self.sent.append, 2, flush=True)
+        self.assertTrue(self.scheduler.calls[0].cancelled)
+        self.assertEqual(self.scheduler.calls[1].delay, 0.0)
+        self.scheduler.run()
+        self.assertEqual(self.sent, [2])
+
+    def test_debounce_restarts_wait(self):
+        self.queue.submit('lift', self.sent.append, 1, delay=1.0,
+                          debounce=True)
+        self.queue.submit('lift', self.sent.append, 2, delay=1.0,
+                          debounce=True)
+        self.assertEqual([call.cancelled for call in self.scheduler.calls],
+                         [True, False])
+        self.scheduler.run()
+        self.assertEqual(self.sent, [2])
+
+    def test_cancel_drops_writes(self):
+        self.queue.submit('level', self.sent.append, 1)
+        self.queue.submit('color', self.sent.append, 2)
+        self.queue.cancel('level')
+        self.scheduler.run()
+        self.assertEqual(self.sent, [2])
+        self.queue.submit('level', self.sent.append, 3)
+        self.queue.cancel()
+        self.scheduler.run()
+        self.assertEqual(self.sent, [2])
+
+    def test_failed_write_logged(self):
+        def fail(value):
+            raise RuntimeError(value)
+        self.queue.submit('level', fail, 1)
+        with self.assertLogs(level='ERROR'):
+            self.scheduler.run()
+        self.assertEqual(self.queue.sent_count, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,177 @@
+# Copyright (c) 2024 LG Electronics, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import datetime
+import hashlib
+import json
+import logging
+import random
+import secrets
+import threading
+
+# Sections of config.json copied to the run manifest
+MANIFEST_SECTIONS = ('simulation', 'value_generator', 'trace_replay')
+# Simulated start time of a deterministic run without 'start_time'
+DEFAULT_START_TIME = '2024-01-01T00:00:00'
+
+_lock = threading.Lock()
+_state = {'seed': None, 'deterministic': False, 'start_time': None,
+          'config': {}, 'streams': {}, 'manifest_path': None,
+          'created': None}
+
+
+def derive_seed(seed, name):
+    """
+    Return the 63 bit seed of a named random stream of a run seed, the
+    same in every process and on every platform.
+
+    Arguments:
+        seed {int} -- the run seed
+        name {str} -- the stream name, e.g. 'value:Pump(0x0303)#fff18001-1'
+    """
+    digest = hashlib.sha256(f'{seed}:{name}'.encode('utf-8')).digest()
+    return int.from_bytes(digest[:8], 'little') >> 1
+
+
+def configure(config=None, manifest_path=None):
+    """
+    Set the run seed from the 'simulation' section of config.json.
+
+    A 'seed' makes the run deterministic: every random stream derives
+    from it and the value generator steps by fixed ticks from the
+    'start_time'. Without seed a random one is drawn and recorded, so the
+    run can still be replayed by putting it in config.json.
+
+    Arguments:
+        config {dict} -- the content of config.json (default None)
+        manifest_path {str} -- file where the run manifest is written,
+                               see save_manifest() (default None)
+    """
+    config = config or {}
+    section = config.get('simulation', {})
+    seed = section.get('seed')
+    with _lock:
+        _state['deterministic'] = seed is not None
+        _state['seed'] = int(seed) if seed is not None \
+            else secrets.randbits(63)
+        _state['start_time'] = section.get('start_time')
+        _state['config'] = {name: config[name] for name in MANIFEST_SECTIONS
+                            if name in config}
+        _state['streams'] = {}
+        _state['manifest_path'] = manifest_path
+        _state['created'] = datetime.datetime.now().isoformat()
+    logging.info(f"Simulation seed {_state['seed']}"
+                 + (' (deterministic)' if seed is not None else ''))
+    save_manifest()
+
+
+def _ensure_configured():
+    """
+    Draw a run seed on first use without configure(), the caller holds
+    the lock.
+    """
+    if _state['seed'] is None:
+        _state['seed'] = secrets.randbits(63)
+        _state['created'] = datetime.datetime.now().isoformat()
+
+
+def run_seed():
+    """
+    Return the run seed.
+    """
+    with _lock:
+        _ensure_configured()
+        return _state['seed']
+
+
+def is_deterministic():
+    """
+    Return True if the run seed was set in config.json.
+    """
+    return _state['deterministic']
+
+
+def start_time():
+    """
+    Return the simulated start time of a deterministic run as seconds
+    since the epoch, None if the run is not deterministic.
+    """
+    if not _state['deterministic']:
+        return None
+    value = _state['start_time'] or DEFAULT_START_TIME
+    return datetime.datetime.fromisoformat(str(value)).timestamp()
+
+
+def stream_seed(name):
+    """
+    Return the seed of a named random stream of the run and record it in
+    the run manifest.
+
+    Arguments:
+        name {str} -- the stream name, stable across runs, e.g. the device
+                      type and its start order
+    """
+    with _lock:
+        _ensure_configured()
+        seed = derive_seed(_state['seed'], name)
+        new = name not in _state['streams']
+        _state['streams'][name] = seed
+    if new:
+        save_manifest()
+    return seed
+
+
+def stream(name):
+    """
+    Return a random.Random of a named random stream of the run.
+
+    Arguments:
+        name {str} -- the stream name, see stream_seed()
+    """
+    return random.Random(stream_seed(name))
+
+
+def manifest():
+    """
+    Return the run manifest: the run seed, the streams with their seeds
+    and the simulation settings.
+    """
+    with _lock:
+        _ensure_configured()
+        return {'created': _state['created'],
+                'seed': _state['seed'],
+                'deterministic': _state['deterministic'],
+                'config': dict(_state['config']),
+                'streams': dict(_state['streams'])}
+
+
+def save_manifest(path=None):
+    """
+    Write the run manifest to a JSON file.
+
+    Arguments:
+        path {str} -- the manifest file (default the one of configure(),
+                      nothing is written without file)
+    """
+    path = path or _state['manifest_path']
+    if path is None:
+        return
+    try:
+        with open(path, 'w') as manifest_file:
+            json.dump(manifest(), manifest_file, indent=4)
+    except OSError as e:
+        logging.error(f'Can not save run manifest {path}: {str(e)}')
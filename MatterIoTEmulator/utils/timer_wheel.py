@@ -0,0 +1,374 @@
+# Copyright (c) 2024 LG Electronics, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import logging
+import threading
+import time
+
+DEFAULT_TICK = 0.1
+SLOT_BITS = 6
+SLOTS = 1 << SLOT_BITS
+SLOT_MASK = SLOTS - 1
+LEVELS = 4
+
+
+class WheelTimer:
+    """
+    WheelTimer class of a call scheduled on the TimerWheel.
+    """
+
+    __slots__ = ('deadline', 'func', 'args', 'cancelled')
+
+    def __init__(self, deadline, func, args):
+        self.deadline = deadline
+        self.func = func
+        self.args = args
+        self.cancelled = False
+
+    def cancel(self):
+        """
+        Cancel the scheduled call.
+        """
+        self.cancelled = True
+
+
+class RepeatTimer:
+    """
+    RepeatTimer class calling a function count times, every interval
+    seconds, on the TimerWheel, see TimerWheel.call_repeat().
+
+    The calls are scheduled on absolute ticks, so the period does not
+    drift with the time spent in the function. The timer can be paused
+    and resumed, it then keeps the time left until the next call.
+    """
+
+    def __init__(self, wheel, interval, count, func, args, on_finished=None):
+        """
+        Initialize a RepeatTimer instance.
+
+        Arguments:
+            wheel {TimerWheel} -- the wheel running the timer
+            interval {float} -- seconds between two calls
+            count {int} -- number of calls
+            func {callable} -- the function to call
+            args {tuple} -- arguments of func
+            on_finished {callable} -- called after the last call
+                                      (default None)
+        """
+        self.wheel = wheel
+        self.interval_ticks = wheel.to_ticks(interval)
+        self.remaining_count = count
+        self.func = func
+        self.args = args
+        self.on_finished = on_finished
+        self.cancelled = False
+        self.paused = False
+        self._timer = None
+        self._paused_ticks = 0
+        self._lock = threading.Lock()
+
+    @property
+    def active(self):
+        """
+        Return True while calls are left and the timer is not cancelled.
+        """
+        return not self.cancelled and self.remaining_count > 0
+
+    def start(self):
+        """
+        Schedule the first call.
+        """
+        with self._lock:
+            if self.active and self._timer is None:
+                self._timer = self.wheel.call_at(
+                    self.wheel.current_tick() + self.interval_ticks,
+                    self._fire)
+
+    def pause(self):
+        """
+        Stop calling the function, keeping the time left and the count.
+        """
+        with self._lock:
+            if self.paused or self._timer is None:
+                return
+            self.paused = True
+            self._paused_ticks = max(
+                self._timer.deadline - self.wheel.current_tick(), 1)
+            self._timer.cancel()
+            self._timer = None
+
+    def resume(self):
+        """
+        Continue a paused timer.
+        """
+        with self._lock:
+            if not self.paused:
+                return
+            self.paused = False
+            if self.active:
+                self._timer = self.wheel.call_at(
+                    self.wheel.current_tick() + self._paused_ticks,
+                    self._fire)
+
+    def cancel(self):
+        """
+        Stop the timer, a call already running finishes.
+        """
+        with self._lock:
+            self.cancelled = True
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+    def remaining_time(self):
+        """
+        Return the seconds left until the next call, 0 when finished.
+        """
+        with self._lock:
+            if self.paused:
+                ticks = self._paused_ticks
+            elif self._timer is not None:
+                ticks = max(self._timer.deadline - self.wheel.current_tick(),
+                            0)
+            else:
+                ticks = 0
+        return ticks * self.wheel.tick
+
+    def _fire(self):
+        """
+        Call the function and schedule the next call.
+        """
+        with self._lock:
+            timer, self._timer = self._timer, None
+            if timer is None or self.cancelled:
+                return
+            self.remaining_count -= 1
+            finished = self.remaining_count <= 0
+            if not finished:
+                self._timer = self.wheel.call_at(
+                    timer.deadline + self.interval_ticks, self._fire)
+        try:
+            self.func(*self.args)
+        except Exception as e:
+            logging.error(f'Timer call of {self.func} failed: {str(e)}')
+        if finished and self.on_finished is not None:
+            try:
+                self.on_finished()
+            except Exception as e:
+                logging.error(f'Timer end of {self.func} failed: {str(e)}')
+
+
+class TimerWheel:
+    """
+    TimerWheel class owning the value timers of all devices.
+
+    The timers are kept in a hierarchical wheel of LEVELS levels of SLOTS
+    slots: the first level holds the calls due in the next SLOTS ticks
+    and every level above covers SLOTS times the range of the one below.
+    Adding or cancelling a timer is O(1) and a tick only looks at one
+    slot, whose timers are moved down a level when their range comes
+    close, so thousands of timers cost one thread waking every tick.
+    The thread sleeps while no timer is scheduled.
+
+    Functions are called on the wheel thread and must return quickly,
+    e.g. emit a Qt signal or hand the work to the poll scheduler.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def instance(cls):
+        """
+        Return the timer wheel shared by all devices, start it if needed.
+        """
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+                cls._instance.start()
+            return cls._instance
+
+    def __init__(self, tick=DEFAULT_TICK):
+        """
+        Initialize a TimerWheel instance.
+
+        Arguments:
+            tick {float} -- resolution of the wheel in seconds (default 0.1)
+        """
+        self.tick = tick
+        self._origin = time.monotonic()
+        self._tick = 0
+        self._count = 0
+        self._wheels = [[[] for _ in range(SLOTS)] for _ in range(LEVELS)]
+        self._cond = threading.Condition()
+        self._thread = None
+        self._running = False
+
+    def start(self):
+        """
+        Start the wheel thread.
+        """
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+        self._thread = threading.Thread(
+            target=self._run, name="timer wheel thread", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stop the wheel thread.
+        """
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+
+    def to_ticks(self, seconds):
+        """
+        Return the number of ticks of a delay, at least one.
+
+        Arguments:
+            seconds {float} -- the delay
+        """
+        return max(int(round(seconds / self.tick)), 1)
+
+    def current_tick(self):
+        """
+        Return the tick of the current time.
+        """
+        return max(int((time.monotonic() - self._origin) / self.tick),
+                   self._tick)
+
+    def call_later(self, delay, func, *args):
+        """
+        Call a function after a delay and return the WheelTimer, whose
+        cancel() method cancels the call.
+
+        Arguments:
+            delay {float} -- seconds to wait, rounded to the tick
+            func {callable} -- the function to call
+        """
+        return self.call_at(self.current_tick() + self.to_ticks(delay),
+                            func, *args)
+
+    def call_at(self, deadline, func, *args):
+        """
+        Call a function at a tick and return the WheelTimer.
+
+        Arguments:
+            deadline {int} -- the tick, see current_tick()
+            func {callable} -- the function to call
+        """
+        timer = WheelTimer(deadline, func, args)
+        with self._cond:
+            if not self._count:
+                # Nothing was ticking, catch up with the clock
+                self._tick = self.current_tick()
+            self._add(timer)
+            self._count += 1
+            self._cond.notify()
+        return timer
+
+    def call_repeat(self, interval, count, func, *args, on_finished=None):
+        """
+        Call a function count times every interval seconds and return
+        the RepeatTimer, which can be paused, resumed and cancelled.
+
+        Arguments:
+            interval {float} -- seconds between two calls
+            count {int} -- number of calls
+            func {callable} -- the function to call
+            on_finished {callable} -- called after the last call
+                                      (default None)
+        """
+        timer = RepeatTimer(self, interval, count, func, args, on_finished)
+        timer.start()
+        return timer
+
+    def _add(self, timer):
+        """
+        Put a timer in the slot of its deadline, the caller holds the lock.
+        """
+        deadline = max(timer.deadline, self._tick + 1)
+        delta = deadline - self._tick
+        level = 0
+        while level < LEVELS - 1 and delta >= 1 << (SLOT_BITS * (level + 1)):
+            level += 1
+        slot = (deadline >> (SLOT_BITS * level)) & SLOT_MASK
+        self._wheels[level][slot].append(timer)
+
+    def _advance(self):
+        """
+        Move the wheel one tick and return the expired timers, the caller
+        holds the lock.
+        """
+        self._tick += 1
+        tick = self._tick
+        expired = []
+        for level in range(1, LEVELS):
+            if tick & ((1 << (SLOT_BITS * level)) - 1):
+                break
+            # Move the timers of the next range down the wheel, the ones
+            # due on this tick expire now
+            slot = (tick >> (SLOT_BITS * level)) & SLOT_MASK
+            timers, self._wheels[level][slot] = self._wheels[level][slot], []
+            for timer in timers:
+                if timer.cancelled:
+                    self._count -= 1
+                elif timer.deadline <= tick:
+                    self._count -= 1
+                    expired.append(timer)
+                else:
+                    self._add(timer)
+        timers = self._wheels[0][tick & SLOT_MASK]
+        self._wheels[0][tick & SLOT_MASK] = []
+        for timer in timers:
+            if timer.cancelled:
+                self._count -= 1
+            elif timer.deadline > tick:
+                self._add(timer)
+            else:
+                self._count -= 1
+                expired.append(timer)
+        return expired
+
+    def _run(self):
+        """
+        Wheel loop: wait for the next tick and call the expired timers.
+        """
+        while True:
+            with self._cond:
+                while self._running and not self._count:
+                    self._cond.wait()
+                if not self._running:
+                    return
+                now = int((time.monotonic() - self._origin) / self.tick)
+                if now <= self._tick:
+                    self._cond.wait(self._origin + (self._tick + 1)
+                                    * self.tick - time.monotonic())
+                    continue
+                expired = []
+                while self._tick < now:
+                    expired.extend(self._advance())
+            for timer in expired:
+                if timer.cancelled:
+                    continue
+                try:
+                    timer.func(*timer.args)
+                except Exception:
+                    logging.exception("Exception in timer wheel call")
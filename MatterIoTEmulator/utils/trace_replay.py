@@ -0,0 +1,383 @@
+# Copyright (c) 2024 LG Electronics, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import csv
+import datetime
+import logging
+import math
+import struct
+import sys
+import threading
+import time
+
+from utils.timer_wheel import TimerWheel
+
+DEFAULT_TIME_COLUMN = 'timestamp'
+DEFAULT_SPEED = 1.0
+
+# Binary trace: header, column names, then one record per row holding
+# the timestamp as a double and the values as floats, NaN when missing
+BINARY_MAGIC = b'MTRC'
+BINARY_VERSION = 1
+_HEADER = struct.Struct('<4sHH')
+_NAME_SIZE = struct.Struct('<H')
+_READ_RECORDS = 1024
+
+
+def get_trace_replay_config(config, device_type=None):
+    """
+    Return the trace replay settings of a device type, or None if no
+    trace is configured.
+
+    The 'trace_replay' section of config.json holds the default 'speed'
+    and, in 'device_types', the 'file' to replay by device type with its
+    own 'speed', 'time_column' and 'columns', see map_columns().
+
+    Arguments:
+        config {dict} -- the content of config.json
+        device_type {str} -- the device name, e.g. 'Pump(0x0303)'
+    """
+    section = (config or {}).get('trace_replay', {})
+    entry = section.get('device_types', {}).get(device_type, {})
+    if not entry.get('file'):
+        return None
+    return {
+        'file': entry['file'],
+        'speed': entry.get('speed', section.get('speed', DEFAULT_SPEED)),
+        'time_column': entry.get('time_column', DEFAULT_TIME_COLUMN),
+        'columns': entry.get('columns')}
+
+
+def parse_time(value):
+    """
+    Return the seconds of a timestamp.
+
+    Arguments:
+        value {str} -- seconds since the epoch or an ISO 8601 date
+    Raises:
+        ValueError: if the timestamp can not be parsed
+    """
+    try:
+        return float(value)
+    except ValueError:
+        return datetime.datetime.fromisoformat(value.strip()).timestamp()
+
+
+def read_csv_trace(path, time_column=DEFAULT_TIME_COLUMN):
+    """
+    Read a CSV trace row by row, yield (seconds, {column: text}) without
+    the empty cells.
+
+    Arguments:
+        path {str} -- the CSV file, with a header row
+        time_column {str} -- the column of the timestamps
+                             (default 'timestamp')
+    """
+    with open(path, newline='') as trace:
+        for row in csv.DictReader(trace):
+            stamp = row.pop(time_column, None)
+            if not stamp:
+                continue
+            yield parse_time(stamp), {
+                column: value for column, value in row.items()
+                if column is not None and value not in (None, '')}
+
+
+def read_binary_trace(path):
+    """
+    Read a binary trace in blocks of records, yield
+    (seconds, {column: value}) without the missing values.
+
+    Arguments:
+        path {str} -- the binary trace, see write_binary_trace()
+    Raises:
+        ValueError: if the file is not a binary trace
+    """
+    with open(path, 'rb') as trace:
+        magic, version, count = _HEADER.unpack(
+            trace.read(_HEADER.size))
+        if magic != BINARY_MAGIC or version != BINARY_VERSION:
+            raise ValueError(f'{path} is not a binary trace')
+        columns = []
+        for _ in range(count):
+            size, = _NAME_SIZE.unpack(trace.read(_NAME_SIZE.size))
+            columns.append(trace.read(size).decode('utf-8'))
+        record = struct.Struct('<d%df' % count)
+        while True:
+            block = trace.read(record.size * _READ_RECORDS)
+            if not block:
+                return
+            for values in record.iter_unpack(
+                    block[:len(block) - len(block) % record.size]):
+                yield values[0], {
+                    column: value
+                    for column, value in zip(columns, values[1:])
+                    if not math.isnan(value)}
+
+
+def read_trace(path, time_column=DEFAULT_TIME_COLUMN):
+    """
+    Read a binary or CSV trace, see read_binary_trace() and
+    read_csv_trace().
+
+    Arguments:
+        path {str} -- the trace file
+        time_column {str} -- the time column of a CSV trace
+                             (default 'timestamp')
+    """
+    with open(path, 'rb') as trace:
+        binary = trace.read(len(BINARY_MAGIC)) == BINARY_MAGIC
+    if binary:
+        return read_binary_trace(path)
+    return read_csv_trace(path, time_column)
+
+
+def write_binary_trace(path, columns, records):
+    """
+    Write records to a binary trace and return their number.
+
+    Arguments:
+        path {str} -- the binary trace to write
+        columns {list} -- the columns to keep
+        records {iterable} -- (seconds, {column: value}) records
+    """
+    record = struct.Struct('<d%df' % len(columns))
+    count = 0
+    with open(path, 'wb') as trace:
+        trace.write(_HEADER.pack(BINARY_MAGIC, BINARY_VERSION,
+                                 len(columns)))
+        for column in columns:
+            name = column.encode('utf-8')
+            trace.write(_NAME_SIZE.pack(len(name)) + name)
+        for stamp, values in records:
+            row = []
+            for column in columns:
+                try:
+                    row.append(float(values[column]))
+                except (KeyError, ValueError):
+                    row.append(math.nan)
+            trace.write(record.pack(stamp, *row))
+            count += 1
+    return count
+
+
+def _convert(value, kind, scale):
+    """
+    Return a trace value as the attribute type.
+    """
+    if kind == 'bool':
+        text = str(value).strip().lower()
+        if text in ('true', 'on', 'open', 'yes'):
+            return True
+        if text in ('false', 'off', 'closed', 'no'):
+            return False
+        return float(value) != 0
+    value = float(value) * scale
+    if kind == 'float':
+        return round(value, 2)
+    return int(round(value))
+
+
+def map_columns(records, columns):
+    """
+    Map the columns of trace records to device attributes, yield
+    (seconds, data) where data is the nested dictionary set through the
+    rpc client, skip the records without mapped value.
+
+    Arguments:
+        records {iterable} -- (seconds, {column: value}) records
+        columns {dict} -- by column: the dotted 'attribute' path, the
+                          'scale' applied to the value (default 1) and
+                          the 'type', 'int', 'float' or 'bool'
+                          (default 'int'), e.g. {'temp_c': {'attribute':
+                          'temperatureValue', 'scale': 100}}
+    """
+    mapping = []
+    for column, target in columns.items():
+        if isinstance(target, str):
+            target = {'attribute': target}
+        mapping.append((column, target['attribute'].split('.'),
+                        target.get('type', 'int'), target.get('scale', 1)))
+    for stamp, values in records:
+        data = {}
+        for column, path, kind, scale in mapping:
+            if column not in values:
+                continue
+            try:
+                value = _convert(values[column], kind, scale)
+            except ValueError:
+                logging.warning(
+                    f'Bad trace value {values[column]!r} of {column}')
+                continue
+            node = data
+            for key in path[:-1]:
+                node = node.setdefault(key, {})
+            node[path[-1]] = value
+        if data:
+            yield stamp, data
+
+
+def merge_record(target, data):
+    """
+    Merge the nested data of a record into target, the values of data
+    win.
+
+    Arguments:
+        target {dict} -- the merged data, changed in place
+        data {dict} -- the data of a later record
+    """
+    for key, value in data.items():
+        if isinstance(value, dict) and isinstance(target.get(key), dict):
+            merge_record(target[key], value)
+        else:
+            target[key] = value
+
+
+class TraceReplay:
+    """
+    TraceReplay class writing trace records to a device at their recorded
+    time, speed times faster.
+
+    The records are pulled one ahead from the trace pipeline, so the file
+    is streamed and never loaded whole. Each record is due at the start
+    time plus its time in the trace divided by speed; the replay waits on
+    the shared timer wheel, and the records due within the same tick are
+    merged into one write. The write function is called on the wheel
+    thread and must hand the write over, e.g. to the write queue.
+    """
+
+    def __init__(self, records, write, speed=DEFAULT_SPEED,
+                 on_finished=None, wheel=None):
+        """
+        Initialize a TraceReplay instance.
+
+        Arguments:
+            records {iterable} -- (seconds, data) records, see
+                                  map_columns()
+            write {callable} -- called with the data of the due records
+            speed {float} -- replay speed, e.g. 10 for 10x (default 1.0)
+            on_finished {callable} -- called after the last record
+                                      (default None)
+            wheel {TimerWheel} -- the wheel waiting for the records
+                                  (default the shared one)
+        """
+        if speed <= 0:
+            raise ValueError(f'Bad replay speed {speed}')
+        self.records = iter(records)
+        self.write = write
+        self.speed = speed
+        self.on_finished = on_finished
+        self.wheel = wheel or TimerWheel.instance()
+        self.replayed_count = 0
+        self._next = None
+        self._start = None
+        self._origin = None
+        self._timer = None
+        self._running = False
+        self._lock = threading.Lock()
+
+    @property
+    def running(self):
+        """
+        Return True until the replay finished or stopped.
+        """
+        return self._running
+
+    def start(self):
+        """
+        Start the replay with the first record.
+        """
+        with self._lock:
+            if self._running:
+                return
+            self._next = next(self.records, None)
+            if self._next is None:
+                return
+            self._running = True
+            self._start = time.monotonic()
+            self._origin = self._next[0]
+            self._schedule()
+
+    def stop(self):
+        """
+        Stop the replay and close the trace.
+        """
+        with self._lock:
+            self._running = False
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        close = getattr(self.records, 'close', None)
+        if close is not None:
+            close()
+
+    def _due(self, record):
+        """
+        Return the monotonic time a record is due.
+        """
+        return self._start + (record[0] - self._origin) / self.speed
+
+    def _schedule(self):
+        """
+        Wait for the next record, the caller holds the lock.
+        """
+        self._timer = self.wheel.call_later(
+            max(self._due(self._next) - time.monotonic(), 0), self._fire)
+
+    def _fire(self):
+        """
+        Write the due records and wait for the next one.
+        """
+        data = {}
+        with self._lock:
+            if not self._running:
+                return
+            limit = time.monotonic() + self.wheel.tick / 2
+            try:
+                while (self._next is not None
+                       and self._due(self._next) <= limit):
+                    merge_record(data, self._next[1])
+                    self.replayed_count += 1
+                    self._next = next(self.records, None)
+            except Exception as e:
+                logging.error(f'Failed to read trace: {str(e)}')
+                self._next = None
+            if self._next is not None:
+                self._schedule()
+            else:
+                self._running = False
+                self._timer = None
+        if data:
+            try:
+                self.write(data)
+            except Exception as e:
+                logging.error(f'Failed to replay trace: {str(e)}')
+        if self._next is None and self.on_finished is not None:
+            self.on_finished()
+
+
+if __name__ == '__main__':
+    # Convert a CSV trace to the binary format
+    if len(sys.argv) < 3:
+        print('Usage: python3 -m utils.trace_replay <trace.csv> <trace.bin>'
+              ' [time column]')
+        sys.exit(1)
+    source = read_csv_trace(sys.argv[1], *sys.argv[3:4])
+    with open(sys.argv[1], newline='') as header:
+        names = [name for name in next(csv.reader(header))
+                 if name != (sys.argv[3:4] or [DEFAULT_TIME_COLUMN])[0]]
+    print(f'{write_binary_trace(sys.argv[2], names, source)} records written')
@@ -0,0 +1,408 @@
+# Copyright (c) 2024 LG Electronics, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import threading
+import time
+
+import numpy as np
+
+from utils import sim_random
+
+DEFAULT_TICK = 0.5
+DEFAULT_TIME_SCALE = 1.0
+DAY = 86400.0
+
+# Constants of the SplitMix64 hash giving the random numbers
+_GOLDEN = np.uint64(0x9E3779B97F4A7C15)
+_DRAW = 0xD1B54A32D192ED03
+_MASK = (1 << 64) - 1
+_MIX1 = np.uint64(0xBF58476D1CE4E5B9)
+_MIX2 = np.uint64(0x94D049BB133111EB)
+
+# Parameters of a value model and their default values:
+#   base        -- center of the values
+#   walk        -- random walk speed, standard deviation per sqrt(second)
+#   revert      -- pull of the random walk back to base, per second
+#   amplitude   -- amplitude of the daily sine, negative for a minimum
+#                  at 'peak'
+#   period      -- seconds of one sine period
+#   peak        -- local time of day of the sine maximum, in seconds
+#   noise       -- standard deviation of the noise of every value
+#   step_rate   -- step changes per second
+#   step_size   -- size of a step change, up or down
+#   correlation -- share of the random walk common to the devices of
+#                  the same group, 0 to 1
+MODEL_PARAMS = {
+    'base': None,
+    'walk': 0.0,
+    'revert': 0.0,
+    'amplitude': 0.0,
+    'period': DAY,
+    'peak': 0.0,
+    'noise': 0.0,
+    'step_rate': 0.0,
+    'step_size': 0.0,
+    'correlation': 0.0}
+
+# Presets of the parameters, the sensor or config.json sets the values
+MODELS = {
+    'uniform': {},
+    'random_walk': {'walk': 1.0, 'revert': 0.001},
+    'diurnal': {'walk': 0.5, 'revert': 0.01},
+    'noise': {},
+    'step': {}}
+
+
+def _uniforms(keys, counters, draw):
+    """
+    Return uniform numbers in (0, 1) of random streams, the same for the
+    same key, counter and draw whatever the other streams.
+
+    Arguments:
+        keys {ndarray} -- uint64 keys of the streams
+        counters {ndarray} -- uint64 position in each stream
+        draw {int} -- index of the number at this position
+    """
+    x = keys + counters * _GOLDEN + np.uint64(draw * _DRAW & _MASK)
+    x = (x ^ (x >> np.uint64(30))) * _MIX1
+    x = (x ^ (x >> np.uint64(27))) * _MIX2
+    x = x ^ (x >> np.uint64(31))
+    return ((x >> np.uint64(11)).astype(np.float64) + 0.5) / 2.0 ** 53
+
+
+def _normals(keys, counters, draw):
+    """
+    Return standard normal numbers of random streams, see _uniforms().
+    """
+    radius = np.sqrt(-2.0 * np.log(_uniforms(keys, counters, 2 * draw)))
+    return radius * np.cos(
+        2.0 * np.pi * _uniforms(keys, counters, 2 * draw + 1))
+
+
+def get_value_generator_config(config, device_type=None):
+    """
+    Return the value generator settings of a device type.
+
+    The 'value_generator' section of config.json holds the 'tick', the
+    'time_scale' and the model parameters of device types in
+    'device_types', e.g. {"model": "diurnal", "amplitude": 500}, which
+    override the model of the sensor.
+
+    Arguments:
+        config {dict} -- the content of config.json
+        device_type {str} -- the device name, e.g. 'Pump(0x0303)'
+    """
+    section = (config or {}).get('value_generator', {})
+    return {
+        'tick': section.get('tick', DEFAULT_TICK),
+        'time_scale': section.get('time_scale', DEFAULT_TIME_SCALE),
+        'model': dict(section.get('device_types', {}).get(device_type, {}))}
+
+
+class ValueGenerator:
+    """
+    ValueGenerator class producing the random values of all sensors.
+
+    Every sensor adds a model (see add()) and gets a row in NumPy arrays
+    holding the parameters and the state of all models. One step moves
+    all rows at once: the random walks, the step changes, the daily sine
+    and the noise are computed on whole arrays, so hundreds of sensors
+    cost one vectorized update and no Python loop per device. Devices of
+    the same group share part of their random walk and move together.
+
+    The values are stepped lazily, on the first read of a tick: sensors
+    reading in the same tick get values of the same step.
+
+    Every row draws from its own random stream, keyed by the stream name
+    of the sensor and counted by its own steps, so the values of a sensor
+    do not depend on the other sensors. In a deterministic run (see
+    sim_random) the wall clock is not used: every read steps only the
+    rows it reads, by one tick, and the daily sine of every row starts at
+    the configured start time, so the n-th value of a sensor is the same
+    in every run with the same seed, whatever the other sensors read.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def instance(cls, config=None):
+        """
+        Return the value generator shared by all sensors.
+
+        Arguments:
+            config {dict} -- the content of config.json, used when the
+                             generator is created (default None)
+        """
+        with cls._instance_lock:
+            if cls._instance is None:
+                settings = get_value_generator_config(config)
+                cls._instance = cls(settings['tick'],
+                                    settings['time_scale'])
+            return cls._instance
+
+    def __init__(self, tick=DEFAULT_TICK, time_scale=DEFAULT_TIME_SCALE,
+                 seed=None, clock=time.time):
+        """
+        Initialize a ValueGenerator instance.
+
+        Arguments:
+            tick {float} -- minimum seconds between two steps (default 0.5)
+            time_scale {float} -- simulated seconds per second, to speed up
+                                  the daily sine and walks (default 1.0)
+            seed {int} -- seed of the random streams, steps are then one
+                          tick long (default None, the run seed of
+                          sim_random)
+            clock {callable} -- returns the current time in seconds
+                                (default time.time)
+        """
+        self.tick = tick
+        self.time_scale = time_scale
+        self.clock = clock
+        self.seed = seed
+        self.fixed_steps = seed is not None or sim_random.is_deterministic()
+        self._lock = threading.Lock()
+        self._groups = {}
+        self._group_keys = np.zeros(0, dtype=np.uint64)
+        self._free = []
+        self._size = 0
+        self._params = {}
+        self._alloc(16)
+        now = clock()
+        self._last = now
+        # Simulated local time of day, the sine follows the clock
+        start = sim_random.start_time() if self.fixed_steps else None
+        if start is None:
+            start = now
+        self._start_time = start + time.localtime(start).tm_gmtoff
+        self._sim_time = self._start_time
+
+    def _stream_key(self, name):
+        """
+        Return the uint64 key of a named random stream.
+        """
+        if self.seed is not None:
+            return np.uint64(sim_random.derive_seed(self.seed, name))
+        return np.uint64(sim_random.stream_seed(name))
+
+    def _alloc(self, capacity):
+        """
+        Grow the arrays to capacity rows, the caller holds the lock.
+        """
+        old = self._size
+        arrays = dict(self._params)
+        for name in ('low', 'high', 'uniform', 'group', 'offset', 'steps',
+                     'values', 'active', 'key', 'count',
+                     'time') + tuple(MODEL_PARAMS):
+            grown = np.zeros(capacity, dtype=(
+                bool if name in ('uniform', 'active') else
+                np.int64 if name == 'group' else
+                np.uint64 if name in ('key', 'count') else np.float64))
+            if name in arrays:
+                grown[:old] = arrays[name][:old]
+            self._params[name] = grown
+        self._size = capacity
+        self._free.extend(range(capacity - 1, old - 1, -1))
+
+    def add(self, low, high, model='uniform', group=None, stream=None,
+            **params):
+        """
+        Add the model of a sensor and return its handle.
+
+        Arguments:
+            low {float} -- smallest value
+            high {float} -- largest value
+            model {str} -- one of MODELS, the preset of the parameters
+                           (default 'uniform', values uniform in range)
+            group {str} -- devices of the same group share the common part
+                           of their random walk (default None)
+            stream {str} -- name of the random stream of the sensor,
+                            stable across runs (default None, by handle)
+            params -- values of MODEL_PARAMS overriding the preset
+        Raises:
+            KeyError: if the model or a parameter is unknown
+        """
+        settings = dict(MODEL_PARAMS)
+        settings.update(MODELS[model])
+        for name, value in params.items():
+            if name not in MODEL_PARAMS:
+                raise KeyError(name)
+            settings[name] = value
+        if settings['base'] is None:
+            settings['base'] = (low + high) / 2.0
+        with self._lock:
+            if not self._free:
+                self._alloc(self._size * 2)
+            handle = self._free.pop()
+            if group not in self._groups:
+                self._groups[group] = len(self._groups)
+                self._group_keys = np.append(
+                    self._group_keys, self._stream_key(f'group:{group}'))
+            p = self._params
+            p['key'][handle] = self._stream_key(
+                f'value:{stream if stream is not None else handle}')
+            p['count'][handle] = 0
+            p['time'][handle] = (self._start_time if self.fixed_steps
+                                 else self._sim_time)
+            p['low'][handle] = low
+            p['high'][handle] = high
+            p['uniform'][handle] = model == 'uniform'
+            p['group'][handle] = self._groups[group]
+            for name in MODEL_PARAMS:
+                p[name][handle] = settings[name]
+            p['offset'][handle] = 0.0
+            p['steps'][handle] = 0.0
+            p['values'][handle] = settings['base']
+            p['active'][handle] = True
+        return handle
+
+    def remove(self, handle):
+        """
+        Remove the model of a sensor.
+
+        Arguments:
+            handle {int} -- the handle returned by add()
+        """
+        with self._lock:
+            if self._params['active'][handle]:
+                self._params['active'][handle] = False
+                self._free.append(handle)
+
+    def value(self, handle):
+        """
+        Return the current value of a sensor, rounded to an integer.
+
+        Arguments:
+            handle {int} -- the handle returned by add()
+        """
+        with self._lock:
+            self._advance([handle])
+            return int(round(self._params['values'][handle]))
+
+    def values(self):
+        """
+        Return the current values of all sensors by handle.
+        """
+        with self._lock:
+            self._advance(np.flatnonzero(self._params['active']))
+            active = self._params['active']
+            handles = np.flatnonzero(active)
+            return dict(zip(handles.tolist(), np.rint(
+                self._params['values'][active]).astype(np.int64).tolist()))
+
+    def value_list(self, handles):
+        """
+        Return the current values of several sensors in the order of
+        their handles, rounded to integers.
+
+        Arguments:
+            handles {list} -- the handles returned by add()
+        """
+        handles = list(handles)
+        with self._lock:
+            self._advance(handles)
+            return np.rint(self._params['values'][handles]).astype(
+                np.int64).tolist()
+
+    def step(self, seconds=None):
+        """
+        Move all sensors one step forward.
+
+        Arguments:
+            seconds {float} -- simulated seconds of the step
+                               (default one tick)
+        """
+        if seconds is None:
+            seconds = self.tick * self.time_scale
+        with self._lock:
+            self._sim_time += seconds
+            self._step(seconds)
+
+    def _advance(self, rows):
+        """
+        Step the rows being read, the caller holds the lock.
+
+        In a deterministic run the read rows move one tick forward on
+        every read. Otherwise all rows move to the current time if a tick
+        went by.
+
+        Arguments:
+            rows {list} -- the handles being read
+        """
+        if self.fixed_steps:
+            self._step(self.tick * self.time_scale, rows)
+            return
+        now = self.clock()
+        elapsed = now - self._last
+        if elapsed >= self.tick:
+            self._last = now
+            self._sim_time += elapsed * self.time_scale
+            self._step(elapsed * self.time_scale)
+
+    def _step(self, dt, rows=None):
+        """
+        Move sensors dt simulated seconds forward, the caller holds the
+        lock.
+
+        Arguments:
+            dt {float} -- simulated seconds of the step
+            rows {list} -- the handles to move (default None, all rows)
+        """
+        p = self._params
+        if rows is None:
+            rows = np.arange(self._size)
+        rows = np.unique(np.asarray(rows, dtype=np.int64))
+        if not len(rows):
+            return
+        r = {name: p[name][rows] for name in p}
+        keys = r['key']
+        counters = r['count'] + np.uint64(1)
+        p['count'][rows] = counters
+        p['time'][rows] = r['time'] + dt
+
+        # Random walk pulled back to base, its innovation is partly
+        # shared by the devices of a group at the same step
+        common = _normals(self._group_keys[r['group']], counters, 0)
+        own = _normals(keys, counters, 1)
+        correlation = r['correlation']
+        shock = (np.sqrt(correlation) * common
+                 + np.sqrt(1.0 - correlation) * own)
+        offset = r['offset'] * np.exp(-r['revert'] * dt)
+        offset += r['walk'] * np.sqrt(dt) * shock
+
+        # Step changes, up or down
+        jumps = _uniforms(keys, counters, 4) < -np.expm1(-r['step_rate'] * dt)
+        signs = np.where(_uniforms(keys, counters, 5) < 0.5, -1.0, 1.0)
+        steps = r['steps'] + np.where(jumps, signs * r['step_size'], 0.0)
+
+        # Bound the level, so walks and steps come back from the limits
+        low_offset = r['low'] - r['base']
+        high_offset = r['high'] - r['base']
+        steps = np.clip(steps, low_offset, high_offset)
+        offset = np.clip(offset, low_offset - steps, high_offset - steps)
+        p['steps'][rows] = steps
+        p['offset'][rows] = offset
+
+        period = np.where(r['period'] > 0, r['period'], DAY)
+        wave = r['amplitude'] * np.cos(
+            2.0 * np.pi * (p['time'][rows] - r['peak']) / period)
+        values = (r['base'] + offset + steps + wave
+                  + r['noise'] * _normals(keys, counters, 3))
+        values = np.where(r['uniform'],
+                          r['low'] + (r['high'] - r['low'])
+                          * _uniforms(keys, counters, 8), values)
+        p['values'][rows] = np.clip(values, r['low'], r['high'])